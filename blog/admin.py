@@ -1,10 +1,11 @@
 from django.contrib import admin
-from .models import Post, Category, Tag, Comment, Series, SeriesPost, SystemLogEntry, PostView, Subscriber
+from .models import Post, Category, Tag, Comment, Series, SeriesPost, SystemLogEntry, PostView, Subscriber, PostNotification
 from django.utils import timezone
 from django.utils.html import format_html
 from django.db.models import Q
 from django.urls import reverse
 from core.admin_mixins import CategoryCSVImportMixin, TagCSVImportMixin, SeriesCSVImportMixin
+from core.pagination import KeysetPaginationMixin
 
 
 @admin.register(Category)
@@ -331,7 +332,9 @@ class SystemLogEntryAdmin(admin.ModelAdmin):
 
 
 @admin.register(PostView)
-class PostViewAdmin(admin.ModelAdmin):
+class PostViewAdmin(KeysetPaginationMixin, admin.ModelAdmin):
+    # One row per view - Previous/Next seek instead of OFFSET, and skip the second COUNT(*)
+    show_full_result_count = False
     list_display = ("post", "ip_address", "viewed_on")
     list_filter = ("viewed_on",)
     search_fields = ("post__title", "ip_address")
@@ -484,6 +487,27 @@ class SubscriberAdmin(admin.ModelAdmin):
         return qs.prefetch_related('subscribed_categories', 'subscribed_tags')
 
 
+@admin.register(PostNotification)
+class PostNotificationAdmin(admin.ModelAdmin):
+    """Read-only view of the new-post email outbox."""
+
+    list_display = ("post", "subscriber", "status", "attempts", "created_at", "sent_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("post__title", "subscriber__email")
+    list_select_related = ("post", "subscriber")
+    readonly_fields = ("post", "subscriber", "status", "attempts", "error", "created_at", "sent_at")
+    actions = ["retry_notifications"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def retry_notifications(self, request, queryset):
+        """Put failed notifications back in the queue."""
+        updated = queryset.filter(status='failed').update(status='pending', attempts=0)
+        self.message_user(request, f'{updated} notification(s) re-queued.')
+    retry_notifications.short_description = 'Retry failed notifications'
+
+
 # Customize admin site
 admin.site.site_header = "AURA Portfolio Administration"
 admin.site.site_title = "AURA Admin"
@@ -12,7 +12,7 @@ from django.utils import timezone
 from django.utils.text import slugify
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
-from django.views.generic import TemplateView, DetailView, View
+from django.views.generic import TemplateView, DetailView
 from django.db import models
 from django.conf import settings
 
@@ -28,9 +28,13 @@ from core.admin_views import (
     StatusAdminCreateView,
     BulkActionMixin,
     BaseAdminView,
-    AdminAccessMixin
+    AdminAccessMixin,
+    StreamingExportView,
 )
 from .models import Post, Category, Tag, Series, SeriesPost, SystemLogEntry, Subscriber
+from .services.notifications import queue_post_notifications
+from .services.relationships import parse_tag_names, sync_post_tags, sync_system_connections
+from core.services.exports import StreamingExport
 from projects.models import SystemModule
 from .forms import PostForm, CategoryForm, TagForm, SeriesForm
 
@@ -372,6 +376,9 @@ class PostUpdateAdminView(BaseAdminUpdateView):
             # Handle learning journey updates
             self.process_learning_journey_update()
 
+            # Email subscribers if this save published it (tags are in place by now)
+            queue_post_notifications(self.object)
+
             messages.success(
                 self.request,
                 f'DataLog "{self.object.title}" updated successfully!'
@@ -395,67 +402,27 @@ class PostUpdateAdminView(BaseAdminUpdateView):
         tags_data = self.request.POST.get('tags_input', '') or self.request.POST.get('tags', '')
 
         if tags_data:
-            # Clear existing tags
-            self.object.tags.clear()
-
-            # Split tags by comma and clean them up
-            tag_names = [tag.strip().lower().replace(' ', '-') for tag in tags_data.split(',') if tag.strip()]
+            sync_post_tags(self.object, parse_tag_names(tags_data))
 
-            for tag_name in tag_names:
-                if tag_name:
-                    tag, created = Tag.objects.get_or_create(
-                        name=tag_name,
-                        defaults={'slug': slugify(tag_name)}
-                    )
-                    self.object.tags.add(tag)
-        
     def process_system_connections(self):
         """Process system connections from the custom JavaScript system."""
-        print("DEBUG: Processing system connections...")
+        system_ids_data = self.request.POST.get('system_connections_input', '').strip()
 
-        # Clear existing system connections
-        SystemLogEntry.objects.filter(post=self.object).delete()
+        connections = {}
+        for sid in system_ids_data.split(','):
+            sid = sid.strip()
+            if not sid.isdigit():
+                continue
+            try:
+                priority = int(self.request.POST.get(f'priority_{sid}', 2))
+            except ValueError:
+                continue
+            connections[int(sid)] = {
+                'connection_type': self.request.POST.get(f'connection_type_{sid}', 'development'),
+                'relationship_priority': priority,
+            }
 
-        # Get system IDs from custom field
-        system_ids_data = self.request.POST.get('system_connections_input', '').strip()
-        print(f"DEBUG: System connections input: '{system_ids_data}'")
-
-        if system_ids_data:
-            # Split by comma and clean up
-            system_ids = [
-                int(sid.strip())
-                for sid in system_ids_data.split(",")
-                if sid.strip().isdigit()
-            ]
-            print(f"DEBUG: Parsed system IDs: {system_ids}")
-
-            # Create new connections
-            for system_id in system_ids:
-                try:
-                    system = SystemModule.objects.get(id=system_id)
-
-                    # Generate log entry ID
-                    existing_count = SystemLogEntry.objects.filter(system=system).count()
-                    log_entry_id = f"SYS-{system.id:03d}-LOG-{existing_count + 1:03d}"
-
-                    # Create system connection
-                    connection = SystemLogEntry.objects.create(
-                        post=self.object,
-                        system=system,
-                        connection_type=self.request.POST.get(f'connection_type_{system_id}', 'development'),
-                        relationship_priority=int(self.request.POST.get(f'priority_{system_id}', 2)),
-                        log_entry_id=log_entry_id
-                    )
-                    print(f"DEBUG: Created system connection: {system.title} -> {connection.log_entry_id}")
-                
-                except SystemModule.DoesNotExist:
-                    print(f"DEBUG: System with ID {system_id} not found")
-                    continue
-                except ValueError as e:
-                    print(f"DEBUG: Error creating connection for system {system_id}: {e}")
-                    continue
-        else:
-            print("DEBUG: No system connections found")
+        sync_system_connections(self.object, connections)
 
     def process_learning_journey_update(self):
         """Handle learning journey (series) alignment updates."""
@@ -1053,6 +1020,7 @@ class PostStatusToggleView(BaseAdminUpdateView):
         
         post.status = new_status
         post.save()
+        queue_post_notifications(post)
         
         return JsonResponse({
             'success': True,
@@ -1260,11 +1228,14 @@ class EnhancedPostCreateView(StatusAdminCreateView):
                     self.request,
                     f'Discovery added to learning journey: {journey.title}'
                 )
+                queue_post_notifications(self.object)
                 return response
             except Series.DoesNotExist:
                 pass
         
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        queue_post_notifications(self.object)
+        return response
 
 
 class LearningJourneyListView(BaseAdminListView):
@@ -1510,6 +1481,7 @@ class SubscriberListView(BaseAdminListView):
     template_name = 'blog/admin/subscriber_list.html'
     context_object_name = 'subscribers'
     paginate_by = 25
+    keyset_ordering = ('-subscribed_at', '-id')
 
     def get_queryset(self):
         queryset = super().get_queryset().prefetch_related(
@@ -1686,19 +1658,38 @@ class SubscriberBulkActionView(BaseAdminListView, BulkActionMixin):
         })
 
 
-class SubscriberExportView(AdminAccessMixin, View):
+def _subscription_summary(row):
+    if row['subscribed_to_all']:
+        return 'All Posts'
+    return f"Categories: {', '.join(row['categories'])} | Tags: {', '.join(row['tags'])}"
+
+
+class SubscriberExport(StreamingExport):
+    fields = ('email', 'is_active', 'is_verified', 'subscribed_to_all', 'subscribed_at')
+    m2m = {
+        'categories': ('subscribed_categories', 'name'),
+        'tags': ('subscribed_tags', 'name'),
+    }
+    columns = (
+        ('Email', 'email'),
+        ('Status', lambda row: 'Active' if row['is_active'] else 'Inactive'),
+        ('Verified', lambda row: 'Yes' if row['is_verified'] else 'No'),
+        ('Subscribed To', _subscription_summary),
+        ('Date Subscribed', lambda row: row['subscribed_at'].strftime('%Y-%m-%d')),
+    )
+    filename = 'subscribers'
+
+
+class SubscriberExportView(StreamingExportView):
     """
-    Export subscriber emails as CSV.
+    Export subscribers as CSV (or JSONL with ?format=jsonl).
     """
 
-    def get(self, request, *args, **kwargs):
-        import csv
-        from django.http import HttpResponse
-
-        # Get filter params
-        status_filter = request.GET.get('status', 'all')
+    model = Subscriber
+    export_class = SubscriberExport
 
-        # Build queryset
+    def get_queryset(self):
+        status_filter = self.request.GET.get('status', 'all')
         queryset = Subscriber.objects.all()
 
         if status_filter == 'active':
@@ -1707,31 +1698,5 @@ class SubscriberExportView(AdminAccessMixin, View):
             queryset = queryset.filter(is_verified=True)
         elif status_filter == 'all_active':
             queryset = queryset.filter(is_active=True)
-        
-        # Create CSV response
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="subscribers_{timezone.now().strftime("%Y%m%d")}.csv"'
 
-        writer = csv.writer(response)
-        writer.writerow(['Email', 'Status', 'Verified', 'Subscribed To', 'Date Subscribed'])
-
-        for subscriber in queryset.select_related().prefetch_related(
-            'subscribed_categories', 'subscribed_tags'
-        ):
-            # Determin sub type
-            if subscriber.subscribed_to_all:
-                sub_type = 'All Posts'
-            else:
-                categories = list(subscriber.subscribed_categories.values_list('name', flat=True))
-                tags = list(subscriber.subscribed_tags.values_list('name', flat=True))
-                sub_type = f"Categories: {', '.join(categories)} | Tags: {', '.join(tags)}"
-            
-            writer.writerow([
-                subscriber.email,
-                'Active' if subscriber.is_active else 'Inactive',
-                'Yes' if subscriber.is_verified else 'No',
-                sub_type,
-                subscriber.subscribed_at.strftime('%Y-%m-%d')
-            ])
-        
-        return response
+        return queryset
@@ -0,0 +1,48 @@
+"""
+DataLogs API Resources
+Read-only JSON resources for published posts (see core.api)
+Version 1.0 - Posts with tags/systems, filters by category, tag and featured
+"""
+
+from django.urls import reverse
+
+from core.api import Resource
+
+from .models import Post
+
+
+class PostResource(Resource):
+    name = 'posts'
+    model = Post
+    fields = {
+        'id': 'id',
+        'title': 'title',
+        'slug': 'slug',
+        'excerpt': 'excerpt',
+        'published_date': 'published_date',
+        'updated_at': 'updated_at',
+        'reading_time': 'reading_time',
+        'featured': 'featured',
+        'category': 'category__slug',
+        'category_name': 'category__name',
+        'author': 'author__username',
+    }
+    m2m = {
+        'tags': ('tags', 'slug'),
+        'systems': ('related_systems', 'slug'),
+    }
+    computed = {'url': ('slug',)}
+    default_fields = ('id', 'title', 'slug', 'excerpt', 'published_date', 'reading_time', 'category', 'tags', 'url')
+    ordering = ('-published_date', '-id')
+    filters = {
+        'category': 'category__slug',
+        'tag': 'tags__slug',
+        'featured': 'featured',
+    }
+    content_group = 'blog'
+
+    def get_queryset(self):
+        return Post.objects.filter(status='published')
+
+    def get_url(self, row):
+        return reverse('blog:post_detail', args=[row['slug']])
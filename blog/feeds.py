@@ -0,0 +1,149 @@
+"""
+DataLog Feeds
+RSS 2.0 and Atom feeds for all DataLogs and per category, tag and series
+Version 1.0 - values() item queries; wired through core.services.syndication for caching/304s
+"""
+
+from django.contrib.syndication.views import Feed
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+
+from core.services.syndication import get_syndication_config
+
+from .models import Category, Post, Series, Tag
+
+
+# Only the columns an entry needs - no content, no model instances
+ITEM_FIELDS = ('title', 'slug', 'excerpt', 'published_date', 'updated_at', 'author__username', 'category__name')
+
+
+class LatestDataLogsFeed(Feed):
+    """Newest published DataLogs."""
+
+    title = "AURA DataLogs"
+    description = "New DataLogs from AURA - Advanced User Repository & Archive"
+
+    def link(self):
+        return reverse('blog:post_list')
+
+    def get_posts(self, obj):
+        return Post.objects.filter(status='published')
+
+    def items(self, obj=None):
+        return (
+            self.get_posts(obj)
+            .order_by('-published_date', '-pk')
+            .values(*ITEM_FIELDS)[:get_syndication_config()['FEED_ITEMS']]
+        )
+
+    def item_title(self, item):
+        return item['title']
+
+    def item_description(self, item):
+        return item['excerpt']
+
+    def item_link(self, item):
+        return reverse('blog:post_detail', args=[item['slug']])
+
+    def item_pubdate(self, item):
+        return item['published_date']
+
+    def item_updateddate(self, item):
+        return item['updated_at']
+
+    def item_author_name(self, item):
+        return item['author__username']
+
+    def item_categories(self, item):
+        return [item['category__name']] if item['category__name'] else []
+
+
+class CategoryDataLogsFeed(LatestDataLogsFeed):
+    """Newest published DataLogs in one category."""
+
+    def get_object(self, request, slug):
+        return get_object_or_404(Category.objects.only('name', 'slug', 'description'), slug=slug)
+
+    def title(self, obj):
+        return f"AURA DataLogs - {obj.name}"
+
+    def description(self, obj):
+        return obj.description or f"DataLogs filed under {obj.name}"
+
+    def link(self, obj):
+        return reverse('blog:category', args=[obj.slug])
+
+    def get_posts(self, obj):
+        return Post.objects.filter(status='published', category=obj)
+
+
+class TagDataLogsFeed(LatestDataLogsFeed):
+    """Newest published DataLogs with one tag."""
+
+    def get_object(self, request, slug):
+        return get_object_or_404(Tag, slug=slug)
+
+    def title(self, obj):
+        return f"AURA DataLogs - #{obj.name}"
+
+    def description(self, obj):
+        return f"DataLogs tagged {obj.name}"
+
+    def link(self, obj):
+        return reverse('blog:tag', args=[obj.slug])
+
+    def get_posts(self, obj):
+        return Post.objects.filter(status='published', tags=obj)
+
+
+class SeriesDataLogsFeed(LatestDataLogsFeed):
+    """Published DataLogs in a series, in reading order."""
+
+    def get_object(self, request, slug):
+        return get_object_or_404(Series.objects.only('title', 'slug', 'description'), slug=slug)
+
+    def title(self, obj):
+        return f"AURA DataLogs - {obj.title}"
+
+    def description(self, obj):
+        return obj.description or f"DataLogs in the {obj.title} series"
+
+    def link(self, obj):
+        # Series have no public page yet
+        return reverse('blog:post_list')
+
+    def items(self, obj):
+        return (
+            Post.objects.filter(status='published', series_associations__series=obj)
+            .order_by('series_associations__order', 'pk')
+            .values(*ITEM_FIELDS)[:get_syndication_config()['FEED_ITEMS']]
+        )
+
+
+# ===== ATOM VARIANTS =====
+
+class LatestDataLogsAtomFeed(LatestDataLogsFeed):
+    feed_type = Atom1Feed
+    subtitle = LatestDataLogsFeed.description
+
+
+class CategoryDataLogsAtomFeed(CategoryDataLogsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+
+class TagDataLogsAtomFeed(TagDataLogsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+
+class SeriesDataLogsAtomFeed(SeriesDataLogsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
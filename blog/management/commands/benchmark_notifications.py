@@ -0,0 +1,175 @@
+"""
+Django Management Command to Benchmark Subscriber Notification Fan-out
+File: blog/management/commands/benchmark_notifications.py
+
+Builds a throwaway test database with --subscribers subscribers spread across
+all/category/tag subscriptions (plus overlaps and inactive/unverified noise),
+publishes a post and runs the notification engine against Django's locmem
+email backend. Checks that every matching subscriber gets exactly one email
+and reports query counts and timings for the enqueue and send phases.
+
+Usage:
+    python manage.py benchmark_notifications
+    python manage.py benchmark_notifications --subscribers 50000 --batch-size 500
+"""
+
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from blog.models import Category, Post, PostNotification, Subscriber, Tag
+from blog.services.notifications import enqueue_post_notifications, send_pending_notifications
+from core.services.request_metrics import QueryRecorder
+
+
+class Command(BaseCommand):
+    help = "Benchmark new-post notification fan-out with the locmem email backend"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--subscribers',
+            type=int,
+            default=10000,
+            help='Number of subscribers to create (default: 10000)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Messages per send_messages() call (default: 200)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1234,
+            help='Random seed for subscription mix (default: 1234)',
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_db_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+                self.run_benchmark(options['subscribers'], options['batch_size'], options['seed'])
+        finally:
+            connection.creation.destroy_test_db(old_db_name, verbosity=0)
+            teardown_test_environment()
+
+    def run_benchmark(self, count, batch_size, seed):
+        rng = random.Random(seed)
+        post, expected = self.seed(count, rng)
+        self.stdout.write(f"Seeded {count} subscribers, {len(expected)} should be notified\n")
+
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            start = time.perf_counter()
+            queued = enqueue_post_notifications(post)
+            enqueue_ms = (time.perf_counter() - start) * 1000
+        self.stdout.write(f"  Enqueue: {queued} rows in {enqueue_ms:.0f}ms, {recorder.count} queries")
+
+        mail.outbox = []
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            start = time.perf_counter()
+            sent, failed = send_pending_notifications(batch_size=batch_size)
+            send_ms = (time.perf_counter() - start) * 1000
+        self.stdout.write(
+            f"  Send:    {sent} emails in {send_ms:.0f}ms, {recorder.count} queries "
+            f"({(sent + batch_size - 1) // batch_size} batches of {batch_size})"
+        )
+
+        # Re-queuing must not email anyone twice
+        requeued = enqueue_post_notifications(post)
+        resent, _ = send_pending_notifications(batch_size=batch_size)
+
+        self.check_results(expected, queued, sent, failed, resent)
+        self.stdout.write(
+            f"  Re-queue: {requeued} rows offered, {resent} extra emails sent"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {sent} notifications, {1000 * sent / max(send_ms, 1):.0f} emails/s send throughput"
+        ))
+
+    def seed(self, count, rng):
+        """Create the subscriber mix and return (post, set of emails that should be notified)."""
+        author = User.objects.create(username='benchmark-author')
+        categories = Category.objects.bulk_create(
+            [Category(name=f"Category {i}", slug=f"category-{i}", code=f"C{i}") for i in range(5)]
+        )
+        tags = Tag.objects.bulk_create([Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(10)])
+
+        post = Post.objects.create(
+            title='Benchmark Post', slug='benchmark-post', content='Benchmark content ' * 50,
+            status='published', author=author, category=categories[0],
+        )
+        post.tags.set(tags[:2])
+        post_tag_ids = {t.id for t in tags[:2]}
+
+        subscribers = Subscriber.objects.bulk_create([
+            Subscriber(
+                email=f"subscriber{i}@example.com",
+                is_active=rng.random() > 0.05,
+                is_verified=rng.random() > 0.05,
+                subscribed_to_all=rng.random() < 0.3,
+                verification_token=f"token{i:06d}",
+            )
+            for i in range(count)
+        ], batch_size=1000)
+
+        category_links = []
+        tag_links = []
+        expected = set()
+        for subscriber in subscribers:
+            chosen_categories = rng.sample(categories, rng.randint(0, 2))
+            chosen_tags = rng.sample(tags, rng.randint(0, 3))
+            category_links += [
+                Subscriber.subscribed_categories.through(subscriber_id=subscriber.id, category_id=c.id)
+                for c in chosen_categories
+            ]
+            tag_links += [
+                Subscriber.subscribed_tags.through(subscriber_id=subscriber.id, tag_id=t.id)
+                for t in chosen_tags
+            ]
+
+            wants_post = (
+                subscriber.subscribed_to_all
+                or categories[0] in chosen_categories
+                or any(t.id in post_tag_ids for t in chosen_tags)
+            )
+            if wants_post and subscriber.is_active and subscriber.is_verified:
+                expected.add(subscriber.email)
+
+        Subscriber.subscribed_categories.through.objects.bulk_create(category_links, batch_size=1000)
+        Subscriber.subscribed_tags.through.objects.bulk_create(tag_links, batch_size=1000)
+        return post, expected
+
+    def check_results(self, expected, queued, sent, failed, resent):
+        recipients = [message.to[0] for message in mail.outbox]
+        problems = []
+
+        if failed:
+            problems.append(f"{failed} sends failed")
+        if queued != len(expected) or sent != len(expected):
+            problems.append(f"queued {queued} / sent {sent}, expected {len(expected)}")
+        if len(recipients) != len(set(recipients)):
+            problems.append(f"{len(recipients) - len(set(recipients))} duplicate emails")
+        if set(recipients) != expected:
+            problems.append(f"{len(expected ^ set(recipients))} recipients differ from the expected set")
+        if resent:
+            problems.append(f"re-queuing sent {resent} duplicate emails")
+
+        stamped = Subscriber.objects.filter(last_email_sent__isnull=False).count()
+        if stamped != len(expected):
+            problems.append(f"last_email_sent set on {stamped} subscribers, expected {len(expected)}")
+        if PostNotification.objects.exclude(status='sent').exists():
+            problems.append("outbox rows left unsent")
+
+        if problems:
+            for problem in problems:
+                self.stdout.write(self.style.ERROR(f"  ❌ {problem}"))
+            raise CommandError("Notification benchmark failed")
@@ -0,0 +1,76 @@
+"""
+Django Management Command to Send New-Post Notifications
+File: blog/management/commands/send_post_notifications.py
+
+Fans out any published posts that haven't been announced yet (e.g. bulk
+published, or published with NOTIFY_ON_PUBLISH=0) and drains the
+PostNotification outbox over a single mail connection. This is the only
+place emails are delivered, so run it from cron (every few minutes).
+
+Usage:
+    python manage.py send_post_notifications
+    python manage.py send_post_notifications --dry-run
+    python manage.py send_post_notifications --retry-failed --limit 500
+"""
+
+from django.core.management.base import BaseCommand
+
+from blog.models import Post, PostNotification
+from blog.services.notifications import (
+    matching_subscribers,
+    notify_post_subscribers,
+    release_stale_claims,
+    send_pending_notifications,
+)
+
+
+class Command(BaseCommand):
+    help = "Queue and send new-post emails to matching subscribers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be queued/sent without sending anything',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Send at most this many emails this run',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Messages per send_messages() call (default: settings)',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='Move failed notifications (and ones stuck sending for over an hour) back to pending first',
+        )
+
+    def handle(self, *args, **options):
+        unannounced = Post.objects.filter(status='published', subscribers_notified_at__isnull=True)
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No emails will be sent"))
+            for post in unannounced:
+                self.stdout.write(f"  Would notify {matching_subscribers(post).count()} subscriber(s) about '{post.title}'")
+            pending = PostNotification.objects.filter(status='pending').count()
+            self.stdout.write(f"  {pending} notification(s) already pending")
+            return
+
+        if options['retry_failed']:
+            retried = PostNotification.objects.filter(status='failed').update(status='pending', attempts=0)
+            released = release_stale_claims()
+            self.stdout.write(f"Re-queued {retried} failed and {released} stuck notification(s)")
+
+        for post_id in unannounced.values_list('id', flat=True):
+            queued, _ = notify_post_subscribers(post_id, send=False)
+            self.stdout.write(f"  ✓ Queued {queued} notification(s) for post #{post_id}")
+
+        sent, failed = send_pending_notifications(batch_size=options['batch_size'], limit=options['limit'])
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Sent {sent} notification(s)"))
+        if failed:
+            self.stdout.write(self.style.ERROR(f"❌ {failed} notification(s) failed (will retry on the next run)"))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_remove_systemlogentry_actual_hours_and_more'),
+        ('projects', '0019_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['status', '-published_date'], name='blog_post_status_pubdate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('featured', True), ('status', 'published')), fields=['-published_date'], name='blog_post_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seriespost',
+            index=models.Index(fields=['series', 'order'], name='blog_seriespost_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_verified', True)), fields=['-subscribed_at'], name='subscriber_active_verif_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_posts_notified(apps, schema_editor):
+    """Posts published before the notification engine existed must not be announced now."""
+    Post = apps.get_model('blog', 'Post')
+    Post.objects.filter(status='published').update(
+        subscribers_notified_at=F('published_date')
+    )
+    Post.objects.filter(status='published', subscribers_notified_at__isnull=True).update(
+        subscribers_notified_at=F('created_at')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='subscribers_notified_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When new-post emails were queued for subscribers', null=True),
+        ),
+        migrations.CreateModel(
+            name='PostNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='blog.post')),
+                ('subscriber', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='blog.subscriber')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['id'], name='postnotification_pending_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'subscriber'), name='unique_post_notification')],
+            },
+        ),
+        migrations.RunPython(mark_existing_posts_notified, migrations.RunPython.noop),
+    ]
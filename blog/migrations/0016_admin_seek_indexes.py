@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_post_notifications'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='postview',
+            index=models.Index(fields=['-viewed_on', '-id'], name='postview_seek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(fields=['-subscribed_at', '-id'], name='subscriber_seek_idx'),
+        ),
+    ]
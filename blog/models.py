@@ -108,6 +108,9 @@ class Post(models.Model):
     reading_time = models.PositiveIntegerField(
         default=0, editable=False,
         help_text="Estimated reading time in minutes")
+    subscribers_notified_at = models.DateTimeField(
+        null=True, blank=True, editable=False,
+        help_text="When new-post emails were queued for subscribers")
     content = MarkdownxField()
 
     # Relationship Fields
@@ -129,6 +132,17 @@ class Post(models.Model):
 
     class Meta:
         ordering = ['-published_date']
+        indexes = [
+            # Published list pages / feeds: filter on status, newest first
+            models.Index(fields=['status', '-published_date'], name='blog_post_status_pubdate_idx'),
+            # Boolean filters compile to a bare column (WHERE "featured"), which SQLite
+            # can only match against a partial index, not a composite one
+            models.Index(
+                fields=['-published_date'],
+                condition=models.Q(status='published', featured=True),
+                name='blog_post_featured_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -343,6 +357,10 @@ class PostView(models.Model):
     class Meta:
         ordering = ['-viewed_on']
         unique_together = ('post', 'ip_address')
+        indexes = [
+            # Keyset pagination in the Django admin changelist
+            models.Index(fields=['-viewed_on', '-id'], name='postview_seek_idx'),
+        ]
 
     def __str__(self):
         return f"View on {self.post} from {self.ip_address}"
@@ -449,6 +467,10 @@ class SeriesPost(models.Model):
     class Meta:
         ordering = ['order']
         unique_together = ('series', 'post')
+        indexes = [
+            # Series navigation walks posts in order (post lookups use the FK index)
+            models.Index(fields=['series', 'order'], name='blog_seriespost_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.post} in {self.series} (#{self.order})"
@@ -697,6 +719,16 @@ class Subscriber(models.Model):
         ordering = ['-subscribed_at']
         verbose_name = 'Subscriber'
         verbose_name_plural = 'Subscribers'
+        indexes = [
+            # Notification recipients
+            models.Index(
+                fields=['-subscribed_at'],
+                condition=models.Q(is_active=True, is_verified=True),
+                name='subscriber_active_verif_idx',
+            ),
+            # Keyset pagination in the admin subscriber list
+            models.Index(fields=['-subscribed_at', '-id'], name='subscriber_seek_idx'),
+        ]
     
     def __str__(self):
         status = "✓" if self.is_verified else "?"
@@ -712,3 +744,43 @@ class Subscriber(models.Model):
         """Unsubscribe user"""
         self.is_active = False
         self.save()
+
+
+class PostNotification(models.Model):
+    """
+    Outbox row for one new-post email to one subscriber.
+    Rows are queued in bulk when a post publishes and drained in batches
+    by blog.services.notifications.send_pending_notifications, which claims
+    each batch (pending -> sending, stamped with its run's claim_token) so
+    overlapping runs never send the same row.
+    """
+
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    )
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='notifications')
+    subscriber = models.ForeignKey(Subscriber, on_delete=models.CASCADE, related_name='notifications')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    claim_token = models.CharField(max_length=32, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        constraints = [
+            # Re-queuing the same post never emails anyone twice
+            models.UniqueConstraint(fields=['post', 'subscriber'], name='unique_post_notification'),
+        ]
+        indexes = [
+            models.Index(fields=['id'], condition=models.Q(status='pending'), name='postnotification_pending_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.post} -> {self.subscriber.email} ({self.status})"
@@ -0,0 +1,332 @@
+"""
+Subscriber Notification Engine
+Fans new DataLog posts out to matching subscribers through an outbox table
+Version 1.2 - Claimed batches, one send_messages() and one UPDATE per batch, per-recipient failures
+"""
+
+import logging
+import smtplib
+import uuid
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.models import Post, PostNotification, Subscriber
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_NOTIFICATION_CONFIG = {
+    'ENABLED': True,
+    # Queue outbox rows as soon as a post publishes; otherwise
+    # `manage.py send_post_notifications` picks the post up. Delivery always
+    # happens in that command (cron), never in the web worker.
+    'QUEUE_ON_PUBLISH': True,
+    # Messages per send_messages() call on the shared connection
+    'BATCH_SIZE': 200,
+    # Rows per INSERT when queuing
+    'ENQUEUE_BATCH_SIZE': 1000,
+    'MAX_ATTEMPTS': 3,
+    'SITE_URL': 'http://localhost:8000',
+}
+
+# Swapped for each subscriber's link after the body is rendered once per post
+UNSUBSCRIBE_PLACEHOLDER = '__AURA_UNSUBSCRIBE_URL__'
+
+
+def get_notification_config():
+    """Merge SUBSCRIBER_NOTIFICATIONS settings over the defaults."""
+    config = DEFAULT_NOTIFICATION_CONFIG.copy()
+    config.update(getattr(settings, 'SUBSCRIBER_NOTIFICATIONS', {}))
+    return config
+
+
+# ===== RECIPIENTS & OUTBOX =====
+
+def matching_subscribers(post):
+    """
+    Active, verified subscribers who want this post, as a single query.
+
+    Category and tag subscriptions are IN-subqueries on the M2M tables rather
+    than joins, so nobody is duplicated and no DISTINCT is needed.
+    """
+    category_subscribers = Subscriber.subscribed_categories.through.objects.filter(
+        category_id=post.category_id
+    ).values('subscriber_id')
+    tag_subscribers = Subscriber.subscribed_tags.through.objects.filter(
+        tag_id__in=post.tags.values('id')
+    ).values('subscriber_id')
+
+    return Subscriber.objects.filter(is_active=True, is_verified=True).filter(
+        Q(subscribed_to_all=True)
+        | Q(id__in=category_subscribers)
+        | Q(id__in=tag_subscribers)
+    )
+
+
+def enqueue_post_notifications(post, batch_size=None):
+    """Queue one outbox row per matching subscriber. Safe to call twice. Returns rows queued."""
+    batch_size = batch_size or get_notification_config()['ENQUEUE_BATCH_SIZE']
+    subscriber_ids = matching_subscribers(post).order_by().values_list('id', flat=True)
+
+    queued = 0
+    batch = []
+    for subscriber_id in subscriber_ids.iterator(chunk_size=batch_size):
+        batch.append(PostNotification(post_id=post.pk, subscriber_id=subscriber_id))
+        if len(batch) >= batch_size:
+            PostNotification.objects.bulk_create(batch, ignore_conflicts=True)
+            queued += len(batch)
+            batch = []
+    if batch:
+        PostNotification.objects.bulk_create(batch, ignore_conflicts=True)
+        queued += len(batch)
+
+    return queued
+
+
+def claim_post_for_notification(post_id):
+    """Atomically mark a published post as notified; False if someone else already did."""
+    return Post.objects.filter(
+        pk=post_id, status='published', subscribers_notified_at__isnull=True
+    ).update(subscribers_notified_at=timezone.now()) == 1
+
+
+def notify_post_subscribers(post_id, send=True):
+    """
+    Fan a newly published post out to subscribers. Returns (queued, sent).
+
+    The claim and the outbox rows commit together, so a crash in between
+    leaves the post unclaimed for the next send_post_notifications run
+    rather than marked notified with nothing queued.
+    """
+    with transaction.atomic():
+        if not claim_post_for_notification(post_id):
+            return 0, 0
+        post = Post.objects.select_related('category').get(pk=post_id)
+        queued = enqueue_post_notifications(post)
+    logger.info(f"Queued {queued} notifications for post {post.slug}")
+
+    sent = send_pending_notifications()[0] if send else 0
+    return queued, sent
+
+
+# ===== SENDING =====
+
+class OutboxMessage(EmailMultiAlternatives):
+    """
+    An outbox row's email. Mail backends render each message (message())
+    just before handing it to the server, so `handed_off` tells how far a
+    send_messages() call got when it raised.
+    """
+
+    def __init__(self, *args, notification_id=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.notification_id = notification_id
+        self.handed_off = False
+
+    def message(self, *args, **kwargs):
+        self.handed_off = True
+        return super().message(*args, **kwargs)
+
+
+class MessageBuilder:
+    """Renders each post's email once, then stamps in per-subscriber unsubscribe links."""
+
+    def __init__(self, email_connection, site_url):
+        self.connection = email_connection
+        self.site_url = site_url.rstrip('/')
+        self._rendered = {}
+
+    def render_post(self, post):
+        if post.pk not in self._rendered:
+            context = {
+                'post': post,
+                'post_url': self.site_url + post.get_absolute_url(),
+                'unsubscribe_url': UNSUBSCRIBE_PLACEHOLDER,
+            }
+            self._rendered[post.pk] = (
+                f"New DataLog: {post.title}",
+                render_to_string('blog/emails/new_post.txt', context),
+                render_to_string('blog/emails/new_post.html', context),
+            )
+        return self._rendered[post.pk]
+
+    def build(self, notification):
+        subject, text, html = self.render_post(notification.post)
+        subscriber = notification.subscriber
+        unsubscribe_url = self.site_url + reverse('blog:unsubscribe', args=[subscriber.verification_token])
+
+        message = OutboxMessage(
+            notification_id=notification.id,
+            subject=subject,
+            body=text.replace(UNSUBSCRIBE_PLACEHOLDER, unsubscribe_url),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[subscriber.email],
+            connection=self.connection,
+            headers={'List-Unsubscribe': f'<{unsubscribe_url}>'},
+        )
+        message.attach_alternative(html.replace(UNSUBSCRIBE_PLACEHOLDER, unsubscribe_url), 'text/html')
+        return message
+
+
+def claim_batch(token, size):
+    """
+    Flip up to `size` pending rows to 'sending' under `token` and return
+    their ids. The UPDATE only matches rows still pending, so when two runs
+    pick the same ids each row goes to exactly one of them.
+    """
+    ids = list(
+        PostNotification.objects.filter(status='pending').order_by('id').values_list('id', flat=True)[:size]
+    )
+    if not ids:
+        return []
+    PostNotification.objects.filter(id__in=ids, status='pending').update(
+        status='sending', claim_token=token, claimed_at=timezone.now()
+    )
+    return list(
+        PostNotification.objects.filter(id__in=ids, status='sending', claim_token=token)
+        .order_by('id').values_list('id', flat=True)
+    )
+
+
+def release_stale_claims(older_than=timedelta(hours=1)):
+    """
+    Put rows stuck in 'sending' (a run died between send_messages() and its
+    UPDATE) back to pending. Their mail may already have gone out, so this
+    is only done on request (send_post_notifications --retry-failed).
+    """
+    return PostNotification.objects.filter(
+        status='sending', claimed_at__lt=timezone.now() - older_than
+    ).update(status='pending', claim_token='')
+
+
+def send_pending_notifications(batch_size=None, limit=None):
+    """
+    Drain the outbox over one reused mail connection.
+
+    Each batch is claimed (claim_batch), sent with one send_messages() call
+    and marked sent with one bulk UPDATE (plus one for
+    Subscriber.last_email_sent). A refused recipient fails only its own row;
+    the rest of the batch is sent on. A connection-level error stops the run:
+    messages already handed to the server are marked sent, the failing row
+    counts an attempt and the untouched rows go back to pending.
+    Returns (sent, failed).
+    """
+    config = get_notification_config()
+    batch_size = batch_size or config['BATCH_SIZE']
+    token = uuid.uuid4().hex
+
+    claimed = (
+        PostNotification.objects.select_related('post__category', 'subscriber')
+        .only(
+            'id', 'post__id', 'post__title', 'post__slug', 'post__excerpt', 'post__reading_time',
+            'post__category__name', 'subscriber__id', 'subscriber__email', 'subscriber__verification_token',
+        )
+        .order_by('id')
+    )
+
+    sent = failed = 0
+    email_connection = get_connection()
+    builder = MessageBuilder(email_connection, config['SITE_URL'])
+
+    email_connection.open()
+    try:
+        while limit is None or sent + failed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - sent - failed)
+            ids = claim_batch(token, size)
+            if not ids:
+                break
+
+            batch = list(claimed.filter(id__in=ids))
+            messages = [builder.build(notification) for notification in batch]
+            subscriber_ids = {notification.id: notification.subscriber_id for notification in batch}
+
+            batch_sent, batch_failed, stop = _send_batch(email_connection, messages, subscriber_ids, config)
+            sent += batch_sent
+            failed += batch_failed
+            if stop:
+                break
+    finally:
+        email_connection.close()
+
+    return sent, failed
+
+
+def _send_batch(email_connection, messages, subscriber_ids, config):
+    """Send one claimed batch; returns (sent, failed, stop the run)."""
+    sent = failed = 0
+    while messages:
+        error = None
+        try:
+            email_connection.send_messages(messages)
+            delivered, remaining = messages, []
+        except (smtplib.SMTPException, OSError) as e:
+            error = e
+            handed_off = [message for message in messages if message.handed_off]
+            # The last message handed off is the one that raised
+            delivered, failing = handed_off[:-1], handed_off[-1:]
+            remaining = [message for message in messages if not message.handed_off]
+
+        if delivered:
+            _mark_sent(delivered, subscriber_ids)
+            sent += len(delivered)
+        if error is None:
+            break
+
+        refused = isinstance(error, smtplib.SMTPRecipientsRefused)
+        if failing:
+            _record_failure(failing[0].notification_id, error, config, refused)
+            failed += 1
+            logger.warning(f"Notification {failing[0].notification_id} failed: {error}")
+        if not refused:
+            # The connection itself is gone; leave the untouched rows for the next run
+            PostNotification.objects.filter(id__in=[m.notification_id for m in remaining]).update(
+                status='pending', claim_token=''
+            )
+            return sent, failed, True
+        messages = remaining
+
+    return sent, failed, False
+
+
+def _mark_sent(messages, subscriber_ids):
+    now = timezone.now()
+    ids = [message.notification_id for message in messages]
+    PostNotification.objects.filter(id__in=ids).update(
+        status='sent', sent_at=now, attempts=F('attempts') + 1, error=''
+    )
+    Subscriber.objects.filter(id__in=[subscriber_ids[pk] for pk in ids]).update(last_email_sent=now)
+
+
+def _record_failure(notification_id, error, config, refused):
+    """A refused address won't start working on retry; anything else is retried up to MAX_ATTEMPTS."""
+    row = PostNotification.objects.filter(id=notification_id)
+    row.update(attempts=F('attempts') + 1, error=str(error), status='pending', claim_token='')
+    if refused:
+        row.update(status='failed')
+    else:
+        row.filter(attempts__gte=config['MAX_ATTEMPTS']).update(status='failed')
+
+
+# ===== PUBLISH HOOK =====
+
+def queue_post_notifications(post):
+    """
+    Call after a post (and its tags) are saved. If it was just published,
+    queue its outbox rows once the transaction commits; send_post_notifications
+    (cron) delivers them.
+    """
+    config = get_notification_config()
+    if not config['ENABLED'] or not config['QUEUE_ON_PUBLISH']:
+        return
+    if post.status != 'published' or post.subscribers_notified_at:
+        return
+
+    transaction.on_commit(partial(notify_post_subscribers, post.pk, send=False))
@@ -0,0 +1,144 @@
+"""
+Post Relationship Sync
+Set-based syncing of a post's tags and system connections from admin input
+Version 1.0 - Diff desired vs current, bulk writes, one-query log ID allocation
+"""
+
+import logging
+import re
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import slugify
+
+from blog.models import SystemLogEntry, Tag
+from projects.models import SystemModule
+
+logger = logging.getLogger(__name__)
+
+LOG_NUMBER_RE = re.compile(r'-LOG-(\d+)$')
+
+
+# ===== TAGS =====
+
+def parse_tag_names(raw):
+    """'Django, REST api' -> ['django', 'rest-api'], de-duplicated, input order kept."""
+    names = (tag.strip().lower().replace(' ', '-') for tag in raw.split(','))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def sync_post_tags(post, tag_names):
+    """
+    Make post.tags exactly `tag_names`, creating missing tags.
+
+    One lookup for existing tags, one INSERT for new ones and a single set()
+    (which itself only adds/removes the difference). Returns the tag list.
+    """
+    slugs = {name: slugify(name) for name in tag_names}
+
+    # Match on name first, then slug - an existing "Python" tag owns slug "python"
+    existing = Tag.objects.filter(Q(name__in=tag_names) | Q(slug__in=slugs.values()))
+    by_name = {tag.name: tag for tag in existing}
+    by_slug = {tag.slug: tag for tag in existing}
+
+    missing = [name for name in tag_names if name not in by_name and slugs[name] not in by_slug]
+    if missing:
+        Tag.objects.bulk_create(
+            [Tag(name=name, slug=slugs[name]) for name in missing],
+            ignore_conflicts=True,
+        )
+        # ignore_conflicts doesn't hand back pks; re-read (also picks up concurrent inserts)
+        by_slug.update((tag.slug, tag) for tag in Tag.objects.filter(slug__in=[slugs[n] for n in missing]))
+
+    tags = [by_name.get(name) or by_slug[slugs[name]] for name in tag_names]
+    post.tags.set(tags)
+    return tags
+
+
+# ===== SYSTEM CONNECTIONS =====
+
+def allocate_log_entry_ids(system_ids):
+    """
+    Next HUD log ID per system, e.g. {7: 'SYS-007-LOG-004'}.
+
+    Reads every system's existing IDs in one query and continues from the
+    highest number, so deleted entries can't cause a repeat. Call inside a
+    transaction that has locked the systems (see sync_system_connections).
+    """
+    highest = dict.fromkeys(system_ids, 0)
+    entries = dict.fromkeys(system_ids, 0)
+    rows = SystemLogEntry.objects.filter(system_id__in=system_ids).values_list('system_id', 'log_entry_id')
+    for system_id, log_entry_id in rows:
+        match = LOG_NUMBER_RE.search(log_entry_id or '')
+        if match:
+            highest[system_id] = max(highest[system_id], int(match.group(1)))
+        entries[system_id] += 1
+
+    # Entries without a parseable ID still count towards the sequence
+    return {
+        system_id: f"SYS-{system_id:03d}-LOG-{max(highest[system_id], entries[system_id]) + 1:03d}"
+        for system_id in system_ids
+    }
+
+
+def sync_system_connections(post, connections):
+    """
+    Make the post's SystemLogEntry rows match `connections`.
+
+    `connections` maps system id -> {'connection_type': ..., 'relationship_priority': ...}.
+    Unknown system ids are ignored. Kept connections keep their log ID; changed
+    ones are bulk-updated, dropped ones deleted in one query and new ones
+    bulk-created with IDs allocated under a row lock on their systems.
+    Returns (created, updated, removed).
+    """
+    with transaction.atomic():
+        # Locking the systems serialises log ID allocation per system
+        system_ids = list(
+            SystemModule.objects.select_for_update()
+            .filter(id__in=list(connections))
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        unknown = set(connections) - set(system_ids)
+        if unknown:
+            logger.debug(f"Ignoring unknown system ids {sorted(unknown)} for post {post.pk}")
+
+        current = {entry.system_id: entry for entry in SystemLogEntry.objects.filter(post=post)}
+
+        removed = [entry.pk for system_id, entry in current.items() if system_id not in system_ids]
+        if removed:
+            SystemLogEntry.objects.filter(pk__in=removed).delete()
+
+        changed = []
+        now = timezone.now()
+        for system_id in system_ids:
+            entry = current.get(system_id)
+            if entry is None:
+                continue
+            wanted = connections[system_id]
+            if (entry.connection_type, entry.relationship_priority) != (
+                wanted['connection_type'], wanted['relationship_priority']
+            ):
+                entry.connection_type = wanted['connection_type']
+                entry.relationship_priority = wanted['relationship_priority']
+                entry.updated_at = now
+                changed.append(entry)
+        if changed:
+            SystemLogEntry.objects.bulk_update(changed, ['connection_type', 'relationship_priority', 'updated_at'])
+
+        new_ids = [system_id for system_id in system_ids if system_id not in current]
+        if new_ids:
+            log_ids = allocate_log_entry_ids(new_ids)
+            SystemLogEntry.objects.bulk_create([
+                SystemLogEntry(
+                    post=post,
+                    system_id=system_id,
+                    connection_type=connections[system_id]['connection_type'],
+                    relationship_priority=connections[system_id]['relationship_priority'],
+                    log_entry_id=log_ids[system_id],
+                )
+                for system_id in new_ids
+            ])
+
+    return len(new_ids), len(changed), len(removed)
@@ -1,3 +1,196 @@
-from django.test import TestCase
+import random
+import smtplib
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Category, Post, PostNotification, Subscriber, Tag
+from blog.services import notifications
+from blog.services.notifications import (
+    claim_batch,
+    enqueue_post_notifications,
+    notify_post_subscribers,
+    queue_post_notifications,
+    send_pending_notifications,
+)
+
+
+class SMTPLikeBackend(EmailBackend):
+    """
+    locmem, but failing the way smtplib does: messages go out one at a time,
+    REFUSED addresses raise SMTPRecipientsRefused and the DISCONNECT_AT-th
+    message drops the connection.
+    """
+
+    REFUSED = set()
+    DISCONNECT_AT = None
+
+    def send_messages(self, messages):
+        count = 0
+        for message in messages:
+            message.message()
+            if message.to[0] in self.REFUSED:
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b'No such user')})
+            if self.DISCONNECT_AT is not None and len(mail.outbox) + 1 == self.DISCONNECT_AT:
+                raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+            mail.outbox.append(message)
+            count += 1
+        return count
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class PostNotificationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(username='author')
+        cls.categories = Category.objects.bulk_create(
+            [Category(name=f"Category {i}", slug=f"category-{i}", code=f"C{i}") for i in range(5)]
+        )
+        cls.tags = Tag.objects.bulk_create([Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(10)])
+        cls.post = Post.objects.create(
+            title='New Post', slug='new-post', content='Content ' * 50,
+            status='published', author=cls.author, category=cls.categories[0],
+        )
+        cls.post.tags.set(cls.tags[:2])
+
+    def setUp(self):
+        SMTPLikeBackend.REFUSED = set()
+        SMTPLikeBackend.DISCONNECT_AT = None
+
+    def create_subscribers(self, count, seed=1234):
+        """A mix of all/category/tag/inactive/unverified subscribers; returns the emails that should be notified."""
+        rng = random.Random(seed)
+        subscribers = Subscriber.objects.bulk_create([
+            Subscriber(
+                email=f"subscriber{i}@example.com",
+                is_active=rng.random() > 0.05,
+                is_verified=rng.random() > 0.05,
+                subscribed_to_all=rng.random() < 0.3,
+                verification_token=f"token{i:06d}",
+            )
+            for i in range(count)
+        ], batch_size=1000)
+
+        post_tag_ids = {tag.id for tag in self.tags[:2]}
+        category_links, tag_links, expected = [], [], set()
+        for subscriber in subscribers:
+            chosen_categories = rng.sample(self.categories, rng.randint(0, 2))
+            chosen_tags = rng.sample(self.tags, rng.randint(0, 3))
+            category_links += [
+                Subscriber.subscribed_categories.through(subscriber_id=subscriber.id, category_id=category.id)
+                for category in chosen_categories
+            ]
+            tag_links += [
+                Subscriber.subscribed_tags.through(subscriber_id=subscriber.id, tag_id=tag.id)
+                for tag in chosen_tags
+            ]
+            wants_post = (
+                subscriber.subscribed_to_all
+                or self.categories[0] in chosen_categories
+                or any(tag.id in post_tag_ids for tag in chosen_tags)
+            )
+            if wants_post and subscriber.is_active and subscriber.is_verified:
+                expected.add(subscriber.email)
+
+        Subscriber.subscribed_categories.through.objects.bulk_create(category_links, batch_size=1000)
+        Subscriber.subscribed_tags.through.objects.bulk_create(tag_links, batch_size=1000)
+        return expected
+
+    def recipients(self):
+        return [message.to[0] for message in mail.outbox]
+
+    def test_10k_subscribers_each_notified_once_in_batches(self):
+        expected = self.create_subscribers(10_000)
+
+        self.assertEqual(enqueue_post_notifications(self.post), len(expected))
+        with CaptureQueriesContext(connection) as queries:
+            sent, failed = send_pending_notifications(batch_size=500)
+
+        self.assertEqual((sent, failed), (len(expected), 0))
+        self.assertEqual(sorted(self.recipients()), sorted(expected))
+        # Claim (3) + load + two bulk UPDATEs per batch, not one UPDATE per email
+        batches = -(-len(expected) // 500)
+        self.assertLessEqual(len(queries), batches * 6 + 2)
+        self.assertFalse(PostNotification.objects.exclude(status='sent').exists())
+        self.assertEqual(Subscriber.objects.filter(last_email_sent__isnull=False).count(), len(expected))
+
+    def test_requeue_sends_nothing_twice(self):
+        expected = self.create_subscribers(300)
+        enqueue_post_notifications(self.post)
+        send_pending_notifications()
+
+        enqueue_post_notifications(self.post)
+        self.assertEqual(send_pending_notifications(), (0, 0))
+        self.assertEqual(len(self.recipients()), len(expected))
+
+    def test_overlapping_runs_claim_disjoint_rows(self):
+        self.create_subscribers(200)
+        enqueue_post_notifications(self.post)
+
+        first = claim_batch('run-a', 50)
+        second = claim_batch('run-b', 50)
+        self.assertEqual(len(first), 50)
+        self.assertFalse(set(first) & set(second))
+
+        # A run only sends what it claimed; the other run's rows stay with it
+        send_pending_notifications()
+        self.assertEqual(PostNotification.objects.filter(status='sending').count(), 100)
+
+    @override_settings(EMAIL_BACKEND='blog.tests.SMTPLikeBackend')
+    def test_refused_recipient_fails_only_its_row(self):
+        expected = self.create_subscribers(300)
+        refused = sorted(expected)[5]
+        SMTPLikeBackend.REFUSED = {refused}
+        enqueue_post_notifications(self.post)
+
+        sent, failed = send_pending_notifications(batch_size=50)
+
+        self.assertEqual((sent, failed), (len(expected) - 1, 1))
+        self.assertEqual(set(self.recipients()), expected - {refused})
+        row = PostNotification.objects.get(subscriber__email=refused)
+        self.assertEqual((row.status, row.attempts), ('failed', 1))
+
+    @override_settings(EMAIL_BACKEND='blog.tests.SMTPLikeBackend')
+    def test_disconnect_keeps_delivered_rows_sent(self):
+        expected = self.create_subscribers(300)
+        SMTPLikeBackend.DISCONNECT_AT = 30
+        enqueue_post_notifications(self.post)
+
+        self.assertEqual(send_pending_notifications(batch_size=50), (29, 1))
+        self.assertEqual(PostNotification.objects.filter(status='sent').count(), 29)
+        self.assertFalse(PostNotification.objects.filter(status='sending').exists())
+
+        SMTPLikeBackend.DISCONNECT_AT = None
+        send_pending_notifications(batch_size=50)
+        recipients = self.recipients()
+        self.assertEqual(len(recipients), len(set(recipients)))
+        self.assertEqual(set(recipients), expected)
+
+    def test_claim_rolls_back_with_failed_enqueue(self):
+        self.create_subscribers(50)
+        Post.objects.filter(pk=self.post.pk).update(subscribers_notified_at=None)
+
+        with mock.patch.object(notifications, 'enqueue_post_notifications', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                notify_post_subscribers(self.post.pk, send=False)
+
+        self.post.refresh_from_db()
+        self.assertIsNone(self.post.subscribers_notified_at)
+        self.assertGreater(notify_post_subscribers(self.post.pk, send=False)[0], 0)
+
+    def test_publish_hook_queues_without_sending(self):
+        expected = self.create_subscribers(100)
+        Post.objects.filter(pk=self.post.pk).update(subscribers_notified_at=None)
+        self.post.refresh_from_db()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_post_notifications(self.post)
+
+        self.assertEqual(PostNotification.objects.filter(status='pending').count(), len(expected))
+        self.assertEqual(mail.outbox, [])
@@ -1,7 +1,12 @@
 from django.urls import path, include
 from . import views
+from . import feeds
+from core.services.syndication import syndicated
 from django.views.generic import TemplateView
 
+# Feeds are cached per blog content generation and answer repeat polls with 304s
+blog_feed = syndicated('blog')
+
 urlpatterns = [
     # Public blog urls - Post views
     path("", views.PostListView.as_view(), name="post_list"),
@@ -19,6 +24,16 @@ urlpatterns = [
     path("tags/", views.TagListView.as_view(), name="tag_list"),
     path("tag/<slug:slug>/", views.TagView.as_view(), name="tag"),
     
+    # RSS/Atom feeds
+    path("feed/", blog_feed(feeds.LatestDataLogsFeed()), name="feed"),
+    path("feed/atom/", blog_feed(feeds.LatestDataLogsAtomFeed()), name="feed_atom"),
+    path("category/<slug:slug>/feed/", blog_feed(feeds.CategoryDataLogsFeed()), name="category_feed"),
+    path("category/<slug:slug>/feed/atom/", blog_feed(feeds.CategoryDataLogsAtomFeed()), name="category_feed_atom"),
+    path("tag/<slug:slug>/feed/", blog_feed(feeds.TagDataLogsFeed()), name="tag_feed"),
+    path("tag/<slug:slug>/feed/atom/", blog_feed(feeds.TagDataLogsAtomFeed()), name="tag_feed_atom"),
+    path("series/<slug:slug>/feed/", blog_feed(feeds.SeriesDataLogsFeed()), name="series_feed"),
+    path("series/<slug:slug>/feed/atom/", blog_feed(feeds.SeriesDataLogsAtomFeed()), name="series_feed_atom"),
+
     # Archive views
     path("archive/", views.ArchiveIndexView.as_view(), name="archive"),
     
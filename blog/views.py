@@ -22,6 +22,7 @@ from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
 from django.conf import settings
+from core.api import get_api_config
 
 
 from datetime import datetime, timedelta, date
@@ -1533,8 +1534,14 @@ def get_bookmarked_posts(request):
                 'posts': []
             })
         
-        # Convert comma-separated string to list of ints
+        # Convert comma-separated string to list of ints (capped like the /api/v1/ ids filter)
+        max_ids = get_api_config()['MAX_IDS']
         id_list = [int(id.strip()) for id in post_ids.split(',') if id.strip().isdigit()]
+        if len(id_list) > max_ids:
+            return JsonResponse({
+                'success': False,
+                'message': f'At most {max_ids} bookmarks can be loaded at once'
+            }, status=400)
 
         # Fetch posts
         posts = Post.objects.filter(
@@ -45,6 +45,7 @@ from .admin_views import (
     ContactMarkReadView,
     ContactMarkResponseSentView,
     ContactDetailAdminView,
+    ContactExportView,
     # Social Link Management
     SocialLinkListAdminView,
     SocialLinkCreateAdminView,
@@ -56,6 +57,8 @@ from .admin_views import (
     PortfolioAnalyticsUpdateAdminView,
     PortfolioAnalyticsDeleteAdminView,
     AnalyticsChartDataView,
+    PortfolioAnalyticsExportView,
+    PerformanceMonitorView,
     # SkillTechnologyRelation Management
     SkillTechnologyRelationListAdminView,
     SkillTechnologyRelationCreateAdminView,
@@ -140,6 +143,7 @@ urlpatterns = [
     
     path("contacts/", ContactListAdminView.as_view(), name="contact_list"),
     path("contacts/create/", ContactCreateAdminView.as_view(), name="contact_create"),
+    path("contacts/export/", ContactExportView.as_view(), name="contact_export"),
     path("contacts/<int:pk>/", ContactDetailAdminView.as_view(), name="contact_detail"),
     path("contacts/<int:pk>/edit/", ContactUpdateAdminView.as_view(), name="contact_update"),
     path("contacts/<int:pk>/delete/", ContactDeleteAdminView.as_view(), name="contact_delete"),
@@ -163,12 +167,19 @@ urlpatterns = [
     
     path("analytics/", PortfolioAnalyticsListAdminView.as_view(), name="analytics_list"),
     path("analytics/create/", PortfolioAnalyticsCreateAdminView.as_view(), name="analytics_create"),
+    path("analytics/export/", PortfolioAnalyticsExportView.as_view(), name="analytics_export"),
     path("analytics/<int:pk>/edit/", PortfolioAnalyticsUpdateAdminView.as_view(), name="analytics_update"),
     path("analytics/<int:pk>/delete/", PortfolioAnalyticsDeleteAdminView.as_view(), name="analytics_delete"),
     
     # Analytics AJAX functionality
     path("analytics/chart-data/", AnalyticsChartDataView.as_view(), name="analytics_chart_data"),
 
+    # ===================
+    # PERFORMANCE MONITORING
+    # ===================
+
+    path("perf/", PerformanceMonitorView.as_view(), name="performance_monitoring"),
+
     # ===================
     # SKILL-TECHNOLOGY RELATIONSHIP MANAGEMENT
     # ===================
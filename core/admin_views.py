@@ -21,14 +21,16 @@ from django.http import JsonResponse
 from django.db.models import Q, Count, Avg, Sum
 from django.utils import timezone
 from django.utils.text import slugify
-from django.core.paginator import Paginator
+from django.core.paginator import InvalidPage, Paginator
 from django.shortcuts import redirect, get_object_or_404, render
 
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse
 
 
 from datetime import datetime, timedelta
 
+from .pagination import KeysetPaginator, cached_total_count
+from .services.exports import StreamingExport
 from .models import CorePage, Skill, Education, EducationSkillDevelopment, Experience, Contact, SocialLink, PortfolioAnalytics, SkillTechnologyRelation, ExperienceSkillApplication
 from .forms import CorePageForm, SkillForm, EducationForm, EducationSkillDevelopmentForm, ExperienceForm, ContactAdminForm, SocialLinkForm, PortfolioAnalyticsForm, SkillTechnologyRelationForm, ExperienceSkillApplicationFormSet
 from projects.models import ArchitectureComponent, ArchitectureConnection, SystemModule, Technology
@@ -159,11 +161,17 @@ class BaseAdminView:
 
 
 class BaseAdminListView(AdminAccessMixin, BaseAdminView, ListView):
-    """Base list view for admin interface."""
+    """
+    Base list view for admin interface.
+
+    Set keyset_ordering (e.g. ("-created_at", "-id")) on views over large
+    tables to page with cursors instead of OFFSET - see core.pagination.
+    """
     
     template_name = 'admin/list.html'
     context_object_name = 'objects'
     paginate_by = 25
+    keyset_ordering = None
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -174,13 +182,51 @@ class BaseAdminListView(AdminAccessMixin, BaseAdminView, ListView):
                 "can_add": self.get_can_add(),
                 "search_query": self.request.GET.get("search", ""),
                 "status_filter": self.request.GET.get("status", ""),
-                "total_count": self.get_base_queryset().count(),
-                "filtered_count": self.get_queryset().count(),
+                **self.get_counts(context),
             }
         )
 
         return context
 
+    def get_counts(self, context):
+        """
+        total_count / filtered_count without re-counting: the paginator has
+        already counted the filtered list, and when no filter narrows it that
+        is also the total. Otherwise the unfiltered total comes from a short cache.
+        """
+        paginator = context.get("paginator")
+        filtered_count = paginator.count if paginator else len(context["object_list"])
+
+        base = self.get_base_queryset()
+        if self.object_list.query.where == base.query.where:
+            total_count = filtered_count
+        else:
+            total_count = cached_total_count(base)
+
+        return {"total_count": total_count, "filtered_count": filtered_count}
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        if self.keyset_ordering:
+            return KeysetPaginator(
+                queryset, per_page, orphans=orphans,
+                allow_empty_first_page=allow_empty_first_page, ordering=self.keyset_ordering,
+            )
+        return super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.keyset_ordering:
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = self.get_paginator(
+            queryset, page_size, orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        try:
+            page = paginator.page_from_request(self.request, self.page_kwarg)
+        except InvalidPage as e:
+            raise Http404(f"Invalid page: {e}")
+        return (paginator, page, page.object_list, page.has_other_pages())
+
     def get_can_add(self):
         """Override to control add permissions per model."""
         return True
@@ -336,6 +382,23 @@ class BulkActionMixin:
         return redirect(request.path)
 
 
+class StreamingExportView(AdminAccessMixin, View):
+    """
+    Stream a queryset as CSV (default) or JSONL (?format=jsonl).
+    Subclasses set export_class and override get_queryset() for filters.
+    """
+
+    export_class = None
+    model = None
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def get(self, request, *args, **kwargs):
+        export = self.export_class(self.get_queryset())
+        return export.response(request.GET.get("format", "csv"))
+
+
 class MainAdminDashboardView(AdminAccessMixin, TemplateView):
     """Main admin dashboard with overview statistics."""
 
@@ -1161,12 +1224,8 @@ class ExperienceDeleteAdminView(BaseAdminDeleteView):
 # ===================
 
 
-class ContactListAdminView(BaseAdminListView, BulkActionMixin):
-    """Manage contact form submissions w bulk actions."""
-
-    model = Contact
-    template_name = "core/admin/contact_list.html"
-    context_object_name = "contacts"
+class ContactFilterMixin:
+    """Search and read/category/priority filters shared by the contact list and its export."""
 
     def get_queryset(self):
         queryset = Contact.objects.order_by("-created_at")
@@ -1198,6 +1257,15 @@ class ContactListAdminView(BaseAdminListView, BulkActionMixin):
 
         return queryset
 
+
+class ContactListAdminView(ContactFilterMixin, BaseAdminListView, BulkActionMixin):
+    """Manage contact form submissions w bulk actions."""
+
+    model = Contact
+    template_name = "core/admin/contact_list.html"
+    context_object_name = "contacts"
+    keyset_ordering = ("-created_at", "-id")
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context.update(
@@ -1493,12 +1561,8 @@ class SocialLinkDeleteAdminView(BaseAdminDeleteView):
 # ===================
 
 
-class PortfolioAnalyticsListAdminView(BaseAdminListView, BulkActionMixin):
-    """Manage portfolio analytics entries."""
-
-    model = PortfolioAnalytics
-    template_name = "core/admin/analytics_list.html"
-    context_object_name = "analytics"
+class PortfolioAnalyticsFilterMixin:
+    """Date range filter shared by the analytics list and its export."""
 
     def get_queryset(self):
         queryset = PortfolioAnalytics.objects.select_related(
@@ -1522,6 +1586,14 @@ class PortfolioAnalyticsListAdminView(BaseAdminListView, BulkActionMixin):
 
         return queryset
 
+
+class PortfolioAnalyticsListAdminView(PortfolioAnalyticsFilterMixin, BaseAdminListView, BulkActionMixin):
+    """Manage portfolio analytics entries."""
+
+    model = PortfolioAnalytics
+    template_name = "core/admin/analytics_list.html"
+    context_object_name = "analytics"
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
@@ -1583,6 +1655,53 @@ class PortfolioAnalyticsDeleteAdminView(BaseAdminDeleteView):
 # ===================
 
 
+class ContactExport(StreamingExport):
+    fields = (
+        "name", "email", "subject", "message", "inquiry_category", "priority",
+        "is_read", "response_sent", "response_date", "referrer_page", "created_at",
+    )
+    columns = (
+        ("Name", "name"),
+        ("Email", "email"),
+        ("Subject", "subject"),
+        ("Message", "message"),
+        ("Category", "inquiry_category"),
+        ("Priority", "priority"),
+        ("Read", "is_read"),
+        ("Response Sent", "response_sent"),
+        ("Response Date", "response_date"),
+        ("Referrer", "referrer_page"),
+        ("Received", "created_at"),
+    )
+    filename = "contacts"
+
+
+class ContactExportView(ContactFilterMixin, StreamingExportView):
+    """Export contacts with the same filters as the contact list."""
+
+    model = Contact
+    export_class = ContactExport
+
+
+class PortfolioAnalyticsExport(StreamingExport):
+    fields = (
+        "date", "learning_hours_logged", "datalog_entries_written", "skills_practiced",
+        "projects_worked_on", "milestones_achieved", "unique_visitors", "page_views",
+        "datalog_views", "system_views", "contact_form_submissions", "github_clicks",
+        "resume_downloads", "top_datalog__title", "top_system__title", "top_country",
+        "top_referrer", "bounce_rate", "avg_session_duration",
+    )
+    columns = tuple((field.replace("__", " ").replace("_", " ").title(), field) for field in fields)
+    filename = "portfolio_analytics"
+
+
+class PortfolioAnalyticsExportView(PortfolioAnalyticsFilterMixin, StreamingExportView):
+    """Export analytics days with the same date range filter as the list."""
+
+    model = PortfolioAnalytics
+    export_class = PortfolioAnalyticsExport
+
+
 class ContactMarkReadView(AdminAccessMixin, TemplateView):
     """AJAX view to mark contact as read."""
 
@@ -1667,6 +1786,41 @@ class AnalyticsChartDataView(AdminAccessMixin, TemplateView):
 
         return JsonResponse(chart_data)
 
+class PerformanceMonitorView(AdminAccessMixin, TemplateView):
+    """Rolling per-URL request timings collected by QueryTimingMiddleware."""
+
+    template_name = "core/admin/performance_monitor.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        from .services.request_metrics import get_perf_config, request_metrics
+
+        rows = request_metrics.summary()
+        config = get_perf_config()
+
+        context.update({
+            "title": "Performance Monitor",
+            "admin_section": True,
+            "perf_rows": rows,
+            "perf_config": config,
+            "perf_totals": {
+                "endpoints": len(rows),
+                "requests": sum(row["requests"] for row in rows),
+                "slow_endpoints": sum(1 for row in rows if row["p95_ms"] >= config["SLOW_REQUEST_MS"]),
+                "n_plus_one_endpoints": sum(1 for row in rows if row["duplicates_max"] > 0),
+            },
+        })
+        return context
+
+    def post(self, request, *args, **kwargs):
+        """Clear the ring buffer."""
+        from .services.request_metrics import request_metrics
+
+        request_metrics.reset()
+        messages.success(request, "Performance samples cleared.")
+        return redirect("aura_admin:performance_monitoring")
+
+
 # ========= INTEGRATION - REWORK ===========
 
 class ProfessionalDevelopmentDashboardView(AdminAccessMixin, TemplateView):
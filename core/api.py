@@ -0,0 +1,256 @@
+"""
+Read-only JSON API
+Declarative .values()-based resources for the front-end and external consumers
+Version 1.0 - ?fields= sparse fieldsets, cursor pagination, capped ?ids=, ETag/Cache-Control
+"""
+
+from functools import wraps
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.http import Http404, JsonResponse
+from django.urls import path
+from django.utils.cache import patch_cache_control
+from django.utils.http import urlencode
+from django.views import View
+
+from .pagination import KeysetPaginator
+from .services.syndication import syndicated
+
+
+DEFAULT_API_CONFIG = {
+    'PAGE_SIZE': 20,
+    'MAX_PAGE_SIZE': 100,
+    'MAX_IDS': 100,        # ?ids= longer than this is rejected
+    'CACHE_MAX_AGE': 60,   # Cache-Control max-age (ETags make revalidation cheap after that)
+}
+
+TRUE_VALUES = ('1', 'true', 'yes')
+
+
+def get_api_config():
+    """Merge API settings over the defaults."""
+    config = DEFAULT_API_CONFIG.copy()
+    config.update(getattr(settings, 'API', {}))
+    return config
+
+
+class ApiError(Exception):
+    """Bad request parameters; rendered as {"error": ...} with a 400."""
+
+
+def parse_ids(raw, max_ids=None):
+    """'1,2,3' -> [1, 2, 3]; ApiError on junk or more than MAX_IDS ids."""
+    max_ids = max_ids or get_api_config()['MAX_IDS']
+    parts = [part.strip() for part in raw.split(',') if part.strip()]
+    if len(parts) > max_ids:
+        raise ApiError(f"At most {max_ids} ids per request")
+    if not all(part.isdigit() for part in parts):
+        raise ApiError("ids must be a comma-separated list of integers")
+    return [int(part) for part in dict.fromkeys(parts)]
+
+
+class Resource:
+    """
+    A read-only collection of one model.
+
+    Subclasses set:
+      model          - the model
+      fields         - {public name: .values() path} ('category__slug' etc. are fine)
+      m2m            - {public name: (m2m field, label field)}, one extra query per page
+      computed       - {public name: (public fields it needs)}; value from get_<name>(row)
+      default_fields - what a response contains without ?fields=
+      ordering       - stable ordering; the pk is appended as tie-breaker for cursors
+      filters        - {query param: ORM lookup}; values 'true'/'false' work for booleans
+      lookup_field / lookup_converter - detail URL: <converter:lookup>
+      content_group  - core.services.syndication group whose changes invalidate responses
+    """
+
+    name = None
+    model = None
+    fields = {}
+    m2m = {}
+    computed = {}
+    default_fields = ()
+    ordering = ('-pk',)
+    filters = {}
+    lookup_field = 'slug'
+    lookup_converter = 'slug'
+    content_group = None
+
+    def get_queryset(self):
+        return self.model.objects.all()
+
+    # ===== FIELDS =====
+
+    @property
+    def available_fields(self):
+        return [*self.fields, *self.m2m, *self.computed]
+
+    def parse_fields(self, raw):
+        if not raw:
+            return list(self.default_fields)
+        names = list(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+        unknown = [name for name in names if name not in self.available_fields]
+        if unknown:
+            raise ApiError(
+                f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(self.available_fields)}"
+            )
+        return names
+
+    def value_paths(self, names):
+        """.values() paths needed to produce `names` (computed fields pull in their inputs)."""
+        wanted = set(names)
+        for name in names:
+            wanted.update(self.computed.get(name, ()))
+        return {name: self.fields[name] for name in self.fields if name in wanted}
+
+    # ===== ROWS =====
+
+    def filter_queryset(self, queryset, params):
+        for param, lookup in self.filters.items():
+            value = params.get(param)
+            if value in (None, ''):
+                continue
+            if lookup.endswith('__in'):
+                value = [part for part in value.split(',') if part]
+            elif self.model._meta.get_field(lookup.split('__')[0]).get_internal_type() == 'BooleanField':
+                value = value.lower() in TRUE_VALUES
+            queryset = queryset.filter(**{lookup: value})
+        if params.get('ids'):
+            queryset = queryset.filter(pk__in=parse_ids(params['ids']))
+        return queryset
+
+    def values_queryset(self, queryset, names, extra=()):
+        paths = self.value_paths(names)
+        return queryset.values('pk', *dict.fromkeys([*paths.values(), *extra]))
+
+    def attach_m2m(self, rows, names):
+        """Fill each requested M2M field with one through-table query for the whole page."""
+        requested = [name for name in names if name in self.m2m]
+        if not rows or not requested:
+            return
+        pks = [row['pk'] for row in rows]
+        for name in requested:
+            field_name, label_field = self.m2m[name]
+            field = self.model._meta.get_field(field_name)
+            owner, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+            labels = {}
+            pairs = (
+                field.remote_field.through.objects.filter(**{f'{owner}__in': pks})
+                .order_by(owner, f'{target}__{label_field}')
+                .values_list(owner, f'{target}__{label_field}')
+            )
+            for owner_pk, label in pairs:
+                labels.setdefault(owner_pk, []).append(label)
+            for row in rows:
+                row[name] = labels.get(row['pk'], [])
+
+    def render(self, row, names):
+        """Raw .values() row -> public dict with exactly `names`, in that order."""
+        paths = self.value_paths(names)
+        output = {}
+        for name in names:
+            if name in self.computed:
+                source = {field: row[path] for field, path in paths.items()}
+                output[name] = getattr(self, f'get_{name}')(source)
+            elif name in self.m2m:
+                output[name] = row[name]
+            else:
+                output[name] = row[paths[name]]
+        return output
+
+
+# ===== VIEWS =====
+
+class ResourceListView(View):
+    """GET ?fields=a,b&limit=N&cursor=...&ids=1,2&<filters> -> {"results": [...], "next": url|null}"""
+
+    resource = None
+
+    def get(self, request, *args, **kwargs):
+        config = get_api_config()
+        try:
+            names = self.resource.parse_fields(request.GET.get('fields'))
+            limit = request.GET.get('limit') or config['PAGE_SIZE']
+            if not str(limit).isdigit() or not 1 <= int(limit) <= config['MAX_PAGE_SIZE']:
+                raise ApiError(f"limit must be between 1 and {config['MAX_PAGE_SIZE']}")
+
+            queryset = self.resource.filter_queryset(self.resource.get_queryset(), request.GET)
+            paginator = KeysetPaginator(queryset, int(limit), ordering=self.resource.ordering)
+            ordering_fields = [field.lstrip('-') for field in paginator.ordering if field.lstrip('-') != 'pk']
+            paginator.object_list = self.resource.values_queryset(paginator.object_list, names, ordering_fields)
+
+            try:
+                rows, has_more = paginator.rows_after(request.GET.get('cursor'))
+            except InvalidPage as e:
+                raise ApiError(str(e))
+        except ApiError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Http404 as e:
+            # A resource's get_queryset() may 404; answer in JSON, not the site's HTML page
+            return JsonResponse({'error': str(e)}, status=404)
+
+        self.resource.attach_m2m(rows, names)
+        next_url = None
+        if has_more:
+            params = request.GET.copy()
+            params['cursor'] = paginator.encode_cursor(rows[-1])
+            next_url = request.build_absolute_uri(f"{request.path}?{urlencode(params, doseq=True)}")
+
+        return JsonResponse({
+            'results': [self.resource.render(row, names) for row in rows],
+            'next': next_url,
+        })
+
+
+class ResourceDetailView(View):
+    """GET <lookup>/?fields=a,b -> the object"""
+
+    resource = None
+
+    def get(self, request, lookup, *args, **kwargs):
+        try:
+            names = self.resource.parse_fields(request.GET.get('fields'))
+        except ApiError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        queryset = self.resource.get_queryset().filter(**{self.resource.lookup_field: lookup})
+        row = self.resource.values_queryset(queryset, names).first()
+        if row is None:
+            return JsonResponse({'error': f"No {self.resource.name} matches {lookup!r}"}, status=404)
+
+        self.resource.attach_m2m([row], names)
+        return JsonResponse(self.resource.render(row, names))
+
+
+def resource_urls(resource_class):
+    """List and detail URL patterns for a resource, with conditional GET and caching applied."""
+    resource = resource_class()
+    max_age = get_api_config()['CACHE_MAX_AGE']
+
+    def wrap(view_class):
+        view = syndicated(resource.content_group)(view_class.as_view(resource=resource))
+
+        @wraps(view)
+        def api_view(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                patch_cache_control(response, public=True, max_age=max_age)
+            else:
+                # Errors aren't tied to a content generation
+                for header in ('ETag', 'Last-Modified'):
+                    if header in response:
+                        del response[header]
+            return response
+
+        return api_view
+
+    return [
+        path(f"{resource.name}/", wrap(ResourceListView), name=f"{resource.name}_list"),
+        path(
+            f"{resource.name}/<{resource.lookup_converter}:lookup>/",
+            wrap(ResourceDetailView),
+            name=f"{resource.name}_detail",
+        ),
+    ]
@@ -0,0 +1,19 @@
+"""
+Public API URL Configuration
+Read-only JSON resources mounted at /api/v1/
+Version 1.0 - Posts, systems, technologies, GitHub repositories
+"""
+
+from blog.api import PostResource
+from projects.api import GitHubRepositoryResource, SystemResource, TechnologyResource
+
+from .api import resource_urls
+
+app_name = 'api'
+
+urlpatterns = [
+    *resource_urls(PostResource),
+    *resource_urls(SystemResource),
+    *resource_urls(TechnologyResource),
+    *resource_urls(GitHubRepositoryResource),
+]
@@ -0,0 +1,214 @@
+"""
+Cache Backends
+Instrumented and tiered cache backends behind settings.CACHES
+Version 2.1 - File tier refuses a cache directory other users can reach
+"""
+
+import itertools
+import os
+import pickle
+import stat
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+
+from core.services.system_metrics import system_metrics
+
+_MISSING = object()
+
+
+class CacheStatsMixin:
+    """Counts every get() (and so get_many()/get_or_set()) as a hit or miss."""
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        if value is _MISSING:
+            system_metrics.cache_lookup(hits=0, misses=1)
+            return default
+        system_metrics.cache_lookup(hits=1, misses=0)
+        return value
+
+
+class InstrumentedLocMemCache(CacheStatsMixin, LocMemCache):
+    pass
+
+
+# ===== SHARED TIER =====
+
+# Write counters per cache directory (backends are instantiated per thread)
+_write_counters = {}
+
+
+# Cache directories already checked by this process
+_checked_dirs = set()
+
+
+def check_cache_dir(path):
+    """
+    Raise ImproperlyConfigured unless `path` is a directory owned by this
+    process's user with no group/other permissions. The file tier unpickles
+    whatever it finds there, so anyone else able to write to it could run
+    code as the app.
+    """
+    info = os.stat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise ImproperlyConfigured(f"Cache directory {path} is not a directory")
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise ImproperlyConfigured(f"Cache directory {path} is owned by uid {info.st_uid}, not this user ({os.getuid()})")
+    if info.st_mode & 0o077:
+        raise ImproperlyConfigured(
+            f"Cache directory {path} has mode {stat.S_IMODE(info.st_mode):o}; it must be 700"
+        )
+
+
+class TunedFileBasedCache(FileBasedCache):
+    """
+    FileBasedCache that checks its size every CULL_EVERY writes.
+
+    The stock backend lists the whole cache directory on every set() to see
+    whether MAX_ENTRIES was passed, which grows with the cache. Checking every
+    N writes lets the directory overshoot MAX_ENTRIES by at most N entries.
+
+    The directory is created 0700 if missing and must be private to the app
+    user (see check_cache_dir); a shared or pre-created one fails loudly on
+    first use instead of being trusted.
+    """
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._cull_every = max(1, params.get('OPTIONS', {}).get('CULL_EVERY', 100))
+        self._writes = _write_counters.setdefault(self._dir, itertools.count())
+        if self._dir not in _checked_dirs:
+            self._createdir()
+            check_cache_dir(self._dir)
+            _checked_dirs.add(self._dir)
+
+    def _cull(self):
+        if next(self._writes) % self._cull_every == 0:
+            super()._cull()
+
+
+# ===== TIERED CACHE =====
+
+# L1 stores per LOCATION, shared by every thread of the process
+_l1_stores = {}
+_l1_locks = {}
+
+
+class TieredCache(BaseCache):
+    """
+    Small per-process LRU (L1) in front of a shared cross-process cache.
+
+    OPTIONS:
+      SHARED_ALIAS   - CACHES alias of the shared tier (default 'shared'); its
+                       TIMEOUT is the default timeout
+      L1_MAX_ENTRIES - LRU size per worker (default 1000)
+      L1_TIMEOUT     - max seconds an L1 copy is trusted (default 5)
+
+    Reads try L1, then the shared tier (copying the value into L1). Writes
+    and deletes go to both. Other workers only see a delete or overwrite once
+    their L1 copy expires, so L1_TIMEOUT bounds cross-worker staleness. Values
+    are pickled in L1 like LocMemCache, so callers can't mutate cached objects.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._shared_alias = options.get('SHARED_ALIAS', 'shared')
+        self._l1_max_entries = options.get('L1_MAX_ENTRIES', 1000)
+        self._l1_timeout = options.get('L1_TIMEOUT', 5)
+        self._l1 = _l1_stores.setdefault(location, OrderedDict())
+        self._lock = _l1_locks.setdefault(location, threading.Lock())
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    # ----- L1 -----
+
+    def _l1_get(self, key):
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return _MISSING
+            expires, pickled = entry
+            if expires <= time.monotonic():
+                del self._l1[key]
+                return _MISSING
+            self._l1.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def _l1_set(self, key, value, timeout):
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None and timeout <= 0:
+            self._l1_delete(key)
+            return
+        ttl = self._l1_timeout if timeout in (DEFAULT_TIMEOUT, None) else min(self._l1_timeout, timeout)
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._l1[key] = (time.monotonic() + ttl, pickled)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self._l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def _l1_delete(self, key):
+        with self._lock:
+            return self._l1.pop(key, None) is not None
+
+    # ----- cache API -----
+
+    def get(self, key, default=None, version=None):
+        l1_key = self.make_and_validate_key(key, version)
+        value = self._l1_get(l1_key)
+        if value is not _MISSING:
+            system_metrics.cache_lookup(hits=1, misses=0, l1_hits=1)
+            return value
+
+        value = self.shared.get(key, _MISSING, version)
+        if value is _MISSING:
+            system_metrics.cache_lookup(hits=0, misses=1)
+            return default
+        system_metrics.cache_lookup(hits=1, misses=0)
+        self._l1_set(l1_key, value, DEFAULT_TIMEOUT)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version)
+        self._l1_set(self.make_and_validate_key(key, version), value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version)
+        if added:
+            self._l1_set(self.make_and_validate_key(key, version), value, timeout)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        in_l1 = self._l1_delete(self.make_and_validate_key(key, version))
+        return self.shared.delete(key, version) or in_l1
+
+    def has_key(self, key, version=None):
+        if self._l1_get(self.make_and_validate_key(key, version)) is not _MISSING:
+            return True
+        return self.shared.has_key(key, version)
+
+    def incr(self, key, delta=1, version=None):
+        # Counters live in the shared tier only so every worker sees the same value
+        self._l1_delete(self.make_and_validate_key(key, version))
+        return self.shared.incr(key, delta, version)
+
+    def clear(self):
+        with self._lock:
+            self._l1.clear()
+        self.shared.clear()
+
+    def l1_size(self):
+        with self._lock:
+            return len(self._l1)
@@ -5,6 +5,7 @@ Version 3.0 - Based on Actual Core Models
 """
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db.models import Count
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -13,6 +14,7 @@ from datetime import date
 from .models import Contact, CorePage, Skill, Education, Experience, PortfolioAnalytics, EducationSkillDevelopment, SocialLink, SkillTechnologyRelation, ExperienceSkillApplication
 from markdownx.fields import MarkdownxFormField  # pyright: ignore[reportMissingImports]
 from projects.models import Technology, SystemModule
+from .widgets import SkillSelectWidget, TechnologySelectWidget
 
 # Existing Contact Form
 # class ContactForm(forms.ModelForm):
@@ -57,8 +59,8 @@ class SkillTechnologyRelationForm(forms.ModelForm):
         ]
 
         widgets = {
-            'skill': forms.Select(attrs={'class': 'form-control'}),
-            'technology': forms.Select(attrs={'class': 'form-control'}),
+            'skill': SkillSelectWidget(attrs={'class': 'form-control'}),
+            'technology': TechnologySelectWidget(attrs={'class': 'form-control'}),
             'strength': forms.Select(attrs={'class': 'form-control'}),
             'relationship_type': forms.Select(attrs={'class': 'form-control'}),
             'notes': forms.Textarea(attrs={
@@ -79,8 +81,10 @@ class SkillTechnologyRelationForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Order skills by category and name
-        self.fields['skill'].queryset = Skill.objects.order_by('category', 'name')
+        # Order skills by category and name (annotated so option labels don't count systems per skill)
+        self.fields['skill'].queryset = Skill.objects.annotate(
+            systems_count=Count('project_gains')
+        ).order_by('category', 'name')
 
         # Order technologies by category and name
         self.fields['technology'].queryset = Technology.objects.order_by('category', 'name')
@@ -402,7 +406,7 @@ class EducationSkillDevelopmentForm(forms.ModelForm):
         ]
         widgets = {
             "education": forms.Select(attrs={"class": "form-control"}),
-            "skill": forms.Select(attrs={"class": "form-control"}),
+            "skill": SkillSelectWidget(attrs={"class": "form-control"}),
             "proficiency_before": forms.Select(attrs={"class": "form-control"}),
             "proficiency_after": forms.Select(attrs={"class": "form-control"}),
             "learning_focus": forms.Select(attrs={"class": "form-control"}),
@@ -419,7 +423,9 @@ class EducationSkillDevelopmentForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields['education'].queryset = Education.objects.order_by('-start_date')
-        self.fields['skill'].queryset = Skill.objects.order_by('category', 'name')
+        self.fields['skill'].queryset = Skill.objects.annotate(
+            systems_count=Count('project_gains')
+        ).order_by('category', 'name')
         self.fields['learning_notes'].required = False
     
     def clean(self):
@@ -442,7 +448,7 @@ class ExperienceForm(forms.ModelForm):
     """Enhanced experience form with technology tracking. NEW: Skill Experience Connections"""
 
     skills_applied = forms.ModelMultipleChoiceField(
-        queryset=Skill.objects.all().order_by('name'),
+        queryset=Skill.objects.annotate(systems_count=Count('project_gains')).order_by('name'),
         required=False,
         widget=forms.CheckboxSelectMultiple,
         help_text='Select skills applied in this role'
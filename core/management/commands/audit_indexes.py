@@ -0,0 +1,117 @@
+"""
+Django Management Command to Audit Hot Query Plans
+File: core/management/commands/audit_indexes.py
+
+Runs EXPLAIN on the catalog of hot queries in core.services.index_audit and
+reports full table scans and temp sorts. Point --baseline at a previous
+--output file to see before/after plans side by side.
+
+Usage:
+    python manage.py audit_indexes
+    python manage.py audit_indexes --show-plans
+    python manage.py audit_indexes --output benchmarks/query_plans/after_indexes.json
+    python manage.py audit_indexes --baseline benchmarks/query_plans/before_indexes.json
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.services.index_audit import HOT_QUERIES, explain_hot_queries
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the site's hot queries and report sequential scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--query',
+            action='append',
+            choices=[name for name, _, _ in HOT_QUERIES],
+            help='Only audit this query (repeatable)',
+        )
+        parser.add_argument(
+            '--show-plans',
+            action='store_true',
+            help='Print the full EXPLAIN output for every query',
+        )
+        parser.add_argument(
+            '--output',
+            help='Write plans as JSON (e.g. to keep a before/after record)',
+        )
+        parser.add_argument(
+            '--baseline',
+            help='JSON from a previous --output run to compare against',
+        )
+        parser.add_argument(
+            '--fail-on-scan',
+            action='store_true',
+            help='Exit non-zero if any query still does a full table scan',
+        )
+
+    def handle(self, *args, **options):
+        results = explain_hot_queries(options['query'])
+        baseline = self.load_baseline(options['baseline']) if options['baseline'] else {}
+
+        self.stdout.write(f"Auditing {len(results)} hot queries on {connection.vendor}...\n")
+
+        for result in results:
+            self.report(result, baseline.get(result['name']), options['show_plans'])
+
+        scanning = [r for r in results if r['full_scans']]
+        if options['output']:
+            self.write_output(Path(options['output']), results)
+
+        if scanning:
+            self.stdout.write(self.style.WARNING(
+                f"\n⚠ {len(scanning)} of {len(results)} queries still scan a full table"
+            ))
+            if options['fail_on_scan']:
+                raise CommandError('Full table scans found')
+        else:
+            self.stdout.write(self.style.SUCCESS(f"\n✓ All {len(results)} hot queries use an index"))
+
+    def report(self, result, before, show_plans):
+        if result['full_scans']:
+            status = self.style.ERROR(f"❌ full scan: {', '.join(result['full_scans'])}")
+        else:
+            status = self.style.SUCCESS("✓ indexed")
+        sorts = f" (+{result['temp_sorts']} temp sort)" if result['temp_sorts'] else ""
+        self.stdout.write(f"  {result['name']:<32} {status}{sorts}  [{result['used_by']}]")
+
+        if before is not None:
+            was = ', '.join(before['full_scans']) or 'indexed'
+            self.stdout.write(f"      before: {was}, {before['temp_sorts']} temp sort(s)")
+            if show_plans:
+                self.write_plan('before', before['plan'])
+
+        if show_plans:
+            self.write_plan('plan' if before is None else 'after', result['plan'])
+
+    def write_plan(self, label, plan):
+        self.stdout.write(f"      {label}:")
+        for line in plan.splitlines():
+            self.stdout.write(f"        {line}")
+
+    def load_baseline(self, path):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read baseline {path}: {e}")
+        return {r['name']: r for r in data.get('queries', [])}
+
+    def write_output(self, path, results):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'database': connection.vendor,
+            'queries': results,
+        }
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=2)
+            f.write('\n')
+        self.stdout.write(self.style.SUCCESS(f"Plans written to {path}"))
@@ -0,0 +1,200 @@
+"""
+Django Management Command to Benchmark the Commit Time-Series Engine
+File: core/management/commands/benchmark_commit_series.py
+
+Seeds --repos GitHub repositories with --weeks weeks of commits each into a
+throwaway test database, then computes the weekly summary, monthly summary
+and commit summary fields for every repository two ways:
+
+  per-repo - the ORM loops the GitHubRepository methods used before
+             projects.services.commit_timeseries (kept here for comparison)
+  engine   - one CommitTimeSeries.load() for the weekly figures and the
+             CommitRollups month tables for the monthly summary
+
+Reports wall time and query count for each and checks the totals agree.
+
+Usage:
+    python manage.py benchmark_commit_series
+    python manage.py benchmark_commit_series --repos 500 --weeks 52 --repeat 5
+"""
+
+import random
+import statistics
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from projects.models import GitHubCommitWeek, GitHubRepository
+from projects.services.commit_rollups import CommitRollups, rebuild_commit_rollups
+from projects.services.commit_timeseries import CommitTimeSeries
+
+
+# ===== PER-REPO BASELINE (pre-engine model methods) =====
+
+def per_repo_monthly(repo, months_back):
+    monthly_data = defaultdict(list)
+    for week in repo.commit_weeks.order_by('-week_start_date'):
+        # By the start date's calendar year, as the rollups bucket weeks; the
+        # old `year` field (ISO year) filed late-December weeks under the next year
+        monthly_data[f"{week.week_start_date.year}-{week.month:02d}"].append(week)
+
+    summaries = []
+    for month_key in sorted(monthly_data, reverse=True)[:months_back]:
+        weeks = monthly_data[month_key]
+        total = sum(w.commit_count for w in weeks)
+        summaries.append({
+            'year': weeks[0].week_start_date.year,
+            'month': weeks[0].month,
+            'total_commits': total,
+            'week_count': len(weeks),
+            'avg_commits_per_week': round(total / len(weeks), 1),
+            'most_active_week': max(weeks, key=lambda w: w.commit_count),
+        })
+    return summaries
+
+
+def per_repo_summaries(repo):
+    """Weekly summary, monthly summary and summary fields for one repo, the pre-engine way."""
+    weeks = repo.commit_weeks.all()
+    total = sum(w.commit_count for w in weeks)
+    weekly = {
+        'total_weeks': weeks.count(),
+        'avg_commits_per_week': round(total / weeks.count(), 1),
+        'most_active_week': max(weeks, key=lambda w: w.commit_count),
+        'trend_weeks': [w.commit_count for w in repo.commit_weeks.order_by('-year', '-week')[:4]],
+        'total_commits_tracked': total,
+    }
+
+    months = per_repo_monthly(repo, 12)
+    monthly = {
+        'total_months': len(months),
+        'most_active_month': max(months, key=lambda m: m['total_commits']),
+        'trend_months': per_repo_monthly(repo, 3),
+        'total_commits_tracked': sum(m['total_commits'] for m in months),
+    }
+
+    fields_weeks = repo.commit_weeks.all()
+    fields_total = sum(w.commit_count for w in fields_weeks)
+    fields = {
+        'total_commits': fields_total,
+        'commits_last_30_days': sum(w.commit_count for w in fields_weeks.order_by('-year', '-week')[:5]),
+        'avg_commits_per_month': round(fields_total / fields_weeks.count() * 4.33, 2),
+    }
+    return weekly, monthly, fields
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-repo commit summaries against the vectorized CommitTimeSeries engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repos', type=int, default=500, help='Repositories to seed (default: 500)')
+        parser.add_argument('--weeks', type=int, default=52, help='Weeks of commits per repository (default: 52)')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per approach; the median is reported (default: 3)')
+        parser.add_argument('--seed', type=int, default=1234, help='Random seed for commit counts (default: 1234)')
+
+    def handle(self, *args, **options):
+        if options['repos'] < 1 or options['weeks'] < 1:
+            raise CommandError("--repos and --weeks must be positive")
+
+        setup_test_environment()
+        self.stdout.write('Creating benchmark database...')
+        old_db_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            repos = self.seed(options['repos'], options['weeks'], options['seed'])
+            per_repo = self.measure('per-repo', lambda: {repo.pk: per_repo_summaries(repo) for repo in repos}, options['repeat'])
+            engine = self.measure('engine', lambda: self.engine_summaries(repos), options['repeat'])
+        finally:
+            connection.creation.destroy_test_db(old_db_name, verbosity=0)
+            teardown_test_environment()
+
+        self.report(per_repo, engine)
+
+    # ===== SEEDING =====
+
+    def seed(self, repo_count, week_count, seed):
+        self.stdout.write(f'Seeding {repo_count} repositories x {week_count} weeks...')
+        rng = random.Random(seed)
+        now = timezone.now()
+        repos = GitHubRepository.objects.bulk_create([
+            GitHubRepository(
+                github_id=index + 1,
+                name=f'repo-{index}',
+                full_name=f'benchmark/repo-{index}',
+                html_url=f'https://github.com/benchmark/repo-{index}',
+                clone_url=f'https://github.com/benchmark/repo-{index}.git',
+                github_created_at=now,
+                github_updated_at=now,
+                enable_detailed_tracking=True,
+            )
+            for index in range(repo_count)
+        ])
+
+        this_monday = date.today() - timedelta(days=date.today().weekday())
+        mondays = [this_monday - timedelta(weeks=offset) for offset in range(week_count)]
+        weeks = []
+        for repo in repos:
+            for monday in mondays:
+                year, week, _ = monday.isocalendar()
+                weeks.append(GitHubCommitWeek(
+                    repository=repo,
+                    year=year,
+                    week=week,
+                    month=monday.month,
+                    month_name=monday.strftime('%B'),
+                    quarter=(monday.month - 1) // 3 + 1,
+                    week_start_date=monday,
+                    week_end_date=monday + timedelta(days=6),
+                    commit_count=rng.choice([0, 0, 1, 2, 3, 5, 8, 13, 21]),
+                ))
+        GitHubCommitWeek.objects.bulk_create(weeks, batch_size=2000)
+        # bulk_create skips the weekly sync's rollup upkeep
+        rebuild_commit_rollups()
+        return list(GitHubRepository.objects.order_by('pk'))
+
+    # ===== MEASURING =====
+
+    def engine_summaries(self, repos):
+        series = CommitTimeSeries.load(repos)
+        rollups = CommitRollups.load(repos)
+        weekly = series.weekly_summaries()
+        fields = series.summary_fields()
+        return {
+            repo.pk: (weekly[repo.pk], rollups.monthly_summary(repo.pk), fields[repo.pk])
+            for repo in repos
+        }
+
+    def measure(self, label, compute, repeat):
+        self.stdout.write(f'Running {label} x{repeat}...')
+        timings = []
+        for _ in range(max(1, repeat)):
+            # The query log is capped; start each run empty so the count is this run's
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                result = compute()
+                timings.append(time.perf_counter() - start)
+        return {'ms': statistics.median(timings) * 1000, 'queries': len(queries), 'result': result}
+
+    def report(self, per_repo, engine):
+        self.stdout.write('')
+        self.stdout.write(f"{'approach':<10} {'median ms':>10} {'queries':>8}")
+        for label, run in (('per-repo', per_repo), ('engine', engine)):
+            self.stdout.write(f"{label:<10} {run['ms']:>10.1f} {run['queries']:>8}")
+        self.stdout.write(f"Speed-up: {per_repo['ms'] / engine['ms']:.1f}x")
+
+        mismatched = [
+            pk for pk, (weekly, monthly, fields) in per_repo['result'].items()
+            if weekly['total_commits_tracked'] != engine['result'][pk][0]['total_commits_tracked']
+            or monthly['total_commits_tracked'] != engine['result'][pk][1]['total_commits_tracked']
+            or fields['total_commits'] != engine['result'][pk][2]['total_commits']
+            or fields['commits_last_30_days'] != engine['result'][pk][2]['commits_last_30_days']
+        ]
+        if mismatched:
+            self.stdout.write(self.style.ERROR(f"❌ Totals differ for {len(mismatched)} repositories"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✓ Weekly, monthly and last-30-day counts match for every repository"))
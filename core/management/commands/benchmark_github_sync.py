@@ -0,0 +1,133 @@
+"""
+Django Management Command to Benchmark Sequential vs Async GitHub Fetching
+File: core/management/commands/benchmark_github_sync.py
+
+Starts the fake GitHub API from core.testing (HTTP/1.1 keep-alive, fixed
+per-request latency, X-RateLimit-* headers) and fetches the per-repository
+data a sync needs - details, languages, Link-header commit counts and weekly commit
+activity - for --repos repositories twice:
+
+  sequential - GitHubAPIService, one request at a time (plain requests.get)
+  async      - AsyncGitHubAPIService, --concurrency requests in flight over
+               one pooled session
+
+Reports wall time, requests made and TCP connections opened for each, and
+checks both produced the same data. Caching and the on-disk response
+store are disabled for the run so every call reaches the server.
+
+Usage:
+    python manage.py benchmark_github_sync
+    python manage.py benchmark_github_sync --repos 100 --latency 80 --concurrency 16
+"""
+
+import asyncio
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from core.services.github_api import GitHubAPIService
+from core.services.github_async import AsyncGitHubAPIService, gather_settled
+from core.testing import USERNAME, FakeGitHubServer, repo_names
+
+
+def fetch_sequential(service, names):
+    return {
+        name: (
+            service.get_repository_details(USERNAME, name),
+            service.get_repository_languages(USERNAME, name),
+            service.get_repository_commit_stats(USERNAME, name),
+            service.get_repository_commit_activity(USERNAME, name),
+        )
+        for name in names
+    }
+
+
+async def fetch_async(client, names):
+    async def one(name):
+        return tuple(await asyncio.gather(
+            client.get_repository_details(USERNAME, name),
+            client.get_repository_languages(USERNAME, name),
+            client.get_repository_commit_stats(USERNAME, name),
+            client.get_repository_commit_activity(USERNAME, name),
+        ))
+
+    return await gather_settled({name: one(name) for name in names})
+
+
+class Command(BaseCommand):
+    help = "Benchmark sequential vs async GitHub fetching against a local fake API"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repos', type=int, default=40, help='Repositories to fetch (default: 40)')
+        parser.add_argument('--latency', type=float, default=50, help='Fake server latency per request in ms (default: 50)')
+        parser.add_argument('--concurrency', type=int, default=8, help='Async requests in flight (default: 8)')
+
+    def handle(self, *args, **options):
+        if options['repos'] < 1 or options['concurrency'] < 1:
+            raise CommandError("--repos and --concurrency must be positive")
+
+        with FakeGitHubServer(options['repos'], options['latency'] / 1000) as server:
+            self.stdout.write(
+                f"Fake GitHub API at {server.base_url}: {options['repos']} repos, {options['latency']:.0f} ms/request"
+            )
+            sequential, concurrent, client = self.run_both(server, repo_names(options['repos']), options['concurrency'])
+
+        self.report(sequential, concurrent, client.rate_limit)
+
+    def run_both(self, server, names, concurrency):
+        # Per-request INFO lines would dominate the output (and the timings)
+        github_logger = logging.getLogger('core.services.github_api')
+        log_level = github_logger.level
+        github_logger.setLevel(logging.WARNING)
+        try:
+            with override_settings(
+                CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+                GITHUB_API_CONFIG={**settings.GITHUB_API_CONFIG, 'RESPONSE_STORE': None, 'REPLAY': False},
+            ):
+                sequential_service = GitHubAPIService()
+                sequential_service.base_url = server.base_url
+                sequential = self.measure(server, 'sequential', lambda: fetch_sequential(sequential_service, names))
+
+                client = AsyncGitHubAPIService(concurrency)
+                client.service.base_url = server.base_url
+                try:
+                    concurrent = self.measure(server, 'async', lambda: asyncio.run(fetch_async(client, names)))
+                finally:
+                    client.close()
+        finally:
+            github_logger.setLevel(log_level)
+        return sequential, concurrent, client
+
+    def measure(self, server, label, fetch):
+        self.stdout.write(f'Running {label}...')
+        requests_before, connections_before = server.requests, server.connections
+        started = time.perf_counter()
+        result = fetch()
+        return {
+            'label': label,
+            'seconds': time.perf_counter() - started,
+            'requests': server.requests - requests_before,
+            'connections': server.connections - connections_before,
+            'result': result,
+        }
+
+    def report(self, sequential, concurrent, rate_limit):
+        self.stdout.write('')
+        self.stdout.write(f"{'approach':<11} {'seconds':>8} {'requests':>9} {'connections':>12}")
+        for run in (sequential, concurrent):
+            self.stdout.write(f"{run['label']:<11} {run['seconds']:>8.2f} {run['requests']:>9} {run['connections']:>12}")
+        self.stdout.write(f"Speed-up: {sequential['seconds'] / concurrent['seconds']:.1f}x")
+        self.stdout.write(f"Rate limit seen by the async client: {rate_limit.remaining} remaining after {rate_limit.requests} requests")
+
+        failed = [name for name, result in concurrent['result'].items() if isinstance(result, Exception)]
+        mismatched = [
+            name for name, result in concurrent['result'].items()
+            if name not in failed and result != sequential['result'][name]
+        ]
+        if failed or mismatched:
+            self.stdout.write(self.style.ERROR(f"❌ {len(failed)} failed, {len(mismatched)} differ from the sequential run"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✓ Async results match the sequential run for every repository"))
@@ -0,0 +1,427 @@
+"""
+Django Management Command to Benchmark Views Against Query Budgets
+File: core/management/commands/benchmark_views.py
+
+Seeds a synthetic dataset (populate_sample_data + create_learning_sample_data
+at --scale) into a throwaway test database, then GETs every URL in core.urls,
+blog.urls, projects.urls and core.admin_urls with the test client, recording
+query count, wall time and response bytes per URL name.
+
+Fails (non-zero exit) when a view exceeds its checked-in query budget in
+benchmarks/query_budgets.json, or when a budgeted view returns a server
+error. Only views that render are budgeted; the rest are reported as
+errors until fixed. Runs with DEBUG off, so query counts don't depend on
+the environment. Results are written as JSON so runs can be diffed between
+releases.
+With --explain the hot query plans from audit_indexes are included too.
+
+Usage:
+    python manage.py benchmark_views --scale 10
+    python manage.py benchmark_views --scale 100 --output benchmarks/results/v4.json
+    python manage.py benchmark_views --scale 10 --update-budgets
+    python manage.py benchmark_views --scale 10 --explain
+"""
+
+import contextlib
+import io
+import json
+import logging
+import random
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from faker import Faker
+
+from core.services.index_audit import explain_hot_queries
+from core.services.request_metrics import QueryRecorder
+
+
+BENCHMARK_DIR = Path(settings.BASE_DIR) / 'benchmarks'
+DEFAULT_BUDGETS = BENCHMARK_DIR / 'query_budgets.json'
+DEFAULT_RESULTS_DIR = BENCHMARK_DIR / 'results'
+
+# URLconfs to drive, in report order
+BENCHMARK_URLCONFS = ('core.urls', 'blog.urls', 'projects.urls', 'core.admin_urls')
+
+# Views that need data the sample generators don't create, or that call out to the network
+SKIP_VIEWS = {
+    'blog:verify_subscription': 'needs a subscriber token',
+    'blog:unsubscribe': 'needs a subscriber token',
+    'projects:github_sync': 'POST only, calls the GitHub API',
+}
+
+# URL kwargs whose model differs from the view's `model` attribute
+SAMPLE_MODELS = {
+    'blog:category': 'blog.Category',
+    'blog:tag': 'blog.Tag',
+    'blog:api_share': 'blog.Post',
+    'aura_admin:blog:series_posts_manage': 'blog.Series',
+}
+
+# Fixed kwargs for non-model URL parameters
+STATIC_KWARGS = {
+    'core:resume_download_format': {'format': 'json'},
+}
+
+# Tiered like production, with a process-private shared tier
+BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'core.cache.TieredCache',
+        'LOCATION': 'benchmark-l1',
+        'OPTIONS': {'SHARED_ALIAS': 'shared'},
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmark-shared',
+    },
+}
+
+# Headroom applied when writing budgets with --update-budgets
+BUDGET_HEADROOM = 1.2
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every public and admin view (queries, time, bytes) against checked-in query budgets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=10,
+            help='Sample data volume multiplier passed to the generators (default: 10, use 100 for stress runs)',
+        )
+        parser.add_argument(
+            '--budgets',
+            default=str(DEFAULT_BUDGETS),
+            help='Path to the query budget JSON file',
+        )
+        parser.add_argument(
+            '--output',
+            help='Where to write the JSON results (default: benchmarks/results/<date>_x<scale>.json)',
+        )
+        parser.add_argument(
+            '--update-budgets',
+            action='store_true',
+            help='Rewrite the budget file from this run (query count + 20%% headroom) instead of failing',
+        )
+        parser.add_argument(
+            '--current-db',
+            action='store_true',
+            help='Benchmark against the configured database as-is (no test DB, no seeding)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1234,
+            help='Random seed for the generators so query counts are reproducible (default: 1234)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Requests per URL; wall time is the median (default: 3)',
+        )
+        parser.add_argument(
+            '--explain',
+            action='store_true',
+            help='Also EXPLAIN the hot query catalog and include the plans in the results',
+        )
+
+    def handle(self, *args, **options):
+        self.scale = max(1, options['scale'])
+        budgets_path = Path(options['budgets'])
+        budgets = self.load_budgets(budgets_path)
+
+        setup_test_environment()
+        # No collectstatic here, so skip the manifest lookups {% static %} would fail on
+        # Same cache tiers, but private and empty, so the first GET of each view is really cold
+        # and nothing from the real database leaks in through a shared file/DB cache
+        # DEBUG off like production, so debug-only context and error pages don't change the counts
+        benchmark_settings = override_settings(DEBUG=False, STORAGES={
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+        }, CACHES=BENCHMARK_CACHES)
+        benchmark_settings.enable()
+        old_db_name = None
+        try:
+            if not options['current_db']:
+                self.stdout.write('Creating benchmark database...')
+                old_db_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+                self.seed_data(options['seed'])
+
+            results = self.run_benchmarks(options['repeat'])
+            query_plans = self.explain_queries() if options['explain'] else None
+        finally:
+            if old_db_name is not None:
+                connection.creation.destroy_test_db(old_db_name, verbosity=0)
+            benchmark_settings.disable()
+            teardown_test_environment()
+
+        output_path = Path(options['output']) if options['output'] else (
+            DEFAULT_RESULTS_DIR / f"{datetime.now():%Y-%m-%d}_x{self.scale}.json"
+        )
+        self.write_results(output_path, results, query_plans)
+
+        if options['update_budgets']:
+            self.write_budgets(budgets_path, results)
+            return
+
+        self.check_budgets(results, budgets)
+
+    # ============ SEEDING ============
+
+    def seed_data(self, seed):
+        """Reuse the sample data generators at the requested scale."""
+        self.stdout.write(f'Seeding sample data at x{self.scale} (seed {seed})...')
+        start = time.perf_counter()
+        quiet = io.StringIO()
+
+        # Same seed -> same dataset -> same query counts, so budgets don't flap
+        random.seed(seed)
+        Faker.seed(seed)
+
+        # Model signals print() and Faker produces naive datetimes; keep the report readable.
+        # Sample images point at files that don't exist, so derivative generation only warns.
+        derivative_logger = logging.getLogger('core.services.image_derivatives')
+        previous_level = derivative_logger.level
+        derivative_logger.setLevel(logging.ERROR)
+        try:
+            with contextlib.redirect_stdout(quiet), warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                call_command('populate_sample_data', scale=self.scale, stdout=quiet)
+                call_command('create_learning_sample_data', scale=self.scale, stdout=quiet)
+        finally:
+            derivative_logger.setLevel(previous_level)
+
+        self.stdout.write(f'  ✓ Seeded in {time.perf_counter() - start:.1f}s')
+
+    # ============ URL DISCOVERY ============
+
+    def iter_urls(self):
+        """Yield (url_name, pattern) for every named pattern in BENCHMARK_URLCONFS."""
+        def walk(patterns, namespace, inside):
+            for entry in patterns:
+                if isinstance(entry, URLResolver):
+                    urlconf = entry.urlconf_name if isinstance(entry.urlconf_name, str) else getattr(entry.urlconf_name, '__name__', '')
+                    child_ns = f'{namespace}:{entry.namespace}' if namespace and entry.namespace else (entry.namespace or namespace)
+                    yield from walk(entry.url_patterns, child_ns, inside or urlconf in BENCHMARK_URLCONFS)
+                elif isinstance(entry, URLPattern) and inside and entry.name:
+                    url_name = f'{namespace}:{entry.name}' if namespace else entry.name
+                    yield url_name, entry
+
+        seen = set()
+        for url_name, pattern in walk(get_resolver().url_patterns, '', False):
+            # Duplicate registrations (same name twice) resolve to the first one
+            if url_name not in seen:
+                seen.add(url_name)
+                yield url_name, pattern
+
+    def get_url_kwargs(self, url_name, pattern):
+        """Build reverse() kwargs from a sample object, or return None if we can't."""
+        converters = getattr(pattern.pattern, 'converters', {})
+        if not converters:
+            return {}
+        if url_name in STATIC_KWARGS:
+            return STATIC_KWARGS[url_name]
+
+        model = None
+        if url_name in SAMPLE_MODELS:
+            model = apps.get_model(SAMPLE_MODELS[url_name])
+        else:
+            view_class = getattr(pattern.callback, 'view_class', None)
+            model = getattr(view_class, 'model', None)
+        if model is None:
+            return None
+
+        queryset = model._default_manager.order_by('pk')
+        if any(f.name == 'status' for f in model._meta.fields):
+            published = queryset.filter(status__in=['published', 'deployed'])
+            queryset = published if published.exists() else queryset
+        obj = queryset.first()
+        if obj is None:
+            return None
+
+        kwargs = {}
+        for name in converters:
+            if name in ('pk', 'id'):
+                kwargs[name] = obj.pk
+            elif hasattr(obj, name):
+                kwargs[name] = getattr(obj, name)
+            else:
+                return None
+        return kwargs
+
+    # ============ BENCHMARK RUN ============
+
+    def run_benchmarks(self, repeat):
+        staff, _ = User.objects.get_or_create(
+            username='benchmark-admin',
+            defaults={'is_staff': True, 'is_superuser': True},
+        )
+        anonymous = Client(raise_request_exception=False)
+        admin_client = Client(raise_request_exception=False)
+        admin_client.force_login(staff)
+
+        # Status codes are in the report; don't interleave request/slow-request/API logs with it
+        quiet_loggers = [
+            logging.getLogger(name)
+            for name in ('django.request', 'core.performance', 'core.services.github_api')
+        ]
+        previous_levels = [logger.level for logger in quiet_loggers]
+        for logger in quiet_loggers:
+            logger.setLevel(logging.CRITICAL)
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                return self.run_url_benchmarks(anonymous, admin_client, repeat)
+        finally:
+            for logger, level in zip(quiet_loggers, previous_levels):
+                logger.setLevel(level)
+
+    def run_url_benchmarks(self, anonymous, admin_client, repeat):
+        results = []
+        for url_name, pattern in self.iter_urls():
+            if url_name in SKIP_VIEWS:
+                results.append({'url_name': url_name, 'skipped': SKIP_VIEWS[url_name]})
+                continue
+
+            kwargs = self.get_url_kwargs(url_name, pattern)
+            if kwargs is None:
+                results.append({'url_name': url_name, 'skipped': 'no sample object for URL kwargs'})
+                continue
+
+            path = reverse(url_name, kwargs=kwargs)
+            client = admin_client if url_name.startswith('aura_admin:') else anonymous
+            result = self.measure(client, url_name, path, repeat)
+            results.append(result)
+
+            self.stdout.write(
+                f"  {result['status']} {url_name:<55} {result['queries']:>4}q "
+                f"({result['duplicate_queries']:>3} dup) {result['time_ms']:>8.1f}ms {result['bytes']:>9}B"
+            )
+
+        return results
+
+    def measure(self, client, url_name, path, repeat):
+        """Median wall time over `repeat` GETs; queries from the first (cold cache) one."""
+        timings = []
+        recorders = []
+        for _ in range(max(1, repeat)):
+            recorder = QueryRecorder()
+            recorders.append(recorder)
+            with connection.execute_wrapper(recorder):
+                start = time.perf_counter()
+                response = client.get(path, secure=True)
+                body = b''.join(response.streaming_content) if response.streaming else response.content
+                timings.append((time.perf_counter() - start) * 1000)
+
+        timings.sort()
+        recorder = recorders[0]
+        return {
+            'url_name': url_name,
+            'path': path,
+            'status': response.status_code,
+            'queries': recorder.count,
+            'duplicate_queries': recorder.duplicate_count,
+            'db_ms': round(recorder.duration_ms, 2),
+            'time_ms': round(timings[len(timings) // 2], 2),
+            'bytes': len(body),
+        }
+
+    # ============ BUDGETS & OUTPUT ============
+
+    def load_budgets(self, path):
+        if not path.exists():
+            self.stdout.write(self.style.WARNING(f'No budget file at {path}; nothing will be enforced.'))
+            return {}
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('scale') and data['scale'] != self.scale:
+            self.stdout.write(self.style.WARNING(
+                f"Budgets were recorded at x{data['scale']} but this run is x{self.scale}; "
+                f"N+1 views will drift with scale."
+            ))
+        return data.get('budgets', {})
+
+    def explain_queries(self):
+        plans = explain_hot_queries()
+        for plan in plans:
+            if plan['full_scans']:
+                self.stdout.write(self.style.WARNING(
+                    f"  ⚠ {plan['name']}: full scan on {', '.join(plan['full_scans'])}"
+                ))
+        self.stdout.write(f"  ✓ Explained {len(plans)} hot queries")
+        return plans
+
+    def write_results(self, path, results, query_plans=None):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'scale': self.scale,
+            'database': connection.vendor,
+            'results': results,
+        }
+        if query_plans is not None:
+            # Same shape as audit_indexes --output, so either works as a --baseline
+            payload['queries'] = query_plans
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f'Results written to {path}'))
+
+    def write_budgets(self, path, results):
+        budgets = {
+            r['url_name']: max(1, int(r['queries'] * BUDGET_HEADROOM + 0.999))
+            for r in results if 'queries' in r and r['status'] < 500
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'scale': self.scale, 'budgets': dict(sorted(budgets.items()))}, f, indent=2)
+            f.write('\n')
+        self.stdout.write(self.style.SUCCESS(f'Wrote {len(budgets)} query budgets to {path}'))
+
+    def check_budgets(self, results, budgets):
+        over_budget = [
+            r for r in results
+            if 'queries' in r and r['url_name'] in budgets and r['queries'] > budgets[r['url_name']]
+        ]
+        errors = [r for r in results if r.get('status', 200) >= 500]
+        # A budgeted view used to render, so an error there is a regression
+        broken = [r for r in errors if r['url_name'] in budgets]
+
+        unbudgeted = [
+            r for r in results
+            if 'queries' in r and r['status'] < 500 and r['url_name'] not in budgets
+        ]
+
+        for r in errors:
+            if r['url_name'] in budgets:
+                self.stdout.write(self.style.ERROR(f"  ❌ {r['url_name']}: HTTP {r['status']}"))
+            else:
+                self.stdout.write(self.style.WARNING(f"  ⚠ {r['url_name']}: HTTP {r['status']} (not budgeted)"))
+        if unbudgeted:
+            self.stdout.write(self.style.WARNING(
+                f"  ⚠ {len(unbudgeted)} view(s) have no budget yet (run with --update-budgets)"
+            ))
+        for r in over_budget:
+            self.stdout.write(self.style.ERROR(
+                f"  ❌ {r['url_name']}: {r['queries']} queries (budget {budgets[r['url_name']]})"
+            ))
+
+        if over_budget or broken:
+            raise CommandError(
+                f'{len(over_budget)} view(s) over query budget, {len(broken)} budgeted view(s) erroring'
+            )
+
+        self.stdout.write(self.style.SUCCESS('✅ All views within query budget'))
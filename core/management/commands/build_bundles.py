@@ -0,0 +1,58 @@
+"""
+Django Management Command to Build Static Asset Bundles
+File: core/management/commands/build_bundles.py
+
+Concatenates and minifies the CSS/JS bundles defined in settings.ASSET_BUNDLES
+into static/bundles/. collectstatic runs this automatically first, so the
+bundles get fingerprinted and precompressed with everything else.
+
+Usage:
+    python manage.py build_bundles
+    python manage.py build_bundles --no-minify
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.asset_bundles import build_bundle, get_bundle_config
+
+
+class Command(BaseCommand):
+    help = "Concatenate and minify per-page CSS/JS bundles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-minify',
+            action='store_true',
+            help='Concatenate only (useful when debugging a bundle)',
+        )
+
+    def handle(self, *args, **options):
+        config = get_bundle_config()
+        if options['no_minify']:
+            config['MINIFY'] = False
+
+        if not config['BUNDLES']:
+            self.stdout.write(self.style.WARNING("No bundles defined in ASSET_BUNDLES"))
+            return
+
+        total_source = 0
+        total_bundle = 0
+        for bundle_name in config['BUNDLES']:
+            try:
+                path, source_bytes, bundle_bytes = build_bundle(bundle_name, config)
+            except FileNotFoundError as e:
+                raise CommandError(str(e))
+
+            total_source += source_bytes
+            total_bundle += bundle_bytes
+            self.stdout.write(
+                f"  ✓ {bundle_name}: {len(config['BUNDLES'][bundle_name])} files, "
+                f"{source_bytes / 1024:.1f}KB → {bundle_bytes / 1024:.1f}KB"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Built {len(config['BUNDLES'])} bundles into {config['OUTPUT_DIR']} "
+                f"({total_source / 1024:.1f}KB → {total_bundle / 1024:.1f}KB before compression)"
+            )
+        )
@@ -0,0 +1,26 @@
+"""
+collectstatic override that builds asset bundles first
+File: core/management/commands/collectstatic.py
+
+Keeps deploys a single step: bundles are written into static/bundles/ before
+files are collected, so the manifest storage hashes and compresses them.
+"""
+
+from django.contrib.staticfiles.management.commands.collectstatic import Command as CollectStaticCommand
+from django.core.management import call_command
+
+
+class Command(CollectStaticCommand):
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--skip-bundles',
+            action='store_true',
+            help='Collect without rebuilding the asset bundles',
+        )
+
+    def handle(self, **options):
+        if not options['skip_bundles'] and not options['dry_run']:
+            call_command('build_bundles', verbosity=options['verbosity'], stdout=self.stdout)
+        return super().handle(**options)
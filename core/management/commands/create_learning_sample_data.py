@@ -14,6 +14,9 @@ from blog.models import Post
 class Command(BaseCommand):
     help = 'Create comprehensive learning journey sample data'
 
+    # Multiplier for the analytics history length (see --scale)
+    scale = 1
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--clear-existing',
@@ -35,12 +38,20 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what data currently exists and exit',
         )
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=1,
+            help='Multiply the days of generated analytics history, e.g. 10 or 100 for benchmarking',
+        )
 
     def handle(self, *args, **options):
         if options['show_existing']:
             self.show_existing_data()
             return
             
+        self.scale = max(1, options.get('scale') or 1)
+
         if options['clear_existing']:
             self.clear_existing_data()
         
@@ -194,7 +205,7 @@ class Command(BaseCommand):
         self.create_core_education(count=3, force_create=force_create)
         self.create_core_experience(count=2, force_create=force_create)
         self.create_education_skill_connections()
-        self.create_sample_analytics(days=7)
+        self.create_sample_analytics(days=7 * self.scale)
 
     def create_comprehensive_dataset(self, force_create=False):
         """Create comprehensive realistic dataset"""
@@ -214,7 +225,7 @@ class Command(BaseCommand):
         self.create_learning_milestones()
         
         # Create analytics data
-        self.create_sample_analytics(days=90)
+        self.create_sample_analytics(days=90 * self.scale)
         
         # Display summary
         self.display_summary()
@@ -227,7 +238,6 @@ class Command(BaseCommand):
             {
                 'degree': 'CS50: Introduction to Computer Science',
                 'institution': 'Harvard University',
-                'platform': 'edX HarvardX',
                 'field_of_study': 'Computer Science',
                 'learning_type': 'online_course',
                 'start_date': date(2022, 8, 15),
@@ -235,13 +245,10 @@ class Command(BaseCommand):
                 'hours_completed': 100,
                 'description': 'Comprehensive introduction to computer science and programming. Covered algorithms, data structures, memory management, and multiple programming languages.',
                 'certificate_url': 'https://certificates.cs50.io/sample-certificate',
-                'career_relevance': 5,
-                'learning_intensity': 4,
             },
             {
                 'degree': '100 Days of Code: Complete Python Pro Bootcamp',
                 'institution': 'Udemy',
-                'platform': 'Udemy',
                 'field_of_study': 'Python Programming',
                 'learning_type': 'online_course',
                 'start_date': date(2023, 1, 10),
@@ -249,26 +256,20 @@ class Command(BaseCommand):
                 'hours_completed': 120,
                 'description': 'Intensive Python programming bootcamp covering web development, data science, automation, and GUI development.',
                 'certificate_url': 'https://udemy.com/certificate/sample-python',
-                'career_relevance': 5,
-                'learning_intensity': 5,
             },
             {
                 'degree': 'Django for Beginners',
                 'institution': 'Django Software Foundation',
-                'platform': 'Official Documentation + Tutorial',
                 'field_of_study': 'Web Development',
                 'learning_type': 'self_study',
                 'start_date': date(2023, 6, 1),
                 'end_date': date(2023, 8, 15),
                 'hours_completed': 80,
                 'description': 'Self-directed learning of Django web framework through official documentation, tutorials, and building practice projects.',
-                'career_relevance': 5,
-                'learning_intensity': 4,
             },
             {
                 'degree': 'JavaScript Algorithms and Data Structures',
                 'institution': 'freeCodeCamp',
-                'platform': 'freeCodeCamp',
                 'field_of_study': 'JavaScript Programming',
                 'learning_type': 'online_course',
                 'start_date': date(2023, 9, 1),
@@ -276,13 +277,10 @@ class Command(BaseCommand):
                 'hours_completed': 60,
                 'description': 'Comprehensive JavaScript course covering ES6, algorithms, data structures, and functional programming.',
                 'certificate_url': 'https://freecodecamp.org/certification/sample-js',
-                'career_relevance': 4,
-                'learning_intensity': 3,
             },
             {
                 'degree': 'Git and GitHub Complete Course',
                 'institution': 'GitHub',
-                'platform': 'GitHub Skills',
                 'field_of_study': 'Version Control',
                 'learning_type': 'online_course',
                 'start_date': date(2023, 3, 1),
@@ -290,13 +288,10 @@ class Command(BaseCommand):
                 'hours_completed': 20,
                 'description': 'Version control fundamentals, branching strategies, collaboration workflows, and GitHub Actions.',
                 'certificate_url': 'https://github.com/skills/sample-completion',
-                'career_relevance': 5,
-                'learning_intensity': 2,
             },
             {
                 'degree': 'LLM Engineering with Python',
                 'institution': 'Udemy',
-                'platform': 'Udemy',
                 'field_of_study': 'AI/Machine Learning',
                 'learning_type': 'online_course',
                 'start_date': date(2024, 11, 1),
@@ -304,8 +299,6 @@ class Command(BaseCommand):
                 'hours_completed': 25,
                 'description': 'Advanced course on Large Language Model engineering, prompt engineering, and AI application development.',
                 'is_current': True,
-                'career_relevance': 5,
-                'learning_intensity': 4,
             },
         ]
         
@@ -348,7 +341,6 @@ class Command(BaseCommand):
             {
                 'degree': 'SQL for Data Science',
                 'institution': 'Coursera',
-                'platform': 'Coursera',
                 'field_of_study': 'Database Management',
                 'learning_type': 'online_course',
                 'start_date': date(2023, 4, 1),
@@ -356,13 +348,10 @@ class Command(BaseCommand):
                 'hours_completed': 40,
                 'description': 'Database fundamentals, SQL queries, joins, and data analysis techniques.',
                 'certificate_url': 'https://coursera.org/verify/sample-sql',
-                'career_relevance': 4,
-                'learning_intensity': 3,
             },
             {
                 'degree': 'Responsive Web Design',
                 'institution': 'freeCodeCamp',
-                'platform': 'freeCodeCamp',
                 'field_of_study': 'Web Design',
                 'learning_type': 'certification',
                 'start_date': date(2023, 2, 1),
@@ -370,21 +359,16 @@ class Command(BaseCommand):
                 'hours_completed': 35,
                 'description': 'HTML5, CSS3, responsive design principles, and accessibility standards.',
                 'certificate_url': 'https://freecodecamp.org/certification/sample-responsive',
-                'career_relevance': 4,
-                'learning_intensity': 3,
             },
             {
                 'degree': 'API Development with FastAPI',
                 'institution': 'Self-Study',
-                'platform': 'Documentation + YouTube',
                 'field_of_study': 'API Development',
                 'learning_type': 'self_study',
                 'start_date': date(2024, 3, 1),
                 'end_date': date(2024, 4, 20),
                 'hours_completed': 30,
                 'description': 'Modern API development with FastAPI, automatic documentation, and async programming.',
-                'career_relevance': 4,
-                'learning_intensity': 3,
             },
         ]
         
@@ -653,40 +637,30 @@ class Command(BaseCommand):
                 'milestone_type': 'first_time',
                 'title': 'First Successful Django Deployment',
                 'description': 'Successfully deployed first Django application to production using Heroku. Learned about environment variables, static file serving, and database configuration.',
-                'difficulty_level': 4,
-                'confidence_boost': 4,
                 'days_ago': 180,
             },
             {
                 'milestone_type': 'breakthrough',
                 'title': 'Understanding Django ORM Relationships',
                 'description': 'Major breakthrough in understanding foreign keys, many-to-many relationships, and complex database queries. This unlocked advanced model design patterns.',
-                'difficulty_level': 5,
-                'confidence_boost': 5,
                 'days_ago': 120,
             },
             {
                 'milestone_type': 'debugging',
                 'title': 'Solved Complex JavaScript Async Issue',
                 'description': 'Spent 3 days debugging a complex asynchronous JavaScript problem with API calls. Finally understood promises, async/await, and error handling.',
-                'difficulty_level': 4,
-                'confidence_boost': 4,
                 'days_ago': 90,
             },
             {
                 'milestone_type': 'completion',
                 'title': 'Portfolio Website Launch',
                 'description': 'Completed and launched personal portfolio website with Django backend, custom admin system, and responsive frontend. First major full-stack project.',
-                'difficulty_level': 4,
-                'confidence_boost': 5,
                 'days_ago': 60,
             },
             {
                 'milestone_type': 'teaching',
                 'title': 'Helped Fellow Learner with Python Problem',
                 'description': 'Successfully helped another developer solve a complex Python algorithm problem on a coding forum. Realized I could explain concepts clearly.',
-                'difficulty_level': 3,
-                'confidence_boost': 4,
                 'days_ago': 30,
             },
         ]
@@ -706,8 +680,6 @@ class Command(BaseCommand):
                         'milestone_type': milestone_data['milestone_type'],
                         'description': milestone_data['description'],
                         'date_achieved': milestone_date,
-                        'difficulty_level': milestone_data['difficulty_level'],
-                        'confidence_boost': milestone_data['confidence_boost'],
                     }
                 )
                 
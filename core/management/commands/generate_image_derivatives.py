@@ -0,0 +1,103 @@
+"""
+Django Management Command to Backfill Responsive Image Derivatives
+File: core/management/commands/generate_image_derivatives.py
+
+Walks every ImageField registered in core.services.image_derivatives and
+renders the WebP/AVIF/JPEG width variants for sources that don't have them
+yet. Resizing is CPU bound, so it runs in a process pool; rows are written
+from the parent process once each source finishes.
+
+Saves no longer render in the request, so new uploads wait for this
+command: run it from cron (every few minutes) and after deploys.
+
+Usage:
+    python manage.py generate_image_derivatives
+    python manage.py generate_image_derivatives --workers 8 --force
+    python manage.py generate_image_derivatives --dry-run
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.models import ImageDerivative
+from core.services.image_derivatives import (
+    DERIVATIVE_FORMATS,
+    iter_source_names,
+    render_derivatives,
+    store_derivatives,
+)
+
+
+class Command(BaseCommand):
+    help = "Generate responsive image derivatives for existing uploads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes (default: CPU count)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate derivatives even for sources that already have them',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the sources that would be processed without rendering anything',
+        )
+
+    def handle(self, *args, **options):
+        sources = list(iter_source_names())
+        if not options['force']:
+            done = set(ImageDerivative.objects.values_list('source', flat=True).distinct())
+            sources = [name for name in sources if name not in done]
+
+        self.stdout.write(
+            f"Formats: {', '.join(DERIVATIVE_FORMATS)} | {len(sources)} source image(s) to process"
+        )
+
+        if options['dry_run']:
+            for name in sources:
+                self.stdout.write(f"  {name}")
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No files written"))
+            return
+
+        if not sources:
+            self.stdout.write(self.style.SUCCESS("✓ All images already have derivatives"))
+            return
+
+        # Forked workers must not inherit open DB connections
+        connections.close_all()
+
+        generated = 0
+        failed = 0
+        workers = max(1, options['workers'])
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(render_derivatives, name): name for name in sources}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    rendered = future.result()
+                except (OSError, ValueError) as e:
+                    failed += 1
+                    self.stdout.write(self.style.ERROR(f"❌ {name}: {e}"))
+                    continue
+
+                store_derivatives(name, rendered)
+                generated += len(rendered)
+                self.stdout.write(f"  ✓ {name} ({len(rendered)} files)")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Generated {generated} derivatives for {len(sources) - failed} image(s)"
+            )
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} image(s) could not be processed"))
@@ -2,26 +2,359 @@
 """
 Django Management Command for Importing Level 1 Foundation Data from CSV
 Usage: python manage.py import_foundation_data <model_name> <csv_file_path>
+
+Bulk mode (large files, CSV/JSON/JSONL):
+    python manage.py import_foundation_data skills data/skills.jsonl --bulk
+    python manage.py import_foundation_data tags tags.csv --bulk --update --chunk-size 5000 --workers 4
 """
 
 import csv
+import json
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from django.apps import apps
 from django.core.management.base import BaseCommand, CommandError, CommandParser
-from django.core.exceptions import FieldError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.contrib.auth.models import User
-from django.db import transaction
+from django.db import connections, transaction
 from django.utils.text import slugify
 from django.utils import timezone
 
 from core.models import Skill, CorePage, SocialLink, Contact
 from projects.models import Technology, SystemType
 from blog.models import Category, Tag, Series
+from core.services.syndication import CONTENT_GROUPS, bump_generation
+
+
+class SkipRow(Exception):
+    """Row can't be imported; the message says why."""
+
+
+# ===== ROW PREPARATION =====
+
+def parse_boolean(value):
+    """Convert various bool representations to Python bool"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        value = value.strip().upper()
+        if value in ['TRUE', '1', 'YES', 'Y']:
+            return True
+        if value in ['FALSE', '0', 'NO', 'N', '']:
+            return False
+    return False
+
+
+def parse_date(value, warnings=None):
+    """Parse date string to date object; unparseable dates are noted in `warnings`"""
+    if not value or value.strip() == '':
+        return None
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d').date()
+    except ValueError:
+        try:
+            return datetime.strptime(value.strip(), '%m/%d/%Y').date()
+        except ValueError:
+            if warnings is not None:
+                warnings.append(f"Could not parse date: {value}, skipping")
+            return None
+
+
+def parse_float(value, default=0.0):
+    """Parse float with fallback"""
+    if not value or value.strip() == '':
+        return default
+    try:
+        return float(value.strip())
+    except ValueError:
+        return default
+
+
+def parse_int(value, default =0):
+    """Parse int w fallback"""
+    if not value or value.strip() == '':
+        return default
+    try:
+        return int(value.strip())
+    except ValueError:
+        return default
+
+
+def key_field(model):
+    """Field that identifies an existing record - slug where the model has one (social links/contacts use name)"""
+    try:
+        model._meta.get_field('slug')
+        return 'slug'
+    except FieldDoesNotExist:
+        return 'name'
+
+
+def unvalidated_fields(model, data):
+    """
+    Fields bulk validation skips: anything the row left empty or doesn't set.
+    The row-by-row import never rejected those, so bulk doesn't either.
+    """
+    provided = {field for field, value in data.items() if value not in ('', None)}
+    return [f.name for f in model._meta.concrete_fields if f.name not in provided]
+
+
+def prepare_row(model, row, warnings=None):
+    """
+    Turn one input row into (name, key, model data).
+    Raises SkipRow for rows missing required values; parse warnings go to `warnings`.
+    """
+    name = row.get('name', '').strip()
+
+    if not name:
+        name = row.get('title', '').strip()
+
+    if not name:
+        raise SkipRow(f"Skipping - no name provided: {name}")
+
+    if model is Category:
+        code = row.get('code', '').strip()
+        if not code:
+            raise SkipRow("Skipping - code required")
+
+    if model is SocialLink:
+        url = row.get('url', '').strip()
+        if not url:
+            raise SkipRow("Skipping - url required")
+
+    if model is Contact:
+        email = row.get('email', '').strip()
+        if not email:
+            raise SkipRow("Skipping - email required")
+
+    if key_field(model) == 'slug':
+        slug = row.get('slug', '').strip() or slugify(name)
+        key = slug
+    else:
+        key = name
+
+    # Prepare Data
+    if model is Skill:
+        data = prep_skills(row, name, slug, warnings)
+    elif model is Technology:
+        data = prep_technologies(row, name, slug)
+    elif model is Category:
+        data = prep_categories(row, name, code, slug)
+    elif model is Tag:
+        data = prep_tags(name, slug)
+    elif model is Series:
+        data = prep_series(row, name, slug)
+    elif model is SystemType:
+        data = prep_systemtypes(row, name, slug)
+    elif model is CorePage:
+        data = prep_corepages(row, name, slug)
+    elif model is SocialLink:
+        data = prep_sociallinks(row, name, url)
+    elif model is Contact:
+        data = prep_contacts(row, name, email)
+
+    return name, key, data
+
+
+def prep_skills(row, name, slug, warnings=None):
+    """Skill-specific data prep"""
+
+    # Prepare data
+    skill_data = {
+        'name': name,
+        'slug': slug,
+        'category': row.get('category', 'technical_concept').strip(),
+        'description': row.get('description', '').strip(),
+        'proficiency': parse_int(row.get('proficiency', '1'), 1),
+        'icon': row.get('icon', 'fa-solid fa-brain').strip(),
+        'color': row.get('color', '#34d399').strip(),
+        'display_order': parse_int(row.get('display_order', '0')),
+        'years_experience': parse_float(row.get('years_experience', '0')),
+        'is_featured': parse_boolean(row.get('is_featured', 'FALSE')),
+        'last_used': parse_date(row.get('last_used', ''), warnings),
+        'is_currently_learning': parse_boolean(row.get('is_currently_learning', 'FALSE')),
+        'is_certified': parse_boolean(row.get('is_certified', 'FALSE')),
+    }
+
+    return skill_data
+
+
+def prep_technologies(row, name, slug):
+    """Technology-specific data prep"""
+
+    tech_data = {
+        'name': name,
+        'slug': slug,
+        'description': row.get('description', '').strip(),
+        'category': row.get('category', 'other').strip(),
+        'icon': row.get('icon', 'fa-solid fa-tools').strip(),
+        'color': row.get('color', '#fb923c').strip(),
+    }
+
+    return tech_data
+
+
+def prep_categories(row, name, code, slug):
+    """Category-specific data prep"""
+
+    cat_data = {
+        'name': name,
+        'slug': slug,
+        'code': code.upper()[:2],
+        'description': row.get('description', '').strip(),
+        'color': row.get('color', '#00f0ff').strip(),
+        'icon': row.get('icon', '').strip(),
+    }
+
+    return cat_data
+
+
+def prep_tags(name, slug):
+    """Tag-specific data prep"""
+
+    tag_data = {
+        'name': name,
+        'slug': slug,
+    }
+
+    return tag_data
+
+
+def prep_series(row, name, slug):
+    """Series-specific data prep"""
+
+    series_data = {
+        'title': name,
+        'slug': slug,
+        'description': row.get('description', '').strip(),
+        'difficulty_level': row.get('difficulty_level', 'intermediate').strip(),
+        'is_complete': parse_boolean(row.get('is_complete', 'FALSE')),
+        'is_featured': parse_boolean(row.get('is_featured', 'FALSE')),
+    }
+
+    return series_data
+
+
+def prep_systemtypes(row, name, slug):
+    """System Type-specific data prep"""
+
+    type_data = {
+        'name': name,
+        'slug': slug,
+        'description': row.get('description', '').strip(),
+        'icon': row.get('icon', 'fa-solid fa-layer-group').strip(),
+        'color': row.get('color', "#b39ddb").strip(),
+        'display_order': parse_int(row.get('display_order', '0')),
+    }
+
+    return type_data
+
+
+def prep_sociallinks(row, name, url):
+    """SocialLink-specific data prep"""
+
+    links = {
+        'name': name,
+        'url': url,
+        'handle': row.get('handle', '').strip(),
+        'icon': row.get('icon', 'fa-solid fa-share-alt').strip(),
+        'display_order': parse_int(row.get('display_order', '0')),
+        'category': row.get('category', 'other').strip(),
+        'color': row.get('color', '#60a5fa').strip(),
+    }
+
+    return links
+
+
+def prep_corepages(row, name, slug):
+    """CorePage-specific data prep"""
+
+    page = {
+        'title': name,
+        'slug': slug,
+        'content': row.get('content', '').strip(),
+        'meta_description': row.get('meta_desccription', '')[:160].strip(),
+        'is_published': parse_boolean(row.get('is_published', 'TRUE')),
+    }
+
+    return page
+
+
+def prep_contacts(row, name, email):
+    """Contact-specific data prep"""
+
+    contact = {
+        'name': name,
+        'email': email,
+        'subject': row.get('subject', '').strip(),
+        'message': row.get('message', '').strip(),
+        'inquiry_category': row.get('inquiry_category', 'other').strip(),
+        'priority': row.get('priority', 'normal').strip(),
+        'is_read': parse_boolean(row.get('is_read', 'FALSE')),
+        'response_sent': parse_boolean(row.get('response_sent', 'FALSE')),
+    }
+
+    return contact
+
+
+def validate_row(model, row):
+    """
+    Prepare one row and validate it in memory with clean_fields() over the
+    values it provides. Returns (name, key, data, warnings); raises SkipRow
+    or ValidationError.
+    """
+    warnings = []
+    name, key, data = prepare_row(model, row, warnings)
+    try:
+        model(**data).clean_fields(exclude=unvalidated_fields(model, data))
+    except ValidationError as e:
+        details = '; '.join(f"{field}: {' '.join(errors)}" for field, errors in e.message_dict.items())
+        raise ValidationError(f"Invalid {name}: {details}")
+    return name, key, data, warnings
+
+
+def _validate_chunk(model_label, rows):
+    """
+    Validate a chunk of (row_num, row) pairs with validate_row(), without touching the DB.
+
+    Module-level so ProcessPoolExecutor workers can pickle it. Returns
+    (prepared, problems): prepared is [(row_num, name, key, data)], problems
+    is [(row_num, level, message)] with level 'skip', 'error' or 'warning'.
+    """
+    model = apps.get_model(model_label)
+    prepared = []
+    problems = []
+
+    for row_num, row in rows:
+        try:
+            name, key, data, warnings = validate_row(model, row)
+        except SkipRow as e:
+            problems.append((row_num, 'skip', str(e)))
+            continue
+        except ValidationError as e:
+            problems.append((row_num, 'error', e.message))
+            continue
+        except Exception as e:
+            problems.append((row_num, 'error', f"Error processing {row.get('name', 'unknown')}: {e}"))
+            continue
+
+        # parse_* warnings (e.g. unparseable dates) ride along with the row
+        problems.extend((row_num, 'warning', warning) for warning in warnings)
+        prepared.append((row_num, name, key, data))
+
+    return prepared, problems
 
 
 class Command(BaseCommand):
     help = "Import Level 1 foundation data from CSV files"
 
+    # Creating these also creates a matching Tag (see core.signals)
+    AUTO_TAG_MODELS = (Skill, Technology)
+
     # Model mapping
     MODELS = {
         'skill': Skill,
@@ -64,6 +397,28 @@ class Command(BaseCommand):
             action='store_true',
             help='Update existing records instead of skipping them'
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Chunked bulk import: validate in memory, write each chunk in one transaction'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'json', 'jsonl'],
+            help='Input format (default: from the file extension)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Rows per validation/write chunk in bulk mode (default: 2000)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Processes for the bulk validation stage (default: 1, inline)'
+        )
     
     def handle(self, *args, **options):
         model_name = options['model'].lower()
@@ -94,7 +449,15 @@ class Command(BaseCommand):
 
         # Import based on model
         try:
-            self.import_data(csv_file, dry_run, update_existing, model=model_class)
+            if options['bulk']:
+                self.import_data_bulk(
+                    csv_file, dry_run, update_existing, model=model_class,
+                    input_format=options['format'] or self.detect_format(csv_file),
+                    chunk_size=max(options['chunk_size'], 1),
+                    workers=max(options['workers'], 1),
+                )
+            else:
+                self.import_data(csv_file, dry_run, update_existing, model=model_class)
             # if model_class == Skill:
             #     self.import_skills(csv_file, dry_run, update_existing)
             # elif model_class == CorePage:
@@ -118,52 +481,6 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"\nERROR: {str(e)}"))
             raise
     
-    def parse_boolean(self, value):
-        """Convert various bool representations to Python bool"""
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            value = value.strip().upper()
-            if value in ['TRUE', '1', 'YES', 'Y']:
-                return True
-            if value in ['FALSE', '0', 'NO', 'N', '']:
-                return False
-        return False
-    
-    def parse_date(self, value):
-        """Parse date string to date object"""
-        if not value or value.strip() == '':
-            return None
-        try:
-            return datetime.strptime(value.strip(), '%Y-%m-%d').date()
-        except ValueError:
-            try:
-                return datetime.strptime(value.strip(), '%m/%d/%Y').date()
-            except ValueError:
-                self.stdout.write(self.style.WARNING(
-                    f"Could not parse date: {value}, skipping"
-                ))
-                return None
-    
-    def parse_float(self, value, default=0.0):
-        """Parse float with fallback"""
-        if not value or value.strip() == '':
-            return default
-        try:
-            return float(value.strip())
-        except ValueError:
-            return default
-        
-    def parse_int(self, value, default =0):
-        """Parse int w fallback"""
-        if not value or value.strip() == '':
-            return default
-        try:
-            return int(value.strip())
-        except ValueError:
-            return default
-    
-
     def import_data(self, csv_file, dry_run, update_existing, model):
         """Import data from CSV"""
         created_count = 0
@@ -176,54 +493,17 @@ class Command(BaseCommand):
 
             for row_num, row in enumerate(reader, start=2):
                 try:
-                    name = row.get('name', '').strip()
-
-                    if not name:
-                        name = row.get('title', '').strip()
-
-                    if not name:
-                        self.stdout.write(self.style.WARNING(
-                            f"Row {row_num}: Skipping - no name provided: {name}"
-                        ))
+                    warnings = []
+                    try:
+                        name, key, data = prepare_row(model, row, warnings)
+                    except SkipRow as e:
+                        self.stdout.write(self.style.WARNING(f"Row {row_num}: {e}"))
                         skipped_count += 1
                         continue
+                    for warning in warnings:
+                        self.stdout.write(self.style.WARNING(warning))
 
-                    if 'Category' in str(model):
-                        code = row.get('code', '').strip()
-
-                        if not code:
-                            self.stdout.write(self.style.WARNING(
-                                f"Row {row_num}: Skipping - code required"
-                            ))
-                            skipped_count += 1
-                            continue
-
-                    if 'SocialLink' in str(model):
-                        url = row.get('url', '').strip()
-
-                        if not url:
-                            self.stdout.write(self.style.WARNING(
-                                f"Row {row_num}: Skipping - url required"
-                            ))
-                            skipped_count += 1
-                            continue
-                    
-                    if 'Contact' in str(model):
-                        email = row.get('email', '').strip()
-
-                        if not email:
-                            self.stdout.write(self.style.WARNING(
-                                f"Row {row_num}: Skipping - email required"
-                            ))
-                            skipped_count += 1
-                            continue
-
-                    # Check if exists - special treatment for social links (no slug)
-                    try:
-                        slug = row.get('slug', '').strip() or slugify(name)
-                        existing = model.objects.filter(slug=slug).first()
-                    except FieldError:
-                        existing = model.objects.filter(name=name).first()
+                    existing = model.objects.filter(**{key_field(model): key}).first()
 
                     if existing and not update_existing:
                         self.stdout.write(self.style.WARNING(
@@ -232,27 +512,6 @@ class Command(BaseCommand):
                         skipped_count += 1
                         continue
 
-                    # Prepare Data
-                    if 'Skill' in str(model):
-                        data = self.prep_skills(row, name, slug)
-                    elif 'Technology' in str(model):
-                        data = self.prep_technologies(row, name, slug)
-                    elif 'Category' in str(model):
-                        data = self.prep_categories(row, name, code, slug)
-                    elif 'Tag' in str(model):
-                        data = self.prep_tags(name, slug)
-                    elif 'Series' in str(model):
-                        data = self.prep_series(row, name, slug)
-                    elif 'SystemType' in str(model):
-                        data = self.prep_systemtypes(row, name, slug)
-                    elif 'CorePage' in str(model):
-                        data = self.prep_corepages(row, name, slug)
-                    elif 'SocialLink' in str(model):
-                        data = self.prep_sociallinks(row, name, url)
-                    elif 'Contact' in str(model):
-                        data = self.prep_contacts(row, name, email)
-                    
-
                     if dry_run:
                         self.stdout.write(self.style.SUCCESS(
                             f"Row {row_num}: Would {'update' if existing else 'create'} {model}: {name}"
@@ -284,139 +543,184 @@ class Command(BaseCommand):
                     error_count += 1
 
         self.print_summary(model, created_count, updated_count, skipped_count, error_count)
-    
-    
-    def prep_skills(self, row, name, slug):
-        """Skill-specific data prep"""
-        
-        # Prepare data
-        skill_data = {
-            'name': name,
-            'slug': slug,
-            'category': row.get('category', 'technical_concept').strip(),
-            'description': row.get('description', '').strip(),
-            'proficiency': self.parse_int(row.get('proficiency', '1'), 1),
-            'icon': row.get('icon', 'fa-solid fa-brain').strip(),
-            'color': row.get('color', '#34d399').strip(),
-            'display_order': self.parse_int(row.get('display_order', '0')),
-            'years_experience': self.parse_float(row.get('years_experience', '0')),
-            'is_featured': self.parse_boolean(row.get('is_featured', 'FALSE')),
-            'last_used': self.parse_date(row.get('last_used', '')),
-            'is_currently_learning': self.parse_boolean(row.get('is_currently_learning', 'FALSE')),
-            'is_certified': self.parse_boolean(row.get('is_certified', 'FALSE')),
-        }
-
-        return skill_data  
-    
-    def prep_technologies(self, row, name, slug):
-        """Technology-specific data prep"""
-
-        tech_data = {
-            'name': name,
-            'slug': slug,
-            'description': row.get('description', '').strip(),
-            'category': row.get('category', 'other').strip(),
-            'icon': row.get('icon', 'fa-solid fa-tools').strip(),
-            'color': row.get('color', '#fb923c').strip(),
-        }
-
-        return tech_data
-    
-    def prep_categories(self, row, name, code, slug):
-        """Category-specific data prep"""
-
-        cat_data = {
-            'name': name,
-            'slug': slug,
-            'code': code.upper()[:2],
-            'description': row.get('description', '').strip(),
-            'color': row.get('color', '#00f0ff').strip(),
-            'icon': row.get('icon', '').strip(),
-        }
-
-        return cat_data
-    
-    def prep_tags(self, name, slug):
-        """Tag-specific data prep"""
 
-        tag_data = {
-            'name': name,
-            'slug': slug,
-        }
+    # ===== BULK IMPORT =====
+
+    def detect_format(self, path):
+        suffix = Path(path).suffix.lower().lstrip('.')
+        if suffix in ('json', 'jsonl'):
+            return suffix
+        if suffix == 'ndjson':
+            return 'jsonl'
+        return 'csv'
+
+    def read_rows(self, path, input_format):
+        """Yield (row_num, row) with every value as a string, like csv.DictReader gives"""
+        def as_text(record):
+            return {
+                key: ('TRUE' if value else 'FALSE') if isinstance(value, bool)
+                else '' if value is None else str(value)
+                for key, value in record.items()
+            }
+
+        with open(path, 'r', encoding='utf-8') as f:
+            if input_format == 'csv':
+                # Row numbers match the spreadsheet (header is row 1)
+                yield from enumerate(csv.DictReader(f), start=2)
+            elif input_format == 'jsonl':
+                for line_num, line in enumerate(f, start=1):
+                    if line.strip():
+                        yield line_num, as_text(json.loads(line))
+            else:
+                data = json.load(f)
+                if isinstance(data, dict):
+                    data = data.get('results') or data.get('data') or [data]
+                for index, record in enumerate(data, start=1):
+                    yield index, as_text(record)
+
+    def iter_chunks(self, rows, chunk_size):
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield chunk
+
+    def validated_chunks(self, chunks, model, workers):
+        """Validate chunks in order - inline, or across processes with a bounded window of in-flight chunks"""
+        if workers == 1:
+            for chunk in chunks:
+                yield _validate_chunk(model._meta.label, chunk)
+            return
 
-        return tag_data
-    
-    def prep_series(self, row, name, slug):
-        """Series-specific data prep"""
-
-        series_data = {
-            'title': name,
-            'slug': slug,
-            'description': row.get('description', '').strip(),
-            'difficulty_level': row.get('difficulty_level', 'intermediate').strip(),
-            'is_complete': self.parse_boolean(row.get('is_complete', 'FALSE')),
-            'is_featured': self.parse_boolean(row.get('is_featured', 'FALSE')),
-        }
-
-        return series_data
-    
-    def prep_systemtypes(self, row, name, slug):
-        """System Type-specific data prep"""
-
-        type_data = {
-            'name': name,
-            'slug': slug,
-            'description': row.get('description', '').strip(),
-            'icon': row.get('icon', 'fa-solid fa-layer-group').strip(),
-            'color': row.get('color', "#b39ddb").strip(),
-            'display_order': self.parse_int(row.get('display_order', '0')),
-        }
-
-        return type_data
-    
-    def prep_sociallinks(self, row, name, url):
-        """SocialLink-specific data prep"""
-
-        links = {
-            'name': name,
-            'url': url,
-            'handle': row.get('handle', '').strip(),
-            'icon': row.get('icon', 'fa-solid fa-share-alt').strip(),
-            'display_order': self.parse_int(row.get('display_order', '0')),
-            'category': row.get('category', 'other').strip(),
-            'color': row.get('color', '#60a5fa').strip(),
-        }
-
-        return links
-    
-    def prep_corepages(self, row, name, slug):
-        """CorePage-specific data prep"""
-
-        page = {
-            'title': name,
-            'slug': slug,
-            'content': row.get('content', '').strip(),
-            'meta_description': row.get('meta_desccription', '')[:160].strip(),
-            'is_published': self.parse_boolean(row.get('is_published', 'TRUE')),
-        }
-
-        return page
-    
-    def prep_contacts(self, row, name, email):
-        """Contact-specific data prep"""
-
-        contact = {
-            'name': name,
-            'email': email,
-            'subject': row.get('subject', '').strip(),
-            'message': row.get('message', '').strip(),
-            'inquiry_category': row.get('inquiry_category', 'other').strip(),
-            'priority': row.get('priority', 'normal').strip(),
-            'is_read': self.parse_boolean(row.get('is_read', 'FALSE')),
-            'response_sent': self.parse_boolean(row.get('response_sent', 'FALSE')),
-        }
-
-        return contact
+        # Forked workers must not inherit open DB connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_validate_chunk, model._meta.label, chunk))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def import_data_bulk(self, path, dry_run, update_existing, model, input_format, chunk_size, workers):
+        """
+        Chunked import: one query to load existing keys, in-memory validation
+        (optionally in parallel), then one transaction and a handful of bulk
+        statements per chunk.
+        """
+        key_name = key_field(model)
+        key_is_unique = model._meta.get_field(key_name).unique
+        created_count = updated_count = skipped_count = error_count = 0
+        validate_seconds = write_seconds = 0.0
+        started = time.perf_counter()
+
+        # key -> pk for everything already in the table
+        existing = dict(model.objects.values_list(key_name, 'pk'))
+        self.stdout.write(f"Format: {input_format}, chunk size {chunk_size}, {workers} validation worker(s)")
+        self.stdout.write(f"Existing {model.__name__} records: {len(existing)}\n")
+
+        chunks = self.iter_chunks(self.read_rows(path, input_format), chunk_size)
+        results = self.validated_chunks(chunks, model, workers)
+
+        while True:
+            chunk_started = time.perf_counter()
+            try:
+                prepared, problems = next(results)
+            except StopIteration:
+                break
+            validate_seconds += time.perf_counter() - chunk_started
+
+            for row_num, level, message in problems:
+                if level == 'error':
+                    self.stdout.write(self.style.ERROR(f"Row {row_num}: {message}"))
+                    error_count += 1
+                else:
+                    self.stdout.write(self.style.WARNING(f"Row {row_num}: {message}"))
+                    skipped_count += level == 'skip'
+
+            # Duplicates of an existing (or earlier) row need --update; with it, the last row wins
+            to_create, to_update = {}, {}
+            for row_num, name, key, data in prepared:
+                if (key in existing or key in to_create) and not update_existing:
+                    self.stdout.write(self.style.WARNING(
+                        f"Row {row_num}: {model} '{name}' already exists, skipping"
+                    ))
+                    skipped_count += 1
+                elif key in existing:
+                    to_update[key] = data
+                else:
+                    to_create[key] = data
+
+            write_started = time.perf_counter()
+            if not dry_run and (to_create or to_update):
+                with transaction.atomic():
+                    self.write_chunk(model, key_name, key_is_unique, to_create, to_update, existing)
+            else:
+                existing.update(dict.fromkeys(to_create))
+            write_seconds += time.perf_counter() - write_started
+
+            created_count += len(to_create)
+            updated_count += len(to_update)
+            self.stdout.write(
+                f"  {'Validated' if dry_run else 'Imported'} chunk: "
+                f"{len(to_create)} new, {len(to_update)} updated, {len(problems)} flagged"
+            )
+
+        elapsed = time.perf_counter() - started
+        total = created_count + updated_count
+        if total and not dry_run:
+            # bulk writes skip the signals that invalidate cached feeds/sitemaps
+            for group in CONTENT_GROUPS:
+                bump_generation(group)
+        self.print_summary(model, created_count, updated_count, skipped_count, error_count)
+        self.stdout.write(
+            f"Timing: {elapsed:.2f}s total (validation {validate_seconds:.2f}s, "
+            f"writes {write_seconds:.2f}s) - {total / max(elapsed, 1e-6):.0f} rows/s\n"
+        )
+
+    def write_chunk(self, model, key_field, key_is_unique, to_create, to_update, existing):
+        """Write one validated chunk. Caller wraps this in a transaction."""
+        data_fields = list(next(iter({**to_create, **to_update}.values())).keys())
+        auto_now = [f.name for f in model._meta.concrete_fields if getattr(f, 'auto_now', False)]
+
+        if key_is_unique:
+            # Single upsert for new + changed rows
+            objs = [model(**data) for data in [*to_create.values(), *to_update.values()]]
+            update_fields = [f for f in data_fields + auto_now if f != key_field]
+            model.objects.bulk_create(
+                objs,
+                update_conflicts=bool(to_update),
+                unique_fields=[key_field] if to_update else None,
+                update_fields=update_fields if to_update else None,
+            )
+        else:
+            created = model.objects.bulk_create([model(**data) for data in to_create.values()])
+            now = timezone.now()
+            updated = []
+            for key, data in to_update.items():
+                obj = model(pk=existing[key], **data)
+                for field in auto_now:
+                    setattr(obj, field, now)
+                updated.append(obj)
+            if updated:
+                model.objects.bulk_update(updated, data_fields + auto_now)
+            for obj in created:
+                existing[getattr(obj, key_field)] = obj.pk
+
+        if key_is_unique and to_create:
+            existing.update(
+                model.objects.filter(**{f'{key_field}__in': list(to_create)}).values_list(key_field, 'pk')
+            )
+
+        # bulk_create skips post_save, so mirror the Skill/Technology -> Tag signal here
+        if model in self.AUTO_TAG_MODELS and to_create:
+            tags = {}
+            for data in to_create.values():
+                tag_name = data['name'].lower()
+                tags.setdefault(slugify(tag_name), tag_name)
+            Tag.objects.bulk_create(
+                [Tag(name=name, slug=slug) for slug, name in tags.items()],
+                ignore_conflicts=True,
+            )
 
     def print_summary(self, model, created, updated, skipped, errors):
         """Print import summary"""
@@ -40,6 +40,9 @@ fake = Faker()
 class Command(BaseCommand):
     help = 'Populate the database with comprehensive sample data for testing'
 
+    # Volume multiplier for posts, systems, contacts and series (see --scale)
+    scale = 1
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--clear',
@@ -52,13 +55,20 @@ class Command(BaseCommand):
             default=1,
             help='Number of users to create (default: 1)',
         )
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=1,
+            help='Multiply generated volume (posts, systems, contacts, series), e.g. 10 or 100 for benchmarking',
+        )
 
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing data...')
             self.clear_data()
 
-        self.stdout.write('Starting data population...')
+        self.scale = max(1, options.get('scale') or 1)
+        self.stdout.write(f'Starting data population (scale x{self.scale})...')
         
         # Create users first
         self.users = self.create_users(options['users'])
@@ -425,8 +435,6 @@ class Command(BaseCommand):
                     'is_current': False,
                     'certificate_url': fake.url() if randint(0, 1) else '',
                     'hours_completed': edu_data['hours'],
-                    'learning_intensity': randint(2, 5),
-                    'career_relevance': randint(3, 5),
                 }
             )
             educations.append(education)
@@ -563,7 +571,8 @@ class Command(BaseCommand):
         inquiry_types = ['project', 'hiring', 'collaboration', 'question', 'feedback']
         priorities = ['low', 'normal', 'high']
         
-        for i in range(15):
+        total = 15 * self.scale
+        for i in range(total):
             contact = Contact.objects.create(
                 name=fake.name(),
                 email=fake.email(),
@@ -579,7 +588,7 @@ class Command(BaseCommand):
                 priority=choice(priorities)
             )
             
-        self.stdout.write('Created 15 contact form submissions')
+        self.stdout.write(f'Created {total} contact form submissions')
 
     def create_systems(self):
         """Create system modules with required fields"""
@@ -614,6 +623,16 @@ class Command(BaseCommand):
             },
         ]
         
+        # Synthetic extra systems when scaling up
+        for i in range(len(system_data) * (self.scale - 1)):
+            system_data.append({
+                'title': f'{fake.catch_phrase()} #{i + 1}',
+                'description': fake.sentence(10),
+                'status': choice(['deployed', 'published', 'in_development', 'planning']),
+                'priority': randint(1, 5),
+                'completion_percent': randint(10, 100),
+            })
+
         systems = []
         author = self.users[0]  # Use first user as author
         for sys_data in system_data:
@@ -722,8 +741,6 @@ class Command(BaseCommand):
                     defaults={
                         'proficiency_gained': randint(2, 5),
                         'how_learned': f"Applied {skill.name.lower()} concepts while building {system.title}",
-                        'skill_level_before': randint(1, 3),
-                        'skill_level_after': randint(3, 5),
                     }
                 )
                 
@@ -824,8 +841,6 @@ class Command(BaseCommand):
                     'description': milestone['description'],
                     'date_achieved': milestone['date'],
                     'milestone_type': choice(['first_time', 'breakthrough', 'completion', 'deployment', 'debugging', 'teaching']),
-                    'difficulty_level': randint(1, 5),
-                    'confidence_boost': randint(1, 5),
                     'system': choice(self.systems),
                 }
             )
@@ -936,9 +951,10 @@ class Command(BaseCommand):
         
         tags = []
         for tag_name in tag_names:
+            # Skill/Technology signals may already have created a tag w this slug
             tag, created = Tag.objects.get_or_create(
-                name=tag_name,
-                defaults={'slug': slugify(tag_name)}
+                slug=slugify(tag_name),
+                defaults={'name': tag_name}
             )
             tags.append(tag)
             if created:
@@ -952,7 +968,7 @@ class Command(BaseCommand):
         posts = []
         author = self.users[0]  # Use first user as author
         
-        for i in range(10):  # Create 10 sample posts
+        for i in range(10 * self.scale):  # Create 10 sample posts per scale step
             post, created = Post.objects.get_or_create(
                 title=fake.sentence(nb_words=6),
                 defaults={
@@ -1040,6 +1056,10 @@ class Command(BaseCommand):
             {'title': 'API Development Guide', 'description': 'Building robust APIs'},
             {'title': 'Machine Learning Journey', 'description': 'My ML learning path'},
         ]
+
+        # Synthetic extra series when scaling up
+        for i in range(len(series_data) * (self.scale - 1)):
+            series_data.append({'title': f'{fake.catch_phrase()} #{i + 1}', 'description': fake.sentence(8)})
         
         series = []
         for series_info in series_data:
@@ -0,0 +1,34 @@
+"""
+Django Management Command to Rebuild Monthly and Quarterly Commit Rollups
+File: core/management/commands/rebuild_commit_rollups.py
+
+Recomputes every GitHubCommitMonth and GitHubCommitQuarter row from
+GitHubCommitWeek. sync_github_data keeps the tables current by refreshing
+only the buckets each weekly ingest touches, and deleting weekly rows (or a
+repository) refreshes theirs; run this after editing weekly rows by hand or
+bulk loading them, or if the tables are ever suspected stale.
+
+Usage:
+    python manage.py rebuild_commit_rollups
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from projects.services.commit_rollups import rebuild_commit_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild monthly and quarterly commit rollups from weekly commit data"
+
+    def handle(self, *args, **options):
+        self.stdout.write('⏳ Rebuilding commit rollups from weekly data...')
+        started = time.perf_counter()
+        months, quarters = rebuild_commit_rollups()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✓ {months} monthly and {quarters} quarterly rollups written '
+                f'in {time.perf_counter() - started:.2f}s'
+            )
+        )
@@ -1,16 +1,32 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.db.models import Q
 from django.db import transaction
 from core.services.github_api import GitHubAPIService, GitHubAPIError
-from projects.models import GitHubRepository, GitHubLanguage, GitHubCommitWeek
+from core.services.github_async import DEFAULT_CONCURRENCY, AsyncGitHubAPIService, gather_settled
+from core.services.github_retry import DEFAULT_RETRY_CONFIG, RetryScheduler
+from projects.models import GitHubRepository, GitHubCommitWeek
+from projects.services.commit_rollups import refresh_commit_rollups
+from projects.services.language_stats import rebuild_language_rollups, upsert_repository_languages
+import asyncio
 import logging
-from datetime import timedelta
+from collections import Counter
+from datetime import datetime, timedelta
 import time
 
 logger = logging.getLogger(__name__)
 
 
+def prefetched_or(result, fetch):
+    """A result fetched ahead by the async client (re-raising its error), or fetch() it now."""
+    if result is None:
+        return fetch()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
 class Command(BaseCommand):
     help = "Enhanced GitHub repository sync with weekly commit tracking"
 
@@ -46,15 +62,68 @@ class Command(BaseCommand):
             action='store_true',
             help='Only sync repositories linked to systems',
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only fetch per-repo data for repositories pushed to since their last sync',
+        )
+        parser.add_argument(
+            '--since',
+            type=str,
+            help='With --incremental (implied): also resync repos pushed on/after this date (YYYY-MM-DD or ISO datetime)',
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='use_async',
+            help='With --incremental or --weekly-only: fetch per-repo data concurrently',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help=f'Parallel requests for --async (default: {DEFAULT_CONCURRENCY})',
+        )
+        parser.add_argument(
+            '--retry-window',
+            type=float,
+            default=DEFAULT_RETRY_CONFIG['DEADLINE'],
+            help='Seconds to keep re-polling stats GitHub is still computing (202) before '
+                 f'leaving them for the next run (default: {DEFAULT_RETRY_CONFIG["DEADLINE"]:.0f}, 0 = no waiting)',
+        )
+        parser.add_argument(
+            '--replay',
+            action='store_true',
+            help='Answer every GitHub request from the recorded response store; never touch the network',
+        )
     
     def handle(self, *args, **options):
-        github_service = GitHubAPIService()
+        self.async_client = None
+        try:
+            github_service = GitHubAPIService(replay=True if options.get('replay') else None)
+        except GitHubAPIError as e:
+            raise CommandError(str(e))
+        if github_service.replay:
+            self.stdout.write(self.style.WARNING('⚠ Replay mode: serving recorded GitHub responses only'))
+        if options.get('use_async'):
+            if not (options.get('incremental') or options.get('since') or options.get('weekly_only')):
+                raise CommandError('--async works with --incremental, --since or --weekly-only')
+            self.async_client = AsyncGitHubAPIService(options['concurrency'], service=github_service)
         username = options.get('username') or github_service.username
         force_update = options.get('force', False)
         commits_only = options.get('commits_only', False)
         weekly_only = options.get('weekly_only', False)
         system_repos_only = options.get('system_repos_only', False)
         repo_limit = options.get('limit_repos', 20)
+        since = self.parse_since(options['since']) if options.get('since') else None
+        incremental = options.get('incremental', False) or since is not None
+
+        # 202 "computing" weekly stats are re-polled with backoff while other repos sync
+        self.github_service = github_service
+        self.username = username
+        self.weekly_retries = RetryScheduler(deadline=options.get('retry_window', DEFAULT_RETRY_CONFIG['DEADLINE']))
+        self.deferred_weekly = {}
+        self.weekly_status = Counter()
 
         if not username:
             self.stdout.write(
@@ -63,12 +132,19 @@ class Command(BaseCommand):
             return
         
         try:
-            if weekly_only:
+            if incremental:
+                self.sync_incremental(github_service, username, since, repo_limit)
+            elif weekly_only:
                 self.sync_weekly_commits_only(github_service, username, force_update)
             elif commits_only:
                 self.sync_commits_only(github_service, username, force_update, repo_limit)
             else:
                 self.sync_full_data(github_service, username, force_update, repo_limit, system_repos_only)
+            self.finish_weekly_retries()
+
+            # Language widgets read these; rebuilt once per sync, not per repo
+            rollup_count = rebuild_language_rollups()
+            self.stdout.write(f'✓ Language rollups rebuilt ({rollup_count} rows)')
 
         except GitHubAPIError as e:
             self.stdout.write(
@@ -78,7 +154,273 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.ERROR(f'Unexpected error: {e}')
             )
+        finally:
+            if self.async_client:
+                self.async_client.close()
+
+    def fan_out(self, calls):
+        """
+        Run {key: (async client method, args)} concurrently; {key: result or
+        exception}. Empty without --async, so callers fall back to fetching
+        one repository at a time.
+        """
+        if not self.async_client or not calls:
+            return {}
+
+        async def run():
+            return await gather_settled({
+                key: getattr(self.async_client, method)(*args) for key, (method, args) in calls.items()
+            })
+
+        started = time.perf_counter()
+        results = asyncio.run(run())
+        self.stdout.write(f'  ⇉ {len(calls)} request group(s) fetched concurrently in {time.perf_counter() - started:.2f}s')
+        return results
     
+    # ===== 202 RETRIES =====
+
+    def defer_weekly(self, github_repo, retry_after, on_settled=None):
+        """Queue a repo whose weekly stats GitHub is still computing for a re-poll later in this run."""
+        self.deferred_weekly[github_repo.pk] = (github_repo, on_settled)
+        delay = self.weekly_retries.defer(github_repo.pk, retry_after)
+        self.stdout.write(f'        ⏳ GitHub computing stats, re-polling in {delay:.0f}s')
+
+    def poll_deferred_weekly(self, pks):
+        """Re-poll deferred repos (concurrently with --async); {pk: retry_after, or None once settled}."""
+        repos = {pk: self.deferred_weekly[pk][0] for pk in pks}
+        prefetched = self.fan_out({
+            pk: ('sync_repository_weekly_commits', (self.username, repo.name, repo.stats_etag or None))
+            for pk, repo in repos.items()
+        })
+
+        outcome = {}
+        for pk, repo in repos.items():
+            try:
+                result = prefetched_or(prefetched.get(pk), lambda: self.github_service.sync_repository_weekly_commits(
+                    self.username, repo.name, repo.stats_etag or None
+                ))
+            except Exception as e:
+                result = {'status': 'error', 'error': str(e)}
+
+            if result['status'] == 'computing':
+                outcome[pk] = result.get('retry_after') or 0
+                continue
+
+            outcome[pk] = None
+            _, on_settled = self.deferred_weekly.pop(pk)
+            self.stdout.write(f'  ↻ Re-polled {repo.name} (attempt {self.weekly_retries.attempts[pk] + 1})')
+            if self.apply_weekly_result(repo, result) in ('success', 'not_modified') and on_settled:
+                on_settled()
+        return outcome
+
+    def poll_weekly_retries(self):
+        """Between repos: re-poll any deferred repo whose backoff has elapsed."""
+        self.weekly_retries.poll_due(self.poll_deferred_weekly)
+
+    def finish_weekly_retries(self):
+        """Wait out the deferred repos within --retry-window; persist the stragglers for the next run."""
+        if not len(self.weekly_retries):
+            return []
+
+        self.stdout.write(f'Waiting on {len(self.weekly_retries)} repo(s) GitHub is still computing stats for...')
+        stragglers = self.weekly_retries.drain(self.poll_deferred_weekly)
+        if stragglers:
+            GitHubRepository.objects.filter(
+                pk__in=stragglers, weekly_stats_pending_since__isnull=True
+            ).update(weekly_stats_pending_since=timezone.now())
+            names = ', '.join(self.deferred_weekly[pk][0].name for pk in stragglers)
+            self.stdout.write(self.style.WARNING(f'  ⏳ Still computing, retried first next run: {names}'))
+        return stragglers
+
+    def apply_weekly_result(self, github_repo, result, indent='        '):
+        """Store a sync_repository_weekly_commits() result on the repo; returns its status."""
+        status = result['status']
+        if status == 'success':
+            github_repo.stats_etag = result['etag']
+            github_repo.commit_weeks_last_synced = timezone.now()
+            github_repo.weekly_stats_pending_since = None
+            github_repo.save()
+
+            weeks_stored = self.store_weekly_commit_data(github_repo, result['weekly_data'])
+            self.stdout.write(f'{indent}✓ {weeks_stored} weeks of data updated')
+        elif status == 'not_modified':
+            # Update sync time even if data unchanged
+            github_repo.commit_weeks_last_synced = timezone.now()
+            github_repo.weekly_stats_pending_since = None
+            github_repo.save()
+            self.stdout.write(f'{indent}≈ No changes since last sync')
+        elif status != 'computing':
+            status = 'error'
+            self.stdout.write(self.style.WARNING(f"{indent}✗ Failed: {result.get('error', 'Unknown error')}"))
+
+        if status != 'computing':
+            self.weekly_status[status] += 1
+        return status
+
+    def parse_since(self, value):
+        """--since as an aware datetime; a bare date means midnight."""
+        since = parse_datetime(value)
+        if since is None:
+            try:
+                day = parse_date(value)
+            except ValueError:
+                day = None
+            if day is None:
+                raise CommandError(f"--since must be YYYY-MM-DD or an ISO datetime, got '{value}'")
+            since = datetime.combine(day, datetime.min.time())
+        return timezone.make_aware(since) if timezone.is_naive(since) else since
+
+    def sync_incremental(self, github_service, username, since, repo_limit):
+        """
+        Sync only repositories that changed since their last per-repo sync.
+
+        One paginated listing call (100 repos per page) refreshes every repo's
+        metadata and decides what changed: a repo is synced when its pushed_at
+        differs from the stored github_pushed_at watermark (or is on/after
+        --since). Changed repos get commit counts; languages are refetched
+        only when the default branch head (last_commit_sha) moved, and weekly
+        stats only when they are older than the last commit. The watermark
+        advances once a repo's sync fully succeeds, so failures and repos
+        past --limit-repos are picked up by the next run.
+        """
+        self.stdout.write(self.style.SUCCESS('=== INCREMENTAL SYNC ==='))
+
+        listing = github_service.list_repositories()
+        self.stdout.write(f'Listed {len(listing)} repositories in {max(1, -(-len(listing) // 100))} request(s)')
+
+        existing = GitHubRepository.objects.in_bulk([repo['id'] for repo in listing], field_name='github_id')
+        created_count = 0
+        updated_count = 0
+        changed = []
+
+        for repo_data in listing:
+            github_repo = existing.get(repo_data['id'])
+            fields = self.listing_fields(repo_data)
+
+            if github_repo is None:
+                github_repo = GitHubRepository.objects.create(
+                    github_id=repo_data['id'],
+                    is_fork=repo_data['fork'],
+                    github_created_at=repo_data['created_at'],
+                    **fields,
+                )
+                created_count += 1
+                self.stdout.write(f'  + Created: {repo_data["full_name"]}')
+            elif any(getattr(github_repo, name) != value for name, value in fields.items()):
+                for name, value in fields.items():
+                    setattr(github_repo, name, value)
+                github_repo.save()
+                updated_count += 1
+
+            if github_repo.is_archived or github_repo.is_fork:
+                continue
+
+            pushed_at = parse_datetime(repo_data['pushed_at']) if repo_data.get('pushed_at') else None
+            if github_repo.github_pushed_at != pushed_at or (since and pushed_at and pushed_at >= since):
+                changed.append((github_repo, repo_data, pushed_at))
+
+        self.stdout.write(
+            f'{len(changed)} changed, {len(listing) - len(changed)} unchanged '
+            f'({created_count} created, {updated_count} metadata updates)'
+        )
+        if len(changed) > repo_limit:
+            self.stdout.write(f'  → Syncing the first {repo_limit}; the rest follow on the next run')
+
+        batch = changed[:repo_limit]
+        for github_repo, _, _ in batch:
+            github_service.invalidate_repository_cache(username, github_repo.name)
+
+        # Commit stats first: they decide which repos need languages and weekly stats
+        commit_stats = self.fan_out({
+            github_repo.pk: ('sync_repository_commits', (username, github_repo.name, repo_data['created_at']))
+            for github_repo, repo_data, _ in batch
+        })
+        ready = []
+        for github_repo, repo_data, pushed_at in batch:
+            self.stdout.write(f'  → {github_repo.name}')
+            previous_sha = github_repo.last_commit_sha
+            if not self.sync_repository_commits(
+                github_service, username, github_repo.name, github_repo,
+                created_at=repo_data['created_at'], commit_stats=commit_stats.get(github_repo.pk),
+            ):
+                continue
+
+            needs_languages = github_repo.last_commit_sha != previous_sha
+            needs_weekly = github_repo.should_track_detailed_commits() and (
+                not github_repo.commit_weeks_last_synced
+                or (github_repo.last_commit_date and github_repo.commit_weeks_last_synced < github_repo.last_commit_date)
+            )
+            ready.append((github_repo, pushed_at, needs_languages, needs_weekly))
+
+        follow_ups = {}
+        for github_repo, _, needs_languages, needs_weekly in ready:
+            if needs_languages:
+                follow_ups[(github_repo.pk, 'languages')] = ('get_repository_languages', (username, github_repo.name))
+            if needs_weekly:
+                follow_ups[(github_repo.pk, 'weekly')] = (
+                    'sync_repository_weekly_commits', (username, github_repo.name, github_repo.stats_etag)
+                )
+        follow_ups = self.fan_out(follow_ups)
+
+        synced = []
+
+        def advance_watermark(github_repo, pushed_at):
+            github_repo.github_pushed_at = pushed_at
+            github_repo.save(update_fields=['github_pushed_at'])
+            synced.append(github_repo.pk)
+
+        for github_repo, pushed_at, needs_languages, needs_weekly in ready:
+            self.stdout.write(f'  → {github_repo.name}: languages & weekly stats')
+            if needs_languages:
+                self.sync_repository_languages(
+                    github_service, username, github_repo.name, github_repo,
+                    languages_data=follow_ups.get((github_repo.pk, 'languages')),
+                )
+            else:
+                self.stdout.write('      ≈ Default branch unchanged, languages kept')
+
+            complete = True
+            if needs_weekly:
+                # Still computing: the watermark advances if a re-poll later in the run succeeds
+                complete = self.sync_repository_weekly_data(
+                    github_service, username, github_repo.name, github_repo,
+                    result=follow_ups.get((github_repo.pk, 'weekly')),
+                    on_settled=lambda repo=github_repo, pushed=pushed_at: advance_watermark(repo, pushed),
+                )
+
+            if complete:
+                advance_watermark(github_repo, pushed_at)
+            self.poll_weekly_retries()
+
+        self.finish_weekly_retries()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Incremental sync completed:\n'
+                f'  ✓ {len(synced)} of {len(changed)} changed repositories synced\n'
+                f'  ≈ {len(listing) - len(changed)} unchanged (listing only)'
+            )
+        )
+
+    def listing_fields(self, repo_data):
+        """Repository fields the listing endpoint already carries."""
+        return {
+            'name': repo_data['name'],
+            'full_name': repo_data['full_name'],
+            'description': repo_data.get('description', ''),
+            'html_url': repo_data['html_url'],
+            'clone_url': repo_data['clone_url'],
+            'homepage': repo_data.get('homepage', ''),
+            'stars_count': repo_data['stargazers_count'],
+            'forks_count': repo_data['forks_count'],
+            'watchers_count': repo_data['watchers_count'],
+            'size': repo_data['size'],
+            'language': repo_data.get('language', ''),
+            'is_private': repo_data['private'],
+            'is_archived': repo_data['archived'],
+            'github_updated_at': parse_datetime(repo_data['updated_at']),
+        }
+
     def sync_weekly_commits_only(self, github_service, username, force_update):
         """Sync only weekly commit data for system-linked repositories."""
         self.stdout.write(self.style.SUCCESS('=== WEEKLY COMMIT SYNC ==='))
@@ -105,10 +447,10 @@ class Command(BaseCommand):
             if repo.stats_etag
         }
         
-        success_count = 0
-        computing_count = 0
-        not_modified_count = 0
-        error_count = 0
+        prefetched = self.fan_out({
+            repo.pk: ('sync_repository_weekly_commits', (username, repo.name, repo.stats_etag or None))
+            for repo in repos_to_sync
+        })
         
         for repo in repos_to_sync:
             try:
@@ -118,71 +460,43 @@ class Command(BaseCommand):
                 etag = repo.stats_etag if repo.stats_etag else None
                 
                 # Sync weekly commit data
-                result = github_service.sync_repository_weekly_commits(
-                    username, repo.name, etag
+                result = prefetched_or(
+                    prefetched.get(repo.pk),
+                    lambda: github_service.sync_repository_weekly_commits(username, repo.name, etag),
                 )
-                
-                if result['status'] == 'success':
-                    # Update repository with new ETag and sync time
-                    repo.stats_etag = result['etag']
-                    repo.commit_weeks_last_synced = timezone.now()
-                    repo.save()
-                    
-                    # Store weekly data
-                    weeks_created = self.store_weekly_commit_data(repo, result['weekly_data'])
-                    
-                    success_count += 1
-                    self.stdout.write(
-                        f'    ✓ {weeks_created} weeks of data updated'
-                    )
-                    
-                elif result['status'] == 'not_modified':
-                    # Update sync time even if data unchanged
-                    repo.commit_weeks_last_synced = timezone.now()
-                    repo.save()
-                    
-                    not_modified_count += 1
-                    self.stdout.write(
-                        '    ≈ No changes since last sync'
-                    )
-                    
-                elif result['status'] == 'computing':
-                    computing_count += 1
-                    self.stdout.write(
-                        '    ⏳ GitHub computing stats (will retry later)'
-                    )
-                    
-                else:
-                    error_count += 1
-                    error_msg = result.get('error', 'Unknown error')
-                    self.stdout.write(
-                        self.style.WARNING(f'    ✗ Failed: {error_msg}')
-                    )
+                if self.apply_weekly_result(repo, result, indent='    ') == 'computing':
+                    self.defer_weekly(repo, result.get('retry_after'))
                 
                 # Small delay between requests
-                time.sleep(0.2)
+                if not prefetched:
+                    time.sleep(0.2)
                 
             except Exception as e:
-                error_count += 1
+                self.weekly_status['error'] += 1
                 self.stdout.write(
                     self.style.WARNING(f'    ✗ Exception: {str(e)}')
                 )
+
+            self.poll_weekly_retries()
+
+        stragglers = self.finish_weekly_retries()
         
         # Summary
         self.stdout.write(
             self.style.SUCCESS(
                 f'\nWeekly sync completed:\n'
-                f'  ✓ {success_count} successful\n'
-                f'  ≈ {not_modified_count} unchanged\n'
-                f'  ⏳ {computing_count} computing\n'
-                f'  ✗ {error_count} errors'
+                f'  ✓ {self.weekly_status["success"]} successful\n'
+                f'  ≈ {self.weekly_status["not_modified"]} unchanged\n'
+                f'  ⏳ {len(stragglers)} still computing\n'
+                f'  ✗ {self.weekly_status["error"]} errors'
             )
         )
     
     def store_weekly_commit_data(self, repository, weekly_data):
         """Store weekly commit data in database efficiently with month metadata."""
         weeks_created = 0
-        
+        touched_weeks = []
+
         with transaction.atomic():
             for week_data in weekly_data:
                 # Calculate month metadata
@@ -190,6 +504,7 @@ class Command(BaseCommand):
                 month = start_date.month
                 month_name = start_date.strftime('%B')
                 quarter = (month - 1) // 3 + 1
+                daily_commits = GitHubCommitWeek.pack_daily_commits(week_data.get('daily_breakdown'))
                 
                 # Use get_or_create to handle duplicates
                 commit_week, created = GitHubCommitWeek.objects.get_or_create(
@@ -203,23 +518,33 @@ class Command(BaseCommand):
                         'week_start_date': week_data['week_start_date'],
                         'week_end_date': week_data['week_end_date'],
                         'commit_count': week_data['commit_count'],
+                        'daily_commits': daily_commits,
                         'lines_added': week_data.get('lines_added', 0),
                         'lines_deleted': week_data.get('lines_deleted', 0),
                         'files_changed': week_data.get('files_changed', 0),
                     }
                 )
                 
-                # Update existing record if commit count changed
-                if not created and commit_week.commit_count != week_data['commit_count']:
+                # Update existing record if commit count (or its daily split) changed
+                if not created and (
+                    commit_week.commit_count != week_data['commit_count']
+                    or (daily_commits and bytes(commit_week.daily_commits) != daily_commits)
+                ):
                     commit_week.commit_count = week_data['commit_count']
+                    commit_week.daily_commits = daily_commits or commit_week.daily_commits
                     # Also update month metadata in case of edge cases
                     commit_week.month = month
                     commit_week.month_name = month_name
                     commit_week.quarter = quarter
                     commit_week.save()
                     weeks_created += 1
+                    touched_weeks.append(start_date)
                 elif created:
                     weeks_created += 1
+                    touched_weeks.append(start_date)
+
+            # Monthly/quarterly rollups for just the buckets these weeks fall in
+            refresh_commit_rollups(repository, touched_weeks)
 
         # NEW: Update summary metrics from accurate weekly data
         if weeks_created > 0:  # Only if we actually stored new data
@@ -276,27 +601,8 @@ class Command(BaseCommand):
                     
                     # If this is a system-linked repo, also sync weekly data
                     if repo.should_track_detailed_commits():
-                        try:
-                            self.stdout.write('    → Syncing weekly data...')
-                            weekly_result = github_service.sync_repository_weekly_commits(
-                                username, repo.name, repo.stats_etag
-                            )
-                            
-                            if weekly_result['status'] == 'success':
-                                repo.stats_etag = weekly_result['etag']
-                                repo.commit_weeks_last_synced = timezone.now()
-                                repo.save()
-                                
-                                weeks_stored = self.store_weekly_commit_data(repo, weekly_result['weekly_data'])
-                                weekly_sync_count += 1
-                                
-                                self.stdout.write(
-                                    f'      ✓ {weeks_stored} weeks of detailed data'
-                                )
-                        except Exception as e:
-                            self.stdout.write(
-                                self.style.WARNING(f'      ! Weekly sync failed: {e}')
-                            )
+                        if self.sync_repository_weekly_data(github_service, username, repo.name, repo):
+                            weekly_sync_count += 1
                 else:
                     self.stdout.write(
                         self.style.WARNING(f'    ! No commit data available for {repo.name}')
@@ -306,6 +612,7 @@ class Command(BaseCommand):
                 self.stdout.write(
                     self.style.WARNING(f'    ! Failed to sync commits for {repo.name}: {e}')
                 )
+            self.poll_weekly_retries()
         
         self.stdout.write(
             self.style.SUCCESS(
@@ -365,6 +672,7 @@ class Command(BaseCommand):
                     self.stdout.write(
                         self.style.WARNING(f'    ! Failed to sync {repo.name}: {e}')
                     )
+                self.poll_weekly_retries()
             
             self.stdout.write(
                 self.style.SUCCESS(
@@ -461,6 +769,7 @@ class Command(BaseCommand):
                 # Language sync (existing logic)
                 if created or force_update:
                     self.sync_repository_languages(github_service, username, repo_data['name'], github_repo)
+                self.poll_weekly_retries()
             
             self.stdout.write(
                 self.style.SUCCESS(
@@ -471,16 +780,20 @@ class Command(BaseCommand):
                 )
             )
     
-    def sync_repository_commits(self, github_service, username, repo_name, github_repo):
-        """Sync basic commit data for a repository."""
+    def sync_repository_commits(self, github_service, username, repo_name, github_repo, created_at=None,
+                                commit_stats=None):
+        """Sync basic commit data for a repository (`commit_stats` if already fetched)."""
         try:
             self.stdout.write(f'    → Syncing commits for {repo_name}...')
             
-            commit_stats = github_service.sync_repository_commits(username, repo_name)
+            commit_stats = prefetched_or(
+                commit_stats, lambda: github_service.sync_repository_commits(username, repo_name, created_at)
+            )
             
             if commit_stats:
                 github_repo.total_commits = commit_stats.get('total_commits', 0)
-                github_repo.last_commit_date = commit_stats.get('last_commit_date')
+                last_commit_date = commit_stats.get('last_commit_date')
+                github_repo.last_commit_date = parse_datetime(last_commit_date) if last_commit_date else None
                 github_repo.last_commit_sha = commit_stats.get('last_commit_sha', '')
                 github_repo.last_commit_message = commit_stats.get('last_commit_message', '')
                 github_repo.commits_last_30_days = commit_stats.get('commits_last_30_days', 0)
@@ -504,37 +817,23 @@ class Command(BaseCommand):
             )
         return False
     
-    def sync_repository_weekly_data(self, github_service, username, repo_name, github_repo):
-        """Sync weekly commit data for a system-linked repository."""
+    def sync_repository_weekly_data(self, github_service, username, repo_name, github_repo, result=None,
+                                    on_settled=None):
+        """
+        Sync weekly commit data for a system-linked repository (`result` if already fetched).
+        If GitHub is still computing, the repo is re-polled later in the run and
+        `on_settled` is called once its data is stored.
+        """
         try:
             self.stdout.write('      → Syncing weekly data...')
             
-            result = github_service.sync_repository_weekly_commits(
+            result = prefetched_or(result, lambda: github_service.sync_repository_weekly_commits(
                 username, repo_name, github_repo.stats_etag
-            )
-            
-            if result['status'] == 'success':
-                github_repo.stats_etag = result['etag']
-                github_repo.commit_weeks_last_synced = timezone.now()
-                github_repo.save()
-                
-                weeks_stored = self.store_weekly_commit_data(github_repo, result['weekly_data'])
-                
-                self.stdout.write(
-                    f"        ✓ {weeks_stored} weeks of data, summary metrics updated"
-                )
-                return True
-            elif result['status'] == 'computing':
-                self.stdout.write(
-                    '        ⏳ GitHub computing (will retry later)'
-                )
-            elif result['status'] == 'not_modified':
-                github_repo.commit_weeks_last_synced = timezone.now()
-                github_repo.save()
-                self.stdout.write(
-                    '        ≈ No changes'
-                )
-                return True
+            ))
+            status = self.apply_weekly_result(github_repo, result)
+            if status == 'computing':
+                self.defer_weekly(github_repo, result.get('retry_after'), on_settled)
+            return status in ('success', 'not_modified')
                 
         except Exception as e:
             self.stdout.write(
@@ -542,26 +841,13 @@ class Command(BaseCommand):
             )
         return False
     
-    def sync_repository_languages(self, github_service, username, repo_name, github_repo):
-        """Sync language data for a repository."""
+    def sync_repository_languages(self, github_service, username, repo_name, github_repo, languages_data=None):
+        """Sync language data for a repository (only changed rows are written)."""
         try:
-            languages_data = github_service.get_repository_languages(username, repo_name)
-
-            # Clear existing language data
-            github_repo.languages.all().delete()
-
-            # Calculate total bytes for percentage calculation
-            total_bytes = sum(languages_data.values()) if languages_data else 0
-
-            # Create new language records
-            for language, bytes_count in languages_data.items():
-                percentage = (bytes_count / total_bytes * 100) if total_bytes > 0 else 0
-                GitHubLanguage.objects.create(
-                    repository=github_repo,
-                    language=language,
-                    bytes_count=bytes_count,
-                    percentage=percentage
-                )
+            languages_data = prefetched_or(
+                languages_data, lambda: github_service.get_repository_languages(username, repo_name)
+            )
+            upsert_repository_languages(github_repo, languages_data or {})
         except GitHubAPIError as e:
             self.stdout.write(
                 self.style.WARNING(f'      ! Language sync failed: {e}')
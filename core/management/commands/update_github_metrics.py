@@ -5,6 +5,7 @@ in case want to update all the repos that already have weekly data but still hav
 
 from django.core.management.base import BaseCommand
 from projects.models import GitHubRepository
+from projects.services.commit_timeseries import CommitTimeSeries
 
 
 class Command(BaseCommand):
@@ -47,49 +48,49 @@ class Command(BaseCommand):
             f'Found {repos_with_weekly_data.count()} repos with weekly data...'
         )
 
-        updated_count = 0
+        repos = list(repos_with_weekly_data)
+        # Every repo's weekly data in one query
+        fields = CommitTimeSeries.load(repos).summary_fields()
+        updated = []
 
-        for repo in repos_with_weekly_data:
-            # Show comparison if requested
-            if show_comparison:
-                comparison = repo.get_accurate_vs_estimated_comparison()
-                if comparison:
-                    self.stdout.write(f"\n📊 {repo.name}:")
-                    self.stdout.write(
-                        f"  Estimated: {comparison['estimated']['total']} total, {comparison['estimated']['last_30_days']} recent"
-                    )
-                    self.stdout.write(
-                        f"  Accurate:  {comparison['accurate']['total']} total, {comparison['accurate']['last_30_days']} recent"
-                    )
+        for repo in repos:
+            accurate = fields.get(repo.pk)
 
-                    total_diff = comparison["difference"]["total"]
-                    recent_diff = comparison["difference"]["last_30_days"]
+            # Show comparison if requested
+            if show_comparison and accurate:
+                self.stdout.write(f"\n📊 {repo.name}:")
+                self.stdout.write(
+                    f"  Estimated: {repo.total_commits} total, {repo.commits_last_30_days} recent"
+                )
+                self.stdout.write(
+                    f"  Accurate:  {accurate['total_commits']} total, {accurate['commits_last_30_days']} recent"
+                )
 
-                    if total_diff != 0 or recent_diff != 0:
-                        self.stdout.write(
-                            f"  Difference: {total_diff:+d} total, {recent_diff:+d} recent"
-                        )
-                    else:
-                        self.stdout.write("  ✓ Already accurate!")
+                total_diff = accurate['total_commits'] - repo.total_commits
+                recent_diff = accurate['commits_last_30_days'] - repo.commits_last_30_days
 
-            # Update metrics (unless dry run)
-            if not dry_run:
-                updated = repo.update_summary_from_weekly_data()
-                if updated:
-                    updated_count += 1
-                    self.stdout.write(f"  ✅ Updated: {repo.name}")
-                else:
-                    self.stdout.write(f"  ⚠️  Skipped: {repo.name} (no weekly data)")
-            else:
-                # Dry run - just show what would be updated
-                weekly_count = repo.commit_weeks.count()
-                if weekly_count > 0:
+                if total_diff != 0 or recent_diff != 0:
                     self.stdout.write(
-                        f"  Would update: {repo.name} ({weekly_count} weeks of data)"
+                        f"  Difference: {total_diff:+d} total, {recent_diff:+d} recent"
                     )
-                    updated_count += 1
                 else:
-                    self.stdout.write(f"  Would skip: {repo.name} (no weekly data)")
+                    self.stdout.write("  ✓ Already accurate!")
+
+            if not accurate:
+                self.stdout.write(f"  ⚠️  Skipped: {repo.name} (no weekly data)")
+            elif dry_run:
+                self.stdout.write(f"  Would update: {repo.name}")
+                updated.append(repo)
+            else:
+                for name, value in accurate.items():
+                    setattr(repo, name, value)
+                updated.append(repo)
+                self.stdout.write(f"  ✅ Updated: {repo.name}")
+
+        # Update metrics (unless dry run) in one bulk UPDATE batch
+        if updated and not dry_run:
+            GitHubRepository.objects.bulk_update(updated, list(fields[updated[0].pk]), batch_size=500)
+        updated_count = len(updated)
 
         # Summary
         if dry_run:
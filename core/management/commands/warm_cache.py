@@ -0,0 +1,176 @@
+"""
+Django Management Command to Warm the Shared Cache
+File: core/management/commands/warm_cache.py
+
+Fills the shared cache tier after a deploy or cache flush so the first
+visitors don't pay for rendering: content generations, RSS/Atom feeds,
+sitemaps, the first page of every API list, the HUD metrics snapshot and
+the responsive image lookups. Responses are rendered in-process through
+the real views, under the public host, so cached bodies and their keys
+match what live requests ask for.
+
+Usage:
+    python manage.py warm_cache
+    python manage.py warm_cache --only feeds,sitemaps
+    python manage.py warm_cache --site-url https://example.com --dry-run
+"""
+
+import re
+import time
+from urllib.parse import urlsplit
+
+from django.core.cache import caches
+from django.core.exceptions import DisallowedHost
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve, reverse
+
+from blog.models import Category, Series, Tag
+from blog.services.notifications import get_notification_config
+from core.cache import TieredCache
+from core.services.image_derivatives import warm_derivatives_cache
+from core.services.syndication import CONTENT_GROUPS, get_generation
+from core.services.system_metrics import get_metrics_snapshot, system_metrics
+
+SECTIONS = ('feeds', 'sitemaps', 'api', 'metrics', 'images')
+
+API_RESOURCES = ('posts', 'systems', 'technologies', 'repositories')
+
+LOC_PATTERN = re.compile(r'<loc>([^<]+)</loc>')
+
+
+class Command(BaseCommand):
+    help = "Pre-render feeds, sitemaps, API pages and lookups into the shared cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only',
+            default=','.join(SECTIONS),
+            help=f"Comma-separated sections to warm (default: all of {', '.join(SECTIONS)})",
+        )
+        parser.add_argument(
+            '--site-url',
+            help='Public site URL the cached bodies are rendered for (default: notifications SITE_URL)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the URLs that would be rendered without rendering them',
+        )
+
+    def handle(self, *args, **options):
+        sections = [section.strip() for section in options['only'].split(',') if section.strip()]
+        unknown = [section for section in sections if section not in SECTIONS]
+        if unknown:
+            raise CommandError(f"Unknown section(s): {', '.join(unknown)}. Choose from {', '.join(SECTIONS)}")
+
+        site = urlsplit(options['site_url'] or get_notification_config()['SITE_URL'])
+        if not site.netloc:
+            raise CommandError("--site-url must be an absolute URL, e.g. https://example.com")
+        self.factory = RequestFactory(HTTP_HOST=site.netloc)
+        self.secure = site.scheme == 'https'
+        self.dry_run = options['dry_run']
+        self.rendered = 0
+        self.failed = 0
+
+        self.stdout.write(f"Warming {', '.join(sections)} for {site.scheme}://{site.netloc}")
+        if self.dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - Nothing rendered or cached"))
+
+        started = time.perf_counter()
+        if not self.dry_run:
+            # Every cached body is keyed by its group's generation token
+            for group in CONTENT_GROUPS:
+                get_generation(group)
+
+        for section in sections:
+            section_started = time.perf_counter()
+            getattr(self, f'warm_{section}')()
+            self.stdout.write(f"  {section:<10} {time.perf_counter() - section_started:.2f}s")
+
+        elapsed = time.perf_counter() - started
+        summary = f"{self.rendered} response(s) rendered in {elapsed:.2f}s"
+        if self.failed:
+            self.stdout.write(self.style.WARNING(f"⚠ {summary}, {self.failed} failed"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✓ {summary}"))
+        if not self.dry_run:
+            self.report_cache()
+
+    # ===== SECTIONS =====
+
+    def warm_feeds(self):
+        paths = [reverse('blog:feed'), reverse('blog:feed_atom')]
+        for route, model in (('category', Category), ('tag', Tag), ('series', Series)):
+            for slug in model.objects.values_list('slug', flat=True).iterator():
+                paths += [
+                    reverse(f'blog:{route}_feed', args=[slug]),
+                    reverse(f'blog:{route}_feed_atom', args=[slug]),
+                ]
+        for path in paths:
+            self.render(path)
+
+    def warm_sitemaps(self):
+        index = self.render(reverse('sitemap_index'))
+        if index is None:
+            return
+        # Every section page the index lists, ?p=N included
+        for location in LOC_PATTERN.findall(index.decode()):
+            location = urlsplit(location.replace('&amp;', '&'))
+            self.render(f"{location.path}?{location.query}" if location.query else location.path)
+
+    def warm_api(self):
+        for name in API_RESOURCES:
+            self.render(reverse(f'api:{name}_list'))
+
+    def warm_metrics(self):
+        if self.dry_run:
+            self.stdout.write("    metrics snapshot")
+            return
+        get_metrics_snapshot()
+
+    def warm_images(self):
+        if self.dry_run:
+            self.stdout.write("    image derivative lookups")
+            return
+        sources = warm_derivatives_cache()
+        self.stdout.write(f"    {sources} image source(s) cached")
+
+    # ===== HELPERS =====
+
+    def render(self, path):
+        """GET `path` through its view; returns the body, or None if it failed."""
+        if self.dry_run:
+            self.stdout.write(f"    {path}")
+            return None
+
+        request = self.factory.get(path, secure=self.secure)
+        try:
+            match = resolve(request.path_info)
+            response = match.func(request, *match.args, **match.kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+            # Streamed bodies are only cached once fully consumed
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+        except (Resolver404, DisallowedHost) as e:
+            self.failed += 1
+            self.stdout.write(self.style.ERROR(f"    ❌ {path}: {e}"))
+            return None
+
+        if response.status_code != 200:
+            self.failed += 1
+            self.stdout.write(self.style.ERROR(f"    ❌ {path}: HTTP {response.status_code}"))
+            return None
+
+        self.rendered += 1
+        return body
+
+    def report_cache(self):
+        stats = system_metrics.snapshot()['cache']
+        self.stdout.write(
+            f"Cache lookups: {stats['hits']} hit(s) ({stats['l1_hits']} L1, {stats['shared_hits']} shared), "
+            f"{stats['misses']} miss(es)"
+        )
+        default = caches['default']
+        if isinstance(default, TieredCache):
+            self.stdout.write(f"L1 entries in this process: {default.l1_size()}")
@@ -1,6 +1,16 @@
+import logging
 import os
+import time
+
+from django.db import connection
 from django.shortcuts import render
 from django.conf import settings
+from django.utils.functional import empty
+
+from core.services.request_metrics import QueryRecorder, get_perf_config, request_metrics
+from core.services.system_metrics import publish_worker_state, system_metrics
+
+logger = logging.getLogger('core.performance')
 
 
 class MaintenanceModeMiddleware:
@@ -30,3 +40,129 @@ class MaintenanceModeMiddleware:
         
         response = self.get_response(request)
         return response
+
+
+class SystemMetricsMiddleware:
+    """
+    Feeds the HUD metrics collector: in-flight gauge and end-to-end latency,
+    published to the shared cache for the other workers.
+    Goes first in MIDDLEWARE so the timing covers the whole stack.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        system_metrics.request_started()
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = self.get_response(request)
+            status_code = response.status_code
+            return response
+        finally:
+            system_metrics.request_finished((time.perf_counter() - start) * 1000, status_code)
+            publish_worker_state()
+
+
+class QueryTimingMiddleware:
+    """
+    Per-request cost instrumentation.
+
+    Counts queries and DB time via connection.execute_wrapper, times template
+    rendering, emits a Server-Timing header (per SERVER_TIMING_HEADER), logs
+    slow requests with their most repeated (N+1) SQL and feeds the Performance
+    Monitor ring buffer.
+
+    Template time is measured for TemplateResponse (every class-based view);
+    templates rendered eagerly with render() are part of the total only.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_perf_config()
+
+    def __call__(self, request):
+        if not self.config['ENABLED']:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._template_render_ms = 0.0
+        start = time.perf_counter()
+
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        template_ms = request._template_render_ms
+
+        if self.show_server_timing(request):
+            response['Server-Timing'] = self.build_server_timing(recorder, template_ms, total_ms)
+
+        url_name = self.get_url_name(request)
+        request_metrics.record(
+            url_name,
+            total_ms=total_ms,
+            db_ms=recorder.duration_ms,
+            template_ms=template_ms,
+            query_count=recorder.count,
+            duplicate_count=recorder.duplicate_count,
+            status_code=response.status_code,
+        )
+
+        if (total_ms >= self.config['SLOW_REQUEST_MS']
+                or recorder.count >= self.config['SLOW_QUERY_COUNT']):
+            self.log_slow_request(request, url_name, recorder, template_ms, total_ms)
+
+        return response
+
+    def process_template_response(self, request, response):
+        """Wrap the deferred render so TemplateResponse render time is measured."""
+        render_response = response.render
+
+        def timed_render():
+            start = time.perf_counter()
+            try:
+                return render_response()
+            finally:
+                request._template_render_ms += (time.perf_counter() - start) * 1000
+
+        response.render = timed_render
+        return response
+
+    def show_server_timing(self, request):
+        """
+        SERVER_TIMING_HEADER: True for every response, 'staff' for staff users only.
+        'staff' only looks at a user the view already loaded, so the header never
+        costs a session/user query of its own.
+        """
+        setting = self.config['SERVER_TIMING_HEADER']
+        if setting == 'staff':
+            user = getattr(request, 'user', None)
+            if user is None or getattr(user, '_wrapped', None) is empty:
+                return False
+            return user.is_staff
+        return bool(setting)
+
+    @staticmethod
+    def get_url_name(request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unresolved'
+        return match.view_name or match._func_path
+
+    @staticmethod
+    def build_server_timing(recorder, template_ms, total_ms):
+        return ', '.join([
+            f'db;dur={recorder.duration_ms:.1f};desc="{recorder.count} queries"',
+            f'tpl;dur={template_ms:.1f};desc="Template render"',
+            f'total;dur={total_ms:.1f}',
+        ])
+
+    def log_slow_request(self, request, url_name, recorder, template_ms, total_ms):
+        lines = [
+            f"Slow request {request.method} {request.path} ({url_name}): "
+            f"{total_ms:.0f}ms total, {recorder.count} queries in {recorder.duration_ms:.0f}ms, "
+            f"template {template_ms:.0f}ms, {recorder.duplicate_count} duplicate queries"
+        ]
+        for sql, count in recorder.repeated_queries(self.config['TOP_REPEATED']):
+            lines.append(f"  x{count}: {sql[:300]}")
+        logger.warning('\n'.join(lines))
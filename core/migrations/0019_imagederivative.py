@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-18 21:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_experienceskillapplication_experience_skills_applied'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageDerivative',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(db_index=True, help_text='Storage name of the original upload', max_length=255)),
+                ('format', models.CharField(choices=[('avif', 'AVIF'), ('webp', 'WebP'), ('jpeg', 'JPEG')], max_length=10)),
+                ('file', models.ImageField(max_length=255, upload_to='derivatives/')),
+                ('width', models.PositiveIntegerField(default=0)),
+                ('height', models.PositiveIntegerField(default=0)),
+                ('source_width', models.PositiveIntegerField(default=0)),
+                ('source_height', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['source', 'format', 'width'],
+                'constraints': [models.UniqueConstraint(fields=('source', 'format', 'width'), name='unique_image_derivative')],
+            },
+        ),
+    ]
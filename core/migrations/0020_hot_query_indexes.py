@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_imagederivative'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['-created_at'], name='contact_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_read', True), ('response_sent', False)), fields=['-created_at'], name='contact_pending_response_idx'),
+        ),
+    ]
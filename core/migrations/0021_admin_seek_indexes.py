@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['-created_at', '-id'], name='contact_created_seek_idx'),
+        ),
+    ]
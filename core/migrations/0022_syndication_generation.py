@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_admin_seek_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyndicationGeneration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('group', models.CharField(max_length=20, unique=True)),
+                ('counter', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -181,6 +181,9 @@ class Skill(models.Model):
 
     def get_systems_count(self):
         """Get count of systems using this skill"""
+        # Querysets annotated with systems_count=Count('project_gains') (e.g. admin selects) skip the COUNT
+        if getattr(self, 'systems_count', None) is not None:
+            return self.systems_count
         return self.get_systems_using_skill().count()
 
     def get_latest_usage(self):
@@ -853,6 +856,17 @@ class Contact(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Unread / awaiting-response counts run on every admin page
+            models.Index(fields=['-created_at'], condition=Q(is_read=False), name='contact_unread_idx'),
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(is_read=True, response_sent=False),
+                name='contact_pending_response_idx',
+            ),
+            # Keyset pagination in the admin contact list
+            models.Index(fields=['-created_at', '-id'], name='contact_created_seek_idx'),
+        ]
 
     def __str__(self):
         return f"Message from {self.name} - {self.created_at.strftime('%Y-%m-%d')}"
@@ -1036,6 +1050,53 @@ class PortfolioAnalytics(models.Model):
         }
 
 
+class ImageDerivative(models.Model):
+    """
+    Resized, metadata-stripped variant of an uploaded image.
+    Keyed by the original file's storage name so any ImageField can use it
+    (see core.services.image_derivatives for which fields are processed).
+    """
+
+    FORMAT_CHOICES = [
+        ('avif', 'AVIF'),
+        ('webp', 'WebP'),
+        ('jpeg', 'JPEG'),
+    ]
+
+    source = models.CharField(max_length=255, db_index=True, help_text="Storage name of the original upload")
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES)
+    file = models.ImageField(upload_to='derivatives/', max_length=255)
+    width = models.PositiveIntegerField(default=0)
+    height = models.PositiveIntegerField(default=0)
+    source_width = models.PositiveIntegerField(default=0)
+    source_height = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['source', 'format', 'width']
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'format', 'width'], name='unique_image_derivative'),
+        ]
+
+    def __str__(self):
+        return f"{self.source} @ {self.width}w ({self.format})"
+
+
+class SyndicationGeneration(models.Model):
+    """
+    Change counter for one syndication content group (core.services.syndication).
+    Bumped on every content change, so rows without timestamps (tags, M2M
+    links) still change the group's ETag, the same way in every worker.
+    """
+
+    group = models.CharField(max_length=20, unique=True)
+    counter = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.group} #{self.counter}"
+
+
 # ======================================
 # ENHANCED LEARNING JOURNEY MANAGER
 # ======================================
@@ -0,0 +1,278 @@
+"""
+Admin List Pagination
+Keyset (seek) pagination and cached totals for large admin tables
+Version 1.1 - Cursor next/previous links in Django admin changelists (KeysetPaginationMixin)
+"""
+
+import base64
+import datetime
+import hashlib
+import json
+
+from django.conf import settings
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.exceptions import FieldDoesNotExist
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+DEFAULT_ADMIN_PAGINATION_CONFIG = {
+    # Seconds to cache a list's unfiltered total (only needed while filters are applied)
+    'TOTAL_COUNT_TIMEOUT': 60,
+}
+
+
+def get_admin_pagination_config():
+    """Merge ADMIN_PAGINATION settings over the defaults."""
+    config = DEFAULT_ADMIN_PAGINATION_CONFIG.copy()
+    config.update(getattr(settings, 'ADMIN_PAGINATION', {}))
+    return config
+
+
+def cached_total_count(queryset):
+    """COUNT(*) for an unfiltered base queryset, cached briefly per distinct SQL."""
+    sql = str(queryset.query)
+    key = f"admin-list-total:{queryset.model._meta.label_lower}:{hashlib.md5(sql.encode()).hexdigest()}"
+    return cache.get_or_set(key, queryset.count, get_admin_pagination_config()['TOTAL_COUNT_TIMEOUT'])
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder trims datetimes to milliseconds; cursors need every microsecond."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPage(Page):
+    """A Page that also knows the cursors of its first and last rows."""
+
+    @cached_property
+    def next_cursor(self):
+        return self.paginator.encode_cursor(self.object_list[-1]) if self.object_list else ''
+
+    @cached_property
+    def previous_cursor(self):
+        return self.paginator.encode_cursor(self.object_list[0]) if self.object_list else ''
+
+    @property
+    def next_query(self):
+        """Query string for the next page, e.g. 'page=3&after=...'"""
+        return f"page={self.next_page_number()}&after={self.next_cursor}"
+
+    @property
+    def previous_query(self):
+        return f"page={self.previous_page_number()}&before={self.previous_cursor}"
+
+
+class KeysetPaginator(Paginator):
+    """
+    Paginator that seeks instead of OFFSETs where it can.
+
+    Rows are ordered by `ordering` (default: the queryset's ordering) plus the
+    primary key as a tie-breaker. Next/previous links carry a cursor - the
+    ordering values of the row at the page edge - and fetch the neighbouring
+    page with a WHERE on (ordering field, pk), which an index on those columns
+    answers directly however deep the page is. The first and last pages are
+    also fetched without OFFSET (the last by reading the ordering backwards).
+    Only a direct jump to a middle page number falls back to OFFSET.
+
+    Ordering fields must be non-null. Works as a drop-in Paginator (e.g.
+    ModelAdmin.paginator): page(number) without a cursor behaves as above.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, ordering=None,
+                 after=None, before=None):
+        ordering = list(ordering or object_list.query.order_by or object_list.model._meta.ordering or ['-pk'])
+        ordering = [{'id': 'pk', '-id': '-pk'}.get(field, field) if isinstance(field, str) else field for field in ordering]
+        if not any(isinstance(field, str) and field.lstrip('-') == 'pk' for field in ordering):
+            descending = isinstance(ordering[0], str) and ordering[0].startswith('-')
+            ordering.append('-pk' if descending else 'pk')
+        self.ordering = ordering
+        # Cursors page() uses when not given any (e.g. from the request a changelist serves)
+        self.after = after
+        self.before = before
+        super().__init__(object_list.order_by(*self.ordering), per_page, orphans, allow_empty_first_page)
+
+    @cached_property
+    def seekable(self):
+        """
+        Cursors need plain non-null columns of the model itself; ordering by a
+        relation or an expression (admin column sorting) pages with OFFSET.
+        """
+        opts = self.object_list.model._meta
+        for field in self.ordering:
+            if not isinstance(field, str):
+                return False
+            name = field.lstrip('-')
+            if name == 'pk':
+                continue
+            try:
+                model_field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return False
+            if model_field.is_relation or model_field.null:
+                return False
+        return True
+
+    # ===== CURSORS =====
+
+    def _field_value(self, obj, field):
+        # Model instances or .values() rows (which must include the ordering keys, 'pk' included)
+        if isinstance(obj, dict):
+            return obj[field.lstrip('-')]
+        return getattr(obj, field.lstrip('-'))
+
+    def encode_cursor(self, obj):
+        values = [self._field_value(obj, field) for field in self.ordering]
+        raw = json.dumps(values, cls=CursorEncoder).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Cursor -> list of Python values, or None if it doesn't parse."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(raw)
+        except (ValueError, TypeError):
+            return None
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            return None
+
+        opts = self.object_list.model._meta
+        try:
+            return [
+                (opts.pk if field.lstrip('-') == 'pk' else opts.get_field(field.lstrip('-'))).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            return None
+
+    def _seek_filter(self, values, forward):
+        """WHERE clause for rows strictly after (forward) or before the cursor values."""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip('-')
+            descending = field.startswith('-')
+            # Moving forward through a descending column means smaller values
+            lookup = 'lt' if descending == forward else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _reversed_ordering(self):
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+
+    # ===== PAGES =====
+
+    def _get_page(self, *args, **kwargs):
+        return KeysetPage(*args, **kwargs)
+
+    def page(self, number, after=None, before=None):
+        number = self.validate_number(number)
+        # Rows on this page; the last page also absorbs orphans
+        size = self.per_page if number < self.num_pages else self.count - (number - 1) * self.per_page
+        after = after or self.after
+        before = before or self.before
+
+        if not self.seekable:
+            bottom = (number - 1) * self.per_page
+            rows = list(self.object_list[bottom:bottom + size])
+        elif after and number > 1 and (values := self.decode_cursor(after)) is not None:
+            rows = list(self.object_list.filter(self._seek_filter(values, forward=True))[:size])
+        elif before and number < self.num_pages and (values := self.decode_cursor(before)) is not None:
+            rows = list(
+                self.object_list.filter(self._seek_filter(values, forward=False))
+                .order_by(*self._reversed_ordering())[:size]
+            )[::-1]
+        elif number == 1:
+            rows = list(self.object_list[:size])
+        elif number == self.num_pages:
+            rows = list(self.object_list.order_by(*self._reversed_ordering())[:size])[::-1]
+        else:
+            bottom = (number - 1) * self.per_page
+            rows = list(self.object_list[bottom:bottom + size])
+
+        return self._get_page(rows, number, self)
+
+    def rows_after(self, cursor=None):
+        """
+        Up to per_page rows following `cursor` (from the start without one),
+        plus whether more follow. Pure seek - no COUNT, no page numbers - for
+        APIs that only hand out "next" links. Raises InvalidPage on a bad cursor.
+        """
+        queryset = self.object_list
+        if cursor:
+            values = self.decode_cursor(cursor)
+            if values is None:
+                raise InvalidPage("Invalid cursor")
+            queryset = queryset.filter(self._seek_filter(values, forward=True))
+        rows = list(queryset[:self.per_page + 1])
+        return rows[:self.per_page], len(rows) > self.per_page
+
+    def page_from_request(self, request, page_kwarg='page'):
+        """Page for ?page=N[&after=cursor|&before=cursor] ('last' works as a page number)."""
+        number = request.GET.get(page_kwarg) or 1
+        if number == 'last':
+            number = self.num_pages
+        return self.page(number, after=request.GET.get('after'), before=request.GET.get('before'))
+
+
+# ===== DJANGO ADMIN =====
+
+CURSOR_VARS = ('after', 'before')
+
+
+class KeysetChangeList(ChangeList):
+    """
+    ChangeList whose Previous/Next links carry KeysetPaginator cursors
+    (rendered by templates/admin/pagination.html). Page-number links stay
+    plain and drop any cursor.
+    """
+
+    def get_filters_params(self, params=None):
+        params = super().get_filters_params(params)
+        for name in CURSOR_VARS:
+            params.pop(name, None)
+        return params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Cursors only belong to the page they were issued for
+        return super().get_query_string({**dict.fromkeys(CURSOR_VARS), **(new_params or {})}, remove)
+
+    def _cursor_link(self, number, cursor_var, row):
+        if not self.paginator.seekable:
+            return self.get_query_string({PAGE_VAR: number})
+        return self.get_query_string({PAGE_VAR: number, cursor_var: self.paginator.encode_cursor(row)})
+
+    @cached_property
+    def next_page_query(self):
+        if not self.multi_page or self.show_all or self.page_num >= self.paginator.num_pages:
+            return None
+        return self._cursor_link(self.page_num + 1, 'after', self.result_list[-1])
+
+    @cached_property
+    def previous_page_query(self):
+        if not self.multi_page or self.show_all or self.page_num <= 1:
+            return None
+        return self._cursor_link(self.page_num - 1, 'before', self.result_list[0])
+
+
+class KeysetPaginationMixin:
+    """
+    ModelAdmin mixin: KeysetPaginator for the changelist, with the request's
+    after/before cursors, so Previous/Next seek instead of OFFSET.
+    """
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        return KeysetPaginator(
+            queryset, per_page, orphans, allow_empty_first_page,
+            after=request.GET.get('after'), before=request.GET.get('before'),
+        )
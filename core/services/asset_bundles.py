@@ -0,0 +1,275 @@
+"""
+Static Asset Bundle Service
+Concatenates and minifies per-page CSS/JS bundles ahead of collectstatic
+Version 1.1 - Minifiers leave strings, template and regex literals untouched
+"""
+
+import logging
+import posixpath
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BUNDLE_CONFIG = {
+    # Serve bundles instead of the individual source files
+    'ENABLED': not settings.DEBUG,
+    # Written inside STATICFILES_DIRS so collectstatic fingerprints/compresses them
+    'OUTPUT_DIR': Path(settings.BASE_DIR) / 'static' / 'bundles',
+    'URL_PREFIX': 'bundles',
+    'MINIFY': True,
+    'BUNDLES': {},
+}
+
+
+def get_bundle_config():
+    """Merge ASSET_BUNDLES settings over the defaults."""
+    config = DEFAULT_BUNDLE_CONFIG.copy()
+    config.update(getattr(settings, 'ASSET_BUNDLES', {}))
+    return config
+
+
+def get_bundle_sources(bundle_name):
+    """Static paths that make up a bundle, in include order."""
+    bundles = get_bundle_config()['BUNDLES']
+    if bundle_name not in bundles:
+        raise KeyError(f"Unknown asset bundle '{bundle_name}'")
+    return bundles[bundle_name]
+
+
+def bundle_static_path(bundle_name):
+    """Path of the built bundle relative to STATIC_URL (what {% static %} expects)."""
+    return f"{get_bundle_config()['URL_PREFIX']}/{bundle_name}"
+
+
+# ===== MINIFIERS =====
+# Deliberately conservative: whitespace/comment removal only, nothing that
+# needs a real parser. Brotli/gzip do the heavy lifting afterwards. Strings
+# (and url() values, template and regex literals) are swapped for
+# placeholders first, so nothing inside them is ever rewritten.
+
+CSS_TOKEN_RE = re.compile(
+    r'/\*.*?\*/|("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|url\(\s*[^\'"\s)][^)]*\))',
+    re.DOTALL | re.IGNORECASE,
+)
+CSS_WHITESPACE_RE = re.compile(r'\s+')
+CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,])\s*')
+CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)(?![a-z]+:|/|#)([^\'")]+)\1\s*\)', re.IGNORECASE)
+
+LITERAL_PLACEHOLDER_RE = re.compile(r'\x00(\d+)\x00')
+JS_SPECIAL_RE = re.compile(r'[\'"`/]')
+JS_TEMPLATE_RE = re.compile(r'[`\\]|\$\{')
+JS_EXPRESSION_RE = re.compile(r'[\'"`/{}]')
+# A `/` after one of these (or at the start) opens a regex literal, otherwise it divides
+JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'void', 'yield', 'await', 'delete', 'throw', 'new'}
+
+
+def _restore_literals(text, literals):
+    return LITERAL_PLACEHOLDER_RE.sub(lambda match: literals[int(match.group(1))], text)
+
+
+def minify_css(css):
+    """Drop comments and whitespace around punctuation; strings and url() values are copied as-is."""
+    literals = []
+
+    def protect(match):
+        if match.group(1) is None:
+            return ''
+        literals.append(match.group(1))
+        return f'\x00{len(literals) - 1}\x00'
+
+    css = CSS_TOKEN_RE.sub(protect, css)
+    css = CSS_WHITESPACE_RE.sub(' ', css)
+    css = CSS_PUNCTUATION_RE.sub(r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    return _restore_literals(css.strip(), literals)
+
+
+def _regex_allowed(js, i):
+    """Whether a `/` at js[i] starts a regex literal, judged by the code just before it."""
+    before = js[max(0, i - 16):i].rstrip()
+    if not before or before[-1] in JS_REGEX_PRECEDERS:
+        return True
+    word = re.search(r'[\w$]+$', before)
+    return bool(word) and word.group() in JS_REGEX_KEYWORDS
+
+
+def _string_end(js, i):
+    """Index past the quoted string starting at js[i] (an unterminated one stops at the line end)."""
+    quote = js[i]
+    i += 1
+    while i < len(js):
+        if js[i] == '\\':
+            i += 2
+        elif js[i] == quote or js[i] == '\n':
+            return i + 1
+        else:
+            i += 1
+    return len(js)
+
+
+def _regex_end(js, i):
+    """Index past the regex literal starting at js[i], or None if nothing closes it on that line."""
+    in_class = False
+    i += 1
+    while i < len(js) and js[i] != '\n':
+        char = js[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            i += 1
+            while i < len(js) and js[i].isalpha():
+                i += 1
+            return i
+        i += 1
+    return None
+
+
+def _template_end(js, i):
+    """Index past the template literal starting at js[i], ${...} expressions included."""
+    i += 1
+    while True:
+        match = JS_TEMPLATE_RE.search(js, i)
+        if not match:
+            return len(js)
+        if match.group() == '`':
+            return match.end()
+        i = match.end() + 1 if match.group() == '\\' else _expression_end(js, match.end())
+
+
+def _expression_end(js, i):
+    """Index past the `}` that closes a template literal's ${ expression."""
+    depth = 0
+    while True:
+        match = JS_EXPRESSION_RE.search(js, i)
+        if not match:
+            return len(js)
+        i = match.start()
+        if js[i] in '{}':
+            if js[i] == '}' and depth == 0:
+                return i + 1
+            depth += 1 if js[i] == '{' else -1
+            i += 1
+        else:
+            end, _ = _js_token_end(js, i)
+            i = end or i + 1
+
+
+def _js_token_end(js, i):
+    """(end, 'comment' or 'literal') for a comment or literal starting at js[i]; (None, None) otherwise."""
+    char, following = js[i], js[i + 1:i + 2]
+    if char == '/' and following == '/':
+        end = js.find('\n', i)
+        return (len(js) if end == -1 else end), 'comment'
+    if char == '/' and following == '*':
+        end = js.find('*/', i + 2)
+        return (len(js) if end == -1 else end + 2), 'comment'
+    if char in '\'"':
+        return _string_end(js, i), 'literal'
+    if char == '`':
+        return _template_end(js, i), 'literal'
+    if char == '/' and _regex_allowed(js, i):
+        end = _regex_end(js, i)
+        if end:
+            return end, 'literal'
+    return None, None
+
+
+def minify_js(js):
+    """
+    Drop comments, indentation and blank lines. Strings, template literals
+    and regex literals are copied as-is, line breaks inside them included.
+    """
+    literals = []
+    code = []
+    i = start = 0
+    while True:
+        match = JS_SPECIAL_RE.search(js, i)
+        if not match:
+            break
+        i = match.start()
+        end, kind = _js_token_end(js, i)
+        if end is None:
+            i += 1
+            continue
+        code.append(js[start:i])
+        if kind == 'literal':
+            code.append(f'\x00{len(literals)}\x00')
+            literals.append(js[i:end])
+        else:
+            # A comment may be all that separates two tokens (or two statements)
+            code.append('\n' if '\n' in js[i:end] else ' ')
+        i = start = end
+    code.append(js[start:])
+
+    lines = (line.strip() for line in ''.join(code).splitlines())
+    return _restore_literals('\n'.join(line for line in lines if line), literals)
+
+
+def rebase_css_urls(css, source_path, bundle_path):
+    """Rewrite relative url() references so they still resolve from the bundle's directory."""
+    source_dir = posixpath.dirname(source_path)
+    bundle_dir = posixpath.dirname(bundle_path)
+
+    def rebase(match):
+        target = posixpath.normpath(posixpath.join(source_dir, match.group(2)))
+        return f'url("{posixpath.relpath(target, bundle_dir)}")'
+
+    return CSS_URL_RE.sub(rebase, css)
+
+
+# ===== BUILD =====
+
+def build_bundle(bundle_name, config=None):
+    """Concatenate (and minify) one bundle into OUTPUT_DIR. Returns (path, source_bytes, bundle_bytes)."""
+    config = config or get_bundle_config()
+    is_css = bundle_name.endswith('.css')
+    bundle_path = bundle_static_path(bundle_name)
+
+    parts = []
+    source_bytes = 0
+    for source in get_bundle_sources(bundle_name):
+        absolute = finders.find(source)
+        if not absolute:
+            raise FileNotFoundError(f"Bundle '{bundle_name}' source not found: {source}")
+
+        content = Path(absolute).read_text(encoding='utf-8')
+        source_bytes += len(content.encode('utf-8'))
+
+        if is_css:
+            content = rebase_css_urls(content, source, bundle_path)
+            if config['MINIFY']:
+                content = minify_css(content)
+        elif config['MINIFY']:
+            content = minify_js(content)
+        parts.append(content)
+
+    # A stray missing semicolon at the end of one script must not merge into the next
+    output = '\n'.join(parts) if is_css else ';\n'.join(parts)
+
+    output_path = Path(config['OUTPUT_DIR']) / bundle_name
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(output, encoding='utf-8')
+
+    return output_path, source_bytes, len(output.encode('utf-8'))
+
+
+def build_all_bundles():
+    """Build every configured bundle. Returns {bundle_name: (path, source_bytes, bundle_bytes)}."""
+    config = get_bundle_config()
+    results = {}
+    for bundle_name in config['BUNDLES']:
+        results[bundle_name] = build_bundle(bundle_name, config)
+        logger.info(f"Built asset bundle {bundle_name}")
+    return results
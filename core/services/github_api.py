@@ -4,12 +4,16 @@ from typing import Dict, List, Optional, Union
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
+import threading
 import time
 import json
 
 import hashlib
-from urllib.parse import urlencode
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse
+
+from .github_retry import RetryScheduler
+from .github_store import build_response, get_response_store
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +23,66 @@ class GitHubAPIError(Exception):
     pass
 
 
+class RateLimitState:
+    """
+    X-RateLimit-* accounting for one GitHubAPIService, shared by every
+    thread making requests through it (see core.services.github_async).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.remaining = None
+        self.reset_at = None
+        self.requests = 0
+
+    def update(self, headers):
+        with self._lock:
+            self.requests += 1
+            if headers.get('X-RateLimit-Remaining') is None:
+                return
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_at = int(headers.get('X-RateLimit-Reset') or 0) or None
+            # Concurrent responses can land out of order; within a window the lowest count is current
+            if reset_at == self.reset_at and self.remaining is not None:
+                remaining = min(remaining, self.remaining)
+            self.remaining, self.reset_at = remaining, reset_at
+
+    def check(self):
+        """Raise instead of spending a request GitHub will refuse."""
+        with self._lock:
+            if self.remaining == 0 and self.reset_at and self.reset_at > time.time():
+                raise GitHubAPIError(f"Rate limit exceeded. Resets at {self.reset_at}")
+
+
 class GitHubAPIService:
     """
     GitHub API Integration service for Django.
     Handles authentication, rate limiting, caching, and error handling.
+
+    `session` is the HTTP client (a pooled requests.Session for the async
+    client); by default each request goes through requests.get.
+
+    Responses are also recorded in the on-disk GitHubResponseStore, which
+    backs the per-process cache across restarts. With `replay` (default:
+    GITHUB_API_CONFIG['REPLAY']) every request is answered from the store
+    and a missing recording raises GitHubAPIError instead of going online.
     """
 
-    def __init__(self):
+    def __init__(self, session=None, replay=None):
+        self.http = session or requests
+        self.rate_limit = RateLimitState()
         self.config = settings.GITHUB_API_CONFIG
+        self.response_store = get_response_store()
+        self.replay = self.config.get('REPLAY', False) if replay is None else replay
         self.base_url = self.config['BASE_URL']
         self.token = self.config['TOKEN']
         self.username = self.config['USERNAME']
         self.timeout = self.config['TIMEOUT']
         self.cache_timeout = self.config['CACHE_TIMEOUT']
 
-        if not self.token:
+        if self.replay and self.response_store is None:
+            raise GitHubAPIError("Replay mode needs GITHUB_API_CONFIG['RESPONSE_STORE']['DIR']")
+        if not self.token and not self.replay:
             logger.warning("GitHub token not configured - API rate limits will apply")
     
     def _get_headers(self) -> Dict[str, str]:
@@ -48,6 +97,43 @@ class GitHubAPIService:
         
         return headers
     
+    def _get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None):
+        """GET through the service's HTTP client, keeping rate-limit accounting and the response store current."""
+        store_key = self._store_key(url, params)
+        if self.replay:
+            return self._replay(store_key, url, headers)
+
+        self.rate_limit.check()
+        response = self.http.get(url, headers=headers or self._get_headers(), params=params, timeout=self.timeout)
+        self.rate_limit.update(response.headers)
+
+        if self.response_store is not None:
+            try:
+                if response.status_code == 304:
+                    self.response_store.touch(store_key)
+                else:
+                    self.response_store.put(store_key, response)
+            except OSError as e:
+                logger.warning(f"Could not record GitHub response for {url}: {e}")
+        return response
+
+    def _replay(self, store_key: str, url: str, headers: Optional[Dict] = None):
+        """The recorded response for a request, as a 304 when the caller already holds its ETag."""
+        entry = self.response_store.get(store_key)
+        if entry is None:
+            raise GitHubAPIError(f"No recorded response for {url} (replay mode)")
+        etag = (headers or {}).get('If-None-Match')
+        if etag and etag == entry['headers'].get('ETag'):
+            return build_response(entry, status=304)
+        return build_response(entry)
+
+    def _store_key(self, url: str, params: Optional[Dict] = None) -> str:
+        """Cache key for a full URL; pagination URLs carry their params in the query string."""
+        parsed = urlparse(url)
+        merged = dict(parse_qsl(parsed.query))
+        merged.update(params or {})
+        return self._create_cache_key(parsed.path, merged)
+
     def _create_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
         """
         Create a cache-safe key for memcached compatibility.
@@ -88,21 +174,26 @@ class GitHubAPIService:
         if cached_result:
             logger.info(f"Cache hit for {endpoint}")
             return cached_result
-        
+
+        # Then the on-disk copy another worker (or an earlier deploy) recorded
+        stored = self.response_store.get_fresh(cache_key) if self.response_store and not self.replay else None
+        if stored and stored['status'] == 200:
+            logger.info(f"Response store hit for {endpoint}")
+            data = json.loads(stored['body'])
+            cache.set(cache_key, data, self.cache_timeout)
+            return data
+
         # Make API request
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
         try:
             logger.info(f"Making GitHub API request: {url}")
-            response = requests.get(url, headers=self._get_headers(), params=params or {}, timeout=self.timeout)
+            response = self._get(url, params=params or {})
 
             # Handle rate limiting
-            if response.status_code == 403:
-                rate_limit_remaining = response.headers.get('X-RateLimit-Remaining', '0')
-                if rate_limit_remaining == 0:
-                    reset_time = response.headers.get('X-RateLimit-Reset')
-                    logger.error(f"GitHub API rate limit exceeded. Resets at {reset_time}")
-                    raise GitHubAPIError("Rate limit exceeded")
+            if response.status_code == 403 and self.rate_limit.remaining == 0:
+                logger.error(f"GitHub API rate limit exceeded. Resets at {self.rate_limit.reset_at}")
+                raise GitHubAPIError("Rate limit exceeded")
             
             response.raise_for_status()
             data = response.json()
@@ -133,6 +224,46 @@ class GitHubAPIService:
         }
         return self._make_request("user/repos", params)
     
+    def list_repositories(self, sort: str = 'pushed') -> List[Dict]:
+        """
+        Every repository owned by the authenticated user, most recent first.
+
+        Uncached and followed through the Link header's rel="next" pages, so
+        incremental syncs compare watermarks against current data for one
+        request per 100 repositories.
+        """
+        url = f"{self.base_url}/user/repos"
+        params = {'sort': sort, 'direction': 'desc', 'per_page': 100, 'type': 'owner'}
+        repositories = []
+
+        while url:
+            try:
+                response = self._get(url, params=params)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"GitHub repository listing failed: {e}")
+                raise GitHubAPIError(f"Repository listing failed: {e}")
+
+            repositories.extend(response.json())
+            # The next URL carries its own query string
+            url = response.links.get('next', {}).get('url')
+            params = None
+
+        return repositories
+
+    def invalidate_repository_cache(self, username: str, repo_name: str):
+        """Drop cached commit counts and languages for a repository that has changed."""
+        languages_key = self._create_cache_key(f"repos/{username}/{repo_name}/languages")
+        if self.response_store is not None and not self.replay:
+            self.response_store.delete(languages_key)
+        now = self._commit_clock(username, repo_name)
+        cache.delete_many([
+            languages_key,
+            self._commit_window_key(username, repo_name),
+            self._commit_window_key(username, repo_name, self._window_start(days=30, now=now)),
+            self._commit_window_key(username, repo_name, self._window_start(days=365, now=now)),
+        ])
+
     def get_repository_details(self, username: str, repo_name: str) -> Dict:
         """Get detailed info about specific repo"""
         return self._make_request(f"repos/{username}/{repo_name}")
@@ -196,90 +327,171 @@ class GitHubAPIService:
                                     since_date: Optional[str] = None) -> Dict:
         """
         Get commit stats for a repository efficiently.
-        Uses commit API with pagination to get accurate counts.
+        Exact counts from Link-header page counting: three requests in total
+        (all history, which also returns the newest commit, last 30 days and
+        last year), each cached per window.
         """
-        # Get total commit count using more efficient approach
-        # First, try to get recent commits to check activity
-        recent_commits = self.get_repository_commits(username, repo_name, per_page=100)
+        history = self._commit_window(username, repo_name)
+        latest_commit = history['latest']
 
-        if not recent_commits:
+        if not latest_commit:
             return {
-                'total_commits': 0,
+                'total_commits': history['count'],
                 'last_commit_date': None,
                 'last_commit_sha': '',
                 'last_commit_message': '',
                 'commits_last_30_days': 0,
                 'commits_last_year': 0
             }
-        
-        # Get the most recent commit info
-        latest_commit = recent_commits[0]
-        last_commit_date = latest_commit['commit']['author']['date']
-        last_commit_sha = latest_commit['sha']
-        last_commit_message = latest_commit['commit']['message']
 
-        # Calculate time-based commit counts
-        now = datetime.now()
-        thirty_days_ago = (now - timedelta(days=30)).isoformat() + 'Z'
-        one_year_ago = (now - timedelta(days=365)).isoformat() + 'Z'
+        now = self._commit_clock(username, repo_name)
+        return {
+            'total_commits': history['count'],
+            'last_commit_date': latest_commit['commit']['author']['date'],
+            'last_commit_sha': latest_commit['sha'],
+            'last_commit_message': latest_commit['commit']['message'],
+            'commits_last_30_days': self.count_commits(
+                username, repo_name, since=self._window_start(days=30, now=now)
+            ),
+            'commits_last_year': self.count_commits(
+                username, repo_name, since=self._window_start(days=365, now=now)
+            ),
+        }
 
-        # Count commits in last 30 days
-        commits_30_days = self._count_commits_since(username, repo_name, thirty_days_ago)
+    # ======== EXACT COMMIT COUNTS ===========
+    @staticmethod
+    def _window_start(days: int, now: Optional[datetime] = None) -> datetime:
+        """Midnight UTC `days` before `now`, so a window's `since` (and cache key) is stable for a whole day."""
+        start = (now or timezone.now()) - timedelta(days=days)
+        return start.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # Count commits in last year
-        commits_year = self._count_commits_since(username, repo_name, one_year_ago)
+    def _commit_clock(self, username: str, repo_name: str) -> Optional[datetime]:
+        """
+        The moment commit windows are measured from: None (now) live, and in
+        replay mode when the repo's all-history count was recorded, so the
+        30-day and yearly `since` params match the ones in the recording.
+        """
+        if not self.replay:
+            return None
+        entry = self.response_store.get(
+            self._store_key(f"{self.base_url}/repos/{username}/{repo_name}/commits", {'per_page': 1})
+        )
+        if entry is None:
+            return None
+        return datetime.fromtimestamp(entry['stored_at'], tz=dt_timezone.utc)
+
+    def count_commits(self, username: str, repo_name: str, since: Optional[datetime] = None) -> int:
+        """Exact number of commits on the default branch since `since` (all history if None)."""
+        return self._commit_window(username, repo_name, since)['count']
+
+    def _commit_window(self, username: str, repo_name: str, since: Optional[datetime] = None) -> Dict:
+        """
+        {'count': commits since `since`, 'latest': newest commit or None},
+        cached per (repo, since).
 
-        # For total commits, use reasonable approximation
-        # Getting exact amount would require paginating through all commits (expensive)
-        total_commits = self._estimate_total_commits(username, repo_name, recent_commits)
+        Tries Link-header counting, then the stats/contributors totals, then
+        a single page of 100 commits (a lower bound, logged as such).
+        """
+        since_param = since.strftime('%Y-%m-%dT%H:%M:%SZ') if since else None
+        cache_key = self._commit_window_key(username, repo_name, since)
+        window = cache.get(cache_key)
+        if window is not None:
+            return window
 
-        return {
-            'total_commits': total_commits,
-            'last_commit_date': last_commit_date,
-            'last_commit_sha': last_commit_sha,
-            'last_commit_message': last_commit_message,
-            'commits_last_30_days': commits_30_days,
-            'commits_last_year': commits_year
-        }
-    
-    def _count_commits_since(self, username: str, repo_name: str, since_date: str) -> int:
-        """Count commits since a specific date."""
         try:
-            commits = self.get_repository_commits(username, repo_name, since=since_date, per_page=100)
-            return len(commits)
-        except GitHubAPIError:
-            return 0
-        
-    def _estimate_total_commits(self, username: str, repo_name: str, recent_commits: List[Dict]) -> int:
+            count, latest = self._count_commits_by_link_header(username, repo_name, since_param)
+        except GitHubAPIError as e:
+            logger.warning(f"Link-header commit count failed for {repo_name}: {e}")
+            latest = None
+            count = self._count_commits_from_contributors(username, repo_name, since)
+            if count is None:
+                try:
+                    page = self.get_repository_commits(username, repo_name, since=since_param, per_page=100)
+                except GitHubAPIError:
+                    page = []
+                count = len(page)
+                latest = page[0] if page else None
+                logger.warning(f"Commit count for {repo_name} is a lower bound ({count})")
+            elif since is None:
+                try:
+                    recent = self.get_repository_commits(username, repo_name, per_page=1)
+                except GitHubAPIError:
+                    recent = []
+                latest = recent[0] if recent else None
+
+        window = {'count': count, 'latest': latest}
+        cache.set(cache_key, window, self.cache_timeout)
+        return window
+
+    def _commit_window_key(self, username: str, repo_name: str, since: Optional[datetime] = None) -> str:
+        since_param = since.strftime('%Y-%m-%dT%H:%M:%SZ') if since else 'all'
+        return self._create_cache_key(f"repos/{username}/{repo_name}/commit_count", {'since': since_param})
+
+    def _count_commits_by_link_header(self, username: str, repo_name: str,
+                                      since: Optional[str] = None):
         """
-        Estimate total commits using repo creation date and recent activity.
-        This is more efficient than paging through all commits.
+        (count, newest commit) from one per_page=1 request.
+
+        With one commit per page, the page number in the Link header's
+        rel="last" URL is the commit count; no Link header means the window
+        holds zero or one commits.
         """
-        if not recent_commits:
-            return 0
-        
+        params = {'per_page': 1}
+        if since:
+            params['since'] = since
+        url = f"{self.base_url}/repos/{username}/{repo_name}/commits"
+
         try:
-            # Get repo creation date
-            repo_info = self.get_repository_details(username, repo_name)
-            created_date = datetime.fromisoformat(repo_info['created_at'].replace('Z', '+00:00'))
-
-            # If we have 100 recent commits, est based on repo age and activity
-            if len(recent_commits) >= 100:
-                # Active repo - estimate higher
-                repo_age_months = (datetime.now() - created_date.replace(tzinfo=None)).days / 30
-                estimated_monthly_commits = max(10, len(recent_commits) / 3)  # Conservative estimate
-                return int(repo_age_months * estimated_monthly_commits)
-            else:
-                # Less active - use actual count as reasonable estimate
-                return len(recent_commits)
-        except Exception:
-            # Fallback to just the commits we found
-            return len(recent_commits)
-    
-    def sync_repository_commits(self, username: str, repo_name: str) -> Dict:
+            response = self._get(url, params=params)
+        except requests.exceptions.RequestException as e:
+            raise GitHubAPIError(f"Commit count request failed: {e}")
+
+        # 409 Conflict: the repository is empty
+        if response.status_code == 409:
+            return 0, None
+        if not response.ok:
+            raise GitHubAPIError(f"Commit count request failed: HTTP {response.status_code}")
+
+        commits = response.json()
+        last_url = response.links.get('last', {}).get('url')
+        if last_url:
+            try:
+                count = int(parse_qs(urlparse(last_url).query)['page'][0])
+            except (KeyError, IndexError, ValueError):
+                raise GitHubAPIError(f"Unexpected Link header: {response.headers.get('Link')}")
+        else:
+            count = len(commits)
+        return count, (commits[0] if commits else None)
+
+    def _count_commits_from_contributors(self, username: str, repo_name: str,
+                                         since: Optional[datetime] = None) -> Optional[int]:
+        """
+        Commits summed from stats/contributors weekly totals (weeks starting
+        on or after `since`'s week). None while GitHub is still computing the
+        stats (202) or on errors.
+        """
+        url = f"{self.base_url}/repos/{username}/{repo_name}/stats/contributors"
+        try:
+            response = self._get(url)
+        except (requests.exceptions.RequestException, GitHubAPIError):
+            return None
+        if response.status_code != 200:
+            return None
+
+        cutoff = (since - timedelta(days=7)).timestamp() if since else None
+        return sum(
+            week['c']
+            for contributor in response.json() or []
+            for week in contributor.get('weeks', [])
+            if cutoff is None or week['w'] > cutoff
+        )
+
+    def sync_repository_commits(self, username: str, repo_name: str,
+                                created_at: Optional[str] = None) -> Dict:
         """
         Sync commit data for a specific repo.
         Returns commit stats and metadata.
+        Pass the listing's `created_at` to skip the repository details request.
         """
         try:
             logger.info(f"Syncing commits for {username}/{repo_name}")
@@ -288,8 +500,8 @@ class GitHubAPIService:
             commit_stats = self.get_repository_commit_stats(username, repo_name)
 
             # Calculate avg commits per month
-            repo_info = self.get_repository_details(username, repo_name)
-            created_date = datetime.fromisoformat(repo_info['created_at'].replace('Z', '+00:00'))
+            created_at = created_at or self.get_repository_details(username, repo_name)['created_at']
+            created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
             repo_age_months = max(1, (datetime.now() - created_date.replace(tzinfo=None)).days / 30)
 
             avg_commits_per_month = commit_stats['total_commits'] / repo_age_months
@@ -337,7 +549,7 @@ class GitHubAPIService:
         
         try:
             url = f"{self.base_url}/{endpoint.lstrip('/')}"
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._get(url, headers=headers)
             
             # Handle 304 Not Modified - no changes since last request
             if response.status_code == 304:
@@ -353,7 +565,7 @@ class GitHubAPIService:
                 logger.info(f"GitHub computing stats for {repo_name} (202)")
                 return {
                     'status': 'computing',
-                    'retry_after': 5,  # Seconds to wait before retry
+                    'retry_after': int(response.headers.get('Retry-After') or 5),  # Seconds to wait before retry
                     'data': []
                 }
             
@@ -503,10 +715,13 @@ class GitHubAPIService:
             return {}
 
     def bulk_sync_weekly_commits(self, username: str, repo_names: List[str],
-                                 delay_between_requests: float = 0.5) -> Dict:
+                                 delay_between_requests: float = 0.5,
+                                 retry_deadline: Optional[float] = None) -> Dict:
         """
         Efficiently sync weekly commit data for multiple repositories.
-        Includes delays to respect rate limits and handles GitHub's async stats computation.
+        Includes delays to respect rate limits and handles GitHub's async stats computation:
+        repos answered with 202 are re-polled with backoff while the rest are synced, until
+        `retry_deadline` seconds pass; 'computing' lists only the ones still pending then.
         """
         results = {
             'successful': [],
@@ -514,11 +729,11 @@ class GitHubAPIService:
             'computing': [],
             'not_modified': []
         }
-        
-        for i, repo_name in enumerate(repo_names):
+        scheduler = RetryScheduler(deadline=retry_deadline)
+
+        def sync_one(repo_name):
+            """Sync and record one repo; returns retry_after while GitHub is still computing, else None."""
             try:
-                logger.info(f"Syncing weekly commits {i + 1}/{len(repo_names)}: {repo_name}")
-                
                 # Get any existing ETag from database
                 # This would be passed in from the calling code
                 etag = None  # Would come from GitHubRepository.stats_etag
@@ -532,7 +747,7 @@ class GitHubAPIService:
                         'etag': result['etag']
                     })
                 elif result['status'] == 'computing':
-                    results['computing'].append(repo_name)
+                    return result.get('retry_after') or 0
                 elif result['status'] == 'not_modified':
                     results['not_modified'].append(repo_name)
                 else:
@@ -540,10 +755,6 @@ class GitHubAPIService:
                         'repo': repo_name,
                         'error': result.get('error', 'Unknown error')
                     })
-                
-                # Delay between requests to be nice to GitHub's API
-                if i < len(repo_names) - 1:  # Don't delay after the last request
-                    time.sleep(delay_between_requests)
                     
             except Exception as e:
                 logger.error(f"Unexpected error syncing {repo_name}: {e}")
@@ -551,6 +762,23 @@ class GitHubAPIService:
                     'repo': repo_name,
                     'error': str(e)
                 })
+            return None
+
+        def poll(due):
+            return {repo_name: sync_one(repo_name) for repo_name in due}
+        
+        for i, repo_name in enumerate(repo_names):
+            logger.info(f"Syncing weekly commits {i + 1}/{len(repo_names)}: {repo_name}")
+            retry_after = sync_one(repo_name)
+            if retry_after is not None:
+                scheduler.defer(repo_name, retry_after)
+            scheduler.poll_due(poll)
+
+            # Delay between requests to be nice to GitHub's API
+            if i < len(repo_names) - 1:  # Don't delay after the last request
+                time.sleep(delay_between_requests)
+
+        results['computing'] = scheduler.drain(poll)
         
         logger.info(f"Bulk sync completed: {len(results['successful'])} successful, "
                     f"{len(results['failed'])} failed, {len(results['computing'])} computing")
@@ -0,0 +1,134 @@
+"""
+Async GitHub Client
+asyncio mirror of GitHubAPIService for fanning per-repository requests out in parallel
+Version 1.0 - Pooled keep-alive session, semaphore-bounded worker threads, shared rate-limit accounting
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional
+
+import requests
+from django.db import connections
+from requests.adapters import HTTPAdapter
+
+from .github_api import GitHubAPIService
+
+
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncGitHubAPIService:
+    """
+    Awaitable versions of the GitHubAPIService methods, same arguments and
+    response shapes.
+
+    Every call runs the synchronous method on a pool of `concurrency`
+    worker threads (asyncio's default to_thread pool is sized by CPU count,
+    too small for I/O fan-out), at most `concurrency` at a time, over one
+    requests.Session whose keep-alive pool holds a connection per slot. The wrapped service (and so its
+    cache keys and RateLimitState) is shared by all calls; once GitHub
+    reports the limit spent, pending calls fail fast with GitHubAPIError.
+
+        async with AsyncGitHubAPIService() as github:
+            details, languages = await asyncio.gather(
+                github.get_repository_details(user, name),
+                github.get_repository_languages(user, name),
+            )
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, service: Optional[GitHubAPIService] = None):
+        self.concurrency = max(1, concurrency)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.service = service or GitHubAPIService()
+        self.service.http = self.session
+        self.executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix='github-async')
+        self._loop = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+    @property
+    def username(self):
+        return self.service.username
+
+    @property
+    def rate_limit(self):
+        return self.service.rate_limit
+
+    def _slots(self):
+        # One client can serve several asyncio.run() phases; a semaphore belongs to one loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._semaphore = loop, asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def _call(self, method: str, *args, **kwargs):
+        async with self._slots():
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, partial(self._run, getattr(self.service, method), *args, **kwargs)
+            )
+
+    @staticmethod
+    def _run(func, *args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # A DB-backed cache tier opens a connection per worker thread
+            connections.close_all()
+
+    # ===== MIRRORED METHODS =====
+
+    async def get_repositories(self, username: Optional[str] = None,
+                               sort: str = 'updated', per_page: int = 30) -> List[Dict]:
+        return await self._call('get_repositories', username, sort, per_page)
+
+    async def list_repositories(self, sort: str = 'pushed') -> List[Dict]:
+        return await self._call('list_repositories', sort)
+
+    async def get_repository_details(self, username: str, repo_name: str) -> Dict:
+        return await self._call('get_repository_details', username, repo_name)
+
+    async def get_repository_languages(self, username: str, repo_name: str) -> Dict:
+        return await self._call('get_repository_languages', username, repo_name)
+
+    async def get_repository_commits(self, username: str, repo_name: str,
+                                     since: Optional[str] = None, per_page: int = 10) -> List[Dict]:
+        return await self._call('get_repository_commits', username, repo_name, since, per_page)
+
+    async def get_repository_commit_stats(self, username: str, repo_name: str) -> Dict:
+        return await self._call('get_repository_commit_stats', username, repo_name)
+
+    async def get_repository_commit_activity(self, username: str, repo_name: str,
+                                             etag: Optional[str] = None) -> Dict:
+        return await self._call('get_repository_commit_activity', username, repo_name, etag)
+
+    async def sync_repository_commits(self, username: str, repo_name: str,
+                                      created_at: Optional[str] = None) -> Dict:
+        return await self._call('sync_repository_commits', username, repo_name, created_at)
+
+    async def sync_repository_weekly_commits(self, username: str, repo_name: str,
+                                             etag: Optional[str] = None) -> Dict:
+        return await self._call('sync_repository_weekly_commits', username, repo_name, etag)
+
+
+async def gather_settled(calls: Dict):
+    """
+    Await {key: coroutine} concurrently; returns {key: result or the
+    exception it raised}, so one failing repository doesn't sink the rest.
+    """
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+    return dict(zip(calls, results))
@@ -0,0 +1,89 @@
+"""
+GitHub Stats Retry Scheduler
+Deferred re-polls for statistics GitHub answers with 202 Accepted (still computing)
+Version 1.0 - Exponential backoff honouring retry_after, bounded by a per-run deadline
+"""
+
+import heapq
+import itertools
+import time
+
+
+DEFAULT_RETRY_CONFIG = {
+    'BASE_DELAY': 2.0,   # First re-poll after this many seconds (or the response's retry_after, if longer)
+    'MAX_DELAY': 60.0,   # Backoff doubles per attempt up to this
+    'DEADLINE': 120.0,   # Stop re-polling this long after the scheduler starts; leftovers carry over
+}
+
+
+class RetryScheduler:
+    """
+    Min-heap of keys (repositories) waiting to be re-polled.
+
+    Callers defer() a key when GitHub says "computing", keep working on
+    other keys, and call poll_due() between them; drain() then sleeps until
+    each remaining key is due and polls it, until everything settles or the
+    deadline passes. Whatever is left is returned for the caller to persist.
+
+    `clock` and `sleep` are injectable so the backoff can be exercised
+    without waiting.
+    """
+
+    def __init__(self, base_delay=None, max_delay=None, deadline=None, clock=time.monotonic, sleep=time.sleep):
+        self.base_delay = DEFAULT_RETRY_CONFIG['BASE_DELAY'] if base_delay is None else base_delay
+        self.max_delay = DEFAULT_RETRY_CONFIG['MAX_DELAY'] if max_delay is None else max_delay
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline_at = clock() + (DEFAULT_RETRY_CONFIG['DEADLINE'] if deadline is None else deadline)
+
+        self._heap = []
+        self._order = itertools.count()
+        self.attempts = {}
+
+    def __len__(self):
+        return len(self._heap)
+
+    def defer(self, key, retry_after=None):
+        """Schedule `key` for another poll: base_delay * 2^(attempts - 1), at least retry_after."""
+        attempts = self.attempts[key] = self.attempts.get(key, 0) + 1
+        delay = min(self.max_delay, max(retry_after or 0, self.base_delay * 2 ** (attempts - 1)))
+        heapq.heappush(self._heap, (self.clock() + delay, next(self._order), key))
+        return delay
+
+    def pending(self):
+        return [key for _, _, key in sorted(self._heap)]
+
+    def pop_due(self):
+        """Remove and return every key whose retry time has come."""
+        now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def poll_due(self, poll):
+        """
+        poll(keys) -> {key: retry_after or None}: None means settled, a
+        number (possibly 0) means still computing and is deferred again.
+        """
+        due = self.pop_due()
+        if due:
+            for key, retry_after in poll(due).items():
+                if retry_after is not None:
+                    self.defer(key, retry_after)
+        return len(due)
+
+    def drain(self, poll):
+        """
+        Wait out and poll the remaining keys until none are left or the
+        deadline passes; returns the stragglers, which are dropped from the queue.
+        """
+        while self._heap:
+            due_at = self._heap[0][0]
+            if due_at > self.deadline_at:
+                break
+            self.sleep(max(0.0, due_at - self.clock()))
+            self.poll_due(poll)
+        stragglers = self.pending()
+        self._heap.clear()
+        return stragglers
@@ -0,0 +1,195 @@
+"""
+GitHub Response Store
+Persistent on-disk copy of GitHub API responses, shared by workers and deploys
+Version 1.0 - Brotli-compressed entries keyed like the cache, TTL freshness, size-bounded LRU eviction, offline replay
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import brotli
+import requests
+from django.conf import settings
+from requests.structures import CaseInsensitiveDict
+
+
+# Response headers the service reads; everything else is dropped before storing
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Link', 'Retry-After', 'X-RateLimit-Remaining', 'X-RateLimit-Reset')
+
+# Statuses worth replaying: data, "repo/user gone" and "empty repository" (commit counts)
+STORED_STATUSES = (200, 404, 409)
+
+ENTRY_SUFFIX = '.json.br'
+
+
+class GitHubResponseStore:
+    """
+    One file per request under `directory`, named by
+    GitHubAPIService._create_cache_key(), holding the status, the headers in
+    KEPT_HEADERS and the body, brotli-compressed (GitHub JSON shrinks ~10x).
+
+    Entries younger than `ttl` are fresh; older ones are still served in
+    replay mode. Reads bump a file's mtime, and once the directory passes
+    `max_bytes` the least recently used files are removed down to 90% of it.
+    Writes go through a temp file + os.replace, so concurrent workers never
+    read half an entry.
+    """
+
+    def __init__(self, directory, ttl, max_bytes):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None
+
+    def _path(self, key):
+        return self.directory / f'{key}{ENTRY_SUFFIX}'
+
+    def get(self, key, max_age=None):
+        """The stored entry for `key`, or None if missing, unreadable or older than max_age seconds."""
+        path = self._path(key)
+        try:
+            entry = json.loads(brotli.decompress(path.read_bytes()))
+        except (OSError, brotli.error, ValueError):
+            return None
+        if max_age is not None and time.time() - entry['stored_at'] > max_age:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def get_fresh(self, key):
+        return self.get(key, max_age=self.ttl)
+
+    def put(self, key, response):
+        """Store a requests.Response if its status is worth replaying; returns whether it was stored."""
+        if response.status_code not in STORED_STATUSES:
+            return False
+        entry = {
+            'url': response.url,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+            'body': response.text,
+            'stored_at': time.time(),
+        }
+        self._write(key, brotli.compress(json.dumps(entry).encode(), quality=5, mode=brotli.MODE_TEXT))
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+
+    def touch(self, key):
+        """Mark an entry as just confirmed by GitHub (a 304 for its ETag)."""
+        entry = self.get(key)
+        if entry is not None:
+            entry['stored_at'] = time.time()
+            self._write(key, brotli.compress(json.dumps(entry).encode(), quality=5, mode=brotli.MODE_TEXT))
+
+    def _write(self, key, payload):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.total_bytes()
+            else:
+                self._size += len(payload) - previous
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.endswith(ENTRY_SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    def total_bytes(self):
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self):
+        """Remove least recently used entries until the store is under 90% of max_bytes; returns files removed."""
+        stats = []
+        for entry in self._entries():
+            try:
+                stats.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+            except OSError:
+                pass  # Removed by another worker
+        stats.sort()
+
+        size = sum(item[1] for item in stats)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, file_size, path in stats:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            size -= file_size
+            removed += 1
+
+        with self._lock:
+            self._size = size
+        return removed
+
+    def clear(self):
+        for entry in self._entries():
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+
+def build_response(entry, status=None):
+    """A requests.Response for a stored entry, so callers read .json(), .links and .headers as usual."""
+    response = requests.Response()
+    response.status_code = status or entry['status']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response.url = entry['url']
+    response.encoding = 'utf-8'
+    response._content = b'' if response.status_code == 304 else entry['body'].encode('utf-8')
+    return response
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_response_store():
+    """The store configured by GITHUB_API_CONFIG['RESPONSE_STORE'], or None when DIR is blank."""
+    global _store
+    config = settings.GITHUB_API_CONFIG.get('RESPONSE_STORE') or {}
+    if not config.get('DIR'):
+        return None
+    with _store_lock:
+        if _store is None or _store.directory != Path(config['DIR']):
+            _store = GitHubResponseStore(config['DIR'], config['TTL'], config['MAX_BYTES'])
+        return _store
@@ -0,0 +1,269 @@
+"""
+Responsive Image Derivative Service
+Generates resized WebP/AVIF/JPEG variants of uploaded images with Pillow
+Version 1.1 - Uploads rendered by the backfill command instead of in the request; replaced images cleaned up
+"""
+
+import io
+import logging
+import os
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# Widths generated for every source (never upscaled past the original)
+DERIVATIVE_WIDTHS = (320, 640, 960, 1280, 1920)
+
+# Output formats, best first. AVIF needs a Pillow build with libavif.
+DERIVATIVE_FORMATS = [
+    fmt for fmt, available in (
+        ('avif', features.check('avif')),
+        ('webp', features.check('webp')),
+        ('jpeg', True),
+    )
+    if available
+]
+
+FORMAT_SETTINGS = {
+    'avif': {'pil_format': 'AVIF', 'ext': 'avif', 'mime': 'image/avif', 'options': {'quality': 60}},
+    'webp': {'pil_format': 'WEBP', 'ext': 'webp', 'mime': 'image/webp', 'options': {'quality': 80, 'method': 6}},
+    'jpeg': {'pil_format': 'JPEG', 'ext': 'jpg', 'mime': 'image/jpeg', 'options': {'quality': 82, 'optimize': True, 'progressive': True}},
+}
+
+# Every ImageField that gets derivatives, by model label
+DERIVATIVE_FIELDS = {
+    'blog.Post': ['thumbnail', 'banner_image'],
+    'blog.Series': ['thumbnail'],
+    'projects.SystemModule': ['thumbnail', 'banner_image', 'featured_image'],
+    'projects.SystemImage': ['image'],
+}
+
+DERIVATIVE_DIR = 'derivatives'
+CACHE_PREFIX = 'img_derivatives:'
+CACHE_TIMEOUT = 60 * 60 * 24
+# Sources still waiting for the generate_image_derivatives run are re-checked sooner
+PENDING_CACHE_TIMEOUT = 60 * 5
+
+
+def derivative_path(source_name, width, fmt):
+    """derivatives/<original path without ext>/<width>w.<ext>"""
+    stem, _ = os.path.splitext(source_name)
+    return f"{DERIVATIVE_DIR}/{stem}/{width}w.{FORMAT_SETTINGS[fmt]['ext']}"
+
+
+def render_derivatives(source_name, storage=None):
+    """
+    Resize one source image into every width/format and write the files.
+
+    Pure Pillow + storage work, no DB access, so it's safe to run in a process pool.
+    Returns a list of dicts describing what was written.
+    """
+    storage = storage or default_storage
+
+    with storage.open(source_name, 'rb') as f:
+        with Image.open(f) as original:
+            # Bake in EXIF orientation before the metadata is dropped
+            image = ImageOps.exif_transpose(original)
+            image.load()
+
+    source_width, source_height = image.size
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    widths = [w for w in DERIVATIVE_WIDTHS if w < source_width] + [min(source_width, DERIVATIVE_WIDTHS[-1])]
+    written = []
+
+    for width in sorted(set(widths)):
+        height = max(1, round(source_height * width / source_width))
+        resized = image if width == source_width else image.resize((width, height), Image.LANCZOS)
+
+        for fmt in DERIVATIVE_FORMATS:
+            fmt_settings = FORMAT_SETTINGS[fmt]
+            output = resized
+            if fmt == 'jpeg' and output.mode != 'RGB':
+                output = output.convert('RGB')
+
+            # A fresh save with no exif/icc_profile kwargs writes no metadata
+            buffer = io.BytesIO()
+            output.save(buffer, fmt_settings['pil_format'], **fmt_settings['options'])
+
+            name = derivative_path(source_name, width, fmt)
+            if storage.exists(name):
+                storage.delete(name)
+            name = storage.save(name, ContentFile(buffer.getvalue()))
+
+            written.append({
+                'source': source_name,
+                'format': fmt,
+                'file': name,
+                'width': width,
+                'height': height,
+                'source_width': source_width,
+                'source_height': source_height,
+            })
+
+    return written
+
+
+def store_derivatives(source_name, rendered):
+    """Replace the ImageDerivative rows for a source with freshly rendered ones."""
+    ImageDerivative = apps.get_model('core', 'ImageDerivative')
+
+    ImageDerivative.objects.filter(source=source_name).delete()
+    ImageDerivative.objects.bulk_create([ImageDerivative(**row) for row in rendered])
+    cache.delete(CACHE_PREFIX + source_name)
+
+
+def generate_derivatives(source_name):
+    """Render and record derivatives for one stored image. Returns the number written."""
+    try:
+        rendered = render_derivatives(source_name)
+    except (OSError, ValueError) as e:
+        # Missing file or something Pillow can't decode - serve the original
+        logger.warning(f"Could not generate derivatives for {source_name}: {e}")
+        return 0
+
+    store_derivatives(source_name, rendered)
+    return len(rendered)
+
+
+def _group_derivatives(rows):
+    """(format, file, width, height) rows -> {'avif': [{'url', 'width', 'height'}, ...], ...} by width."""
+    grouped = {}
+    for fmt, name, width, height in rows:
+        grouped.setdefault(fmt, []).append({
+            'url': default_storage.url(name),
+            'width': width,
+            'height': height,
+        })
+    for items in grouped.values():
+        items.sort(key=lambda item: item['width'])
+    return grouped
+
+
+def get_derivatives(source_name):
+    """
+    Derivatives for a source grouped by format, cached.
+
+    Returns {'avif': [...], 'webp': [...], 'jpeg': [...]} where each item is
+    {'url', 'width', 'height'} sorted by width, or {} if none exist.
+    """
+    if not source_name:
+        return {}
+
+    key = CACHE_PREFIX + source_name
+    grouped = cache.get(key)
+    if grouped is not None:
+        return grouped
+
+    ImageDerivative = apps.get_model('core', 'ImageDerivative')
+    rows = ImageDerivative.objects.filter(source=source_name).values_list('format', 'file', 'width', 'height')
+    grouped = _group_derivatives(rows)
+
+    cache.set(key, grouped, CACHE_TIMEOUT if grouped else PENDING_CACHE_TIMEOUT)
+    return grouped
+
+
+def warm_derivatives_cache():
+    """Cache every source's derivatives from one query (what get_derivatives would fill lazily)."""
+    ImageDerivative = apps.get_model('core', 'ImageDerivative')
+    rows = (
+        ImageDerivative.objects.order_by('source')
+        .values_list('source', 'format', 'file', 'width', 'height')
+        .iterator(chunk_size=2000)
+    )
+    by_source = {}
+    for source, *row in rows:
+        by_source.setdefault(source, []).append(row)
+
+    cache.set_many(
+        {CACHE_PREFIX + source: _group_derivatives(source_rows) for source, source_rows in by_source.items()},
+        CACHE_TIMEOUT,
+    )
+    return len(by_source)
+
+
+def iter_source_names():
+    """Distinct storage names referenced by every registered ImageField."""
+    seen = set()
+    for label, field_names in DERIVATIVE_FIELDS.items():
+        model = apps.get_model(label)
+        for field_name in field_names:
+            names = (
+                model._default_manager.exclude(**{field_name: ''})
+                .exclude(**{f'{field_name}__isnull': True})
+                .values_list(field_name, flat=True)
+                .distinct()
+            )
+            for name in names:
+                if name not in seen:
+                    seen.add(name)
+                    yield name
+
+
+def remember_image_sources(instance):
+    """
+    post_init hook: note each image field's stored name, so a save can tell
+    which images changed without querying. Deferred fields aren't tracked.
+    """
+    instance._image_sources = {
+        field_name: getattr(instance.__dict__[field_name], 'name', instance.__dict__[field_name])
+        for field_name in DERIVATIVE_FIELDS.get(instance._meta.label, [])
+        if field_name in instance.__dict__
+    }
+
+
+def release_replaced_images(instance):
+    """
+    post_save hook: drop the derivatives of images this save replaced.
+
+    New uploads are only flagged, by having no ImageDerivative rows yet:
+    `manage.py generate_image_derivatives` (run from cron) renders them, and
+    templates serve the original until it has.
+    """
+    previous = getattr(instance, '_image_sources', {})
+    remember_image_sources(instance)
+
+    replaced = [
+        name for field_name, name in previous.items()
+        if name and instance._image_sources.get(field_name, name) != name
+    ]
+    for name in replaced:
+        transaction.on_commit(lambda name=name: _delete_unreferenced_derivatives(name))
+
+
+def _delete_unreferenced_derivatives(source_name):
+    # Another record may still use the old image (e.g. copied between posts)
+    if not is_source_referenced(source_name):
+        delete_derivatives(source_name)
+
+
+def is_source_referenced(source_name):
+    """True if any registered ImageField still points at the stored name."""
+    for label, field_names in DERIVATIVE_FIELDS.items():
+        model = apps.get_model(label)
+        for field_name in field_names:
+            if model._default_manager.filter(**{field_name: source_name}).exists():
+                return True
+    return False
+
+
+def delete_derivatives(source_name):
+    """Remove a source's ImageDerivative rows and their files."""
+    ImageDerivative = apps.get_model('core', 'ImageDerivative')
+    rows = ImageDerivative.objects.filter(source=source_name)
+
+    for name in rows.values_list('file', flat=True):
+        try:
+            default_storage.delete(name)
+        except OSError as e:
+            logger.warning(f"Could not delete derivative {name}: {e}")
+    deleted, _ = rows.delete()
+    cache.delete(CACHE_PREFIX + source_name)
+    return deleted
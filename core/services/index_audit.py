@@ -0,0 +1,134 @@
+"""
+Query Plan / Index Audit Service
+Runs EXPLAIN over a catalog of the site's hot queries and flags full table scans
+Version 1.0 - SQLite + PostgreSQL plan parsing, JSON-friendly results
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from blog.models import Post, SeriesPost, Subscriber
+from core.models import Contact
+from projects.models import GitHubRepository, SystemModule
+
+
+def _first_pk(model):
+    """A real FK value for lookups, so the planner sees a realistic parameter."""
+    return model.objects.order_by('pk').values_list('pk', flat=True).first() or 0
+
+
+# (name, where it runs, queryset factory). Mirrors the filters/orderings in the
+# views, template tags and context processors that run on most requests.
+HOT_QUERIES = [
+    (
+        'post_published_recent',
+        'blog post list, home latest posts, feeds',
+        lambda: Post.objects.filter(status='published').order_by('-published_date')[:10],
+    ),
+    (
+        'post_published_featured',
+        'blog post list featured post',
+        lambda: Post.objects.filter(status='published', featured=True).order_by('-published_date')[:1],
+    ),
+    (
+        'system_status_recent',
+        'system list / featured learning systems',
+        lambda: SystemModule.objects.filter(status__in=['deployed', 'published']).order_by('-updated_at')[:12],
+    ),
+    (
+        'system_featured_active',
+        'home page featured systems',
+        lambda: SystemModule.objects.filter(featured=True).exclude(status__in=['draft', 'archived'])[:3],
+    ),
+    (
+        'system_portfolio_ready',
+        'home page fallback systems, portfolio counts',
+        lambda: SystemModule.objects.filter(portfolio_ready=True, status__in=['deployed', 'published'])[:3],
+    ),
+    (
+        'repo_most_active_for_system',
+        'SystemModule GitHub summary',
+        lambda: GitHubRepository.objects.filter(
+            related_system_id=_first_pk(SystemModule)
+        ).order_by('-commits_last_30_days')[:1],
+    ),
+    (
+        'repo_latest_commit',
+        'GitHub integration dashboards',
+        lambda: GitHubRepository.objects.filter(
+            last_commit_date__isnull=False
+        ).order_by('-last_commit_date')[:10],
+    ),
+    (
+        'contact_unread',
+        'admin context processor (every admin page)',
+        lambda: Contact.objects.filter(is_read=False),
+    ),
+    (
+        'contact_pending_response',
+        'admin dashboard',
+        lambda: Contact.objects.filter(is_read=True, response_sent=False),
+    ),
+    (
+        'subscriber_active_verified',
+        'new post notifications, subscriber admin',
+        lambda: Subscriber.objects.filter(is_active=True, is_verified=True),
+    ),
+    (
+        'series_post_for_post',
+        'post detail / post edit series lookup',
+        lambda: SeriesPost.objects.filter(post_id=_first_pk(Post))[:1],
+    ),
+    (
+        'post_published_in_series',
+        'series navigation',
+        lambda: Post.objects.filter(
+            Q(status='published') & Q(series_associations__series_id=_first_pk(SeriesPost))
+        ).order_by('series_associations__order'),
+    ),
+]
+
+# SQLite: "SCAN blog_post" (no index) vs "SCAN blog_post USING INDEX ..." (ordered walk)
+SQLITE_SCAN_RE = re.compile(r'\bSCAN (\w+)(?! USING (?:COVERING )?INDEX)(?:\s|$)')
+SQLITE_SORT_RE = re.compile(r'USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT)')
+# PostgreSQL: "Seq Scan on blog_post"
+POSTGRES_SCAN_RE = re.compile(r'Seq Scan on (\w+)')
+POSTGRES_SORT_RE = re.compile(r'\bSort\b')
+
+
+def parse_plan(plan, vendor=None):
+    """Return (full_scan_tables, extra_sorts) found in an EXPLAIN plan."""
+    vendor = vendor or connection.vendor
+    if vendor == 'postgresql':
+        scans = POSTGRES_SCAN_RE.findall(plan)
+        sorts = len(POSTGRES_SORT_RE.findall(plan))
+    else:
+        scans = SQLITE_SCAN_RE.findall(plan)
+        sorts = len(SQLITE_SORT_RE.findall(plan))
+    return sorted(set(scans)), sorts
+
+
+def explain_hot_queries(names=None):
+    """
+    EXPLAIN every catalogued query (or just `names`).
+
+    Returns a list of dicts: name, used_by, sql, plan, full_scans, temp_sorts.
+    """
+    results = []
+    for name, used_by, factory in HOT_QUERIES:
+        if names and name not in names:
+            continue
+        queryset = factory()
+        plan = queryset.explain()
+        full_scans, temp_sorts = parse_plan(plan)
+        results.append({
+            'name': name,
+            'used_by': used_by,
+            'sql': str(queryset.query),
+            'plan': plan,
+            'full_scans': full_scans,
+            'temp_sorts': temp_sorts,
+        })
+    return results
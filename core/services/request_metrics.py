@@ -0,0 +1,140 @@
+"""
+Request Performance Metrics Store
+In-memory ring buffer of per-request timings used by the Performance Monitor
+Version 1.0 - Query counts, DB time and template render time per URL name
+"""
+
+import math
+import threading
+import time
+from collections import Counter, defaultdict, deque
+
+from django.conf import settings
+
+
+DEFAULT_PERF_CONFIG = {
+    'ENABLED': True,
+    # Requests slower than this (or with more queries) get logged
+    'SLOW_REQUEST_MS': 500,
+    'SLOW_QUERY_COUNT': 50,
+    # How many samples to keep per URL name
+    'BUFFER_SIZE': 200,
+    # How many repeated SQL signatures to include in slow request logs
+    'TOP_REPEATED': 5,
+    # Server-Timing response header: True (everyone), 'staff' (staff users only) or False
+    'SERVER_TIMING_HEADER': False,
+}
+
+
+def get_perf_config():
+    """Merge PERFORMANCE_MONITORING settings over the defaults."""
+    config = DEFAULT_PERF_CONFIG.copy()
+    config.update(getattr(settings, 'PERFORMANCE_MONITORING', {}))
+    return config
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, math.ceil(pct / 100 * len(values)) - 1))
+    return values[rank]
+
+
+class QueryRecorder:
+    """
+    Callable for connection.execute_wrapper() that counts queries and DB time.
+
+    SQL arrives with placeholders (params are passed separately), so identical
+    SQL text is a good signature for N+1 patterns.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.signatures = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.signatures[sql] += 1
+
+    @property
+    def duration_ms(self):
+        return self.duration * 1000
+
+    def repeated_queries(self, limit=5):
+        """Return (sql, count) pairs executed more than once, most frequent first."""
+        return [
+            (sql, count) for sql, count in self.signatures.most_common(limit)
+            if count > 1
+        ]
+
+    @property
+    def duplicate_count(self):
+        """Number of executions that repeated an earlier identical statement."""
+        return sum(count - 1 for count in self.signatures.values() if count > 1)
+
+
+class RequestMetricsStore:
+    """Thread-safe ring buffer of request samples, keyed by URL name."""
+
+    def __init__(self, buffer_size=200):
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.buffer_size))
+
+    def record(self, url_name, total_ms, db_ms, template_ms, query_count, duplicate_count, status_code):
+        sample = {
+            'timestamp': time.time(),
+            'total_ms': total_ms,
+            'db_ms': db_ms,
+            'template_ms': template_ms,
+            'queries': query_count,
+            'duplicates': duplicate_count,
+            'status': status_code,
+        }
+        with self._lock:
+            self._samples[url_name].append(sample)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        """Rolling p50/p95 stats per URL name, slowest p95 first."""
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+
+        rows = []
+        for url_name, samples in snapshot.items():
+            if not samples:
+                continue
+            totals = sorted(s['total_ms'] for s in samples)
+            db_times = sorted(s['db_ms'] for s in samples)
+            queries = sorted(s['queries'] for s in samples)
+            rows.append({
+                'url_name': url_name,
+                'requests': len(samples),
+                'p50_ms': round(percentile(totals, 50), 1),
+                'p95_ms': round(percentile(totals, 95), 1),
+                'max_ms': round(totals[-1], 1),
+                'db_p50_ms': round(percentile(db_times, 50), 1),
+                'db_p95_ms': round(percentile(db_times, 95), 1),
+                'template_avg_ms': round(sum(s['template_ms'] for s in samples) / len(samples), 1),
+                'queries_p50': percentile(queries, 50),
+                'queries_max': queries[-1],
+                'duplicates_max': max(s['duplicates'] for s in samples),
+                'errors': sum(1 for s in samples if s['status'] >= 500),
+                'last_seen': max(s['timestamp'] for s in samples),
+            })
+
+        rows.sort(key=lambda row: row['p95_ms'], reverse=True)
+        return rows
+
+
+request_metrics = RequestMetricsStore(buffer_size=get_perf_config()['BUFFER_SIZE'])
@@ -0,0 +1,199 @@
+"""
+Feed & Sitemap Caching Service
+Content generations, conditional GET and response caching for RSS/Atom feeds and sitemaps
+Version 1.1 - Tokens from the DB fingerprint plus a shared bump counter; per-URL ETags
+"""
+
+import hashlib
+import threading
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.http import HttpResponse
+from django.utils import timezone
+from django.views.decorators.http import condition
+
+
+DEFAULT_SYNDICATION_CONFIG = {
+    'FEED_ITEMS': 20,                 # Entries per RSS/Atom feed
+    'SITEMAP_LIMIT': 10000,           # URLs per sitemap page (protocol max is 50,000)
+    'CACHE_TIMEOUT': 60 * 60 * 24,    # Rendered feed/sitemap bodies (keyed by generation)
+    'GENERATION_TIMEOUT': 300,        # How long a worker trusts its generation before re-reading the DB
+    'MAX_CACHED_BYTES': 1024 * 1024,  # Streamed sitemaps larger than this aren't cached
+}
+
+GENERATION_KEY = 'syndication:generation:'
+BODY_KEY = 'syndication:body:'
+
+# Models whose rows end up in each content group, with the timestamp used as Last-Modified
+CONTENT_GROUPS = {
+    'blog': [('blog.Post', 'updated_at'), ('blog.Series', 'updated_at')],
+    'projects': [('projects.SystemModule', 'updated_at')],
+    'github': [('projects.GitHubRepository', 'last_synced')],
+}
+
+
+def get_syndication_config():
+    """Merge SYNDICATION settings over the defaults."""
+    config = DEFAULT_SYNDICATION_CONFIG.copy()
+    config.update(getattr(settings, 'SYNDICATION', {}))
+    return config
+
+
+# ===== GENERATIONS =====
+
+def _generation_from_db(group):
+    """
+    Fingerprint a group from MAX(timestamp)/COUNT per model (one query per
+    model) plus its SyndicationGeneration counter (one more). Every worker
+    derives the same token for the same content and bump count.
+    """
+    from django.apps import apps
+
+    SyndicationGeneration = apps.get_model('core', 'SyndicationGeneration')
+    counter = SyndicationGeneration.objects.filter(group=group).values_list('counter', 'updated_at').first()
+    counter, bumped_at = counter or (0, None)
+
+    last_modified = bumped_at
+    parts = [f"bumps:{counter}"]
+    for label, field in CONTENT_GROUPS[group]:
+        stats = apps.get_model(label).objects.aggregate(latest=Max(field), total=Count('pk'))
+        parts.append(f"{label}:{stats['total']}:{stats['latest'] and stats['latest'].isoformat()}")
+        if stats['latest'] and (last_modified is None or stats['latest'] > last_modified):
+            last_modified = stats['latest']
+
+    return {
+        'token': hashlib.md5('|'.join(parts).encode()).hexdigest()[:16],
+        'last_modified': last_modified or timezone.now(),
+    }
+
+
+def get_generation(group):
+    """{'token': ..., 'last_modified': datetime} for a content group."""
+    key = GENERATION_KEY + group
+    generation = cache.get(key)
+    if generation is None:
+        generation = _generation_from_db(group)
+        cache.set(key, generation, get_syndication_config()['GENERATION_TIMEOUT'])
+    return generation
+
+
+_pending_bumps = threading.local()
+
+
+def bump_generation(group):
+    """
+    Mark a group's content as changed.
+
+    Once the current transaction commits, the group's SyndicationGeneration
+    counter goes up and this worker re-derives the generation, orphaning
+    every cached feed/sitemap body (they're keyed by its token). Other
+    workers derive the same token within GENERATION_TIMEOUT.
+    Rows without timestamps (categories, tags, technologies) only change the
+    token this way, so call it after bulk writes that skip signals too.
+    Repeated bumps in one transaction count once.
+    """
+    pending = getattr(_pending_bumps, 'groups', None)
+    if pending is None:
+        pending = _pending_bumps.groups = set()
+    pending.add(group)
+    transaction.on_commit(_apply_bumps)
+
+
+def _apply_bumps():
+    from django.apps import apps
+
+    groups = getattr(_pending_bumps, 'groups', None)
+    if not groups:
+        return
+    _pending_bumps.groups = None
+
+    SyndicationGeneration = apps.get_model('core', 'SyndicationGeneration')
+    timeout = get_syndication_config()['GENERATION_TIMEOUT']
+    for group in sorted(groups):
+        SyndicationGeneration.objects.get_or_create(group=group)
+        # F() increment, so concurrent bumps from other workers all count
+        SyndicationGeneration.objects.filter(group=group).update(counter=F('counter') + 1, updated_at=timezone.now())
+        cache.set(GENERATION_KEY + group, _generation_from_db(group), timeout)
+
+
+# ===== CONDITIONAL, CACHED RESPONSES =====
+
+def _combined(groups):
+    generations = [get_generation(group) for group in groups]
+    return '-'.join(g['token'] for g in generations), max(g['last_modified'] for g in generations)
+
+
+def _url_token(request, groups):
+    """The groups' tokens hashed with host and URL: each feed/sitemap page gets its own ETag and cache key."""
+    # Host is part of it: bodies contain absolute URLs
+    return hashlib.md5(
+        f"{_combined(groups)[0]}:{request.get_host()}:{request.get_full_path()}".encode()
+    ).hexdigest()
+
+
+def _cache_streamed(response, key, timeout, limit):
+    """Pass streamed chunks through, caching the whole body if it stays under `limit`."""
+    content_type = response['Content-Type']
+    stream = response.streaming_content
+
+    def tee():
+        chunks = []
+        size = 0
+        for chunk in stream:
+            if chunks is not None:
+                size += len(chunk)
+                if size > limit:
+                    chunks = None
+                else:
+                    chunks.append(chunk)
+            yield chunk
+        if chunks is not None:
+            cache.set(key, (b''.join(chunks), content_type), timeout)
+
+    response.streaming_content = tee()
+    return response
+
+
+def syndicated(*groups):
+    """
+    Decorator for feed/sitemap views built from the given content groups.
+
+    Answers If-None-Match/If-Modified-Since with a 304 from the cached
+    generation alone (no queries), otherwise serves the body cached for the
+    current generation and URL, rendering and caching it on a miss. Streamed
+    responses are passed through as they render and cached once complete if
+    they are small enough.
+    """
+    def decorator(view):
+        def etag(request, *args, **kwargs):
+            return _url_token(request, groups)
+
+        def last_modified(request, *args, **kwargs):
+            return _combined(groups)[1]
+
+        @wraps(view)
+        def cached_view(request, *args, **kwargs):
+            config = get_syndication_config()
+            key = BODY_KEY + _url_token(request, groups)
+
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            if response.streaming:
+                return _cache_streamed(response, key, config['CACHE_TIMEOUT'], config['MAX_CACHED_BYTES'])
+
+            cache.set(key, (response.content, response['Content-Type']), config['CACHE_TIMEOUT'])
+            return response
+
+        return condition(etag_func=etag, last_modified_func=last_modified)(cached_view)
+
+    return decorator
@@ -0,0 +1,377 @@
+"""
+System Metrics Collector
+Live process/request metrics for the HUD, read from /proc and in-process counters
+Version 1.0 - RSS, latency histogram, in-flight requests, DB connection reuse, cache hit rate
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db.backends.signals import connection_created
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .request_metrics import percentile
+
+
+DEFAULT_SYSTEM_METRICS_CONFIG = {
+    # Seconds a snapshot (including the content COUNTs) is served before being rebuilt
+    'SNAPSHOT_TTL': 5,
+    # Recent request latencies kept for percentiles
+    'BUFFER_SIZE': 1000,
+    # Latency histogram bucket upper bounds in ms (a final +Inf bucket is implied)
+    'LATENCY_BUCKETS_MS': (10, 25, 50, 100, 250, 500, 1000, 2500),
+    # Seconds between a worker's publishes of its state to the shared cache
+    'PUBLISH_INTERVAL': 5,
+    # Seconds a silent worker's state is kept before it drops out of the snapshot
+    'WORKER_TTL': 60,
+}
+
+SNAPSHOT_CACHE_KEY = 'system-metrics:snapshot'
+WORKERS_KEY = 'system-metrics:workers'
+WORKER_KEY_PREFIX = 'system-metrics:worker:'
+
+
+def get_system_metrics_config():
+    """Merge SYSTEM_METRICS settings over the defaults."""
+    config = DEFAULT_SYSTEM_METRICS_CONFIG.copy()
+    config.update(getattr(settings, 'SYSTEM_METRICS', {}))
+    return config
+
+
+# ===== /proc READERS =====
+
+def _read_proc(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _proc_kb(text, field):
+    """'VmRSS:   12345 kB' -> 12345 (kB) from a /proc status-style file."""
+    for line in (text or '').splitlines():
+        if line.startswith(field + ':'):
+            return int(line.split()[1])
+    return None
+
+
+def process_memory():
+    """{'rss_mb', 'total_mb', 'percent'} from /proc; Nones where /proc isn't available."""
+    rss_kb = _proc_kb(_read_proc('/proc/self/status'), 'VmRSS')
+    total_kb = _proc_kb(_read_proc('/proc/meminfo'), 'MemTotal')
+    if rss_kb is None:
+        # No /proc (macOS dev): peak RSS is the best the stdlib offers
+        try:
+            import resource
+            rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+        except (ImportError, OSError):
+            pass
+    return {
+        'rss_mb': round(rss_kb / 1024, 1) if rss_kb else None,
+        'total_mb': round(total_kb / 1024, 1) if total_kb else None,
+        'percent': round(100 * rss_kb / total_kb, 2) if rss_kb and total_kb else None,
+    }
+
+
+def process_uptime_seconds(fallback_started):
+    """Seconds since this process started (/proc/self/stat field 22 vs /proc/uptime)."""
+    stat = _read_proc('/proc/self/stat')
+    uptime = _read_proc('/proc/uptime')
+    if stat and uptime:
+        try:
+            # The command name may contain spaces; fields resume after the closing paren
+            fields = stat.rsplit(')', 1)[1].split()
+            started_ticks = int(fields[19])
+            return max(0.0, float(uptime.split()[0]) - started_ticks / os.sysconf('SC_CLK_TCK'))
+        except (IndexError, ValueError, OSError):
+            pass
+    return time.time() - fallback_started
+
+
+# ===== COLLECTOR =====
+
+class SystemMetricsCollector:
+    """
+    Process-wide request and resource counters.
+
+    Every thread of the worker shares one collector: a ring buffer of recent
+    latencies, a cumulative latency histogram, the in-flight request gauge,
+    DB connections opened vs requests served and cache hits/misses by tier
+    (counted by core.cache backends). Each worker publishes its state to the
+    shared cache tier every PUBLISH_INTERVAL seconds, and the snapshot merges
+    every live worker's ring buffer and counters; no extra services are involved.
+    """
+
+    def __init__(self, buffer_size=1000, buckets=(10, 25, 50, 100, 250, 500, 1000, 2500)):
+        self.started = time.time()
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=buffer_size)
+        self._published = 0.0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.histogram = [0] * (len(self.buckets) + 1)
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.connections_opened = 0
+        self.cache_hits = 0
+        self.cache_l1_hits = 0
+        self.cache_misses = 0
+        self._latencies.clear()
+
+    # ----- recording -----
+
+    def request_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, duration_ms, status_code):
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self.requests += 1
+            if status_code >= 500:
+                self.errors += 1
+            self._latencies.append((time.time(), duration_ms))
+            for index, bound in enumerate(self.buckets):
+                if duration_ms <= bound:
+                    self.histogram[index] += 1
+                    break
+            else:
+                self.histogram[-1] += 1
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def cache_lookup(self, hits, misses, l1_hits=0):
+        """Count cache reads; l1_hits are the subset served by a TieredCache's in-process tier."""
+        with self._lock:
+            self.cache_hits += hits
+            self.cache_l1_hits += l1_hits
+            self.cache_misses += misses
+
+    # ----- reading -----
+
+    def state(self):
+        """This worker's raw counters, latency ring buffer and process stats (picklable)."""
+        with self._lock:
+            counters = {
+                'histogram': list(self.histogram),
+                'in_flight': self.in_flight,
+                'requests': self.requests,
+                'errors': self.errors,
+                'connections_opened': self.connections_opened,
+                'cache_hits': self.cache_hits,
+                'cache_l1_hits': self.cache_l1_hits,
+                'cache_misses': self.cache_misses,
+            }
+            latencies = list(self._latencies)
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(process_uptime_seconds(self.started)),
+            'memory': process_memory(),
+            'counters': counters,
+            'latencies': latencies,
+        }
+
+    def snapshot(self):
+        """Metrics for this worker alone."""
+        return summarize_states([self.state()], self.buckets)
+
+    def publish_due(self, interval):
+        """True at most once every `interval` seconds per worker."""
+        now = time.time()
+        with self._lock:
+            if now - self._published < interval:
+                return False
+            self._published = now
+            return True
+
+
+def summarize_states(states, buckets):
+    """Merge worker states: counters and histograms summed, ring buffers pooled for percentiles."""
+    counters = {
+        name: sum(state['counters'][name] for state in states)
+        for name in ('in_flight', 'requests', 'errors', 'connections_opened',
+                     'cache_hits', 'cache_l1_hits', 'cache_misses')
+    }
+    histogram = [sum(column) for column in zip(*(state['counters']['histogram'] for state in states))]
+    samples = [sample for state in states for sample in state['latencies']]
+    latencies = sorted(ms for _, ms in samples)
+    minute_ago = time.time() - 60
+    last_minute = sum(1 for ts, _ in samples if ts >= minute_ago)
+
+    requests = counters['requests']
+    lookups = counters['cache_hits'] + counters['cache_misses']
+    bounds = [f"le_{bound}" for bound in buckets] + ['le_inf']
+    return {
+        'workers': [
+            {'pid': state['pid'], 'uptime_seconds': state['uptime_seconds'], 'memory': state['memory']}
+            for state in states
+        ],
+        'host': {
+            'load_average': [round(value, 2) for value in os.getloadavg()] if hasattr(os, 'getloadavg') else None,
+        },
+        'requests': {
+            'total': requests,
+            'in_flight': counters['in_flight'],
+            'last_minute': last_minute,
+            'error_rate': round(counters['errors'] / requests, 4) if requests else 0.0,
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50), 1),
+                'p95': round(percentile(latencies, 95), 1),
+                'p99': round(percentile(latencies, 99), 1),
+                'samples': len(latencies),
+            },
+            'latency_histogram': dict(zip(bounds, histogram)),
+        },
+        'database': {
+            'connections_opened': counters['connections_opened'],
+            # Share of requests served on an already-open connection (CONN_MAX_AGE)
+            'connection_reuse': round(max(0.0, 1 - counters['connections_opened'] / requests), 4) if requests else None,
+        },
+        'cache': {
+            'hits': counters['cache_hits'],
+            'l1_hits': counters['cache_l1_hits'],
+            'shared_hits': counters['cache_hits'] - counters['cache_l1_hits'],
+            'misses': counters['cache_misses'],
+            'hit_rate': round(counters['cache_hits'] / lookups, 4) if lookups else None,
+        },
+    }
+
+
+_config = get_system_metrics_config()
+system_metrics = SystemMetricsCollector(_config['BUFFER_SIZE'], _config['LATENCY_BUCKETS_MS'])
+
+
+def _count_connection(sender, connection, **kwargs):
+    system_metrics.connection_opened()
+
+
+connection_created.connect(_count_connection, dispatch_uid='system-metrics-connection-created')
+
+
+# ===== CROSS-WORKER SHARING =====
+
+def _shared_cache():
+    """The cross-process tier when one is configured (its L1 would hide other workers' writes)."""
+    return caches['shared'] if 'shared' in settings.CACHES else cache
+
+
+def publish_worker_state():
+    """
+    Store this worker's state in the shared cache, at most every
+    PUBLISH_INTERVAL seconds. Called by SystemMetricsMiddleware after each request.
+    """
+    config = get_system_metrics_config()
+    if not system_metrics.publish_due(config['PUBLISH_INTERVAL']):
+        return
+    state = system_metrics.state()
+    shared = _shared_cache()
+    shared.set(f"{WORKER_KEY_PREFIX}{state['pid']}", state, config['WORKER_TTL'])
+
+    # Worker registry; a lost concurrent update is repaired on that worker's next publish
+    now = time.time()
+    workers = {
+        pid: seen for pid, seen in (shared.get(WORKERS_KEY) or {}).items()
+        if seen >= now - config['WORKER_TTL']
+    }
+    workers[state['pid']] = now
+    shared.set(WORKERS_KEY, workers, config['WORKER_TTL'])
+
+
+def worker_states():
+    """Every live worker's published state, with this worker's current one."""
+    shared = _shared_cache()
+    pids = set(shared.get(WORKERS_KEY) or {}) - {os.getpid()}
+    published = shared.get_many([f"{WORKER_KEY_PREFIX}{pid}" for pid in pids])
+    return [system_metrics.state(), *published.values()]
+
+
+def shared_runtime_metrics():
+    """Request, DB and cache metrics merged across workers, plus per-worker process stats."""
+    return summarize_states(worker_states(), system_metrics.buckets)
+
+
+# ===== HUD SNAPSHOT =====
+
+def content_counts():
+    """The HUD's content totals in three aggregate queries (was eight COUNTs)."""
+    from blog.models import Post
+    from projects.models import SystemModule, Technology
+
+    systems = SystemModule.objects.aggregate(
+        total=Count('pk', filter=Q(status__in=['deployed', 'published'])),
+        deployed=Count('pk', filter=Q(status='deployed')),
+        in_development=Count('pk', filter=Q(status='in_development')),
+        testing=Count('pk', filter=Q(status='testing')),
+    )
+    logs = Post.objects.filter(status='published').aggregate(
+        total=Count('pk'),
+        recent=Count('pk', filter=Q(published_date__gte=timezone.now() - timezone.timedelta(days=30))),
+    )
+    technologies = Technology.objects.aggregate(
+        total=Count('pk'),
+        languages=Count('pk', filter=Q(category='language')),
+        frameworks=Count('pk', filter=Q(category='framework')),
+    )
+    return {'systems': systems, 'logs': logs, 'technologies': technologies}
+
+
+_snapshot_lock = threading.Lock()
+
+
+def build_metrics_snapshot():
+    """
+    The public HUD payload: content totals and the HUD's summary figures.
+    Per-worker process stats, host load, error and cache counters stay out
+    of it (staff get them from shared_runtime_metrics()).
+    """
+    live = shared_runtime_metrics()
+    latency = live['requests']['latency_ms']
+    rss_mb = sum(worker['memory']['rss_mb'] or 0 for worker in live['workers'])
+    total_mb = live['workers'][0]['memory']['total_mb']
+    return {
+        **content_counts(),
+        'system_status': {
+            # Same keys the HUD has always read, now measured across every worker
+            'uptime': format_uptime(max(worker['uptime_seconds'] for worker in live['workers'])),
+            'response_time': f"{latency['p50']:.0f}ms",
+            'memory_usage': f"{100 * rss_mb / total_mb:.1f}%" if rss_mb and total_mb else None,
+            'active_connections': live['requests']['in_flight'],
+            'last_updated': timezone.now().isoformat(),
+        },
+    }
+
+
+def get_metrics_snapshot():
+    """
+    The HUD payload, rebuilt at most every SNAPSHOT_TTL seconds.
+
+    Concurrent pollers in a worker wait on one rebuild instead of each running
+    the COUNT queries; other workers share it through the cache.
+    """
+    snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+    if snapshot is None:
+        with _snapshot_lock:
+            snapshot = cache.get(SNAPSHOT_CACHE_KEY)
+            if snapshot is None:
+                snapshot = build_metrics_snapshot()
+                cache.set(SNAPSHOT_CACHE_KEY, snapshot, get_system_metrics_config()['SNAPSHOT_TTL'])
+    return snapshot
+
+
+def format_uptime(seconds):
+    """93784 -> '1d 2h 3m'"""
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
+    return f"{days}d {hours}h {minutes}m" if days else f"{hours}h {minutes}m"
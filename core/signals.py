@@ -1,9 +1,15 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import DEFERRED
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
 from django.dispatch import receiver
 from django.utils.text import slugify
-from blog.models import Tag
+from blog.models import Category, Post, Series, SeriesPost, Tag
 from core.models import Skill
-from projects.models import Technology
+from core.services.image_derivatives import DERIVATIVE_FIELDS, release_replaced_images, remember_image_sources
+from core.services.syndication import bump_generation
+from projects.models import GitHubCommitWeek, GitHubRepository, SystemImage, SystemModule, SystemType, Technology
+from projects.services.commit_rollups import refresh_combined_rollups, schedule_rollup_refresh
+from projects.services.language_stats import schedule_language_rollup_rebuild
 
 
 @receiver(post_save, sender=Skill)
@@ -44,3 +50,118 @@ def create_technology_tag(sender, instance, created, **kwargs):
                 slug=tag_slug
             )
             print(f"Auto-created tag '{tag_name}' from Technology")
+
+
+@receiver(post_init, sender=Post)
+@receiver(post_init, sender=Series)
+@receiver(post_init, sender=SystemModule)
+@receiver(post_init, sender=SystemImage)
+def track_image_sources(sender, instance, **kwargs):
+    """Remember the loaded image names so saves can spot replaced images without a query."""
+    remember_image_sources(instance)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_save, sender=Series)
+@receiver(post_save, sender=SystemModule)
+@receiver(post_save, sender=SystemImage)
+def release_replaced_image_derivatives(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the derivatives of images a save replaced. New uploads are rendered
+    outside the request by the generate_image_derivatives command.
+    """
+    image_fields = DERIVATIVE_FIELDS.get(sender._meta.label, [])
+
+    # Skip saves that can't have touched an image (e.g. counter updates)
+    if update_fields is not None and not set(update_fields) & set(image_fields):
+        return
+
+    release_replaced_images(instance)
+
+
+@receiver(post_delete, sender=GitHubCommitWeek)
+def refresh_commit_rollups_on_delete(sender, instance, **kwargs):
+    """
+    Keep the monthly/quarterly rollups in step when weekly rows go, including
+    through a GitHubRepository delete, which would otherwise leave its commits
+    in the all-repositories totals.
+    """
+    schedule_rollup_refresh(instance.repository_id, instance.week_start_date)
+
+
+TRACKING_FIELDS = ('related_system_id', 'is_archived', 'is_fork')
+
+
+def loaded_tracking_state(instance):
+    """is_detailed_tracking_candidate, or None when any field it needs is deferred (never fetched here)."""
+    if all(field in instance.__dict__ for field in TRACKING_FIELDS):
+        return instance.is_detailed_tracking_candidate
+    return None
+
+
+@receiver(post_init, sender=GitHubRepository)
+def track_detailed_tracking(sender, instance, **kwargs):
+    """
+    Remember whether the loaded repository counts toward the all-repositories
+    rollups (None if deferred) and which system its languages roll up to.
+    """
+    instance._was_tracked = loaded_tracking_state(instance)
+    instance._was_system_id = instance.__dict__.get('related_system_id', DEFERRED)
+
+
+@receiver(post_save, sender=GitHubRepository)
+def refresh_combined_rollups_on_tracking_change(sender, instance, created, **kwargs):
+    """
+    The all-repositories rollups only sum detailed-tracking repositories, so
+    redo the buckets a repository's weeks fall in when it joins or leaves
+    that set (linked to a system, archived, ...).
+    """
+    was_tracked = instance._was_tracked
+    instance._was_tracked = loaded_tracking_state(instance)
+    if created or instance._was_tracked is None or was_tracked == instance._was_tracked:
+        return
+    transaction.on_commit(lambda: refresh_combined_rollups(instance.pk))
+
+
+@receiver(post_save, sender=GitHubRepository)
+def rebuild_language_rollups_on_system_change(sender, instance, created, **kwargs):
+    """
+    LanguageRollup keeps a scope per system, so a repository moving between
+    systems moves its languages too. New repositories have no languages yet.
+    """
+    was_system_id = instance._was_system_id
+    instance._was_system_id = instance.__dict__.get('related_system_id', DEFERRED)
+    if created or was_system_id == instance._was_system_id:
+        return
+    schedule_language_rollup_rebuild()
+
+
+@receiver(post_delete, sender=GitHubRepository)
+def rebuild_language_rollups_on_delete(sender, instance, **kwargs):
+    """A deleted repository's languages (gone by cascade) must leave every rollup scope."""
+    schedule_language_rollup_rebuild()
+
+
+# Anything that shows up in a feed, sitemap or API response, by content group
+SYNDICATED_MODELS = {
+    Post: 'blog', Series: 'blog', SeriesPost: 'blog', Category: 'blog', Tag: 'blog',
+    SystemModule: 'projects', Technology: 'projects', SystemType: 'projects',
+    GitHubRepository: 'github', GitHubCommitWeek: 'github',
+}
+
+
+def bump_syndication_generation(sender, **kwargs):
+    """Invalidate cached feeds/sitemaps when their content changes."""
+    bump_generation(SYNDICATED_MODELS[sender])
+
+
+for model in SYNDICATED_MODELS:
+    post_save.connect(bump_syndication_generation, sender=model, dispatch_uid=f'syndication-save-{model._meta.label}')
+    post_delete.connect(bump_syndication_generation, sender=model, dispatch_uid=f'syndication-delete-{model._meta.label}')
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+@receiver(m2m_changed, sender=SystemModule.technologies.through)
+def bump_syndication_generation_m2m(sender, instance, action, **kwargs):
+    if action.startswith('post_'):
+        bump_generation('blog' if sender is Post.tags.through else 'projects')
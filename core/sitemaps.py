@@ -0,0 +1,178 @@
+"""
+AURA Sitemaps
+Sitemap sections per model, rendered as a sitemap index plus streamed section pages
+Version 1.0 - values() items, per-section pagination, streaming XML writer
+"""
+
+from django.contrib.sitemaps import Sitemap
+from django.db.models import F, Max, Q
+from django.urls import reverse
+from django.utils.html import escape
+
+from blog.models import Category, Post, Tag
+from projects.models import SystemModule, SystemType, Technology
+
+from .services.syndication import get_syndication_config
+
+# Statuses that SystemModule.objects.public() leaves out
+HIDDEN_SYSTEM_STATUSES = ('draft', 'archived')
+
+
+class ValuesSitemap(Sitemap):
+    """
+    Sitemap over a .values() queryset of {'slug', 'lastmod'} dicts.
+
+    Subclasses set url_name and implement items(); iter_page() streams one
+    page of entries straight off a DB cursor.
+    """
+
+    url_name = None
+    content_group = None
+
+    @property
+    def limit(self):
+        return get_syndication_config()['SITEMAP_LIMIT']
+
+    def location(self, item):
+        return reverse(self.url_name, args=[item['slug']])
+
+    def lastmod(self, item):
+        return item.get('lastmod')
+
+    def iter_page(self, page):
+        """Items on a 1-based page, streamed with .iterator()."""
+        start = (page - 1) * self.limit
+        return self.items()[start:start + self.limit].iterator(chunk_size=2000)
+
+
+class PostSitemap(ValuesSitemap):
+    url_name = 'blog:post_detail'
+    content_group = 'blog'
+    changefreq = 'weekly'
+    priority = 0.8
+
+    def items(self):
+        return (
+            Post.objects.filter(status='published')
+            .order_by('-published_date', 'pk')
+            .values('slug', lastmod=F('updated_at'))
+        )
+
+
+class CategorySitemap(ValuesSitemap):
+    url_name = 'blog:category'
+    content_group = 'blog'
+    changefreq = 'weekly'
+    priority = 0.5
+
+    def items(self):
+        # Only categories with something published; lastmod = their newest post
+        return (
+            Category.objects.annotate(lastmod=Max('posts__updated_at', filter=Q(posts__status='published')))
+            .filter(lastmod__isnull=False)
+            .order_by('slug')
+            .values('slug', 'lastmod')
+        )
+
+
+class TagSitemap(ValuesSitemap):
+    url_name = 'blog:tag'
+    content_group = 'blog'
+    changefreq = 'weekly'
+    priority = 0.4
+
+    def items(self):
+        return (
+            Tag.objects.annotate(lastmod=Max('posts__updated_at', filter=Q(posts__status='published')))
+            .filter(lastmod__isnull=False)
+            .order_by('slug')
+            .values('slug', 'lastmod')
+        )
+
+
+class SystemSitemap(ValuesSitemap):
+    url_name = 'projects:system_detail'
+    content_group = 'projects'
+    changefreq = 'weekly'
+    priority = 0.8
+
+    def items(self):
+        return (
+            SystemModule.objects.public()
+            .order_by('-updated_at', 'pk')
+            .values('slug', lastmod=F('updated_at'))
+        )
+
+
+class TechnologySitemap(ValuesSitemap):
+    url_name = 'projects:technology_detail'
+    content_group = 'projects'
+    changefreq = 'monthly'
+    priority = 0.5
+
+    def items(self):
+        return (
+            Technology.objects.annotate(
+                lastmod=Max('systems__updated_at', filter=~Q(systems__status__in=HIDDEN_SYSTEM_STATUSES))
+            )
+            .order_by('slug')
+            .values('slug', 'lastmod')
+        )
+
+
+class SystemTypeSitemap(ValuesSitemap):
+    url_name = 'projects:system_type'
+    content_group = 'projects'
+    changefreq = 'monthly'
+    priority = 0.4
+
+    def items(self):
+        return (
+            SystemType.objects.annotate(
+                lastmod=Max('systems__updated_at', filter=~Q(systems__status__in=HIDDEN_SYSTEM_STATUSES))
+            )
+            .order_by('slug')
+            .values('slug', 'lastmod')
+        )
+
+
+SITEMAPS = {
+    'datalogs': PostSitemap,
+    'categories': CategorySitemap,
+    'tags': TagSitemap,
+    'systems': SystemSitemap,
+    'technologies': TechnologySitemap,
+    'system-types': SystemTypeSitemap,
+}
+
+
+# ===== XML =====
+
+def render_sitemap_index(entries):
+    """entries: [(absolute url, lastmod or None)]"""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    for location, lastmod in entries:
+        lastmod_tag = f"<lastmod>{lastmod.isoformat()}</lastmod>" if lastmod else ''
+        lines.append(f"<sitemap><loc>{escape(location)}</loc>{lastmod_tag}</sitemap>")
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines) + '\n'
+
+
+def stream_sitemap_page(sitemap, page, base_url):
+    """Yield a <urlset> for one section page, one <url> per DB row."""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    )
+    for item in sitemap.iter_page(page):
+        lastmod = sitemap.lastmod(item)
+        yield (
+            f"<url><loc>{escape(base_url + sitemap.location(item))}</loc>"
+            + (f"<lastmod>{lastmod.date().isoformat()}</lastmod>" if lastmod else '')
+            + f"<changefreq>{sitemap.changefreq}</changefreq>"
+            + f"<priority>{sitemap.priority}</priority></url>\n"
+        )
+    yield '</urlset>\n'
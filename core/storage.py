@@ -0,0 +1,36 @@
+"""
+AURA Static Files Storage
+WhiteNoise manifest storage with stronger precompression
+Version 1.0 - Zopfli gzip + max-quality brotli for hashed static files
+"""
+
+import brotli
+import zopfli.gzip
+from whitenoise.compress import Compressor
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class ZopfliCompressor(Compressor):
+    """
+    Same file selection as WhiteNoise, but gzip output comes from zopfli.
+
+    Zopfli is a lot slower than zlib but produces ~5% smaller gzip files that
+    any gzip client can read. It only runs once per deploy during collectstatic.
+    Past ~5 iterations the extra savings are a few bytes per file.
+    """
+
+    ZOPFLI_ITERATIONS = 5
+
+    def compress_gzip(self, data):
+        return zopfli.gzip.compress(data, numiterations=self.ZOPFLI_ITERATIONS)
+
+    @staticmethod
+    def compress_brotli(data):
+        return brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+
+class AuraStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """Fingerprinted static files with zopfli/brotli precompressed variants."""
+
+    def create_compressor(self, **kwargs):
+        return ZopfliCompressor(**kwargs)
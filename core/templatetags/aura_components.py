@@ -6,7 +6,7 @@ Version: 1.0.2 - Fine-Tuned Alert Boxes & Progress Bars, add section header hand
 
 from django import template
 from django.utils.safestring import mark_safe
-from django.utils.html import format_html
+from django.utils.html import format_html, format_html_join
 from django.urls import reverse
 from django.utils import timezone
 import json
@@ -1456,6 +1456,80 @@ def preload_image(src, alt=""):
     return mark_safe(f'<link rel="preload" as="image" href="{src}" alt="{alt}">')
 
 
+@register.simple_tag
+def responsive_image(image, alt="", sizes="100vw", css_class="", loading="lazy"):
+    """
+    Render an ImageField as <picture> with AVIF/WebP sources and a JPEG srcset.
+    Falls back to a plain <img> until derivatives have been generated.
+    Usage: {% responsive_image post.thumbnail post.title sizes="(min-width: 768px) 33vw, 100vw" %}
+    """
+    if not image:
+        return ""
+
+    from core.services.image_derivatives import FORMAT_SETTINGS, get_derivatives
+
+    derivatives = get_derivatives(image.name)
+    fallback = derivatives.get("jpeg")
+
+    if not fallback:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async">',
+            image.url, alt, css_class, loading,
+        )
+
+    def srcset(items):
+        return ", ".join(f"{item['url']} {item['width']}w" for item in items)
+
+    sources = format_html_join(
+        "",
+        '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (FORMAT_SETTINGS[fmt]["mime"], srcset(items), sizes)
+            for fmt, items in derivatives.items()
+            if fmt != "jpeg"
+        ),
+    )
+    largest = fallback[-1]
+
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" '
+        'alt="{}" class="{}" loading="{}" decoding="async"></picture>',
+        sources, largest["url"], srcset(fallback), sizes,
+        largest["width"], largest["height"], alt, css_class, loading,
+    )
+
+
+@register.simple_tag
+def aura_bundle(bundle_name):
+    """
+    Include a CSS/JS bundle from settings.ASSET_BUNDLES by its hashed URL.
+    With bundling disabled (DEBUG) the individual source files are included instead.
+    Usage: {% aura_bundle "aura-base.css" %}
+    """
+    from django.templatetags.static import static
+    from core.services.asset_bundles import (
+        bundle_static_path,
+        get_bundle_config,
+        get_bundle_sources,
+    )
+
+    if bundle_name.endswith(".css"):
+        tag = '<link rel="stylesheet" href="{}">'
+    else:
+        tag = '<script src="{}"></script>'
+
+    if get_bundle_config()["ENABLED"]:
+        try:
+            return format_html(tag, static(bundle_static_path(bundle_name)))
+        except ValueError:
+            # Not in the manifest (bundles not built) - serve the sources
+            pass
+
+    return format_html_join(
+        "\n", tag, ((static(source),) for source in get_bundle_sources(bundle_name))
+    )
+
+
 @register.simple_tag
 def critical_css(css_content):
     """
@@ -0,0 +1,179 @@
+"""
+Test Support
+Fake GitHub REST API shared by the test suite and benchmark_github_sync
+Version 1.0 - Listing, details, languages, Link-header commit counts and weekly activity over HTTP/1.1 keep-alive
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+USERNAME = 'benchmark'
+RATE_LIMIT = 5000
+PUSHED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def repo_names(count):
+    return [f'repo-{index}' for index in range(count)]
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    """
+    Just enough of the GitHub REST API for a sync: /user/repos (paginated by
+    Link header) and the per-repo endpoints for `repo_count` repositories
+    owned by USERNAME, each request delayed by `latency` seconds.
+
+    push(name) records a new commit on a repository - a later pushed_at,
+    a new head SHA and one more commit - so incremental syncs see it change.
+    Every request path is kept in `paths`.
+
+        with FakeGitHubServer(10) as server:
+            ...  # point GITHUB_API_CONFIG['BASE_URL'] at server.base_url
+    """
+
+    daemon_threads = True
+
+    def __init__(self, repo_count, latency=0):
+        super().__init__(('127.0.0.1', 0), FakeGitHubHandler)
+        self.repo_count = repo_count
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.paths = []
+        self.pushes = Counter()
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, attribute):
+        with self.lock:
+            setattr(self, attribute, getattr(self, attribute) + 1)
+            return getattr(self, attribute)
+
+    def push(self, name):
+        with self.lock:
+            self.pushes[int(name.rsplit('-', 1)[-1])] += 1
+
+    def repository(self, index):
+        name = f'repo-{index}'
+        pushed_at = (PUSHED_AT + timedelta(days=self.pushes[index])).strftime('%Y-%m-%dT%H:%M:%SZ')
+        return {
+            'id': index + 1,
+            'name': name,
+            'full_name': f'{USERNAME}/{name}',
+            'description': f'Repository {index}',
+            'html_url': f'https://github.com/{USERNAME}/{name}',
+            'clone_url': f'https://github.com/{USERNAME}/{name}.git',
+            'homepage': '',
+            'stargazers_count': index % 5,
+            'forks_count': index % 3,
+            'watchers_count': index % 5,
+            'size': 100 + index,
+            'language': 'Python',
+            'private': False,
+            'fork': False,
+            'archived': False,
+            'created_at': '2024-01-01T00:00:00Z',
+            'updated_at': pushed_at,
+            'pushed_at': pushed_at,
+        }
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.count('connections')
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        served = self.server.count('requests')
+        time.sleep(self.server.latency)
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        with self.server.lock:
+            self.server.paths.append(url.path)
+        parts = url.path.strip('/').split('/')
+        headers = {
+            'X-RateLimit-Remaining': str(max(0, RATE_LIMIT - served)),
+            'X-RateLimit-Reset': str(int(time.time()) + 3600),
+        }
+
+        if parts == ['user', 'repos']:
+            return self.send_listing(query, headers)
+        if parts[:2] != ['repos', USERNAME] or len(parts) < 3:
+            return self.send_json(404, {'message': 'Not Found'}, headers)
+
+        index = int(parts[2].rsplit('-', 1)[-1])
+        if index >= self.server.repo_count:
+            return self.send_json(404, {'message': 'Not Found'}, headers)
+        pushes = self.server.pushes[index]
+        endpoint = '/'.join(parts[3:])
+        if endpoint == '':
+            body = self.server.repository(index)
+        elif endpoint == 'languages':
+            body = {'Python': 1000 * (index + 1) + pushes, 'HTML': 100 * (index % 7)}
+        elif endpoint == 'commits':
+            # Windowed counts shrink with the window; per_page=1 makes the last page the count
+            total = 50 + index * 3 + pushes if 'since' not in query else 5 + index % 11
+            body = [{
+                'sha': f'{index:020x}{pushes:020x}',
+                'commit': {'author': {'date': self.server.repository(index)['pushed_at']}, 'message': 'Update'},
+            }]
+            headers['Link'] = (
+                f'<{self.server.base_url}{url.path}?per_page=1&page=2>; rel="next", '
+                f'<{self.server.base_url}{url.path}?per_page=1&page={total}>; rel="last"'
+            )
+        elif endpoint == 'stats/commit_activity':
+            etag = f'"activity-{index}-{pushes}"'
+            if self.headers.get('If-None-Match') == etag:
+                return self.send_json(304, None, headers)
+            body = [
+                {'week': 1735689600 + week * 604800, 'total': (index + week) % 9, 'days': [0, 1, 0, 2, 0, 0, 0]}
+                for week in range(52)
+            ]
+            headers['ETag'] = etag
+        else:
+            return self.send_json(404, {'message': 'Not Found'}, headers)
+        self.send_json(200, body, headers)
+
+    def send_listing(self, query, headers):
+        """/user/repos, most recently pushed first, `per_page` at a time."""
+        per_page = int(query.get('per_page', ['30'])[0])
+        page = int(query.get('page', ['1'])[0])
+        repositories = sorted(
+            (self.server.repository(index) for index in range(self.server.repo_count)),
+            key=lambda repo: (repo['pushed_at'], -repo['id']), reverse=True,
+        )
+        if page * per_page < len(repositories):
+            next_query = urlencode({'per_page': per_page, 'page': page + 1})
+            headers['Link'] = f'<{self.server.base_url}/user/repos?{next_query}>; rel="next"'
+        self.send_json(200, repositories[(page - 1) * per_page:page * per_page], headers)
+
+    def send_json(self, status, body, headers):
+        payload = json.dumps(body).encode() if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
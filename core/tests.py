@@ -1,3 +1,123 @@
-from django.test import TestCase
+import logging
+from io import StringIO
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from core.services.asset_bundles import minify_css, minify_js
+from core.testing import USERNAME, FakeGitHubServer
+from projects.models import GitHubRepository, LanguageRollup, SystemModule
+
+
+class SyncGitHubDataTests(TestCase):
+    """sync_github_data --async --incremental against the fake GitHub API."""
+
+    REPOS = 12
+
+    def setUp(self):
+        self.server = self.enterContext(FakeGitHubServer(self.REPOS))
+        github_logger = logging.getLogger('core.services.github_api')
+        self.addCleanup(github_logger.setLevel, github_logger.level)
+        github_logger.setLevel(logging.WARNING)
+        settings_override = override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'sync-tests'}},
+            GITHUB_API_CONFIG={
+                **settings.GITHUB_API_CONFIG,
+                'BASE_URL': self.server.base_url,
+                'USERNAME': USERNAME,
+                'TOKEN': 'test-token',
+                'RESPONSE_STORE': None,
+                'REPLAY': False,
+            },
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def sync(self):
+        self.server.paths.clear()
+        output = StringIO()
+        call_command(
+            'sync_github_data', '--async', '--incremental', '--concurrency', '4',
+            '--retry-window', '0', '--limit-repos', str(self.REPOS), stdout=output,
+        )
+        return output.getvalue()
+
+    def repo_paths(self, name):
+        return [path for path in self.server.paths if path.startswith(f'/repos/{USERNAME}/{name}/')]
+
+    def test_first_run_syncs_every_repository(self):
+        output = self.sync()
+
+        self.assertIn('⇉', output)
+        self.assertEqual(GitHubRepository.objects.count(), self.REPOS)
+        self.assertFalse(GitHubRepository.objects.filter(github_pushed_at__isnull=True).exists())
+        repo = GitHubRepository.objects.get(name='repo-3')
+        self.assertEqual(repo.total_commits, 59)
+        self.assertEqual(repo.last_commit_sha, f'{3:020x}{0:020x}')
+        self.assertEqual(
+            dict(repo.languages.values_list('language', 'bytes_count')), {'Python': 4000, 'HTML': 300}
+        )
+        self.assertTrue(LanguageRollup.objects.exists())
+
+    def test_second_run_fetches_only_pushed_repositories(self):
+        self.sync()
+        self.assertIn('0 changed', self.sync())
+        self.assertEqual(self.server.paths, ['/user/repos'])
+
+        self.server.push('repo-5')
+        output = self.sync()
+
+        self.assertIn('1 changed', output)
+        self.assertEqual(
+            {path.split('/')[3] for path in self.server.paths if path.startswith('/repos/')}, {'repo-5'}
+        )
+        repo = GitHubRepository.objects.get(name='repo-5')
+        self.assertEqual(repo.total_commits, 66)
+        self.assertEqual(repo.last_commit_sha, f'{5:020x}{1:020x}')
+        self.assertEqual(repo.languages.get(language='Python').bytes_count, 6001)
+
+    def test_system_linked_repository_gets_weekly_stats(self):
+        self.sync()
+        system = SystemModule.objects.create(
+            title='Linked System', slug='linked-system', system_id='SYS-001',
+            author=User.objects.create(username='author'),
+        )
+        GitHubRepository.objects.filter(name='repo-2').update(related_system=system)
+
+        self.server.push('repo-2')
+        self.sync()
+
+        self.assertIn(f'/repos/{USERNAME}/repo-2/stats/commit_activity', self.repo_paths('repo-2'))
+        repo = GitHubRepository.objects.get(name='repo-2')
+        self.assertEqual(repo.commit_weeks.count(), 52)
+        self.assertIsNotNone(repo.commit_weeks_last_synced)
+
+
+class MinifierTests(TestCase):
+    """The minifiers only touch code; literal text comes through byte for byte."""
+
+    def test_js_keeps_strings_template_and_regex_literals(self):
+        template = '`\n    <div>\n      // kept\n\n      /* kept */ ${items.map(i => `<li>${i + "}"}</li>`)}\n    </div>`'
+        js = (
+            f"    const html = {template}; // note\n"
+            "    /* block\n       comment */\n"
+            "    const url = 'http://example.com/*'; const re = /[\"'`]\\/*/g;\n"
+            "    const half = total / 2 / count;\n"
+        )
+        self.assertEqual(minify_js(js), (
+            f"const html = {template};\n"
+            "const url = 'http://example.com/*'; const re = /[\"'`]\\/*/g;\n"
+            "const half = total / 2 / count;"
+        ))
+
+    def test_css_keeps_strings_and_urls(self):
+        css = (
+            '/* note */ .a::before { content: "a ; b  /* c */ : d"; }\n'
+            ".b { font-family: 'Open  Sans', serif; background: url(data:image/svg+xml;utf8,%3Csvg) ; }"
+        )
+        self.assertEqual(minify_css(css), (
+            '.a::before{content:"a ; b  /* c */ : d"}'
+            ".b{font-family:'Open  Sans',serif;background:url(data:image/svg+xml;utf8,%3Csvg)}"
+        ))
@@ -1,7 +1,7 @@
 from django.views.generic import TemplateView, DetailView, FormView, View
 from django.urls import reverse_lazy, reverse
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponseRedirect, HttpResponse, HttpResponseNotFound, HttpResponseServerError, HttpResponseForbidden, Http404
+from django.http import JsonResponse, HttpResponseRedirect, HttpResponse, HttpResponseNotFound, HttpResponseServerError, HttpResponseForbidden, Http404, StreamingHttpResponse
 from django.shortcuts import render, redirect
 from django.views.decorators.http import require_POST
 from django.utils.decorators import method_decorator
@@ -11,12 +11,16 @@ from django.db.models import Count, Avg, Q
 from django.template.loader import render_to_string, get_template
 from django.conf import settings 
 import os
+import math
 import calendar
 from collections import defaultdict
 import json
 
 from .models import CorePage, Skill, Education, Experience, SocialLink, Contact, LearningJourneyManager, PortfolioAnalytics, SkillTechnologyRelation
 from .forms import ContactForm
+from .services.syndication import get_generation, syndicated
+from .services.system_metrics import get_metrics_snapshot, get_system_metrics_config, shared_runtime_metrics
+from .sitemaps import SITEMAPS, render_sitemap_index, stream_sitemap_page
 from blog.models import Post, Category
 from projects.models import SystemModule, Technology, LearningMilestone
 from datetime import timedelta, datetime
@@ -647,11 +651,12 @@ class CommTerminalView(FormView):
 
         # Add system metrics for HUD display
         # Can get System Specs for this feed?
+        live_status = get_metrics_snapshot()['system_status']
         context['system_metrics'] = {
-            'uptime': '99.7%',
-            'response_time': '142ms',
+            'uptime': live_status['uptime'],
+            'response_time': live_status['response_time'],
             'security_level': 'AES-256',
-            'active_connections': '1,247',
+            'active_connections': live_status['active_connections'],
             'messages_processed': Contact.objects.count(),
             'encryption_status': 'ACTIVE',
             'firewall_status': 'ENABLED',
@@ -782,42 +787,21 @@ class ErrorView(TemplateView):
 
 # API Views for AURA HUD Data
 class SystemMetricsAPIView(TemplateView):
-    """API endpoint for real-time system metrics (for HUD dashboard)."""
+    """
+    API endpoint for real-time system metrics (for HUD dashboard).
+    Staff also get the per-worker runtime metrics under 'runtime'.
+    """
 
     def get(self, request, *args, **kwargs):
-        metrics = {
-            "systems": {
-                "total": SystemModule.objects.filter(
-                    status__in=["deployed", "published"]
-                ).count(),
-                "deployed": SystemModule.objects.filter(status="deployed").count(),
-                "in_development": SystemModule.objects.filter(
-                    status="in_development"
-                ).count(),
-                "testing": SystemModule.objects.filter(status="testing").count(),
-            },
-            "logs": {
-                "total": Post.objects.filter(status="published").count(),
-                "recent": Post.objects.filter(
-                    status="published",
-                    published_date__gte=timezone.now() - timezone.timedelta(days=30),
-                ).count(),
-            },
-            "technologies": {
-                "total": Technology.objects.count(),
-                "languages": Technology.objects.filter(category="language").count(),
-                "frameworks": Technology.objects.filter(category="framework").count(),
-            },
-            "system_status": {
-                "uptime": "99.7%",
-                "response_time": f"{142 + (timezone.now().second % 30)}ms",
-                "memory_usage": f"{65 + (timezone.now().second % 20)}%",
-                "active_connections": 1247 + (timezone.now().minute * 3),
-                "last_updated": timezone.now().isoformat(),
-            },
-        }
+        # Snapshot shared by every poller for SYSTEM_METRICS['SNAPSHOT_TTL'] seconds
+        if request.user.is_staff:
+            response = JsonResponse({**get_metrics_snapshot(), 'runtime': shared_runtime_metrics()})
+            response['Cache-Control'] = 'private, no-store'
+            return response
 
-        return JsonResponse(metrics)
+        response = JsonResponse(get_metrics_snapshot())
+        response['Cache-Control'] = f"max-age={get_system_metrics_config()['SNAPSHOT_TTL']}"
+        return response
 
 
 # ======================  CUSTOM ERROR VIEWS ==================
@@ -1391,4 +1375,39 @@ class TrackDownloadAPIView(View):
             return JsonResponse({'status': 'tracked', 'format': format_type})
         
         except Exception as e:
-            return JsonResponse({'error': 'tracking failed'}, status=400)
\ No newline at end of file
+            return JsonResponse({'error': 'tracking failed'}, status=400)
+
+# ===== SITEMAPS =====
+
+@syndicated('blog', 'projects')
+def sitemap_index(request):
+    """Sitemap index: one entry per section page (cached per content generation)."""
+    base_url = f"{request.scheme}://{request.get_host()}"
+    entries = []
+    for section, sitemap_class in SITEMAPS.items():
+        sitemap = sitemap_class()
+        pages = max(1, math.ceil(sitemap.items().count() / sitemap.limit))
+        lastmod = get_generation(sitemap.content_group)['last_modified']
+        location = base_url + reverse('sitemap_section', args=[section])
+        entries += [(location if page == 1 else f"{location}?p={page}", lastmod) for page in range(1, pages + 1)]
+
+    return HttpResponse(render_sitemap_index(entries), content_type='application/xml')
+
+
+@syndicated('blog', 'projects')
+def sitemap_section(request, section):
+    """One page of a sitemap section, streamed row by row."""
+    sitemap_class = SITEMAPS.get(section)
+    if sitemap_class is None:
+        raise Http404("Unknown sitemap section")
+    try:
+        page = int(request.GET.get('p', 1))
+    except ValueError:
+        raise Http404("Invalid sitemap page")
+
+    sitemap = sitemap_class()
+    if page < 1 or (page > 1 and not sitemap.items()[(page - 1) * sitemap.limit:].exists()):
+        raise Http404("Sitemap page out of range")
+
+    base_url = f"{request.scheme}://{request.get_host()}"
+    return StreamingHttpResponse(stream_sitemap_page(sitemap, page, base_url), content_type='application/xml')
@@ -0,0 +1,87 @@
+"""
+Admin Form Widgets
+Choice widgets that decorate each <option> with data-* metadata
+Version 1.0 - One annotated query per widget render instead of one per option
+"""
+
+from django import forms
+from django.db.models import Count
+
+
+class MetadataChoiceMixin:
+    """
+    Adds data-* attributes to every model choice.
+
+    Subclasses override get_metadata_queryset() (annotate/select_related what
+    option_metadata() needs) and option_metadata(obj). The metadata for all
+    choices is loaded in one query the first time an option is rendered and
+    cached on the widget - Django deep-copies widgets per form instance, so
+    the cache lives exactly as long as the form.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._option_metadata = None
+
+    def __deepcopy__(self, memo):
+        obj = super().__deepcopy__(memo)
+        obj._option_metadata = None
+        return obj
+
+    def get_metadata_queryset(self, queryset):
+        return queryset
+
+    def option_metadata(self, obj):
+        return {}
+
+    def get_option_metadata(self):
+        if self._option_metadata is None:
+            queryset = getattr(self.choices, 'queryset', None)
+            if queryset is None:
+                self._option_metadata = {}
+            else:
+                self._option_metadata = {
+                    str(obj.pk): self.option_metadata(obj)
+                    for obj in self.get_metadata_queryset(queryset.order_by())
+                }
+        return self._option_metadata
+
+    def create_option(self, name, value, label, selected, index, subindex=None, attrs=None):
+        option = super().create_option(name, value, label, selected, index, subindex, attrs)
+        if value:
+            # ModelChoiceIteratorValue wraps the pk; plain choices are the pk itself
+            pk = str(getattr(value, 'value', value))
+            option['attrs'] = {**option['attrs'], **self.get_option_metadata().get(pk, {})}
+        return option
+
+
+class MetadataSelect(MetadataChoiceMixin, forms.Select):
+    pass
+
+
+class SkillSelectWidget(MetadataSelect):
+    """Skill select with category, proficiency and number of systems it was gained in"""
+
+    def get_metadata_queryset(self, queryset):
+        return queryset.annotate(systems_count=Count('project_gains')).only('pk', 'category', 'proficiency')
+
+    def option_metadata(self, skill):
+        return {
+            'data-category': skill.category,
+            'data-proficiency': skill.proficiency,
+            'data-systems': skill.systems_count,
+        }
+
+
+class TechnologySelectWidget(MetadataSelect):
+    """Technology select with category, color and number of systems using it"""
+
+    def get_metadata_queryset(self, queryset):
+        return queryset.annotate(system_count=Count('systems')).only('pk', 'category', 'color')
+
+    def option_metadata(self, technology):
+        return {
+            'data-category': technology.category,
+            'data-color': technology.color,
+            'data-systems': technology.system_count,
+        }
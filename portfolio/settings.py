@@ -61,6 +61,14 @@ GITHUB_API_CONFIG = {
     'USERNAME': os.getenv("GITHUB_USERNAME", ""),
     'TIMEOUT': 30,
     'CACHE_TIMEOUT': 3600,  # 1hr
+    # Brotli-compressed responses on disk (core.services.github_store); survives restarts, shared by workers
+    'RESPONSE_STORE': {
+        'DIR': os.getenv("GITHUB_RESPONSE_STORE", str(BASE_DIR / ".github_responses")),  # blank disables
+        'TTL': int(os.getenv("GITHUB_RESPONSE_STORE_TTL", "21600")),  # 6hr
+        'MAX_BYTES': int(os.getenv("GITHUB_RESPONSE_STORE_MAX_MB", "50")) * 1024 * 1024,
+    },
+    # Serve every request from the store and never touch the network (CI, benchmarks, offline dev)
+    'REPLAY': os.getenv("GITHUB_REPLAY", "0") == "1",
 }
 
 
@@ -82,8 +90,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Live HUD metrics (latency histogram, in-flight requests) - outermost so it times everything
+    "core.middleware.SystemMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Query count / timing instrumentation (Server-Timing header + Performance Monitor)
+    "core.middleware.QueryTimingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -194,7 +206,51 @@ MEDIA_URL = "/files/"
 # Note: For production, plan to move MEDIA to S3/Cloudinary. WhiteNoise does *not* serve MEDIA.
 
 # Use WhiteNoise for serving static files in production (recommended)
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Hashed filenames + zopfli gzip / brotli precompressed variants (see core/storage.py)
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "core.storage.AuraStaticFilesStorage",
+    },
+}
+
+# Per-page CSS/JS bundles built by `manage.py build_bundles` (runs automatically before collectstatic)
+# Output lands in static/bundles/ and is resolved with {% aura_bundle "name" %}
+ASSET_BUNDLES = {
+    'ENABLED': os.getenv("ASSET_BUNDLES", "0" if DEBUG else "1") == "1",
+    'MINIFY': True,
+    'BUNDLES': {
+        'aura-base.css': [
+            'css/base.css',
+            'css/components/aura-shared.css',
+            'css/components/glass-cards.css',
+            'css/components/hud-elements.css',
+            'css/components/data-grid.css',
+            'css/components/animations.css',
+            'css/components/navigation.css',
+        ],
+        'aura-base.js': [
+            'js/base.js',
+            'js/components/navigation.js',
+        ],
+        'datalogs.css': [
+            'blog/css/datalogs-consolidated.css',
+            'blog/css/interactions.css',
+            'blog/css/subscribe-widget.css',
+        ],
+        'datalogs.js': [
+            'blog/js/datalogs-consolidated.js',
+            'blog/js/interactions.js',
+        ],
+        'systems.css': [
+            'projects/css/systems-unified.css',
+            'projects/css/systems.css',
+            'projects/css/systems-components.css',
+        ],
+    },
+}
 
 # Add WhiteNoise to middleware (add after SecurityMiddleware)
 # 'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -264,16 +320,105 @@ if not DEBUG:
 
 
 # ========== PERFORMANCE SETTINGS ==========
-# Cache configuration for better error page performance (see prod config options in settings prod breakdown doc)
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'aura-cache',
-        'TIMEOUT': 300,  # 5 minutes
+# Cache tier (core.cache), picked with CACHE_TIER:
+#   locmem - per-process LocMemCache only (dev default)
+#   file   - per-process L1 LRU in front of a FileBasedCache every worker shares (prod default);
+#            CACHE_DIR must be private to the app user (owned by it, mode 0700) or the cache refuses
+#            to start. Point it at a directory of your own on tmpfs to keep it in memory
+#   db     - per-process L1 LRU in front of a DatabaseCache (run `manage.py createcachetable` first)
+# Warm a cold cache after deploys with `manage.py warm_cache`.
+CACHE_TIER = os.getenv("CACHE_TIER", "locmem" if DEBUG else "file")
+CACHE_DIR = os.getenv("CACHE_DIR", str(BASE_DIR / ".cache"))
+
+SHARED_CACHE_BACKENDS = {
+    'file': {
+        'BACKEND': 'core.cache.TunedFileBasedCache',
+        'LOCATION': CACHE_DIR,
         'OPTIONS': {
-            'MAX_ENTRIES': 1000,
+            'MAX_ENTRIES': 5000,
+            'CULL_FREQUENCY': 4,    # drop a quarter of the entries when full
+            'CULL_EVERY': 100,      # only count the directory every 100 writes
+        },
+    },
+    'db': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'aura_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+            'CULL_FREQUENCY': 4,
+        },
+    },
+}
+
+if CACHE_TIER in SHARED_CACHE_BACKENDS:
+    CACHES = {
+        'default': {
+            'BACKEND': 'core.cache.TieredCache',
+            'LOCATION': 'aura-l1',
+            'OPTIONS': {
+                'SHARED_ALIAS': 'shared',
+                'L1_MAX_ENTRIES': 1000,
+                # Longest a worker serves its own copy after another worker changed the value
+                'L1_TIMEOUT': 5,
+            },
+        },
+        'shared': {**SHARED_CACHE_BACKENDS[CACHE_TIER], 'TIMEOUT': 300},
+    }
+else:
+    CACHES = {
+        'default': {
+            # LocMemCache that also counts hits/misses for the HUD metrics
+            'BACKEND': 'core.cache.InstrumentedLocMemCache',
+            'LOCATION': 'aura-cache',
+            'TIMEOUT': 300,  # 5 minutes
+            'OPTIONS': {
+                'MAX_ENTRIES': 1000,
+            }
         }
     }
+
+# Admin list pagination (core.pagination)
+ADMIN_PAGINATION = {
+    # Unfiltered totals shown next to filtered admin lists are cached this long
+    'TOTAL_COUNT_TIMEOUT': 60,
+}
+
+# Live HUD metrics behind /api/metrics/ (core.services.system_metrics)
+SYSTEM_METRICS = {
+    # Dashboards polling at once share one snapshot rebuilt at most this often (seconds)
+    'SNAPSHOT_TTL': 5,
+    'BUFFER_SIZE': 1000,
+    # Each worker shares its latency buffer and counters through the cache this often (seconds)
+    'PUBLISH_INTERVAL': 5,
+}
+
+# Read-only JSON API at /api/v1/ (core.api)
+API = {
+    'PAGE_SIZE': 20,
+    'MAX_PAGE_SIZE': 100,
+    'MAX_IDS': 100,
+    'CACHE_MAX_AGE': 60,
+}
+
+# RSS/Atom feeds and sitemaps (core.services.syndication)
+SYNDICATION = {
+    'FEED_ITEMS': 20,
+    'SITEMAP_LIMIT': 10000,
+    # Each worker re-checks the DB fingerprint this often; with the per-process locmem
+    # cache that bounds how long other workers serve a feed from before a change
+    'GENERATION_TIMEOUT': 300,
+}
+
+# Request instrumentation (core.middleware.QueryTimingMiddleware)
+PERFORMANCE_MONITORING = {
+    'ENABLED': os.getenv("PERF_MONITORING", "1") == "1",
+    'SLOW_REQUEST_MS': int(os.getenv("PERF_SLOW_REQUEST_MS", "500")),
+    'SLOW_QUERY_COUNT': int(os.getenv("PERF_SLOW_QUERY_COUNT", "50")),
+    'BUFFER_SIZE': 200,  # samples kept per URL name
+    'TOP_REPEATED': 5,  # repeated SQL signatures included in slow request logs
+    # Server-Timing header (db/tpl/total) for everyone in development, staff only in production.
+    # tpl covers TemplateResponse renders (class-based views); render() shortcuts count in total only
+    'SERVER_TIMING_HEADER': True if DEBUG else 'staff',
 }
 
 # CSRF/Session hardening Configuration
@@ -283,15 +428,29 @@ SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 CSRF_COOKIE_HTTPONLY = False  # Changed to allow contact list in aura admin to use cookies to get csrf token for quick actions
 CSRF_COOKIE_SAMESITE = 'Lax'
 
-# For development (emails print to console)
-EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
-
-# For production (use real email service)
-# TODO: Update w email service info
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-EMAIL_HOST = 'smtp.gmail.com'  # Or your email provider
-EMAIL_PORT = 587
+# Console in development, SMTP in production. EMAIL_BACKEND can also point at
+# django.core.mail.backends.filebased.EmailBackend (writes to EMAIL_FILE_PATH)
+# or django.core.mail.backends.locmem.EmailBackend.
+EMAIL_BACKEND = os.getenv(
+    "EMAIL_BACKEND",
+    'django.core.mail.backends.console.EmailBackend' if DEBUG else 'django.core.mail.backends.smtp.EmailBackend',
+)
+EMAIL_FILE_PATH = BASE_DIR / "logs" / "emails"
+EMAIL_HOST = os.getenv("EMAIL_HOST", 'smtp.gmail.com')  # Or your email provider
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
 EMAIL_USE_TLS = True
-EMAIL_HOST_USER = 'your-email@gmail.com'
-EMAIL_HOST_PASSWORD = 'your-app-password'
-DEFAULT_FROM_EMAIL = 'AURA DataLogs <noreply@yourdomain.com>'
\ No newline at end of file
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", 'your-email@gmail.com')
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", 'your-app-password')
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", 'AURA DataLogs <noreply@yourdomain.com>')
+
+# New-post emails to blog subscribers (blog.services.notifications)
+SUBSCRIBER_NOTIFICATIONS = {
+    'ENABLED': os.getenv("SUBSCRIBER_NOTIFICATIONS", "1") == "1",
+    # Queue emails when a post publishes (0: send_post_notifications queues them instead).
+    # Either way they're delivered by `send_post_notifications`, run from cron.
+    'QUEUE_ON_PUBLISH': os.getenv("NOTIFY_ON_PUBLISH", "1") == "1",
+    'BATCH_SIZE': 200,  # messages per SMTP send_messages() call
+    'ENQUEUE_BATCH_SIZE': 1000,
+    'MAX_ATTEMPTS': 3,
+    'SITE_URL': os.getenv("SITE_URL", "http://localhost:8000"),
+}
\ No newline at end of file
@@ -21,6 +21,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
 
+from core.views import sitemap_index, sitemap_section
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     # Custom Admin
@@ -32,6 +34,11 @@ urlpatterns = [
     # Blog app URLs
     path("datalogs/", include("blog.urls", namespace="blog")),
     path("markdownx/", include("markdownx.urls")),
+    # Read-only JSON API
+    path("api/v1/", include("core.api_urls", namespace="api")),
+    # Sitemaps (index + one streamed section per model)
+    path("sitemap.xml", sitemap_index, name="sitemap_index"),
+    path("sitemap-<slug:section>.xml", sitemap_section, name="sitemap_section"),
     # Test new AURA global filters/templatetags
     path("test-aura/", TemplateView.as_view(template_name="test_aura.html"), name="test_aura")
 ]
@@ -60,6 +60,9 @@ urlpatterns = [
     path('api/systems/<int:pk>/architecture-preview/', admin_views.ArchitecturePreviewView.as_view(), name='architecture_preview'),
     path('api/systems/<int:pk>/create-default-architecture/', admin_views.CreateDefaultArchitectureView.as_view(), name='create_default_architecture'),
 
+    # GitHub data exports
+    path('github/commit-weeks/export/', admin_views.CommitWeekExportView.as_view(), name='commit_week_export'),
+
     # ======== New SystemSkillGain Views ========
     path('system-skill-gains/', admin_views.SystemSkillGainListAdminView.as_view(), name='system_skill_gain_list'),
     path('system-skill-gains/create/', admin_views.SystemTypeCreateAdminView.as_view(), name='system_skill_gain_create'),
@@ -22,9 +22,11 @@ from core.admin_views import (
     SlugAdminCreateView,
     BaseAdminView,
     BulkActionMixin,
-    AdminAccessMixin
+    AdminAccessMixin,
+    StreamingExportView,
 )
-from .models import SystemModule, Technology, SystemType, ArchitectureComponent, ArchitectureConnection, SystemSkillGain
+from core.services.exports import StreamingExport
+from .models import SystemModule, Technology, SystemType, ArchitectureComponent, ArchitectureConnection, SystemSkillGain, GitHubCommitWeek
 from .forms import SystemModuleForm, TechnologyForm, SystemTypeForm, ArchitectureComponentForm, ArchitectureConnectionForm, SystemSkillGainForm
 from core.models import Skill
 
@@ -1199,3 +1201,44 @@ class SystemDetailAdminView(BaseAdminView, DetailView):
         context['has_suggestions'] = len(suggestions) > 0
 
         return context
+
+
+class CommitWeekExport(StreamingExport):
+    fields = (
+        'repository__name', 'year', 'week', 'month', 'quarter', 'week_start_date',
+        'week_end_date', 'commit_count', 'lines_added', 'lines_deleted', 'files_changed',
+    )
+    columns = (
+        ('Repository', 'repository__name'),
+        ('Year', 'year'),
+        ('Week', 'week'),
+        ('Month', 'month'),
+        ('Quarter', 'quarter'),
+        ('Week Start', 'week_start_date'),
+        ('Week End', 'week_end_date'),
+        ('Commits', 'commit_count'),
+        ('Lines Added', 'lines_added'),
+        ('Lines Deleted', 'lines_deleted'),
+        ('Files Changed', 'files_changed'),
+    )
+    filename = 'github_commit_weeks'
+
+
+class CommitWeekExportView(StreamingExportView):
+    """Export weekly GitHub commit history. ?repository=<id> and ?year= narrow it down."""
+
+    model = GitHubCommitWeek
+    export_class = CommitWeekExport
+
+    def get_queryset(self):
+        queryset = GitHubCommitWeek.objects.all()
+
+        repository = self.request.GET.get('repository', '')
+        if repository.isdigit():
+            queryset = queryset.filter(repository_id=repository)
+
+        year = self.request.GET.get('year', '')
+        if year.isdigit():
+            queryset = queryset.filter(year=year)
+
+        return queryset
@@ -0,0 +1,111 @@
+"""
+Systems API Resources
+Read-only JSON resources for systems, technologies and GitHub repositories (see core.api)
+Version 1.0 - Public systems only; repositories exclude private ones
+"""
+
+from django.urls import reverse
+
+from core.api import Resource
+
+from .models import GitHubRepository, SystemModule, Technology
+
+
+class SystemResource(Resource):
+    name = 'systems'
+    model = SystemModule
+    fields = {
+        'id': 'id',
+        'system_id': 'system_id',
+        'title': 'title',
+        'slug': 'slug',
+        'subtitle': 'subtitle',
+        'excerpt': 'excerpt',
+        'status': 'status',
+        'featured': 'featured',
+        'system_type': 'system_type__slug',
+        'complexity': 'complexity',
+        'completion_percent': 'completion_percent',
+        'github_url': 'github_url',
+        'live_url': 'live_url',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+    m2m = {'technologies': ('technologies', 'slug')}
+    computed = {'url': ('slug',)}
+    default_fields = ('id', 'system_id', 'title', 'slug', 'excerpt', 'status', 'system_type', 'technologies', 'url')
+    ordering = ('-updated_at', '-id')
+    filters = {
+        'status': 'status__in',
+        'type': 'system_type__slug',
+        'technology': 'technologies__slug',
+        'featured': 'featured',
+    }
+    content_group = 'projects'
+
+    def get_queryset(self):
+        return SystemModule.objects.public()
+
+    def get_url(self, row):
+        return reverse('projects:system_detail', args=[row['slug']])
+
+
+class TechnologyResource(Resource):
+    name = 'technologies'
+    model = Technology
+    fields = {
+        'id': 'id',
+        'name': 'name',
+        'slug': 'slug',
+        'category': 'category',
+        'description': 'description',
+        'icon': 'icon',
+        'color': 'color',
+    }
+    computed = {'url': ('slug',)}
+    default_fields = ('id', 'name', 'slug', 'category', 'color', 'url')
+    ordering = ('name', 'id')
+    filters = {'category': 'category__in'}
+    content_group = 'projects'
+
+    def get_url(self, row):
+        return reverse('projects:technology_detail', args=[row['slug']])
+
+
+class GitHubRepositoryResource(Resource):
+    name = 'repositories'
+    model = GitHubRepository
+    fields = {
+        'id': 'id',
+        'github_id': 'github_id',
+        'name': 'name',
+        'full_name': 'full_name',
+        'description': 'description',
+        'html_url': 'html_url',
+        'homepage': 'homepage',
+        'language': 'language',
+        'stars': 'stars_count',
+        'forks': 'forks_count',
+        'is_fork': 'is_fork',
+        'is_archived': 'is_archived',
+        'github_updated_at': 'github_updated_at',
+        'last_commit_date': 'last_commit_date',
+        'total_commits': 'total_commits',
+        'commits_last_30_days': 'commits_last_30_days',
+        'commits_last_year': 'commits_last_year',
+        'system': 'related_system__slug',
+    }
+    default_fields = ('id', 'name', 'full_name', 'description', 'html_url', 'language', 'stars', 'github_updated_at')
+    ordering = ('-github_updated_at', '-id')
+    filters = {
+        'language': 'language__iexact',
+        'system': 'related_system__slug',
+        'archived': 'is_archived',
+        'fork': 'is_fork',
+    }
+    lookup_field = 'github_id'
+    lookup_converter = 'int'
+    content_group = 'github'
+
+    def get_queryset(self):
+        return GitHubRepository.objects.filter(is_private=False)
@@ -5,10 +5,42 @@ Version 2.0
 """
 
 from django import forms
+from django.db.models import Count
 from django.utils.text import slugify
 from markdownx.fields import MarkdownxFormField
 from .models import SystemModule, Technology, SystemType, ArchitectureComponent, ArchitectureConnection, SystemSkillGain
 from core.models import Skill
+from core.widgets import MetadataChoiceMixin, SkillSelectWidget, TechnologySelectWidget
+
+
+# ============================================================================
+# SYSTEM SELECTION WIDGETS FOR BETTER UX
+# ============================================================================
+
+class SystemMetadataMixin(MetadataChoiceMixin):
+    """Status, type and component count on each system option - one query for all options"""
+
+    def get_metadata_queryset(self, queryset):
+        return (
+            queryset.select_related('system_type')
+            .annotate(component_count=Count('architecture_components'))
+            .only('pk', 'status', 'system_type__name')
+        )
+
+    def option_metadata(self, system):
+        return {
+            'data-status': system.status,
+            'data-type': system.system_type.name if system.system_type else '',
+            'data-components': system.component_count,
+        }
+
+
+class SystemSelectWidget(SystemMetadataMixin, forms.Select):
+    """Custom widget for system selection with enhanced display"""
+
+
+class SystemCheckboxSelectMultiple(SystemMetadataMixin, forms.CheckboxSelectMultiple):
+    """Multi-system checkboxes with the same per-option metadata"""
 
 
 # NEW: For new skill-tech relationship
@@ -26,10 +58,10 @@ class SystemSkillGainForm(forms.ModelForm):
             'how_learned',
         ]
         widgets = {
-            'system': forms.Select(attrs={
+            'system': SystemSelectWidget(attrs={
                 'class': 'w-full px-3 py-2 bg-black bg-opacity-30 border border-gray-600 rounded-lg text-white focus:border-teal-400 focus:outline-none',
             }),
-            'skill': forms.Select(attrs={
+            'skill': SkillSelectWidget(attrs={
                 'class': 'w-full px-3 py-2 bg-black bg-opacity-30 border border-gray-600 rounded-lg text-white focus:border-teal-400 focus:outline-none',
             }),
             'proficiency_gained': forms.Select(attrs={
@@ -49,7 +81,9 @@ class SystemSkillGainForm(forms.ModelForm):
         
         # Order querysets for better UX
         self.fields['system'].queryset = SystemModule.objects.order_by('title')
-        self.fields['skill'].queryset = Skill.objects.order_by('category', 'name')
+        self.fields['skill'].queryset = Skill.objects.annotate(
+            systems_count=Count('project_gains')
+        ).order_by('category', 'name')
         self.fields['technologies_used'].queryset = Technology.objects.order_by('category', 'name')
         
         # Make some fields optional
@@ -532,7 +566,7 @@ class ArchitectureComponentForm(forms.ModelForm):
             'color', 'size', 'is_core', 'display_order'
         ]
         widgets = {
-            'system': forms.Select(attrs={
+            'system': SystemSelectWidget(attrs={
                 'class': 'form-select',
                 'data-placeholder': 'Select system...'
             }),
@@ -548,7 +582,7 @@ class ArchitectureComponentForm(forms.ModelForm):
                 'rows': 3,
                 'placeholder': 'Describe the component\'s role and functionality...'
             }),
-            'technology': forms.Select(attrs={
+            'technology': TechnologySelectWidget(attrs={
                 'class': 'form-select',
                 'data-placeholder': 'Select primary technology (optional)...'
             }),
@@ -748,7 +782,7 @@ class BulkArchitectureForm(forms.Form):
     
     systems = forms.ModelMultipleChoiceField(
         queryset=SystemModule.objects.all(),
-        widget=forms.CheckboxSelectMultiple(attrs={
+        widget=SystemCheckboxSelectMultiple(attrs={
             'class': 'form-check-input'
         }),
         help_text='Select systems to create default architecture for'
@@ -790,25 +824,3 @@ class BulkArchitectureForm(forms.Form):
             self.fields['systems'].help_text = 'Systems without existing architecture'
         else:
             self.fields['systems'].help_text = 'All systems (some already have architecture)'
-
-
-# ============================================================================
-# SYSTEM SELECTION WIDGET FOR BETTER UX
-# ============================================================================
-
-class SystemSelectWidget(forms.Select):
-    """Custom widget for system selection with enhanced display"""
-    
-    def create_option(self, name, value, label, selected, index, subindex=None, attrs=None):
-        option = super().create_option(name, value, label, selected, index, subindex, attrs)
-        
-        if value:
-            try:
-                system = SystemModule.objects.get(pk=value)
-                option['attrs']['data-status'] = system.status
-                option['attrs']['data-type'] = system.system_type.name if system.system_type else ''
-                option['attrs']['data-components'] = system.architecture_components.count()
-            except SystemModule.DoesNotExist:
-                pass
-        
-        return option
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_hot_query_indexes'),
+        ('projects', '0018_remove_systemmodule_architecture_diagram_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='githubrepository',
+            index=models.Index(fields=['related_system', '-commits_last_30_days'], name='ghrepo_system_commits30_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='githubrepository',
+            index=models.Index(fields=['-last_commit_date'], name='ghrepo_last_commit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemmodule',
+            index=models.Index(fields=['status', '-updated_at'], name='sysmod_status_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemmodule',
+            index=models.Index(condition=models.Q(('featured', True)), fields=['-created_at'], name='sysmod_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemmodule',
+            index=models.Index(condition=models.Q(('portfolio_ready', True)), fields=['status'], name='sysmod_ready_status_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0019_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubcommitweek',
+            name='daily_commits',
+            field=models.BinaryField(blank=True, default=b'', help_text="Commits per day (Sun-Sat), packed array('H')"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0020_githubcommitweek_daily_commits'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='github_pushed_at',
+            field=models.DateTimeField(blank=True, help_text='pushed_at as of the last per-repo sync (incremental sync watermark)', null=True),
+        ),
+    ]
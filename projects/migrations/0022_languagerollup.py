@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_rollups(apps, schema_editor):
+    from projects.services.language_stats import rebuild_language_rollups
+    rebuild_language_rollups(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0021_githubrepository_github_pushed_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LanguageRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=50)),
+                ('total_bytes', models.BigIntegerField()),
+                ('repo_count', models.IntegerField()),
+                ('percentage', models.FloatField()),
+                ('system', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='language_rollups', to='projects.systemmodule')),
+            ],
+            options={
+                'ordering': ['-total_bytes'],
+                'indexes': [models.Index(fields=['system', '-total_bytes'], name='langrollup_system_bytes_idx')],
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
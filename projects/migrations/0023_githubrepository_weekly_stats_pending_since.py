@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0022_languagerollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='githubrepository',
+            name='weekly_stats_pending_since',
+            field=models.DateTimeField(blank=True, help_text='Set while GitHub is still computing weekly stats (202); retried first on the next sync', null=True),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.1 on 2026-10-18 23:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_rollups(apps, schema_editor):
+    from projects.services.commit_rollups import rebuild_commit_rollups
+    rebuild_commit_rollups(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0023_githubrepository_weekly_stats_pending_since'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitHubCommitMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('month', models.IntegerField(help_text='Month Number (1-12)')),
+                ('month_name', models.CharField(max_length=10)),
+                ('total_commits', models.IntegerField(default=0)),
+                ('week_count', models.IntegerField(default=0, help_text='Weeks with a GitHubCommitWeek row')),
+                ('peak_week_start', models.DateField()),
+                ('peak_week_commits', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('repository', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='commit_months', to='projects.githubrepository')),
+            ],
+            options={
+                'ordering': ['-year', '-month'],
+                'unique_together': {('repository', 'year', 'month')},
+            },
+        ),
+        migrations.CreateModel(
+            name='GitHubCommitQuarter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('quarter', models.IntegerField(help_text='Quarter (1-4)')),
+                ('total_commits', models.IntegerField(default=0)),
+                ('week_count', models.IntegerField(default=0)),
+                ('months_mask', models.PositiveSmallIntegerField(default=0)),
+                ('peak_week_start', models.DateField()),
+                ('peak_week_commits', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('repository', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='commit_quarters', to='projects.githubrepository')),
+            ],
+            options={
+                'ordering': ['-year', '-quarter'],
+                'unique_together': {('repository', 'year', 'quarter')},
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 00:16
+
+from django.db import migrations
+
+
+def rebuild_rollups(apps, schema_editor):
+    # The all-repositories scope now sums detailed-tracking repositories only
+    from projects.services.commit_rollups import rebuild_commit_rollups
+    rebuild_commit_rollups(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0024_githubcommitmonth_githubcommitquarter'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_rollups, migrations.RunPython.noop),
+    ]
@@ -5,11 +5,12 @@ from django.contrib.auth.models import User
 from markdownx.models import MarkdownxField
 from markdownx.utils import markdownify
 import re
+import sys
 import calendar
+from array import array
 from bs4 import BeautifulSoup
 from datetime import date, timedelta, datetime
-from collections import defaultdict
-from django.db.models import Avg, Count, Sum, Q
+from django.db.models import Avg, Count, F, Sum, Q
 from django.utils import timezone
 
 
@@ -42,6 +43,9 @@ class GitHubCommitWeek(models.Model):
     # Commit data
     commit_count = models.IntegerField(default=0, help_text="Commits in this week")
 
+    # Commits per day as GitHub reports them (Sunday first): array('H') of 7, little-endian (14 bytes)
+    daily_commits = models.BinaryField(blank=True, default=b'', help_text="Commits per day (Sun-Sat), packed array('H')")
+
     # Optional detailed data (if we want to include)
     lines_added = models.IntegerField(default=0, blank=True)
     lines_deleted = models.IntegerField(default=0, blank=True)
@@ -100,6 +104,26 @@ class GitHubCommitWeek(models.Model):
             **kwargs
         )
     
+    @staticmethod
+    def pack_daily_commits(days):
+        """[Sun, Mon, ..., Sat] counts -> 14-byte blob for daily_commits (b'' if not 7 days)."""
+        if not days or len(days) != 7:
+            return b''
+        packed = array('H', (min(max(int(count), 0), 0xFFFF) for count in days))
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        return packed.tobytes()
+
+    @property
+    def daily_commit_counts(self):
+        """The seven daily counts (Sunday first), or [] if the sync didn't store them."""
+        if not self.daily_commits or len(self.daily_commits) != 14:
+            return []
+        unpacked = array('H', bytes(self.daily_commits))
+        if sys.byteorder == 'big':
+            unpacked.byteswap()
+        return unpacked.tolist()
+
     @property
     def is_current_week(self):
         """Check if this is the current week."""
@@ -133,62 +157,83 @@ class GitHubCommitWeek(models.Model):
     
     @classmethod
     def get_monthly_summary(cls, repository, year, month):
-        """Get commit summary for a specific month."""
-        weeks_in_month = cls.objects.filter(repository=repository, year=year, month=month)
-
-        if not weeks_in_month:
-            return {
-                'month': month,
-                'month_name': '',
-                'total_commits': 0,
-                'weeks_count': 0,
-                'avg_commits_per_week': 0
-            }
-        
-        total_commits = sum(week.commit_count for week in weeks_in_month)
-        weeks_count = weeks_in_month.count()
+        """Get commit summary for a specific month (from GitHubCommitMonth)."""
+        from projects.services.commit_rollups import CommitRollups
+        return CommitRollups.load([repository]).month_summary(repository.pk, year, month)
 
-        return {
-            'month': month,
-            'month_name': weeks_in_month.first().month_name,
-            'year': year,
-            'total_commits': total_commits,
-            'weeks_count': weeks_count,
-            'avg_commits_per_week': round(total_commits / weeks_count, 1) if weeks_count > 0 else 0,
-            'most_active_week': max(weeks_in_month, key=lambda w: w.commit_count) if weeks_in_month else None
-        }
-    
     @classmethod
     def get_quarterly_summary(cls, repository, year, quarter):
-        """Get commit summary for a specific quarter."""
-        weeks_in_quarter = cls.objects.filter(repository=repository, year=year, quarter=quarter)
+        """Get commit summary for a specific quarter (from GitHubCommitQuarter)."""
+        from projects.services.commit_rollups import CommitRollups
+        return CommitRollups.load([repository]).quarter_summary(repository.pk, year, quarter)
 
-        if not weeks_in_quarter:
-            return {
-                'quarter': quarter,
-                'year': year,
-                'total_commits': 0,
-                'weeks_count': 0,
-                'months_included': []
-            }
-        
-        total_commits = sum(week.commit_count for week in weeks_in_quarter)
-        months_in_quarter = list(set(week.month for week in weeks_in_quarter))
+class GitHubCommitMonth(models.Model):
+    """
+    Commits per calendar month (of each week's Sunday start) for one repository,
+    or summed across every repository with weekly data (repository is null).
+    Kept in step with GitHubCommitWeek by projects.services.commit_rollups.
+    """
 
-        return {
-            'quarter': quarter,
-            'year': year,
-            'total_commits': total_commits,
-            'weeks_count': weeks_in_quarter.count(),
-            'months_included': sorted(months_in_quarter),
-            'avg_commits_per_week': round(total_commits / weeks_in_quarter.count(), 1) if weeks_in_quarter else 0
-        }
+    repository = models.ForeignKey('GitHubRepository', on_delete=models.CASCADE, null=True, blank=True, related_name='commit_months')
+    year = models.IntegerField()
+    month = models.IntegerField(help_text="Month Number (1-12)")
+    month_name = models.CharField(max_length=10)
+
+    total_commits = models.IntegerField(default=0)
+    week_count = models.IntegerField(default=0, help_text="Weeks with a GitHubCommitWeek row")
+
+    # Busiest tracked week (earliest on ties)
+    peak_week_start = models.DateField()
+    peak_week_commits = models.IntegerField(default=0)
+
+    last_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['repository', 'year', 'month']
+        ordering = ['-year', '-month']
+
+    def __str__(self):
+        scope = self.repository.name if self.repository_id else 'All repositories'
+        return f"{scope} - {self.month_name} {self.year} ({self.total_commits} commits)"
+
+
+class GitHubCommitQuarter(models.Model):
+    """Commits per calendar quarter; same scopes and upkeep as GitHubCommitMonth."""
+
+    repository = models.ForeignKey('GitHubRepository', on_delete=models.CASCADE, null=True, blank=True, related_name='commit_quarters')
+    year = models.IntegerField()
+    quarter = models.IntegerField(help_text="Quarter (1-4)")
+
+    total_commits = models.IntegerField(default=0)
+    week_count = models.IntegerField(default=0)
+    # Bit m-1 set for each month m with tracked weeks
+    months_mask = models.PositiveSmallIntegerField(default=0)
+
+    peak_week_start = models.DateField()
+    peak_week_commits = models.IntegerField(default=0)
+
+    last_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['repository', 'year', 'quarter']
+        ordering = ['-year', '-quarter']
+
+    def __str__(self):
+        scope = self.repository.name if self.repository_id else 'All repositories'
+        return f"{scope} - Q{self.quarter} {self.year} ({self.total_commits} commits)"
+
+    @property
+    def months_included(self):
+        return [month for month in range(1, 13) if self.months_mask & (1 << (month - 1))]
 
 
 # Enhanced GitHubRepository model methods
 class GitHubRepositoryManager(models.Manager):
     def with_detailed_tracking(self):
-        """Get repositories that have detailed weekly commit tracking."""
+        """
+        Get repositories that have detailed weekly commit tracking.
+        Keep in step with commit_rollups.TRACKED_WEEKS and is_detailed_tracking_candidate.
+        """
         return self.filter(related_system__isnull=False, is_archived=False, is_fork=False)
     
     def needs_weekly_sync(self, hours_threshold=24):
@@ -196,7 +241,8 @@ class GitHubRepositoryManager(models.Manager):
         cutoff = timezone.now() - timedelta(hours=hours_threshold)
         return self.with_detailed_tracking().filter(
             Q(commit_weeks_last_synced__isnull=True) | Q(commit_weeks_last_synced__lt=cutoff)
-        )
+            | Q(weekly_stats_pending_since__isnull=False)
+        ).order_by(F('weekly_stats_pending_since').asc(nulls_last=True))
 
 
 class GitHubRepository(models.Model):
@@ -228,6 +274,7 @@ class GitHubRepository(models.Model):
     # Timestamps
     github_created_at = models.DateTimeField()
     github_updated_at = models.DateTimeField()
+    github_pushed_at = models.DateTimeField(null=True, blank=True, help_text="pushed_at as of the last per-repo sync (incremental sync watermark)")
     last_synced = models.DateTimeField(auto_now=True)
 
     # Integration w existing SystemModule
@@ -255,6 +302,7 @@ class GitHubRepository(models.Model):
 
     # ETag for GitHub stattistic endpoint (conditional requests)
     stats_etag = models.CharField(max_length=64, blank=True, help_text="ETag for GitHub stats API conditional requests")
+    weekly_stats_pending_since = models.DateTimeField(null=True, blank=True, help_text="Set while GitHub is still computing weekly stats (202); retried first on the next sync")
 
     # Flag to enable detailed tracking (auto-enabled for system-linked repos)
     enable_detailed_tracking = models.BooleanField(default=False, help_text="Enable weekly commit tracking (auto-enabled for system-linked repos)")
@@ -266,6 +314,11 @@ class GitHubRepository(models.Model):
         ordering = ['-github_updated_at']
         verbose_name = 'GitHub Repository'
         verbose_name_plural = 'GitHub Repositories'
+        indexes = [
+            # Most active repo per system
+            models.Index(fields=['related_system', '-commits_last_30_days'], name='ghrepo_system_commits30_idx'),
+            models.Index(fields=['-last_commit_date'], name='ghrepo_last_commit_idx'),
+        ]
     
     def __str__(self):
         return self.full_name
@@ -326,176 +379,69 @@ class GitHubRepository(models.Model):
     # ===== NEW ENHANCED METHODS (Added w Weekly Commit model) =====
     def should_track_detailed_commits(self):
         """Determine if this repo should have detailed weekly tracking."""
-        return (
-            self.related_system is not None and
-            not self.is_archived and
-            not self.is_fork
-        )
+        return self.is_detailed_tracking_candidate
+
+    @property
+    def is_detailed_tracking_candidate(self):
+        """with_detailed_tracking() membership, from loaded fields only (no related_system fetch)."""
+        return self.related_system_id is not None and not self.is_archived and not self.is_fork
     
     def get_weekly_commit_data(self, weeks_back=12):
         """Get weekly commit data for last N weeks."""
         return self.commit_weeks.order_by('-year', '-week')[:weeks_back]
     
+    def get_commit_series(self):
+        """This repo's weekly commits as a CommitTimeSeries (one query)."""
+        from projects.services.commit_timeseries import CommitTimeSeries
+        return CommitTimeSeries.load([self.pk])
+
+    def get_commit_rollups(self):
+        """This repo's GitHubCommitMonth rows as a CommitRollups (one query)."""
+        from projects.services.commit_rollups import CommitRollups
+        return CommitRollups.load([self.pk])
+
     def get_monthly_commit_data(self, months_back=6):
         """Get monthly commit summaries for the last N months."""
-        # Get all weeks from the last N months
-        recent_weeks = self.commit_weeks.order_by('-year', '-month', '-week')
-
-        # Group by year-month
-        monthly_data = defaultdict(list)
-        for week in recent_weeks:
-            month_key = f"{week.year}-{week.month:02d}"
-            monthly_data[month_key].append(week)
-        
-        # Convert to monthly summaries
-        monthly_summaries = []
-        for month_key in sorted(monthly_data.keys(), reverse=True)[:months_back]:
-            weeks = monthly_data[month_key]
-            if weeks:
-                total_commits = sum(w.commit_count for w in weeks)
-                first_week = weeks[0]  # For month metadata
-
-                monthly_summaries.append({
-                    'year': first_week.year,
-                    'month': first_week.month,
-                    'month_name': first_week.month_name,
-                    'total_commits': total_commits,
-                    'week_count': len(weeks),
-                    'avg_commits_per_week': round(total_commits / len(weeks), 1),
-                    'most_active_week': max(weeks, key=lambda w: w.commit_count)
-                })
-        
-        return monthly_summaries
-    
+        return self.get_commit_rollups().monthly(self.pk, months_back)
+
     def get_commit_trend(self, weeks=4):
         """Get commit trend over recent weeks."""
-        recent_weeks = self.commit_weeks.order_by('-year', '-week')[:weeks]
-        if not recent_weeks:
-            return "no-data"
-        
-        commits = [w.commit_count for w in recent_weeks]
-        if len(commits) < 2:
-            return "Insufficient-data"
-        
-        # Simple trend calculation
-        first_half = sum(commits[:len(commits) // 2])
-        second_half = sum(commits[len(commits) // 2:])
-
-        if second_half > first_half * 1.2:
-            return "increasing"
-        elif second_half < first_half * 0.8:
-            return "decreasing"
-        else:
-            return "stable"
-    
+        return self.get_commit_series().weekly_trend(self.pk, weeks)
+
     def get_monthly_trend(self, months=3):
         """Get commit trend over recent months."""
-        monthly_data = self.get_monthly_commit_data(months_back=months)
-        if len(monthly_data) < 2:
-            return "Insufficient-data"
-        
-        # Compare first half to second half of months
-        commits = [month['total_commits'] for month in monthly_data]
-        first_half = sum(commits[:len(commits) // 2])
-        second_half = sum(commits[len(commits) // 2:])
-
-        if second_half > first_half * 1.3:
-            return "increasing"
-        elif second_half < first_half * 0.7:
-            return "decreasing"
-        else:
-            return "stable"
-    
+        return self.get_commit_rollups().monthly_trend(self.pk, months)
+
     def get_weekly_commit_summary(self):
         """Get a summary of weekly commit activity."""
-        weeks = self.commit_weeks.all()
-        if not weeks:
-            return {
-                'total_weeks': 0,
-                'avg_commits_per_week': 0,
-                'most_active_week': None,
-                'recent_activity': 'No data'
-            }
-        
-        total_commits = sum(w.commit_count for w in weeks)
-        most_active = max(weeks, key=lambda w: w.commit_count)
+        return self.get_commit_series().weekly_summary(self.pk)
 
-        return {
-            'total_weeks': weeks.count(),
-            'avg_commits_per_week': round(total_commits / weeks.count(), 1),
-            'most_active_week': most_active,
-            'trend': self.get_commit_trend(),
-            'total_commits_tracked': total_commits
-        }
-    
     def get_monthly_commit_summary(self):
         """Get a summary of monthly commit activity."""
-        monthly_data = self.get_monthly_commit_data(months_back=12)
-        if not monthly_data:
-            return {
-                'total_months': 0,
-                'avg_commits_per_month': 0,
-                'most_active_month': None,
-                'monthly_trend': 'no-data'
-            }
-        
-        total_commits = sum(month['total_commits'] for month in monthly_data)
-        most_active = max(monthly_data, key=lambda m: m['total_commits'])
+        return self.get_commit_rollups().monthly_summary(self.pk)
+
+    # Counted exactly by the commit sync (Link-header page counting); the
+    # weekly stats only fill them in until that sync has run
+    EXACT_COUNT_FIELDS = ('total_commits', 'commits_last_30_days', 'commits_last_year')
 
-        return {
-            'total_months': len(monthly_data),
-            'avg_commits_per_month': round(total_commits / len(monthly_data), 1),
-            'most_active_month': most_active,
-            'monthly_trend': self.get_monthly_trend(),
-            'total_commits_tracked': total_commits
-        }
-    
     def update_summary_from_weekly_data(self):
         """
-        Update basic commit summary fields using accurate weekly data.
-        Call this after weekly sync to get real numbers instead of estimates.
+        Update commit summary fields from the stored weekly data.
+        Call this after weekly sync. Once the commit sync has stored exact
+        counts (commits_last_synced), only the monthly average is refreshed.
         """
         if not self.enable_detailed_tracking:
             return False
-        
-        # Get all weekly commit data for this repo
-        weekly_data = self.commit_weeks.all()
-        
-        if not weekly_data:
+
+        fields = self.get_commit_series().summary_fields().get(self.pk)
+        if not fields:
             return False
-        
-        # Calculate accurate total commits from weekly data
-        total_commits = sum(week.commit_count for week in weekly_data)
-        
-        # Calculate commits in last 30 days (approximately last 4-5 weeks)
-        recent_weeks = weekly_data.order_by('-year', '-week')[:5]  # Last 5 weeks to cover 30+ days
-        commits_last_30_days = sum(week.commit_count for week in recent_weeks)
-        
-        # Calculate commits in last year (all our data since we only store 52 weeks max)
-        commits_last_year = total_commits
-        
-        # Calculate average commits per month from weekly data
-        weeks_count = weekly_data.count()
-        if weeks_count > 0:
-            avg_commits_per_week = total_commits / weeks_count
-            avg_commits_per_month = avg_commits_per_week * 4.33  # Average weeks per month
-        else:
-            avg_commits_per_month = 0.0
-        
-        # Update the summary fields with accurate data
-        self.total_commits = total_commits
-        self.commits_last_30_days = commits_last_30_days
-        self.commits_last_year = commits_last_year
-        self.avg_commits_per_month = round(avg_commits_per_month, 2)
-        
-        # Save the updated summary
-        self.save(update_fields=[
-            'total_commits', 
-            'commits_last_30_days', 
-            'commits_last_year', 
-            'avg_commits_per_month'
-        ])
-        
+        if self.commits_last_synced:
+            fields = {name: value for name, value in fields.items() if name not in self.EXACT_COUNT_FIELDS}
+
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.save(update_fields=list(fields))
         return True
 
     def get_accurate_vs_estimated_comparison(self):
@@ -511,14 +457,13 @@ class GitHubRepository(models.Model):
         estimated_30_days = self.commits_last_30_days
         
         # Calculate accurate values from weekly data
-        weekly_data = self.commit_weeks.all()
-        if not weekly_data:
+        fields = self.get_commit_series().summary_fields().get(self.pk)
+        if not fields:
             return None
-        
-        accurate_total = sum(week.commit_count for week in weekly_data)
-        recent_weeks = weekly_data.order_by('-year', '-week')[:5]
-        accurate_30_days = sum(week.commit_count for week in recent_weeks)
-        
+
+        accurate_total = fields['total_commits']
+        accurate_30_days = fields['commits_last_30_days']
+
         return {
             'estimated': {
                 'total': estimated_total,
@@ -553,6 +498,30 @@ class GitHubLanguage(models.Model):
         return f"{self.repository.name} - {self.language} ({self.percentage:.1f}%)"
 
 
+class LanguageRollup(models.Model):
+    """
+    Precomputed language totals, across all repositories (system is null) or
+    the repositories linked to one SystemModule. Rebuilt at the end of every
+    GitHub sync by projects.services.language_stats.
+    """
+
+    system = models.ForeignKey('SystemModule', on_delete=models.CASCADE, null=True, blank=True, related_name='language_rollups')
+    language = models.CharField(max_length=50)
+    total_bytes = models.BigIntegerField()
+    repo_count = models.IntegerField()
+    percentage = models.FloatField()  # Share of all bytes in the scope
+
+    class Meta:
+        ordering = ['-total_bytes']
+        indexes = [
+            models.Index(fields=['system', '-total_bytes'], name='langrollup_system_bytes_idx'),
+        ]
+
+    def __str__(self):
+        scope = self.system.title if self.system_id else 'All repositories'
+        return f"{scope} - {self.language} ({self.percentage:.1f}%)"
+
+
 class SystemModuleQuerySet(models.QuerySet):
     """Custom queryset for SystemModule w useful filters."""
 
@@ -562,6 +531,10 @@ class SystemModuleQuerySet(models.QuerySet):
     def published(self):
         return self.filter(status='published')
 
+    def public(self):
+        """Everything the public system pages show (not draft or archived)."""
+        return self.exclude(status__in=['draft', 'archived'])
+
     def in_development(self):
         return self.filter(status='in_development')
 
@@ -595,6 +568,9 @@ class SystemModuleManager(models.Manager):
     def published(self):
         return self.get_queryset().published()
 
+    def public(self):
+        return self.get_queryset().public()
+
     def in_development(self):
         return self.get_queryset().in_development()
 
@@ -925,6 +901,13 @@ class SystemModule(models.Model):
         ordering = ['-created_at']
         verbose_name = "System Module"
         verbose_name_plural = "System Modules"
+        indexes = [
+            # Public lists exclude draft/archived and show most recently updated first
+            models.Index(fields=['status', '-updated_at'], name='sysmod_status_updated_idx'),
+            # Partial on the boolean flags so SQLite can use them too
+            models.Index(fields=['-created_at'], condition=Q(featured=True), name='sysmod_featured_idx'),
+            models.Index(fields=['status'], condition=Q(portfolio_ready=True), name='sysmod_ready_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.system_id}: {self.title}"
@@ -0,0 +1,365 @@
+"""
+Commit Rollup Service
+GitHubCommitMonth / GitHubCommitQuarter upkeep and the monthly and quarterly readers over them
+Version 1.1 - All-repositories scope limited to detailed-tracking repositories
+"""
+
+import calendar
+import threading
+from collections import defaultdict
+from datetime import date
+
+import numpy as np
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q, QuerySet, Sum
+
+from .commit_timeseries import ALL_REPOSITORIES, trend_labels
+
+
+MONTH_NAMES = list(calendar.month_name)
+
+# Growth of the newer half over the older half needed to call a monthly trend increasing/decreasing
+MONTHLY_TREND_THRESHOLD = 0.3
+
+
+def quarter_of(month):
+    return (month - 1) // 3 + 1
+
+
+def quarter_months(quarter):
+    return list(range(quarter * 3 - 2, quarter * 3 + 1))
+
+
+# ===== UPKEEP =====
+
+def _fold_weeks(rows):
+    """
+    Fold (repository_id or None, week_start_date, commit_count) rows into
+    month and quarter buckets: ({(repo, year, month): bucket},
+    {(repo, year, quarter): bucket}). Weeks belong to their start date's
+    month (GitHub's Sunday), as in CommitTimeSeries.
+    """
+    months = {}
+    quarters = {}
+    for repo_id, week_start, commits in sorted(rows, key=lambda row: row[1]):
+        for buckets, key in (
+            (months, (repo_id, week_start.year, week_start.month)),
+            (quarters, (repo_id, week_start.year, quarter_of(week_start.month))),
+        ):
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = {
+                    'total': 0, 'weeks': 0, 'mask': 0, 'peak_start': week_start, 'peak_commits': commits,
+                }
+            bucket['total'] += commits
+            bucket['weeks'] += 1
+            bucket['mask'] |= 1 << (week_start.month - 1)
+            # Rows are in date order, so ties keep the earliest week
+            if commits > bucket['peak_commits']:
+                bucket['peak_start'], bucket['peak_commits'] = week_start, commits
+    return months, quarters
+
+
+# Weeks of the repositories GitHubRepositoryManager.with_detailed_tracking() returns,
+# spelled out so migrations' historical models can use it
+TRACKED_WEEKS = Q(repository__related_system__isnull=False, repository__is_archived=False, repository__is_fork=False)
+
+
+def _combined_rows(weeks):
+    """
+    (None, week_start_date, commits summed across repositories) rows for the
+    all-repositories scope, which covers the detailed-tracking repositories
+    the overview's weekly series sums.
+    """
+    return [
+        (None, week_start, commits)
+        for week_start, commits in weeks.filter(TRACKED_WEEKS).order_by().values('week_start_date').annotate(
+            commits=Sum('commit_count')
+        ).values_list('week_start_date', 'commits')
+    ]
+
+
+def _write_rollups(app_registry, months, quarters):
+    GitHubCommitMonth = app_registry.get_model('projects', 'GitHubCommitMonth')
+    GitHubCommitQuarter = app_registry.get_model('projects', 'GitHubCommitQuarter')
+    GitHubCommitMonth.objects.bulk_create([
+        GitHubCommitMonth(
+            repository_id=repo_id,
+            year=year,
+            month=month,
+            month_name=MONTH_NAMES[month],
+            total_commits=bucket['total'],
+            week_count=bucket['weeks'],
+            peak_week_start=bucket['peak_start'],
+            peak_week_commits=bucket['peak_commits'],
+        )
+        for (repo_id, year, month), bucket in months.items()
+    ], batch_size=1000)
+    GitHubCommitQuarter.objects.bulk_create([
+        GitHubCommitQuarter(
+            repository_id=repo_id,
+            year=year,
+            quarter=quarter,
+            total_commits=bucket['total'],
+            week_count=bucket['weeks'],
+            months_mask=bucket['mask'],
+            peak_week_start=bucket['peak_start'],
+            peak_week_commits=bucket['peak_commits'],
+        )
+        for (repo_id, year, quarter), bucket in quarters.items()
+    ], batch_size=1000)
+
+
+def refresh_commit_rollups(repository, week_starts):
+    """
+    Recompute the quarters (and their months) containing `week_starts` - the
+    start dates of weeks just stored, changed or deleted - for `repository`
+    (an instance or id; None for the all-repositories scope only) and for
+    the all-repositories scope. Other buckets are left alone, so the cost
+    follows the size of the sync, not of the history.
+
+    Returns the number of quarters refreshed.
+    """
+    GitHubCommitWeek = apps.get_model('projects', 'GitHubCommitWeek')
+    GitHubCommitMonth = apps.get_model('projects', 'GitHubCommitMonth')
+    GitHubCommitQuarter = apps.get_model('projects', 'GitHubCommitQuarter')
+
+    touched = {(week_start.year, quarter_of(week_start.month)) for week_start in week_starts}
+    if not touched:
+        return 0
+
+    in_quarters = Q()
+    month_buckets = Q()
+    quarter_buckets = Q()
+    for year, quarter in touched:
+        months = quarter_months(quarter)
+        last_day = calendar.monthrange(year, months[-1])[1]
+        in_quarters |= Q(week_start_date__range=(date(year, months[0], 1), date(year, months[-1], last_day)))
+        month_buckets |= Q(year=year, month__in=months)
+        quarter_buckets |= Q(year=year, quarter=quarter)
+
+    weeks = GitHubCommitWeek.objects.filter(in_quarters)
+    repo_id = getattr(repository, 'pk', repository)
+    rows = [] if repo_id is None else [
+        (repo_id, week_start, commits)
+        for week_start, commits in weeks.filter(repository_id=repo_id).order_by().values_list(
+            'week_start_date', 'commit_count'
+        )
+    ]
+    months, quarters = _fold_weeks(rows + _combined_rows(weeks))
+
+    scopes = Q(repository__isnull=True) if repo_id is None else Q(repository_id=repo_id) | Q(repository__isnull=True)
+    with transaction.atomic():
+        GitHubCommitMonth.objects.filter(scopes, month_buckets).delete()
+        GitHubCommitQuarter.objects.filter(scopes, quarter_buckets).delete()
+        _write_rollups(apps, months, quarters)
+
+    return len(touched)
+
+
+def refresh_combined_rollups(repository):
+    """
+    Recompute the all-repositories buckets `repository`'s weeks fall in; for
+    when it joins or leaves the detailed-tracking set.
+    """
+    GitHubCommitWeek = apps.get_model('projects', 'GitHubCommitWeek')
+    repo_id = getattr(repository, 'pk', repository)
+    week_starts = GitHubCommitWeek.objects.filter(repository_id=repo_id).values_list('week_start_date', flat=True)
+    return refresh_commit_rollups(None, set(week_starts))
+
+
+_deleted_weeks = threading.local()
+
+
+def schedule_rollup_refresh(repository_id, week_start):
+    """
+    Note a deleted GitHubCommitWeek; its buckets are refreshed once the
+    deleting transaction commits. A cascade from a repository delete sends
+    one signal per week, so weeks are collected and refreshed in one pass
+    (later callbacks find nothing left to do).
+    """
+    pending = getattr(_deleted_weeks, 'pending', None)
+    if pending is None:
+        pending = _deleted_weeks.pending = defaultdict(set)
+    pending[repository_id].add(week_start)
+    transaction.on_commit(_refresh_deleted_weeks)
+
+
+def _refresh_deleted_weeks():
+    pending = getattr(_deleted_weeks, 'pending', None)
+    if not pending:
+        return
+    _deleted_weeks.pending = None
+
+    GitHubRepository = apps.get_model('projects', 'GitHubRepository')
+    remaining = set(GitHubRepository.objects.filter(pk__in=list(pending)).values_list('pk', flat=True))
+    for repo_id in remaining:
+        refresh_commit_rollups(repo_id, pending[repo_id])
+    # Deleted repositories took their own rollups with them; only the combined totals still count them
+    refresh_commit_rollups(None, set().union(*pending.values()))
+
+
+def rebuild_commit_rollups(app_registry=apps):
+    """
+    Recompute every GitHubCommitMonth and GitHubCommitQuarter row from
+    GitHubCommitWeek, swapped inside a transaction. Returns (months,
+    quarters) written. `app_registry` lets migrations run it against
+    historical models.
+    """
+    GitHubCommitWeek = app_registry.get_model('projects', 'GitHubCommitWeek')
+    GitHubCommitMonth = app_registry.get_model('projects', 'GitHubCommitMonth')
+    GitHubCommitQuarter = app_registry.get_model('projects', 'GitHubCommitQuarter')
+
+    weeks = GitHubCommitWeek.objects.all()
+    rows = list(weeks.order_by().values_list('repository_id', 'week_start_date', 'commit_count'))
+    months, quarters = _fold_weeks(rows + _combined_rows(weeks))
+    with transaction.atomic():
+        GitHubCommitMonth.objects.all().delete()
+        GitHubCommitQuarter.objects.all().delete()
+        _write_rollups(app_registry, months, quarters)
+
+    return len(months), len(quarters)
+
+
+# ===== READERS =====
+
+class CommitRollups:
+    """
+    Monthly and quarterly commits for a set of repositories, read from the
+    rollup tables (month_summary, quarter_summary, monthly, monthly_summary,
+    monthly_trend).
+
+    Rows load lazily, one query per table on first use. With `combined`
+    the all-repositories scope is included under ALL_REPOSITORIES; it sums
+    the detailed-tracking repositories, like the overview's weekly series. "Last N months" ends at the latest
+    month loaded, so every repo is measured over the same window.
+    """
+
+    def __init__(self, scope):
+        self.scope = scope
+        self._months = None
+        self._quarters = None
+        self._span = None
+
+    @classmethod
+    def load(cls, repositories=None, combined=False):
+        """Rollups for `repositories` (a queryset, or ids/instances; every repository when None)."""
+        if isinstance(repositories, QuerySet):
+            scope = Q(repository__in=repositories.values('pk'))
+        elif repositories is not None:
+            scope = Q(repository_id__in=[getattr(repo, 'pk', repo) for repo in repositories])
+        else:
+            scope = Q(repository__isnull=False)
+        if combined:
+            scope |= Q(repository__isnull=True)
+        return cls(scope)
+
+    def _rows(self, model_name, period_field):
+        model = apps.get_model('projects', model_name)
+        rows = {}
+        for row in model.objects.filter(self.scope).order_by():
+            key = row.year * 12 + row.month - 1 if period_field == 'month' else row.year * 4 + row.quarter - 1
+            rows.setdefault(row.repository_id or ALL_REPOSITORIES, {})[key] = row
+        return rows
+
+    @property
+    def months(self):
+        """{repo_id: {months since year 0: GitHubCommitMonth}}"""
+        if self._months is None:
+            self._months = self._rows('GitHubCommitMonth', 'month')
+            keys = [key for rows in self._months.values() for key in rows]
+            self._span = (min(keys), max(keys)) if keys else (0, -1)
+        return self._months
+
+    @property
+    def quarters(self):
+        if self._quarters is None:
+            self._quarters = self._rows('GitHubCommitQuarter', 'quarter')
+        return self._quarters
+
+    def __contains__(self, repo_id):
+        return repo_id in self.months
+
+    # ===== MONTHS =====
+
+    @staticmethod
+    def _month_summary(row):
+        year, week, _ = row.peak_week_start.isocalendar()
+        return {
+            'year': row.year,
+            'month': row.month,
+            'month_name': row.month_name,
+            'total_commits': row.total_commits,
+            'week_count': row.week_count,
+            'avg_commits_per_week': round(row.total_commits / row.week_count, 1),
+            'most_active_week': {
+                'year': year,
+                'week': week,
+                'week_start_date': row.peak_week_start,
+                'commit_count': row.peak_week_commits,
+            },
+        }
+
+    def monthly(self, repo_id, months_back=6):
+        """Newest-first summaries of the latest `months_back` months with tracked weeks."""
+        rows = self.months.get(repo_id, {})
+        return [self._month_summary(rows[key]) for key in sorted(rows, reverse=True)[:months_back]]
+
+    def month_summary(self, repo_id, year, month):
+        """One month for one repo (GitHubCommitWeek.get_monthly_summary's shape)."""
+        row = self.months.get(repo_id, {}).get(year * 12 + month - 1)
+        if row is None:
+            return {'month': month, 'month_name': '', 'total_commits': 0, 'weeks_count': 0, 'avg_commits_per_week': 0}
+
+        summary = self._month_summary(row)
+        summary['weeks_count'] = summary.pop('week_count')
+        return summary
+
+    def monthly_trend(self, repo_id, months=3):
+        """Newer vs older half of the last `months` months ('no-data' if the repo has none)."""
+        if repo_id not in self.months:
+            return 'no-data'
+        first, last = self._span
+        keys = range(max(first, last - months + 1), last + 1)
+        rows = self.months[repo_id]
+        window = np.array([[rows[key].total_commits if key in rows else 0 for key in keys]], dtype=np.int64)
+        tracked = np.array([sum(key in rows for key in keys)])
+        return str(trend_labels(window, tracked, MONTHLY_TREND_THRESHOLD)[0])
+
+    def monthly_summary(self, repo_id, months_back=12):
+        """get_monthly_commit_summary() for one repo over its latest `months_back` tracked months."""
+        months = self.monthly(repo_id, months_back)
+        if not months:
+            return {
+                'total_months': 0,
+                'avg_commits_per_month': 0,
+                'most_active_month': None,
+                'monthly_trend': 'no-data',
+            }
+
+        total = sum(month['total_commits'] for month in months)
+        return {
+            'total_months': len(months),
+            'avg_commits_per_month': round(total / len(months), 1),
+            'most_active_month': max(months, key=lambda month: month['total_commits']),
+            'monthly_trend': self.monthly_trend(repo_id),
+            'total_commits_tracked': total,
+        }
+
+    # ===== QUARTERS =====
+
+    def quarter_summary(self, repo_id, year, quarter):
+        """One quarter for one repo (GitHubCommitWeek.get_quarterly_summary's shape)."""
+        row = self.quarters.get(repo_id, {}).get(year * 4 + quarter - 1)
+        if row is None:
+            return {'quarter': quarter, 'year': year, 'total_commits': 0, 'weeks_count': 0, 'months_included': []}
+
+        return {
+            'quarter': quarter,
+            'year': year,
+            'total_commits': row.total_commits,
+            'weeks_count': row.week_count,
+            'months_included': row.months_included,
+            'avg_commits_per_week': round(row.total_commits / row.week_count, 1),
+        }
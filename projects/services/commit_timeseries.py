@@ -0,0 +1,269 @@
+"""
+Commit Time-Series Engine
+Weekly commit series over GitHubCommitWeek with NumPy
+Version 1.1 - Monthly/quarterly readers removed; projects.services.commit_rollups serves those from the rollup tables
+
+Weeks are keyed by week_start_date as stored from GitHub's stats/commit_activity:
+the Sunday each GitHub week starts on, not an ISO Monday. The heatmap's day columns
+(Sunday first) rely on that alignment.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+from django.apps import apps
+from django.db.models import QuerySet
+
+
+WEEK = np.timedelta64(7, 'D')
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Row id of the series returned by CommitTimeSeries.combined()
+ALL_REPOSITORIES = 0
+
+# Growth of the newer half over the older half needed to call a trend increasing/decreasing
+WEEKLY_TREND_THRESHOLD = 0.2
+
+# Average weeks per month, for per-month averages from weekly data
+WEEKS_PER_MONTH = 4.33
+
+
+def trend_labels(window, tracked, threshold):
+    """
+    Label each row of `window` (columns oldest -> newest) as increasing,
+    decreasing or stable by comparing the newer half's mean to the older half's.
+
+    `tracked` is how many of the window's columns had data per row; rows with
+    none are 'no-data', rows with one are 'insufficient-data'.
+    """
+    if not window.shape[1]:
+        return np.full(window.shape[0], 'no-data')
+    # Means, so an odd window (3 months) doesn't favour the larger older half
+    newer_count = max(window.shape[1] // 2, 1)
+    newer = window[:, window.shape[1] - newer_count:].mean(axis=1)
+    older = window[:, :window.shape[1] - newer_count].sum(axis=1) / max(window.shape[1] - newer_count, 1)
+    return np.select(
+        [
+            tracked == 0,
+            tracked < 2,
+            newer > older * (1 + threshold),
+            newer < older * (1 - threshold),
+        ],
+        ['no-data', 'insufficient-data', 'increasing', 'decreasing'],
+        default='stable',
+    )
+
+
+class CommitTimeSeries:
+    """
+    Weekly commit counts for a set of repositories as a dense matrix.
+
+    Rows are repositories (sorted by id), columns consecutive weeks (GitHub's
+    Sunday week starts) from the earliest to the latest stored week. `present` marks weeks that
+    have a GitHubCommitWeek row; weeks without one count as zero commits.
+    "Last N weeks" always means the N columns ending at the latest week in
+    the series, so every repo is measured over the same calendar window.
+    Monthly and quarterly figures come from CommitRollups.
+    """
+
+    def __init__(self, repo_ids, weeks, counts, present):
+        self.repo_ids = repo_ids
+        self.weeks = weeks
+        self.counts = counts
+        self.present = present
+        self._rows = {repo_id: row for row, repo_id in enumerate(repo_ids.tolist())}
+        self._summaries = {}
+        self._week_info_cache = None
+
+    # ===== LOADING =====
+
+    @classmethod
+    def load(cls, repositories=None, since=None):
+        """
+        Weekly counts for `repositories` (a queryset, or ids/instances; every
+        repository when None) in one query, optionally from `since` on.
+        """
+        GitHubCommitWeek = apps.get_model('projects', 'GitHubCommitWeek')
+        weeks = GitHubCommitWeek.objects.all()
+        if isinstance(repositories, QuerySet):
+            weeks = weeks.filter(repository__in=repositories.values('pk'))
+        elif repositories is not None:
+            weeks = weeks.filter(repository_id__in=[getattr(repo, 'pk', repo) for repo in repositories])
+        if since is not None:
+            weeks = weeks.filter(week_start_date__gte=since)
+        return cls.from_rows(
+            weeks.order_by().values_list('repository_id', 'week_start_date', 'commit_count')
+        )
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build the matrix from (repository_id, week_start_date, commit_count) rows."""
+        rows = list(rows)
+        if not rows:
+            empty = np.zeros((0, 0), dtype=np.int64)
+            return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype='datetime64[D]'), empty, empty.astype(bool))
+
+        repo_column, week_column, count_column = zip(*rows)
+        # date -> days since 1970-01-01 via ordinals; far cheaper than np.array(dates)
+        week_starts = (
+            np.fromiter(map(date.toordinal, week_column), dtype=np.int64, count=len(rows)) - EPOCH_ORDINAL
+        ).astype('datetime64[D]')
+        repo_ids, row_index = np.unique(np.array(repo_column, dtype=np.int64), return_inverse=True)
+
+        first = week_starts.min()
+        weeks = np.arange(first, week_starts.max() + WEEK, WEEK)
+        column_index = ((week_starts - first) // WEEK).astype(np.intp)
+
+        counts = np.zeros((len(repo_ids), len(weeks)), dtype=np.int64)
+        present = np.zeros(counts.shape, dtype=bool)
+        counts[row_index, column_index] = np.array(count_column, dtype=np.int64)
+        present[row_index, column_index] = True
+        return cls(repo_ids, weeks, counts, present)
+
+    def combined(self):
+        """One-row series (id ALL_REPOSITORIES) summing every repository week by week."""
+        return CommitTimeSeries(
+            np.array([ALL_REPOSITORIES], dtype=np.int64),
+            self.weeks,
+            self.counts.sum(axis=0, keepdims=True),
+            self.present.any(axis=0, keepdims=True),
+        )
+
+    def __contains__(self, repo_id):
+        return repo_id in self._rows
+
+    def __len__(self):
+        return len(self.repo_ids)
+
+    # ===== TRENDS =====
+
+    def trend_slopes(self, weeks=12):
+        """Least-squares slope (commits/week per week) over the last `weeks` weeks, per repo."""
+        window = self.counts[:, -weeks:].astype(np.float64)
+        x = np.arange(window.shape[1]) - (window.shape[1] - 1) / 2
+        denominator = (x ** 2).sum()
+        if not denominator:
+            return np.zeros(len(self.repo_ids))
+        return window @ x / denominator
+
+    def consistency_scores(self, weeks=52):
+        """Share (0-1) of the last `weeks` weeks with at least one commit, per repo."""
+        window = self.counts[:, -weeks:]
+        if not window.shape[1]:
+            return np.zeros(len(self.repo_ids))
+        return (window > 0).mean(axis=1)
+
+    def weekly_trends(self, weeks=4):
+        """Newer vs older half of the last `weeks` weeks, per repo."""
+        return trend_labels(
+            self.counts[:, -weeks:], self.present[:, -weeks:].sum(axis=1), WEEKLY_TREND_THRESHOLD
+        )
+
+    # ===== TEMPLATE-SHAPED RESULTS =====
+
+    def _week_info(self, column):
+        """(ISO year, ISO week, week start) of a column, computed once per column. ISO fields are the Sunday's, as at sync."""
+        if self._week_info_cache is None:
+            self._week_info_cache = [
+                (*week_start.isocalendar()[:2], week_start) for week_start in self.weeks.tolist()
+            ]
+        return self._week_info_cache[column]
+
+    def week_point(self, repo_id, column):
+        """{'year', 'week', 'week_start_date', 'commit_count'} for one repo and column."""
+        year, week, week_start = self._week_info(column)
+        return {
+            'year': year,
+            'week': week,
+            'week_start_date': week_start,
+            'commit_count': int(self.counts[self._rows[repo_id], column]),
+        }
+
+    def week(self, repo_id, column):
+        """Unsaved GitHubCommitWeek for one column, so templates can use its labels."""
+        GitHubCommitWeek = apps.get_model('projects', 'GitHubCommitWeek')
+        year, week, week_start = self._week_info(column)
+        return GitHubCommitWeek(
+            repository_id=repo_id or None,
+            year=year,
+            week=week,
+            month=week_start.month,
+            month_name=week_start.strftime('%B'),
+            quarter=(week_start.month - 1) // 3 + 1,
+            week_start_date=week_start,
+            week_end_date=week_start + timedelta(days=6),
+            commit_count=int(self.counts[self._rows[repo_id], column]),
+        )
+
+    def weekly(self, repo_id, weeks_back=12):
+        """The latest `weeks_back` tracked weeks, newest first (get_weekly_commit_data's shape)."""
+        if repo_id not in self._rows:
+            return []
+        columns = np.flatnonzero(self.present[self._rows[repo_id]])[::-1][:weeks_back]
+        return [self.week(repo_id, column) for column in columns.tolist()]
+
+    def weekly_summaries(self, trend_weeks=4):
+        """{repo_id: get_weekly_commit_summary() dict} for every repo with tracked weeks (cached)."""
+        key = ('weekly', trend_weeks)
+        if key not in self._summaries:
+            self._summaries[key] = self._weekly_summaries(trend_weeks)
+        return self._summaries[key]
+
+    def _weekly_summaries(self, trend_weeks):
+        totals = self.counts.sum(axis=1)
+        tracked = self.present.sum(axis=1)
+        peaks = np.where(self.present, self.counts, -1).argmax(axis=1) if self.counts.size else tracked
+        trends = self.weekly_trends(trend_weeks)
+        slopes = self.trend_slopes()
+        consistency = self.consistency_scores()
+
+        summaries = {}
+        for row, repo_id in enumerate(self.repo_ids.tolist()):
+            if not tracked[row]:
+                continue
+            summaries[repo_id] = {
+                'total_weeks': int(tracked[row]),
+                'avg_commits_per_week': round(float(totals[row] / tracked[row]), 1),
+                'most_active_week': self.week_point(repo_id, int(peaks[row])),
+                'trend': str(trends[row]),
+                'trend_slope': round(float(slopes[row]), 2),
+                'consistency': round(float(consistency[row]), 3),
+                'total_commits_tracked': int(totals[row]),
+            }
+        return summaries
+
+    def weekly_summary(self, repo_id):
+        return self.weekly_summaries().get(repo_id) or {
+            'total_weeks': 0,
+            'avg_commits_per_week': 0,
+            'most_active_week': None,
+            'recent_activity': 'No data',
+        }
+
+    def weekly_trend(self, repo_id, weeks=4):
+        """weekly_trends() for one repo ('no-data' if it isn't in the series)."""
+        if repo_id not in self._rows:
+            return 'no-data'
+        return str(self.weekly_trends(weeks)[self._rows[repo_id]])
+
+    def summary_fields(self):
+        """
+        {repo_id: GitHubRepository commit summary fields} from the weekly data:
+        total, last 5 weeks (30+ days), last 52 weeks and average per month.
+        """
+        totals = self.counts.sum(axis=1)
+        last_30_days = self.counts[:, -5:].sum(axis=1)
+        last_year = self.counts[:, -52:].sum(axis=1)
+        tracked = self.present.sum(axis=1)
+        per_month = np.divide(
+            totals * WEEKS_PER_MONTH, tracked, out=np.zeros(len(totals)), where=tracked > 0
+        )
+        return {
+            repo_id: {
+                'total_commits': int(totals[row]),
+                'commits_last_30_days': int(last_30_days[row]),
+                'commits_last_year': int(last_year[row]),
+                'avg_commits_per_month': round(float(per_month[row]), 2),
+            }
+            for row, repo_id in enumerate(self.repo_ids.tolist())
+        }
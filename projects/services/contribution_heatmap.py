@@ -0,0 +1,95 @@
+"""
+Contribution Heatmap Service
+Year-long, day-by-day commit calendar across tracked GitHub repositories
+Version 1.0 - Packed daily_commits decoded with NumPy into a 53x7 grid, cached per GitHub sync generation
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from django.apps import apps
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.services.syndication import get_generation
+
+
+HEATMAP_WEEKS = 53
+HEATMAP_CACHE_KEY = 'contribution-heatmap:'
+HEATMAP_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Intensity levels 1-4 split the active days at these percentiles (0 = no commits)
+LEVEL_PERCENTILES = (25, 50, 75)
+
+
+def heatmap_window(today=None):
+    """(first Sunday, today): 53 Sunday-first weeks ending with the current one, like GitHub's."""
+    today = today or timezone.localdate()
+    this_sunday = today - timedelta(days=(today.weekday() + 1) % 7)
+    return this_sunday - timedelta(weeks=HEATMAP_WEEKS - 1), today
+
+
+def build_contribution_heatmap(repositories=None, today=None):
+    """
+    Commit counts per day for the heatmap window, summed across repositories.
+
+    `repositories` defaults to every repo with detailed tracking. One query
+    reads the packed daily_commits of the weeks overlapping the window;
+    weeks synced before daily counts were stored don't contribute.
+
+    Returns {'start', 'end', 'counts': 53 lists of 7 (Sunday first),
+    'levels': same shape, 0-4, 'total', 'max', 'active_days'}; days after
+    `end` in the last week are 0.
+    """
+    GitHubCommitWeek = apps.get_model('projects', 'GitHubCommitWeek')
+    GitHubRepository = apps.get_model('projects', 'GitHubRepository')
+    if repositories is None:
+        repositories = GitHubRepository.objects.with_detailed_tracking()
+
+    start, end = heatmap_window(today)
+    rows = [
+        (week_start, bytes(blob))
+        for week_start, blob in GitHubCommitWeek.objects.filter(
+            repository__in=repositories,
+            week_start_date__gt=start - timedelta(days=7),
+            week_start_date__lte=end,
+        ).order_by().values_list('week_start_date', 'daily_commits')
+        if blob and len(blob) == 14
+    ]
+
+    grid = np.zeros(HEATMAP_WEEKS * 7, dtype=np.int64)
+    if rows:
+        days = np.frombuffer(b''.join(blob for _, blob in rows), dtype='<u2').reshape(-1, 7)
+        first_day = np.array([(week_start - start).days for week_start, _ in rows])
+        offsets = first_day[:, None] + np.arange(7)
+        # Weeks straddling the window edges contribute only their days inside it
+        inside = (offsets >= 0) & (offsets <= (end - start).days)
+        np.add.at(grid, offsets[inside], days[inside])
+    grid = grid.reshape(HEATMAP_WEEKS, 7)
+
+    active = grid[grid > 0]
+    levels = np.zeros_like(grid)
+    if active.size:
+        thresholds = np.percentile(active, LEVEL_PERCENTILES)
+        levels[grid > 0] = np.digitize(grid[grid > 0], thresholds, right=True) + 1
+
+    return {
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'counts': grid.tolist(),
+        'levels': levels.tolist(),
+        'total': int(grid.sum()),
+        'max': int(grid.max()),
+        'active_days': int(active.size),
+    }
+
+
+def get_contribution_heatmap():
+    """The heatmap for tracked repos, rebuilt only after a GitHub sync changes data (or a new day starts)."""
+    _, end = heatmap_window()
+    key = f"{HEATMAP_CACHE_KEY}{get_generation('github')['token']}:{end.isoformat()}"
+    heatmap = cache.get(key)
+    if heatmap is None:
+        heatmap = build_contribution_heatmap()
+        cache.set(key, heatmap, HEATMAP_CACHE_TIMEOUT)
+    return heatmap
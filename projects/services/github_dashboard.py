@@ -0,0 +1,154 @@
+"""
+GitHub Dashboard Service
+Repository totals, weekly timeline, monthly trends and top languages for the GitHub integration page
+Version 1.0 - Three queries plus one in-memory pass, cached per GitHub sync generation
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models import Count, Max, Min, Q, Sum
+from django.utils import timezone
+
+from core.services.syndication import get_generation
+
+from .language_stats import get_top_languages
+
+
+DASHBOARD_CACHE_KEY = 'github-dashboard:'
+DASHBOARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+ACTIVE_REPO_DAYS = 180   # "Active" = updated on GitHub within this window
+TIMELINE_WEEKS = 8       # Weeks on the development timeline
+RECENT_WEEKS = 4         # Weeks summed for the "recent commits" stat
+TREND_MONTHS = 6         # Months in the monthly trend
+
+
+def build_github_dashboard(now=None):
+    """
+    Everything the GitHub integration page and the sync endpoint show about
+    local data, from three queries (plus the precomputed language rollups):
+
+      1. one conditional aggregate over GitHubRepository (totals, active,
+         tracked, last sync)
+      2. GitHubCommitWeek summed per (year, week) across tracked repos,
+         newest TIMELINE_WEEKS weeks
+      3. the tracked repos' GitHubCommitMonth rollups, folded in memory
+         into monthly trends and the most active repo
+
+    Returns {'github_stats', 'weekly_stats' (None without weekly data),
+    'recent_weekly_activity', 'monthly_trends', 'top_languages',
+    'last_sync', 'tracked_repositories'}.
+    """
+    GitHubRepository = apps.get_model('projects', 'GitHubRepository')
+    GitHubCommitWeek = apps.get_model('projects', 'GitHubCommitWeek')
+    GitHubCommitMonth = apps.get_model('projects', 'GitHubCommitMonth')
+    now = now or timezone.now()
+
+    tracked = GitHubRepository.objects.with_detailed_tracking()
+    totals = GitHubRepository.objects.aggregate(
+        total=Count('pk'),
+        public=Count('pk', filter=Q(is_private=False)),
+        active=Count('pk', filter=Q(github_updated_at__gte=now - timedelta(days=ACTIVE_REPO_DAYS))),
+        tracked=Count('pk', filter=Q(pk__in=tracked.values('pk'))),
+        stars=Sum('stars_count'),
+        forks=Sum('forks_count'),
+        size=Sum('size'),
+        last_sync=Max('last_synced'),
+    )
+
+    # Grouping happens in SQL, so the slice keeps whole weeks across every repo
+    weeks = list(
+        GitHubCommitWeek.objects.filter(repository__in=tracked)
+        .values('year', 'week')
+        .annotate(
+            total_commits=Sum('commit_count'),
+            repos_active=Count('pk', filter=Q(commit_count__gt=0)),
+            week_start=Min('week_start_date'),
+        )
+        .order_by('-year', '-week')[:TIMELINE_WEEKS]
+    )
+    repo_months = (
+        GitHubCommitMonth.objects.filter(repository__in=tracked)
+        .values('repository__name', 'year', 'month', 'month_name', 'total_commits')
+        .order_by()
+    )
+
+    months = {}
+    this_month = defaultdict(int)
+    this_year = defaultdict(int)
+    for row in repo_months:
+        month = months.setdefault(
+            (row['year'], row['month']),
+            {'year': row['year'], 'month': row['month'], 'month_name': row['month_name'],
+             'total_commits': 0, 'repos_count': 0},
+        )
+        month['total_commits'] += row['total_commits']
+        month['repos_count'] += 1
+
+        if row['year'] == now.year:
+            this_year[row['repository__name']] += row['total_commits']
+            if row['month'] == now.month:
+                this_month[row['repository__name']] += row['total_commits']
+
+    total = totals['total']
+    return {
+        'github_stats': {
+            'total_repositories': total,
+            'public_repositories': totals['public'],
+            'private_repositories': total - totals['public'],
+            'total_stars': totals['stars'] or 0,
+            'total_forks': totals['forks'] or 0,
+            'total_size_mb': round((totals['size'] or 0) / 1024, 2),
+            'active_repositories': totals['active'],
+            'activity_percentage': round(totals['active'] / total * 100, 1) if total else 0,
+        },
+        'weekly_stats': _weekly_stats(weeks, totals['tracked'], this_month or this_year),
+        'recent_weekly_activity': [
+            {
+                'week_label': GitHubCommitWeek(
+                    year=week['year'], week=week['week'], week_start_date=week['week_start']
+                ).get_week_label(),
+                'week_start': week['week_start'],
+                'total_commits': week['total_commits'],
+                'repos_active': week['repos_active'],
+            }
+            for week in weeks
+        ],
+        'monthly_trends': [months[key] for key in sorted(months, reverse=True)[:TREND_MONTHS]],
+        'top_languages': get_top_languages(limit=10),
+        'last_sync': totals['last_sync'],
+        'tracked_repositories': totals['tracked'],
+    }
+
+
+def _weekly_stats(weeks, tracked_count, repo_totals):
+    """Overview card numbers; None until a tracked repo has weekly data."""
+    if not tracked_count or not weeks:
+        return None
+
+    recent_commits = sum(week['total_commits'] for week in weeks[:RECENT_WEEKS])
+    most_active_repo = None
+    if repo_totals:
+        name = max(repo_totals, key=repo_totals.get)
+        most_active_repo = {'repository__name': name, 'total_commits': repo_totals[name]}
+
+    return {
+        'total_tracked_repos': tracked_count,
+        'total_recent_commits': recent_commits,
+        'avg_commits_per_week': round(recent_commits / RECENT_WEEKS, 1),
+        'most_active_repo': most_active_repo,
+        'tracking_active': True,
+    }
+
+
+def get_github_dashboard():
+    """The dashboard data, rebuilt only after a GitHub sync changes data (or a new day starts)."""
+    key = f"{DASHBOARD_CACHE_KEY}{get_generation('github')['token']}:{timezone.localdate().isoformat()}"
+    dashboard = cache.get(key)
+    if dashboard is None:
+        dashboard = build_github_dashboard()
+        cache.set(key, dashboard, DASHBOARD_CACHE_TIMEOUT)
+    return dashboard
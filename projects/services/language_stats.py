@@ -0,0 +1,129 @@
+"""
+Language Statistics Service
+Per-repository language upserts and cross-repository language rollups
+Version 1.1 - Rollups also rebuilt on commit when a repository changes system or is deleted
+"""
+
+import threading
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, Sum
+
+
+def upsert_repository_languages(repository, languages):
+    """
+    Bring a repository's GitHubLanguage rows in line with GitHub's
+    {language: bytes} map, touching only the rows that changed.
+
+    Returns (created, updated, deleted) counts.
+    """
+    GitHubLanguage = apps.get_model('projects', 'GitHubLanguage')
+
+    total_bytes = sum(languages.values())
+    existing = {row.language: row for row in repository.languages.all()}
+
+    to_create = []
+    to_update = []
+    for language, bytes_count in languages.items():
+        percentage = bytes_count / total_bytes * 100 if total_bytes else 0
+        row = existing.get(language)
+        if row is None:
+            to_create.append(GitHubLanguage(
+                repository=repository,
+                language=language,
+                bytes_count=bytes_count,
+                percentage=percentage,
+            ))
+        elif row.bytes_count != bytes_count or abs(row.percentage - percentage) > 1e-9:
+            row.bytes_count = bytes_count
+            row.percentage = percentage
+            to_update.append(row)
+    gone = [language for language in existing if language not in languages]
+
+    with transaction.atomic():
+        if gone:
+            repository.languages.filter(language__in=gone).delete()
+        if to_create:
+            GitHubLanguage.objects.bulk_create(to_create)
+        if to_update:
+            GitHubLanguage.objects.bulk_update(to_update, ['bytes_count', 'percentage'])
+
+    return len(to_create), len(to_update), len(gone)
+
+
+def rebuild_language_rollups(app_registry=apps):
+    """
+    Recompute every LanguageRollup row: one scope for all repositories
+    (system=None) plus one per SystemModule with linked repositories.
+
+    One aggregate query per scope type; the table is swapped inside a
+    transaction so readers never see it half-built. Returns rows written.
+    `app_registry` lets migrations run it against historical models.
+    """
+    GitHubLanguage = app_registry.get_model('projects', 'GitHubLanguage')
+    LanguageRollup = app_registry.get_model('projects', 'LanguageRollup')
+
+    totals = {None: list(GitHubLanguage.objects.order_by().values('language').annotate(
+        total_bytes=Sum('bytes_count'),
+        repo_count=Count('repository', distinct=True),
+    ))}
+    by_system = defaultdict(list)
+    for row in GitHubLanguage.objects.filter(
+        repository__related_system__isnull=False
+    ).order_by().values('repository__related_system', 'language').annotate(
+        total_bytes=Sum('bytes_count'),
+        repo_count=Count('repository', distinct=True),
+    ):
+        by_system[row['repository__related_system']].append(row)
+    totals.update(by_system)
+
+    rollups = []
+    for system_id, rows in totals.items():
+        scope_bytes = sum(row['total_bytes'] for row in rows)
+        rollups += [
+            LanguageRollup(
+                system_id=system_id,
+                language=row['language'],
+                total_bytes=row['total_bytes'],
+                repo_count=row['repo_count'],
+                percentage=row['total_bytes'] / scope_bytes * 100 if scope_bytes else 0,
+            )
+            for row in rows
+        ]
+
+    with transaction.atomic():
+        LanguageRollup.objects.all().delete()
+        LanguageRollup.objects.bulk_create(rollups)
+
+    return len(rollups)
+
+
+_scheduled = threading.local()
+
+
+def schedule_language_rollup_rebuild():
+    """
+    Rebuild LanguageRollup once the current transaction commits, e.g. after a
+    repository moved to another system or was deleted. Repeated calls in one
+    transaction (a bulk delete sends a signal per repository) rebuild once.
+    """
+    _scheduled.pending = True
+    transaction.on_commit(_rebuild_scheduled)
+
+
+def _rebuild_scheduled():
+    # Later callbacks from the same transaction find nothing left to do
+    if not getattr(_scheduled, 'pending', False):
+        return
+    _scheduled.pending = False
+    rebuild_language_rollups()
+
+
+def get_top_languages(system=None, limit=10):
+    """Top LanguageRollup rows for all repositories, or for one system's linked repositories."""
+    LanguageRollup = apps.get_model('projects', 'LanguageRollup')
+    if system is None:
+        return list(LanguageRollup.objects.filter(system__isnull=True)[:limit])
+    return list(LanguageRollup.objects.filter(system=system)[:limit])
@@ -4,9 +4,11 @@ from django.utils.safestring import mark_safe
 from core.utils.github_helpers import GitHubDataProcessor
 
 import re
-from datetime import datetime, timedelta
-from django.db.models import Sum, Count, Avg
-from projects.models import GitHubCommitWeek
+from datetime import date, datetime, timedelta
+from projects.models import GitHubCommitMonth, GitHubCommitWeek
+from projects.services.commit_rollups import CommitRollups
+from projects.services.commit_timeseries import ALL_REPOSITORIES, CommitTimeSeries
+from projects.services.contribution_heatmap import get_contribution_heatmap
 
 register = template.Library()
 
@@ -45,10 +47,16 @@ def github_username_from_url(url):
 @register.inclusion_tag('projects/components/repo_language_bar.html')
 def repo_language_bar(repository):
     """Render language breakdown bar for repository."""
-    languages = repository.languages.all()
+    languages = list(repository.languages.all())
     return {'languages': languages}
 
 
+@register.inclusion_tag('projects/components/repo_language_bar.html')
+def language_bar(languages):
+    """Render a language breakdown bar from precomputed rows (e.g. a system's LanguageRollups)."""
+    return {'languages': list(languages)}
+
+
 @register.filter
 def commit_frequency_badge(rating):
     """Generate badge for commit frequency rating."""
@@ -102,10 +110,15 @@ def commit_summary_card(system_module):
     return {'stats': commit_stats, 'system': system_module}
 
 @register.inclusion_tag("projects/components/github_weekly_panel.html")
-def github_weekly_panel(repo=None, weeks_back=12, panel_style="dashboard"):
+def github_weekly_panel(repo=None, weeks_back=12, panel_style="dashboard", series=None, rollups=None):
     """
     Display weekly commit activity panel.
     Can show data for specific repo or all system-linked repos.
+
+    Pass a CommitTimeSeries and a CommitRollups (combined=True) loaded once
+    for the page as `series` and `rollups` to render several panels without
+    a query each. Months come from the rollup tables; the overview's from
+    the all-repositories scope.
     """
     from projects.models import (
         GitHubRepository,
@@ -113,48 +126,30 @@ def github_weekly_panel(repo=None, weeks_back=12, panel_style="dashboard"):
 
     if repo:
         # Single repository data
-        weekly_data = repo.get_weekly_commit_data(weeks_back=weeks_back)
-        monthly_data = repo.get_monthly_commit_data(months_back=6)
+        if series is None:
+            series = CommitTimeSeries.load([repo.pk])
+        if rollups is None:
+            rollups = CommitRollups.load([repo.pk])
+        repo_id = repo.pk
         repo_name = repo.name
         context_title = f"Weekly Activity - {repo.name}"
     else:
-        # All system-linked repositories
-        repos = GitHubRepository.objects.with_detailed_tracking()
-        weekly_data = GitHubCommitWeek.objects.filter(repository__in=repos).order_by(
-            "-year", "-week"
-        )[:weeks_back]
-
-        # Aggregate monthly data
-        monthly_data = []
-        monthly_totals = (
-            GitHubCommitWeek.objects.filter(repository__in=repos)
-            .values("year", "month", "month_name")
-            .annotate(
-                total_commits=Sum("commit_count"),
-                avg_weekly=Avg("commit_count"),
-                weeks_count=Count("id"),
-            )
-            .order_by("-year", "-month")[:6]
-        )
-
-        for month in monthly_totals:
-            monthly_data.append(
-                {
-                    "year": month["year"],
-                    "month": month["month"],
-                    "month_name": month["month_name"],
-                    "total_commits": month["total_commits"],
-                    "avg_commits_per_week": round(month["avg_weekly"], 1),
-                    "weeks_count": month["weeks_count"],
-                }
-            )
-
+        # All system-linked repositories, summed week by week
+        if series is None:
+            series = CommitTimeSeries.load(GitHubRepository.objects.with_detailed_tracking())
+        series = series.combined()
+        if rollups is None:
+            rollups = CommitRollups.load([], combined=True)
+        repo_id = ALL_REPOSITORIES
         repo_name = "All Projects"
         context_title = "Development Activity Overview"
 
+    weekly_data = series.weekly(repo_id, weeks_back)
+    monthly_data = rollups.monthly(repo_id, months_back=6)
+
     # Calculate trends and metrics using GitHubDataProcessor
     metrics = GitHubDataProcessor.format_weekly_metrics(weekly_data)
-    trend = GitHubDataProcessor.calculate_commit_trend(weekly_data)
+    trend = series.weekly_trend(repo_id)
     trend_info = GitHubDataProcessor.get_trend_icon_and_color(trend)
 
     # Add trend info to metrics
@@ -180,14 +175,18 @@ def github_weekly_panel(repo=None, weeks_back=12, panel_style="dashboard"):
 
 
 @register.inclusion_tag("projects/components/github_repo_card.html")
-def github_repo_card(repo, show_weekly_summary=True):
-    """Enhanced repository card with weekly data."""
+def github_repo_card(repo, show_weekly_summary=True, series=None, rollups=None):
+    """Enhanced repository card with weekly data (`series`/`rollups`: page-wide CommitTimeSeries/CommitRollups)."""
     weekly_summary = None
     monthly_summary = None
 
     if show_weekly_summary and repo.enable_detailed_tracking:
-        weekly_summary = repo.get_weekly_commit_summary()
-        monthly_summary = repo.get_monthly_commit_summary()
+        if series is None:
+            series = CommitTimeSeries.load([repo.pk])
+        if rollups is None:
+            rollups = CommitRollups.load([repo.pk])
+        weekly_summary = series.weekly_summary(repo.pk)
+        monthly_summary = rollups.monthly_summary(repo.pk)
 
     return {
         "repo": repo,
@@ -197,6 +196,29 @@ def github_repo_card(repo, show_weekly_summary=True):
     }
 
 
+@register.inclusion_tag("projects/components/contribution_heatmap.html")
+def contribution_heatmap():
+    """Year of daily commits across tracked repos as a GitHub-style calendar (cached, no queries when warm)."""
+    heatmap = get_contribution_heatmap()
+    start = date.fromisoformat(heatmap["start"])
+    end = date.fromisoformat(heatmap["end"])
+
+    weeks = []
+    for week_index, (counts, levels) in enumerate(zip(heatmap["counts"], heatmap["levels"])):
+        week_start = start + timedelta(weeks=week_index)
+        weeks.append([
+            {
+                "date": week_start + timedelta(days=day),
+                "count": count,
+                "level": level,
+                "future": week_start + timedelta(days=day) > end,
+            }
+            for day, (count, level) in enumerate(zip(counts, levels))
+        ])
+
+    return {"heatmap": heatmap, "weeks": weeks}
+
+
 @register.filter
 def weekly_commit_chart_color(trend):
     """Get chart color based on trend."""
@@ -250,11 +272,10 @@ def weekly_activity_summary(repos_with_tracking):
     current_year = timezone.now().year
 
     most_active_repo = (
-        GitHubCommitWeek.objects.filter(
+        GitHubCommitMonth.objects.filter(
             repository__in=repos_with_tracking, year=current_year, month=current_month
         )
-        .values("repository__name")
-        .annotate(total_commits=Sum("commit_count"))
+        .values("repository__name", "total_commits")
         .order_by("-total_commits")
         .first()
     )
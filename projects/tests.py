@@ -1,3 +1,62 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Create your tests here.
+from projects.models import GitHubRepository, LanguageRollup, SystemModule
+from projects.services.language_stats import rebuild_language_rollups, upsert_repository_languages
+
+
+class LanguageRollupSignalTests(TestCase):
+    """LanguageRollup follows repositories between systems and out of the table without a sync."""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create(username='author')
+        cls.systems = [
+            SystemModule.objects.create(title=f'System {i}', slug=f'system-{i}', system_id=f'SYS-00{i}', author=author)
+            for i in range(2)
+        ]
+        cls.repos = [
+            GitHubRepository.objects.create(
+                github_id=i + 1, name=f'repo-{i}', full_name=f'owner/repo-{i}',
+                html_url=f'https://github.com/owner/repo-{i}', clone_url=f'https://github.com/owner/repo-{i}.git',
+                github_created_at='2024-01-01T00:00:00Z', github_updated_at='2024-01-01T00:00:00Z',
+                related_system=cls.systems[0] if i == 0 else None,
+            )
+            for i in range(2)
+        ]
+        upsert_repository_languages(cls.repos[0], {'Python': 3000, 'HTML': 1000})
+        upsert_repository_languages(cls.repos[1], {'Go': 2000})
+        rebuild_language_rollups()
+
+    def rollups(self, system):
+        return dict(LanguageRollup.objects.filter(system=system).values_list('language', 'total_bytes'))
+
+    def test_relinking_a_repository_moves_its_languages(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            repo = GitHubRepository.objects.get(pk=self.repos[0].pk)
+            repo.related_system = self.systems[1]
+            repo.save()
+
+        self.assertEqual(self.rollups(self.systems[0]), {})
+        self.assertEqual(self.rollups(self.systems[1]), {'Python': 3000, 'HTML': 1000})
+
+    def test_saves_that_keep_the_system_do_not_rebuild(self):
+        with mock.patch('projects.services.language_stats.rebuild_language_rollups') as rebuild:
+            with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(2):
+                # Deferred fields are not fetched to decide
+                repo = GitHubRepository.objects.only('name').get(pk=self.repos[1].pk)
+                repo.save(update_fields=['name'])
+            with self.captureOnCommitCallbacks(execute=True):
+                repo = GitHubRepository.objects.get(pk=self.repos[0].pk)
+                repo.stars_count = 10
+                repo.save()
+
+        rebuild.assert_not_called()
+
+    def test_deleting_repositories_drops_their_languages(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            GitHubRepository.objects.all().delete()
+
+        self.assertFalse(LanguageRollup.objects.exists())
@@ -23,6 +23,7 @@ urlpatterns = [
     # GitHub Integration URLs
     path('github/', views.GitHubIntegrationView.as_view(), name='github_integration'),
     path('github/sync/', views.GitHubSyncView.as_view(), name='github_sync'),
+    path('github/heatmap/', views.GitHubHeatmapView.as_view(), name='github_heatmap'),
     path('github/test/', views.GitHubIntegrationTestView.as_view(), name='github_test'),
     path('chartjs-test/', TemplateView.as_view(template_name='projects/chartjs_test.html'), name='chartjs_test'),
 ]
@@ -11,6 +11,7 @@ from django.db.models import Count, Avg, Q, Sum, Max, Min, F, Case, When, Value,
 from django.db.models.functions import TruncMonth, Extract, Coalesce
 from django.http import JsonResponse
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django.core.cache import cache
 from django.core.management import call_command
 
@@ -23,6 +24,11 @@ import json
 
 from .models import SystemModule, SystemType, Technology, SystemFeature, SystemMetric, SystemDependency, SystemImage, SystemSkillGain, LearningMilestone, GitHubRepository, GitHubLanguage, GitHubCommitWeek, GitHubRepositoryManager
 from core.services.github_api import GitHubAPIService, GitHubAPIError
+from .services.commit_rollups import CommitRollups
+from .services.commit_timeseries import CommitTimeSeries
+from .services.contribution_heatmap import get_contribution_heatmap
+from .services.github_dashboard import get_github_dashboard
+from .services.language_stats import get_top_languages
 from blog.models import Post, SystemLogEntry
 from core.models import Skill, PortfolioAnalytics, SkillTechnologyRelation
 
@@ -1317,6 +1323,7 @@ class LearningSystemControlInterfaceView(DetailView):
             'tech_relationships': tech_relationships,
             'total_technologies': technologies.count(),
             'primary_language': self.get_primary_language(system),
+            'language_breakdown': get_top_languages(system, limit=None),
             'tech_stack_summary': self.get_tech_stack_summary(technologies),
         }
 
@@ -3196,26 +3203,14 @@ class GitHubIntegrationView(TemplateView):
             # Local repository data (fast)
             local_repos = GitHubRepository.objects.select_related().prefetch_related('languages')
 
-            # GitHub stats
-            github_stats = self.get_github_stats(local_repos)
-
-            # Get sync info
-            sync_info = self.get_sync_info(local_repos)
+            # Stats, weekly tracking, trends and languages (cached per sync)
+            dashboard = get_github_dashboard()
 
             # Recent Activity (from API if needed)
             recent_activity = self.get_recent_activity(github_service)
 
             # NEW: Enhanced repositories with weekly tracking
             repos_with_tracking = GitHubRepository.objects.with_detailed_tracking()
-            
-            # NEW: Weekly tracking statistics
-            weekly_stats = self.get_weekly_tracking_stats(repos_with_tracking)
-            
-            # NEW: Recent weekly activity across all tracked repos
-            recent_weekly_activity = self.get_recent_weekly_activity(repos_with_tracking)
-            
-            # NEW: Monthly trends
-            monthly_trends = self.get_monthly_trends(repos_with_tracking)
 
             context.update(
                 {
@@ -3224,18 +3219,22 @@ class GitHubIntegrationView(TemplateView):
                     'page_subtitle': 'Live development metrics and project synchronization',
                     'show_breadcrumbs': True,
 
-                    "github_stats": github_stats,
+                    "github_stats": dashboard['github_stats'],
                     "recent_repos": local_repos.filter(is_archived=False)[:6],
-                    "top_languages": self.get_top_languages(local_repos),
+                    "top_languages": dashboard['top_languages'],
                     "recent_activity": recent_activity,
                     "integration_status": "active",
-                    "sync_info": sync_info,  # Add sync info
+                    "sync_info": self.get_sync_info(dashboard['last_sync'], dashboard['github_stats']['total_repositories']),
                     # NEW: Weekly tracking context
                     "repos_with_tracking": repos_with_tracking,
-                    "weekly_stats": weekly_stats,
-                    "recent_weekly_activity": recent_weekly_activity,
-                    "monthly_trends": monthly_trends,
-                    "show_weekly_panels": repos_with_tracking.count() > 0,
+                    "weekly_stats": dashboard['weekly_stats'],
+                    "recent_weekly_activity": dashboard['recent_weekly_activity'],
+                    "monthly_trends": dashboard['monthly_trends'],
+                    # One query for every weekly panel and repo card on the page
+                    "commit_series": CommitTimeSeries.load(repos_with_tracking),
+                    # ...and one for their months (GitHubCommitMonth, incl. the all-repos scope)
+                    "commit_rollups": CommitRollups.load(repos_with_tracking, combined=True),
+                    "show_weekly_panels": dashboard['tracked_repositories'] > 0,
                     "sync_url": True,  # Flag for JavaScript initialization
                 }
             )
@@ -3244,158 +3243,15 @@ class GitHubIntegrationView(TemplateView):
                 'integration_status': 'error',
                 'error_message': str(e),
                 'github_stats': {},
-                'sync_info': self.get_sync_info([]),  # Empty sync info for error state
+                'sync_info': self.get_sync_info(None, 0),  # Empty sync info for error state
                 'show_weekly_panels': False,
                 'repos_with_tracking': GitHubRepository.objects.none(),
             })
         return context
     
-    def get_weekly_tracking_stats(self, repos_with_tracking):
-        """Get overview stats for weekly tracking."""
-        
-        if not repos_with_tracking.exists():
-            return None
-        
-        # Get recent weekly data (last 4 weeks)
-        recent_weeks = GitHubCommitWeek.objects.filter(
-            repository__in=repos_with_tracking
-        ).order_by('-year', '-week')[:4]
-        
-        if not recent_weeks:
-            return None
-        
-        # Calculate stats
-        total_recent_commits = sum(week.commit_count for week in recent_weeks)
-        avg_commits_per_week = total_recent_commits / 4 if recent_weeks else 0
-        
-        # Most active repo this month
-        current_month = timezone.now().month
-        current_year = timezone.now().year
-        
-        most_active_repo = GitHubCommitWeek.objects.filter(
-            repository__in=repos_with_tracking,
-            year=current_year,
-            month=current_month
-        ).values('repository__name').annotate(
-            total_commits=Sum('commit_count')
-        ).order_by('-total_commits').first()
-
-        if not most_active_repo:
-            most_active_repo = GitHubCommitWeek.objects.filter(
-            repository__in=repos_with_tracking,
-            year=current_year
-        ).values('repository__name').annotate(
-            total_commits=Sum('commit_count')
-        ).order_by('-total_commits').first()
-        
-        return {
-            'total_tracked_repos': repos_with_tracking.count(),
-            'total_recent_commits': total_recent_commits,
-            'avg_commits_per_week': round(avg_commits_per_week, 1),
-            'most_active_repo': most_active_repo,
-            'tracking_active': True
-        }
-
-    def get_recent_weekly_activity(self, repos_with_tracking):
-        """Get recent weekly activity for timeline."""
-        
-        recent_weeks = GitHubCommitWeek.objects.filter(
-            repository__in=repos_with_tracking
-        ).select_related('repository').order_by('-year', '-week')[:12]
-        
-        # Group by week for aggregated view
-        weekly_totals = defaultdict(lambda: {'commit_count': 0, 'repos_active': 0, 'week_info': None})
-        
-        for week in recent_weeks:
-            week_key = f"{week.year}-W{week.week:02d}"
-            weekly_totals[week_key]['commit_count'] += week.commit_count
-            if week.commit_count > 0:
-                weekly_totals[week_key]['repos_active'] += 1
-            if not weekly_totals[week_key]['week_info']:
-                weekly_totals[week_key]['week_info'] = week
-        
-        return [
-            {
-                'week_label': data['week_info'].get_week_label(),
-                'week_start': data['week_info'].week_start_date,
-                'total_commits': data['commit_count'],
-                'repos_active': data['repos_active'],
-                'week_info': data['week_info']
-            }
-            for data in weekly_totals.values()
-            if data['week_info']
-        ][:8]  # Last 8 weeks
-
-    def get_monthly_trends(self, repos_with_tracking):
-        """Get monthly trends for visualization."""
-        
-        monthly_data = GitHubCommitWeek.objects.filter(
-            repository__in=repos_with_tracking
-        ).values('year', 'month', 'month_name').annotate(
-            total_commits=Sum('commit_count'),
-            repos_count=Count('repository', distinct=True)
-        ).order_by('-year', '-month')[:6]
-        
-        return list(monthly_data)
-    
-    def get_github_stats(self, repositories):
-        """Calculate GitHub statistics from local data."""
-        total_repos = repositories.count()
-        public_repos = repositories.filter(is_private=False).count()
-
-        # Aggregate statistics
-        stats = repositories.aggregate(
-            total_stars=Sum('stars_count'),
-            total_forks=Sum('forks_count'),
-            total_size=Sum('size')
-        )
-
-        # Active repos (updated in last 6 months)
-        six_months_ago = timezone.now() - timedelta(days=180)
-        active_repos = repositories.filter(github_updated_at__gte=six_months_ago).count()
-
-        return {
-            'total_repositories': total_repos,
-            'public_repositories': public_repos,
-            'private_repositories': total_repos - public_repos,
-            'total_stars': stats['total_stars'] or 0,
-            'total_forks': stats['total_forks'] or 0,
-            'total_size_mb': round((stats['total_size'] or 0) / 1024, 2),
-            'active_repositories': active_repos,
-            'activity_percentage': round((active_repos / total_repos * 100), 1) if total_repos > 0 else 0,
-        }
-    
-    def get_top_languages(self, repositories):
-        """Get top programming langs across all repos."""
-        lang_stats = GitHubLanguage.objects.filter(
-            repository__in=repositories
-        ).values('language').annotate(
-            total_bytes=Sum('bytes_count'),
-            repo_count=Count('repository', distinct=True)
-        ).order_by('-total_bytes')[:10]
-
-        return lang_stats
-    
-    def get_sync_info(self, repositories):
-        """Get synchronization info for display."""
-        if not repositories:
-            return {
-                'last_sync': None,
-                'last_sync_display': 'Never',
-                'next_sync_hours': 24,
-                'next_sync_display': 'In 24 hours',
-                'total_repos_synced': 0,
-            }
-        
-        # Get the most recently synced repo
-        if hasattr(repositories, 'order_by'):
-            # Queryset
-            most_recent = repositories.order_by('-last_synced').first()
-        else:
-            # List
-            most_recent = max(repositories, key=lambda r: r.last_synced) if repositories else None
-        
-        if not most_recent or not most_recent.last_synced:
+    def get_sync_info(self, last_sync, total_repos):
+        """Get synchronization info for display (last_sync = most recent GitHubRepository.last_synced)."""
+        if not total_repos or not last_sync:
             return {
                 "last_sync": None,
                 "last_sync_display": "Never",
@@ -3403,8 +3259,6 @@ class GitHubIntegrationView(TemplateView):
                 "next_sync_display": "In 24 hours",
                 "total_repos_synced": 0,
             }
-        
-        last_sync = most_recent.last_synced
 
         # Calculate next sync time (1hr from last sync)
         next_sync = last_sync + timedelta(hours=1)
@@ -3443,7 +3297,7 @@ class GitHubIntegrationView(TemplateView):
             'last_sync_display': last_sync_display,
             'next_sync_hours': hours_until_next,
             'next_sync_display': next_sync_display,
-            'total_repos_synced': len(repositories) if hasattr(repositories, '__len__') else repositories.count(),
+            'total_repos_synced': total_repos,
         }
     
     def get_recent_activity(self, github_service):
@@ -3461,6 +3315,15 @@ class GitHubIntegrationView(TemplateView):
 # =================================
 
 
+class GitHubHeatmapView(View):
+    """Year of daily commits across tracked repos as JSON (cached per GitHub sync)."""
+
+    def get(self, request):
+        response = JsonResponse(get_contribution_heatmap())
+        patch_cache_control(response, public=True, max_age=300)
+        return response
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class GitHubSyncView(LoginRequiredMixin, View):
     """AJAX endpoint for GitHub data sync"""
@@ -3483,12 +3346,12 @@ class GitHubSyncView(LoginRequiredMixin, View):
 
             output = out.getvalue()
 
-            # Get updated sync info
-            repos = GitHubRepository.objects.all()
+            # Sync saves bump the 'github' generation, so this is rebuilt from the new data
+            dashboard = get_github_dashboard()
 
             # Calculate updated stats
-            sync_info = self.get_sync_info(repos)
-            stats = self.get_updated_stats(repos)
+            sync_info = self.get_sync_info(dashboard['last_sync'], dashboard['github_stats']['total_repositories'])
+            stats = self.get_updated_stats(dashboard)
 
             return JsonResponse({
                 'success': True,
@@ -3503,25 +3366,22 @@ class GitHubSyncView(LoginRequiredMixin, View):
                 'error': str(e),
             }, status=500)
         
-    def get_sync_info(self, repositories):
+    def get_sync_info(self, last_sync, total_repos):
         """Get sync info for AJAX response."""
-        if not repositories.exists():
+        if not total_repos:
             return {
                 'last_sync_display': 'Never',
                 'next_sync_display': 'In 24 hours',
                 'total_repos_synced': 0,
             }
-        
-        most_recent = repositories.order_by('-last_synced').first()
 
-        if not most_recent or not most_recent.last_synced:
+        if not last_sync:
             return {
                 'last_sync_display': 'Never',
                 'next_sync_display': 'In 24 hours',
-                'total_repos_synced': repositories.count(),
+                'total_repos_synced': total_repos,
             }
-        
-        last_sync = most_recent.last_synced
+
         next_sync = last_sync + timedelta(hours=1)
         now = timezone.now()
 
@@ -3551,36 +3411,17 @@ class GitHubSyncView(LoginRequiredMixin, View):
         return {
             'last_sync_display': last_sync_display,
             'next_sync_display': next_sync_display,
-            'total_repos_synced': repositories.count(),
+            'total_repos_synced': total_repos,
         }
     
-    def get_updated_stats(self, repositories):
-        """Get updated stats for AJAX response."""
-        total_repos = repositories.count()
-
-        if total_repos == 0:
-            return {
-                'total_repositories': 0,
-                'total_stars': 0,
-                'total_forks': 0,
-                'active_repositories': 0
-            }
-        
-        # Aggregate statistics
-        stats = repositories.aggregate(
-            total_stars=Sum('stars_count'),
-            total_forks=Sum('forks_count')
-        )
-
-        # Active repos (updated in last 6 mo)
-        six_months_ago = timezone.now() - timedelta(days=180)
-        active_repos = repositories.filter(github_updated_at__gte=six_months_ago).count()
-
+    def get_updated_stats(self, dashboard):
+        """Get updated stats for AJAX response (from get_github_dashboard())."""
+        stats = dashboard['github_stats']
         return {
-            'total_repositories': total_repos,
-            'total_stars': stats['total_stars'] or 0,
-            'total_forks': stats['total_forks'] or 0,
-            'active_repositories': active_repos,
+            'total_repositories': stats['total_repositories'],
+            'total_stars': stats['total_stars'],
+            'total_forks': stats['total_forks'],
+            'active_repositories': stats['active_repositories'],
         }
     
     def get(self, request, *args, **kwargs):